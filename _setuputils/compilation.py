@@ -123,4 +123,12 @@ def getExtensionArgsFromSetupOptions(options):
     if "c++11" in options:
         if onLinux or onMacOS:
             args["extra_compile_args"] = ["-std=c++11"]
+    if "openmp" in options:
+        # The default compiler on macOS has no OpenMP support,
+        # so parallel loops run in a single thread there.
+        if onLinux:
+            args.setdefault("extra_compile_args", []).append("-fopenmp")
+            args["extra_link_args"] = ["-fopenmp"]
+        elif onWindows:
+            args.setdefault("extra_compile_args", []).append("/openmp")
     return args
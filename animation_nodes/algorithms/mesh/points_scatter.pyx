@@ -1,5 +1,9 @@
+# setup: options = openmp
+
 import cython
 from libc.math cimport sqrt, ceil
+from cython.parallel cimport prange
+from ... utils.parallel cimport getThreadAmount
 from ... algorithms.random_number_generators cimport XoShiRo256Plus, XoShiRo256StarStar
 from ... data_structures cimport (
     LongList,
@@ -103,43 +107,68 @@ cdef LongList computeDistribution(DoubleList triangleWeights, long numberOfPoint
 cdef Matrix4x4List sampleRandomPointsOnPolygons(Vector3DList vertices, PolygonIndicesList polygons,
                                                 Vector3DList polyNormals, LongList distribution,
                                                 long numberOfPoints, long seed):
-    cdef XoShiRo256Plus rng = XoShiRo256Plus(seed)
+    # The random numbers are generated up front in the same order as before,
+    # so that the points do not depend on the amount of threads.
+    cdef DoubleList randomNumbers = generateRandomNumbers(seed, numberOfPoints * 2)
+    cdef LongList offsets = calculateOffsets(distribution)
     cdef Matrix4x4List matrices = Matrix4x4List(length = numberOfPoints)
+    cdef Py_ssize_t i, amount = polygons.getLength()
+    for i in prange(amount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(numberOfPoints, 20000)):
+        sampleRandomPointsOnTriangle(matrices.data + offsets.data[i], distribution.data[i],
+            vertices.data, polygons.indices.data + i * 3, polyNormals.data + i,
+            randomNumbers.data + offsets.data[i] * 2)
+    return matrices
+
+cdef void sampleRandomPointsOnTriangle(Matrix4 *matrices, long amount, Vector3 *vertices,
+                                       unsigned int *triangle, Vector3 *polyNormal,
+                                       double *randomNumbers) nogil:
     cdef Vector3 v1, v2, v3, v, normal, tangent, bitangent
-    cdef Py_ssize_t i, j, k, index
+    cdef Py_ssize_t k
     cdef double p1, p2, p3
-    index = 0
-    for i in range(polygons.getLength()):
-        j = i * 3
-        v1 = vertices.data[polygons.indices.data[j]]
-        v2 = vertices.data[polygons.indices.data[j + 1]]
-        v3 = vertices.data[polygons.indices.data[j + 2]]
+    v1 = vertices[triangle[0]]
+    v2 = vertices[triangle[1]]
+    v3 = vertices[triangle[2]]
 
-        normal = polyNormals.data[i]
-        normalizeVec3_InPlace(&normal)
+    normal = polyNormal[0]
+    normalizeVec3_InPlace(&normal)
 
-        subVec3(&tangent, &v1, &v2)
-        normalizeVec3_InPlace(&tangent)
+    subVec3(&tangent, &v1, &v2)
+    normalizeVec3_InPlace(&tangent)
 
-        crossVec3(&bitangent, &tangent, &normal)
-        normalizeVec3_InPlace(&bitangent)
+    crossVec3(&bitangent, &tangent, &normal)
+    normalizeVec3_InPlace(&bitangent)
 
-        for k in range(distribution.data[i]):
-            p1 = rng.nextDouble()
-            p2 = rng.nextDouble()
-            if p1 + p2 > 1.0:
-                p1 = 1.0 - p1
-                p2 = 1.0 - p2
-            p3 = 1.0 - p1 - p2
+    for k in range(amount):
+        p1 = randomNumbers[k * 2]
+        p2 = randomNumbers[k * 2 + 1]
+        if p1 + p2 > 1.0:
+            p1 = 1.0 - p1
+            p2 = 1.0 - p2
+        p3 = 1.0 - p1 - p2
 
-            v.x = p1 * v1.x + p2 * v2.x + p3 * v3.x
-            v.y = p1 * v1.y + p2 * v2.y + p3 * v3.y
-            v.z = p1 * v1.z + p2 * v2.z + p3 * v3.z
+        v.x = p1 * v1.x + p2 * v2.x + p3 * v3.x
+        v.y = p1 * v1.y + p2 * v2.y + p3 * v3.y
+        v.z = p1 * v1.z + p2 * v2.z + p3 * v3.z
 
-            matrixFromNormalizedAxisData(matrices.data + index, &v, &bitangent, &tangent, &normal)
-            index += 1
+        matrixFromNormalizedAxisData(matrices + k, &v, &bitangent, &tangent, &normal)
 
-    return matrices
+cdef DoubleList generateRandomNumbers(long seed, Py_ssize_t amount):
+    cdef XoShiRo256Plus rng = XoShiRo256Plus(seed)
+    cdef DoubleList numbers = DoubleList(length = amount)
+    cdef Py_ssize_t i
+    for i in range(amount):
+        numbers.data[i] = rng.nextDouble()
+    return numbers
+
+cdef LongList calculateOffsets(LongList distribution):
+    cdef LongList offsets = LongList(length = distribution.length)
+    cdef Py_ssize_t i
+    cdef long offset = 0
+    for i in range(distribution.length):
+        offsets.data[i] = offset
+        offset += distribution.data[i]
+    return offsets
 
 
 def scatterPointsOnEdges(Vector3DList vertices, EdgeIndicesList edges, Vector3DList vertexNormals,
@@ -170,37 +199,42 @@ cdef DoubleList calculateEdgeWeights(Vector3DList vertices, EdgeIndicesList edge
 cdef Matrix4x4List sampleRandomPointsOnEdges(Vector3DList vertices, EdgeIndicesList edges,
                                              Vector3DList vertexNormals, LongList distribution,
                                              long numberOfPoints, long seed):
-    cdef XoShiRo256Plus rng = XoShiRo256Plus(seed)
+    cdef DoubleList randomNumbers = generateRandomNumbers(seed, numberOfPoints)
+    cdef LongList offsets = calculateOffsets(distribution)
     cdef Matrix4x4List matrices = Matrix4x4List(length = numberOfPoints)
+    cdef Py_ssize_t i, amount = edges.getLength()
+    for i in prange(amount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(numberOfPoints, 20000)):
+        sampleRandomPointsOnEdge(matrices.data + offsets.data[i], distribution.data[i],
+            vertices.data, vertexNormals.data, edges.data[i].v1, edges.data[i].v2,
+            randomNumbers.data + offsets.data[i])
+    return matrices
+
+cdef void sampleRandomPointsOnEdge(Matrix4 *matrices, long amount,
+                                   Vector3 *vertices, Vector3 *vertexNormals,
+                                   unsigned int i1, unsigned int i2,
+                                   double *randomNumbers) nogil:
     cdef Vector3 v, normal, tangent, bitangent
-    cdef Vector3 *v1, *v2, *n1, *n2
-    cdef Py_ssize_t i, j, index
+    cdef Vector3 *v1 = vertices + i1
+    cdef Vector3 *v2 = vertices + i2
+    cdef Py_ssize_t j
     cdef double p1, p2
-    index = 0
-    for i in range(edges.getLength()):
-        v1 = vertices.data + edges.data[i].v1
-        v2 = vertices.data + edges.data[i].v2
-
-        n1 = vertexNormals.data + edges.data[i].v1
-        n2 = vertexNormals.data + edges.data[i].v2
-        addVec3(&normal, n1, n2)
-        normalizeVec3_InPlace(&normal)
 
-        subVec3(&tangent, v1, v2)
-        normalizeVec3_InPlace(&tangent)
+    addVec3(&normal, vertexNormals + i1, vertexNormals + i2)
+    normalizeVec3_InPlace(&normal)
 
-        crossVec3(&bitangent, &tangent, &normal)
-        normalizeVec3_InPlace(&bitangent)
+    subVec3(&tangent, v1, v2)
+    normalizeVec3_InPlace(&tangent)
 
-        for j in range(distribution.data[i]):
-            p1 = rng.nextDouble()
-            p2 = 1.0 - p1
+    crossVec3(&bitangent, &tangent, &normal)
+    normalizeVec3_InPlace(&bitangent)
 
-            v.x = p1 * v1[0].x + p2 * v2[0].x
-            v.y = p1 * v1[0].y + p2 * v2[0].y
-            v.z = p1 * v1[0].z + p2 * v2[0].z
+    for j in range(amount):
+        p1 = randomNumbers[j]
+        p2 = 1.0 - p1
 
-            matrixFromNormalizedAxisData(matrices.data + index, &v, &bitangent, &tangent, &normal)
-            index += 1
+        v.x = p1 * v1[0].x + p2 * v2[0].x
+        v.y = p1 * v1[0].y + p2 * v2[0].y
+        v.z = p1 * v1[0].z + p2 * v2[0].z
 
-    return matrices
+        matrixFromNormalizedAxisData(matrices + j, &v, &bitangent, &tangent, &normal)
@@ -5,8 +5,9 @@ from bpy.props import *
 from .. utils.handlers import eventHandler
 from .. utils.nodes import getAnimationNodeTrees
 from .. utils.animation import isAnimationPlaying
+from . tree_frame_cache import FrameCacheProperties
 from . tree_auto_execution import AutoExecutionProperties
-from .. events import treeChanged, isRendering, propertyChanged
+from .. events import nodeTreeChanged, isRendering, propertyChanged
 from .. preferences import getBlenderVersion, getAnimationNodesVersion
 from .. utils.blender_ui import isViewportRendering, isInterfaceLocked
 from .. tree_info import getNetworksByNodeTree, getSubprogramNetworksByNodeTree
@@ -45,6 +46,7 @@ class AnimationNodeTree(bpy.types.NodeTree):
 
     autoExecution: PointerProperty(type = AutoExecutionProperties)
     lastExecutionInfo: PointerProperty(type = LastTreeExecutionInfo)
+    frameCache: PointerProperty(type = FrameCacheProperties)
 
     globalScene: PointerProperty(type = bpy.types.Scene, name = "Scene",
         description = "The global scene used by this node tree (never none)")
@@ -52,7 +54,7 @@ class AnimationNodeTree(bpy.types.NodeTree):
     editNodeLabels: BoolProperty(name = "Edit Node Labels", default = False)
 
     def update(self):
-        treeChanged()
+        nodeTreeChanged(self)
 
     def canAutoExecute(self, events):
         a = self.autoExecution
@@ -81,7 +83,8 @@ class AnimationNodeTree(bpy.types.NodeTree):
         return customTriggerHasBeenActivated
 
     def autoExecute(self):
-        self._execute()
+        if not self.frameCache.load(self, self.scene.frame_current):
+            self._execute()
         self.autoExecution.lastExecutionTimestamp = time.process_time()
 
     def execute(self):
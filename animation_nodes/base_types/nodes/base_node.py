@@ -24,8 +24,10 @@ from ... utils.blender_ui import (
 )
 
 from ... execution.measurements import (
+    getPeakMemoryUsageString,
     getMinExecutionTimeString,
-    getMeasurementResultString
+    getMeasurementResultString,
+    getMemoryMeasurementResultString
 )
 from ... tree_info import (
     getNetworkWithNode, getOriginNodes,
@@ -55,7 +57,7 @@ class AnimationNode:
     onlySearchTags = False
 
     # can contain: 'NO_EXECUTION', 'NOT_IN_SUBPROGRAM',
-    #              'NO_AUTO_EXECUTION'
+    #              'NO_AUTO_EXECUTION', 'VOLATILE'
     options = set()
 
     # can be "NONE", "ALWAYS" or "HIDDEN_ONLY"
@@ -135,6 +137,9 @@ class AnimationNode:
     def getBakeCode(self):
         return []
 
+    def getFrameCacheCode(self):
+        return []
+
     def getUsedModules(self):
         return []
 
@@ -181,6 +186,8 @@ class AnimationNode:
     def draw_label(self):
         if nodeLabelMode == "MEASURE" and self.hide:
             return getMinExecutionTimeString(self)
+        if nodeLabelMode == "MEASURE_MEMORY" and self.hide:
+            return getPeakMemoryUsageString(self)
 
         if self.dynamicLabelType == "NONE":
             return self.bl_label
@@ -439,9 +446,13 @@ class AnimationNode:
     def getAllUIExtensions(self):
         extensions = []
 
-        if getExecutionCodeType() == "MEASURE":
+        codeType = getExecutionCodeType()
+        if codeType == "MEASURE":
             text = getMeasurementResultString(self)
             extensions.append(TextUIExtension(text))
+        elif codeType == "MEASURE_MEMORY":
+            text = getMemoryMeasurementResultString(self)
+            extensions.append(TextUIExtension(text))
 
         errorType = self.getErrorHandlingType()
         if errorType in ("MESSAGE", "EXCEPTION"):
@@ -552,7 +563,7 @@ class AnimationNode:
     # Code Generation
     ####################################################
 
-    def getLocalExecutionCode(self, required, bake = False):
+    def getLocalExecutionCode(self, required, bake = False, frameCache = False):
         inputVariables = self.getInputSocketVariables()
         outputVariables = self.getOutputSocketVariables()
 
@@ -564,6 +575,8 @@ class AnimationNode:
 
         if bake:
             code = "\n".join((code, toString(self.getBakeCode())))
+        if frameCache:
+            code = "\n".join((code, toString(self.getFrameCacheCode())))
 
         return self.applyCodeEffects(code, required)
 
@@ -603,8 +616,8 @@ nodeLabelMode = "DEFAULT"
 def updateNodeLabelMode():
     global nodeLabelMode
     nodeLabelMode = "DEFAULT"
-    if getExecutionCodeType() == "MEASURE":
-        nodeLabelMode = "MEASURE"
+    if getExecutionCodeType() in ("MEASURE", "MEASURE_MEMORY"):
+        nodeLabelMode = getExecutionCodeType()
 
 
 class CurrentSocketData:
@@ -0,0 +1,46 @@
+import os
+import bpy
+from bpy.props import *
+from .. utils.path import getPrivateDirectory
+from .. execution.frame_cache import getFramePath, loadFrame, getUnsupportedNodes
+
+def enabledChanged(self, context):
+    # loading the cache would skip the changes of the unsupported nodes
+    if self.enabled and not self.isSupported(self.id_data):
+        self.enabled = False
+
+class FrameCacheProperties(bpy.types.PropertyGroup):
+    bl_idname = "an_FrameCacheProperties"
+
+    enabled: BoolProperty(name = "Use Frame Cache", default = False,
+        description = ("Load baked frames from the frame cache instead of executing the node tree "
+                       "(only possible when all output nodes in the tree support it)"),
+        update = enabledChanged)
+
+    directory: StringProperty(name = "Directory", default = "", subtype = "DIR_PATH",
+        description = "Folder that contains the baked frames; a folder next to the .blend file is used when empty")
+
+    def load(self, tree, frame):
+        '''Returns False when the frame has not been baked.'''
+        if not self.enabled: return False
+        if not self.isSupported(tree): return False
+        path = self.getFramePath(tree, frame)
+        if path is None: return False
+        return loadFrame(path)
+
+    def isSupported(self, tree):
+        return len(getUnsupportedNodes(tree)) == 0
+
+    def getFramePath(self, tree, frame):
+        directory = self.getDirectory(tree)
+        if directory is None: return None
+        return getFramePath(directory, frame)
+
+    def getDirectory(self, tree):
+        '''Returns None when there is no folder that can be used.'''
+        if self.directory != "":
+            return bpy.path.abspath(self.directory)
+        if bpy.data.filepath == "":
+            # unsaved files use a folder that only the current user can write to
+            return getPrivateDirectory("frame_cache", bpy.path.clean_name(tree.name))
+        return os.path.join(bpy.path.abspath("//an_frame_cache"), bpy.path.clean_name(tree.name))
@@ -0,0 +1,246 @@
+'''
+Benchmarks for performance critical parts of Animation Nodes.
+
+The benchmarks don't need the user interface, so they can be run in the background:
+
+    blender --background --addons animation_nodes --python-exit-code 1 \
+        --python-expr "import animation_nodes.benchmarks as b; b.main()" -- [options]
+
+Options:
+    --baseline PATH     json file with the timings to compare with
+    --update            write the new timings into the baseline file
+    --tolerance FLOAT   allowed slowdown relative to the baseline (default: 0.25)
+    --filter TEXT       only run benchmarks whose name contains the text
+
+Timings depend on the machine, so no baseline is shipped. When the baseline
+file does not exist yet, the first run creates it.
+'''
+
+import sys
+import json
+import timeit
+import argparse
+from os.path import dirname, join, abspath, isfile
+
+defaultBaselinePath = join(dirname(dirname(abspath(__file__))), "benchmark_baseline.json")
+defaultSizes = (1_000, 100_000, 1_000_000)
+
+class Benchmark:
+    def __init__(self, name, function, sizes):
+        self.name = name
+        self.function = function
+        self.sizes = sizes
+
+    def iterKeys(self):
+        for size in self.sizes:
+            yield "{}[{}]".format(self.name, size), size
+
+    def measure(self, size, repetitions = 5):
+        # the function prepares the data and returns the callable that is measured
+        measuredFunction = self.function(size)
+        timer = timeit.Timer(measuredFunction)
+        number, _ = timer.autorange()
+        return min(timer.repeat(repetitions, number)) / number
+
+registeredBenchmarks = []
+
+def benchmark(name, sizes = defaultSizes):
+    def benchmarkDecorator(function):
+        registeredBenchmarks.append(Benchmark(name, function, sizes))
+        return function
+    return benchmarkDecorator
+
+
+# Runner
+##################################
+
+def main():
+    arguments = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog = "animation_nodes.benchmarks")
+    parser.add_argument("--baseline", default = defaultBaselinePath)
+    parser.add_argument("--update", action = "store_true")
+    parser.add_argument("--tolerance", type = float, default = 0.25)
+    parser.add_argument("--filter", default = "")
+    options = parser.parse_args(arguments)
+
+    success = runBenchmarks(options.baseline, options.update, options.tolerance, options.filter)
+    if not success:
+        sys.exit(1)
+
+def runBenchmarks(baselinePath = defaultBaselinePath, updateBaseline = False,
+                  tolerance = 0.25, nameFilter = ""):
+    if not isfile(baselinePath):
+        print("No baseline found, the timings of this run are used as baseline.\n")
+        updateBaseline = True
+
+    baseline = loadBaseline(baselinePath)
+    results = {}
+    regressions = []
+
+    try:
+        for key, benchmark, size in iterSelectedBenchmarks(nameFilter):
+            duration = benchmark.measure(size)
+            results[key] = duration
+
+            oldDuration = baseline.get(key)
+            if oldDuration is None:
+                print("{:<50} {:>12}".format(key, prettyDuration(duration)))
+            else:
+                change = duration / oldDuration - 1
+                isRegression = change > tolerance
+                if isRegression:
+                    regressions.append(key)
+                print("{:<50} {:>12} {:>+8.1%}{}".format(key, prettyDuration(duration), change,
+                    "  <-- regression" if isRegression else ""))
+    finally:
+        removeTemporaryTree()
+
+    if updateBaseline:
+        baseline.update(results)
+        with open(baselinePath, "w") as f:
+            json.dump(baseline, f, indent = 2, sort_keys = True)
+        print("\nBaseline written to {}".format(baselinePath))
+
+    if len(regressions) > 0:
+        print("\n{} benchmarks are more than {:.0%} slower than the baseline:".format(
+            len(regressions), tolerance))
+        for key in regressions:
+            print("  " + key)
+        return False
+    return True
+
+def iterSelectedBenchmarks(nameFilter):
+    for benchmark in registeredBenchmarks:
+        for key, size in benchmark.iterKeys():
+            if nameFilter in key:
+                yield key, benchmark, size
+
+def loadBaseline(path):
+    if not isfile(path): return {}
+    with open(path) as f:
+        return json.load(f)
+
+def prettyDuration(seconds):
+    if seconds > 1: return "{:.3f} s".format(seconds)
+    if seconds > 1e-3: return "{:.3f} ms".format(seconds * 1e3)
+    return "{:.3f} us".format(seconds * 1e6)
+
+
+# Benchmarks
+##################################
+
+def getRandomVectors(amount, seed = 0):
+    import numpy
+    from . data_structures import Vector3DList
+    values = numpy.random.RandomState(seed).uniform(-1, 1, amount * 3)
+    return Vector3DList.fromNumpyArray(values.astype("float32"))
+
+@benchmark("Vector3DList.copy")
+def bench_Vector3DListCopy(size):
+    vectors = getRandomVectors(size)
+    return vectors.copy
+
+@benchmark("Vector3DList.transform")
+def bench_Vector3DListTransform(size):
+    from mathutils import Matrix
+    vectors = getRandomVectors(size)
+    matrix = Matrix.Rotation(0.5, 4, "Z")
+    return lambda: vectors.transform(matrix)
+
+@benchmark("Vector3DList.normalize")
+def bench_Vector3DListNormalize(size):
+    vectors = getRandomVectors(size)
+    return vectors.normalize
+
+@benchmark("Matrix4x4List.transform")
+def bench_Matrix4x4ListTransform(size):
+    from mathutils import Matrix
+    from . data_structures import Matrix4x4List
+    matrices = Matrix4x4List.fromValue(Matrix.Translation((1, 2, 3)), length = size)
+    matrix = Matrix.Rotation(0.5, 4, "Z")
+    return lambda: matrices.transform(matrix)
+
+@benchmark("Matrix4x4List.toEulers")
+def bench_Matrix4x4ListToEulers(size):
+    from mathutils import Matrix
+    from . data_structures import Matrix4x4List
+    matrices = Matrix4x4List.fromValue(Matrix.Rotation(0.5, 4, "Z"), length = size)
+    return lambda: matrices.toEulers(isNormalized = True)
+
+@benchmark("FalloffEvaluator.evaluateList")
+def bench_FalloffEvaluateList(size):
+    from . data_structures.falloffs.evaluation import FalloffEvaluator
+    from . nodes.falloff.directional_falloff import BiDirectionalFalloff
+    vectors = getRandomVectors(size)
+    falloff = BiDirectionalFalloff((0, 0, 0), (0, 0, 1), 2)
+    evaluator = FalloffEvaluator.create(falloff, "LOCATION", clamped = True)
+    return lambda: evaluator.evaluateList(vectors)
+
+@benchmark("PolySpline.getDistributedPoints")
+def bench_SplineDistributedPoints(size):
+    from . data_structures import PolySpline
+    spline = PolySpline(getRandomVectors(1000))
+    spline.ensureUniformConverter(1000)
+    return lambda: spline.getDistributedPoints(size, distributionType = "UNIFORM")
+
+@benchmark("KDTree.construct")
+def bench_KDTreeConstruct(size):
+    from . data_structures import KDTree
+    vectors = getRandomVectors(size)
+    return lambda: KDTree(vectors)
+
+@benchmark("KDTree.findNearestList")
+def bench_KDTreeFindNearestList(size):
+    from . data_structures import KDTree
+    tree = KDTree(getRandomVectors(size))
+    searchVectors = getRandomVectors(size, seed = 1)
+    return lambda: tree.findNearestList(searchVectors)
+
+@benchmark("TriangleBVH.isInsideList", sizes = (1_000, 50_000))
+def bench_TriangleBVHIsInsideList(size):
+    from . data_structures import TriangleBVH
+    mesh = getGridMesh(100)
+    bvh = TriangleBVH(mesh.vertices, mesh.polygons)
+    vectors = getRandomVectors(size)
+    return lambda: bvh.isInsideList(vectors)
+
+@benchmark("calculateVertexNormals", sizes = (100, 300, 1000))
+def bench_CalculateVertexNormals(size):
+    from . data_structures.meshes.mesh_data import calculateVertexNormals
+    mesh = getGridMesh(size)
+    polygonNormals = mesh.getPolygonNormals()
+    return lambda: calculateVertexNormals(mesh.vertices, mesh.polygons, polygonNormals)
+
+@benchmark("Mesh.triangulateMesh", sizes = (100, 300, 1000))
+def bench_TriangulateMesh(size):
+    mesh = getGridMesh(size)
+    return lambda: mesh.copy().triangulateMesh("FAN")
+
+@benchmark("DistributeMatrices.execute_Grid", sizes = (10, 50, 100))
+def bench_DistributeMatricesGrid(size):
+    node = getTemporaryNode("an_DistributeMatricesNode")
+    node.distanceMode = "SIZE"
+    return lambda: node.execute_Grid(size, size, size, 1, 1, 1)
+
+def getGridMesh(divisions):
+    from . algorithms.mesh_generation.grid import getGridMesh_Size
+    return getGridMesh_Size(1, 1, divisions, divisions)
+
+temporaryTreeName = "AN Benchmark Tree"
+
+def getTemporaryNode(idName):
+    import bpy
+    tree = bpy.data.node_groups.get(temporaryTreeName)
+    if tree is None:
+        tree = bpy.data.node_groups.new(temporaryTreeName, "an_AnimationNodeTree")
+    # reuse the node so that repeated runs don't fill the tree
+    for node in tree.nodes:
+        if node.bl_idname == idName:
+            return node
+    return tree.nodes.new(idName)
+
+def removeTemporaryTree():
+    import bpy
+    tree = bpy.data.node_groups.get(temporaryTreeName)
+    if tree is not None:
+        bpy.data.node_groups.remove(tree)
@@ -7,10 +7,14 @@ from . data_structures.virtual_list.virtual_clists cimport *
 
 from . data_structures.default_lists.c_default_list cimport CDefaultList
 from . data_structures.meshes.mesh_data cimport Mesh
+from . data_structures.kd_tree cimport KDTree
+from . data_structures.triangle_bvh cimport TriangleBVH
+from . data_structures.point_grid cimport PointGrid
 
 from . data_structures.splines.base_spline cimport Spline
 from . data_structures.splines.poly_spline cimport PolySpline
 from . data_structures.splines.bezier_spline cimport BezierSpline
+from . data_structures.splines.spline_collection cimport SplineCollection
 
 from . data_structures.attributes.attribute cimport Attribute
 
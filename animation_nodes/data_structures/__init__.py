@@ -4,6 +4,9 @@ def importDataStructures():
 
     from . lists.clist import CList
     from . meshes.mesh_data import Mesh
+    from . kd_tree import KDTree
+    from . triangle_bvh import TriangleBVH
+    from . point_grid import PointGrid
     from . gpencils.gp_layer_data import GPLayer
     from . gpencils.gp_frame_data import GPFrame
     from . gpencils.gp_stroke_data import GPStroke
@@ -24,6 +27,7 @@ def importDataStructures():
     from . splines.base_spline import Spline
     from . splines.poly_spline import PolySpline
     from . splines.bezier_spline import BezierSpline
+    from . splines.spline_collection import SplineCollection
     from . default_lists.c_default_list import CDefaultList
     from . attributes.attribute import Attribute
     from . attributes.attribute import AttributeType
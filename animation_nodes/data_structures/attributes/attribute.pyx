@@ -71,6 +71,9 @@ cdef class Attribute:
         return Attribute(self.name, self.type, self.domain, self.dataType,
                          self.data.copy())
 
+    def __reduce__(self):
+        return (Attribute, (self.name, int(self.type), int(self.domain), int(self.dataType), self.data))
+
     def replicate(self, Py_ssize_t amount):
         return Attribute(self.name, self.type, self.domain, self.dataType,
                          self.data.repeated(amount = amount))
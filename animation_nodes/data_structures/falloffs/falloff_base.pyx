@@ -19,6 +19,11 @@ cdef class BaseFalloff(Falloff):
 
     cdef void evaluateList(self, void *objects, Py_ssize_t startIndex,
                            Py_ssize_t amount, float *target):
+        # This loop stays serial, evaluate is not nogil. Some falloffs need the GIL
+        # for every element: the sound falloff computes a spectrum, the custom
+        # falloff indexes a Python list and the spline falloffs build their BVH
+        # lazily. Falloffs that can run in parallel override this method,
+        # e.g. the noise falloff.
         cdef Py_ssize_t i
         cdef Py_ssize_t elementSize = getSizeOfFalloffDataType(self.dataType)
         for i in range(amount):
@@ -39,6 +44,8 @@ cdef class CompoundFalloff(Falloff):
         raise NotImplementedError()
 
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
+        # Serial for the same reason as in BaseFalloff.evaluateList. Also, the
+        # buffer would be needed once per thread.
         cdef Py_ssize_t i, j
         cdef Py_ssize_t depsAmount = len(self.getDependencies())
         cdef float *buffer = <float*>malloc(sizeof(float) * depsAmount)
@@ -0,0 +1,20 @@
+from .. math cimport Vector3
+from . lists.base_lists cimport Vector3DList, LongList, DoubleList, CharList
+
+cdef class KDTree:
+    cdef readonly Vector3DList points
+    cdef LongList indices
+    cdef CharList axes
+
+    cdef Py_ssize_t getLength(self)
+    cdef void build(self, Py_ssize_t start, Py_ssize_t end)
+    cdef char getLargestExtentAxis(self, Py_ssize_t start, Py_ssize_t end)
+
+    cdef Py_ssize_t findNearest_LowLevel(self, Vector3* point, float* distanceSquared)
+    cdef Py_ssize_t findNearestN_LowLevel(self, Vector3* point, Py_ssize_t amount,
+                                          double* distances, long* indices)
+    cdef void findInRadius_LowLevel(self, Vector3* point, float radius,
+                                    DoubleList distances, LongList indices)
+
+cdef void heapify(double* distances, long* indices, Py_ssize_t length)
+cdef void sortHeap(double* distances, long* indices, Py_ssize_t length)
@@ -0,0 +1,404 @@
+from libc.math cimport sqrt, INFINITY
+from .. math cimport toVector3, toPyVector3, distanceSquaredVec3
+
+cdef class KDTree:
+    '''
+    Balanced 3D KD-Tree that is stored implicitly in flat arrays.
+    The point in the middle of every range of points splits the range
+    into the two subtrees, the split axis is stored per point.
+
+    The methods find, find_n and find_range behave like the ones
+    of mathutils.kdtree.KDTree. The list methods search for many points
+    at once and return flat lists; offsets tell where the results
+    of every search point start.
+    '''
+
+    def __cinit__(self, Vector3DList points = None):
+        cdef Py_ssize_t i
+        if points is None:
+            points = Vector3DList()
+
+        self.points = points.copy()
+        self.indices = LongList(length = points.length)
+        self.axes = CharList(length = points.length)
+        for i in range(points.length):
+            self.indices.data[i] = i
+            self.axes.data[i] = 0
+
+        self.build(0, points.length)
+
+    def __len__(self):
+        return self.getLength()
+
+    cdef Py_ssize_t getLength(self):
+        return self.points.length
+
+    def getMemoryUsage(self):
+        return (self.points.getMemoryUsage() +
+                self.indices.getMemoryUsage() +
+                self.axes.getMemoryUsage())
+
+    def __repr__(self):
+        return "<AN KDTree with {} points>".format(self.getLength())
+
+
+    # Construction
+    ###############################################
+
+    cdef void build(self, Py_ssize_t start, Py_ssize_t end):
+        cdef Py_ssize_t middle
+        cdef char axis
+        while end - start > 1:
+            middle = (start + end) // 2
+            axis = self.getLargestExtentAxis(start, end)
+            selectNth(self.points.data, self.indices.data, start, end, middle, axis)
+            self.axes.data[middle] = axis
+            self.build(start, middle)
+            start = middle + 1
+
+    cdef char getLargestExtentAxis(self, Py_ssize_t start, Py_ssize_t end):
+        cdef Vector3 low = self.points.data[start]
+        cdef Vector3 high = self.points.data[start]
+        cdef Vector3 *point
+        cdef Py_ssize_t i
+        for i in range(start + 1, end):
+            point = self.points.data + i
+            low.x = min(low.x, point.x)
+            low.y = min(low.y, point.y)
+            low.z = min(low.z, point.z)
+            high.x = max(high.x, point.x)
+            high.y = max(high.y, point.y)
+            high.z = max(high.z, point.z)
+
+        cdef float extentX = high.x - low.x
+        cdef float extentY = high.y - low.y
+        cdef float extentZ = high.z - low.z
+        if extentX >= extentY and extentX >= extentZ: return 0
+        if extentY >= extentZ: return 1
+        return 2
+
+
+    # Single Point Search
+    ###############################################
+
+    def find(self, co):
+        cdef Vector3 point = toVector3(co)
+        cdef float distanceSquared
+        cdef Py_ssize_t index = self.findNearest_LowLevel(&point, &distanceSquared)
+        if index == -1:
+            return None, None, None
+        return (toPyVector3(self.points.data + index),
+                self.indices.data[index], sqrt(distanceSquared))
+
+    def find_n(self, co, Py_ssize_t n):
+        vectors, indices, distances = self.findNearestN(co, n)
+        return list(zip(vectors, indices, distances))
+
+    def find_range(self, co, float radius):
+        vectors, indices, distances = self.findInRadius(co, radius)
+        return list(zip(vectors, indices, distances))
+
+    def findNearestN(self, co, Py_ssize_t amount):
+        cdef Vector3 point = toVector3(co)
+        amount = max(min(amount, self.getLength()), 0)
+        cdef DoubleList distances = DoubleList(length = amount)
+        cdef LongList indices = LongList(length = amount)
+        cdef Py_ssize_t foundAmount = self.findNearestN_LowLevel(
+            &point, amount, distances.data, indices.data)
+        distances.length = foundAmount
+        indices.length = foundAmount
+        return self.finishSearchResult(indices, distances)
+
+    def findInRadius(self, co, float radius):
+        cdef Vector3 point = toVector3(co)
+        cdef DoubleList distances = DoubleList()
+        cdef LongList indices = LongList()
+        self.findInRadius_LowLevel(&point, max(radius, 0), distances, indices)
+        return self.finishSearchResult(indices, distances)
+
+
+    # List Search
+    ###############################################
+
+    def findNearestList(self, Vector3DList points):
+        '''
+        Returns the nearest point, its index and distance for every search point.
+        When the tree is empty, the index is 0 and the distance -1.
+        '''
+        cdef Py_ssize_t i, index
+        cdef float distanceSquared
+        cdef Vector3DList vectors = Vector3DList(length = points.length)
+        cdef LongList indices = LongList(length = points.length)
+        cdef DoubleList distances = DoubleList(length = points.length)
+
+        for i in range(points.length):
+            index = self.findNearest_LowLevel(points.data + i, &distanceSquared)
+            if index == -1:
+                vectors.data[i] = Vector3(0, 0, 0)
+                indices.data[i] = 0
+                distances.data[i] = -1
+            else:
+                vectors.data[i] = self.points.data[index]
+                indices.data[i] = self.indices.data[index]
+                distances.data[i] = sqrt(distanceSquared)
+        return vectors, indices, distances
+
+    def findNearestNList(self, Vector3DList points, Py_ssize_t amount):
+        '''
+        Returns the flat lists of found points, indices and distances
+        and the offset of the results of every search point.
+        The results of a search point are sorted by distance.
+        '''
+        cdef Py_ssize_t i, foundAmount, totalAmount = 0
+        amount = max(min(amount, self.getLength()), 0)
+        cdef DoubleList distances = DoubleList(length = points.length * amount)
+        cdef LongList indices = LongList(length = points.length * amount)
+        cdef LongList offsets = LongList(length = points.length + 1)
+
+        for i in range(points.length):
+            offsets.data[i] = totalAmount
+            foundAmount = self.findNearestN_LowLevel(points.data + i, amount,
+                distances.data + totalAmount, indices.data + totalAmount)
+            totalAmount += foundAmount
+        offsets.data[points.length] = totalAmount
+
+        distances.length = totalAmount
+        indices.length = totalAmount
+        return self.finishSearchResult(indices, distances) + (offsets, )
+
+    def findInRadiusList(self, Vector3DList points, float radius):
+        '''
+        Returns the flat lists of found points, indices and distances
+        and the offset of the results of every search point.
+        The results of a search point are sorted by distance.
+        '''
+        cdef Py_ssize_t i
+        cdef DoubleList distances = DoubleList()
+        cdef LongList indices = LongList()
+        cdef LongList offsets = LongList(length = points.length + 1)
+
+        radius = max(radius, 0)
+        for i in range(points.length):
+            offsets.data[i] = indices.length
+            self.findInRadius_LowLevel(points.data + i, radius, distances, indices)
+        offsets.data[points.length] = indices.length
+
+        return self.finishSearchResult(indices, distances) + (offsets, )
+
+    def finishSearchResult(self, LongList indices, DoubleList distances):
+        # the low level functions return internal indices and squared distances
+        cdef Py_ssize_t i, index
+        cdef Vector3DList vectors = Vector3DList(length = indices.length)
+        for i in range(indices.length):
+            index = indices.data[i]
+            vectors.data[i] = self.points.data[index]
+            indices.data[i] = self.indices.data[index]
+            distances.data[i] = sqrt(distances.data[i])
+        return vectors, indices, distances
+
+
+    # Low Level Search
+    ###############################################
+
+    cdef Py_ssize_t findNearest_LowLevel(self, Vector3* point, float* distanceSquared):
+        '''Returns the internal index of the nearest point or -1 when the tree is empty.'''
+        cdef Py_ssize_t index = -1
+        distanceSquared[0] = INFINITY
+        searchNearest(self.points.data, self.axes.data, 0, self.getLength(),
+                      point, &index, distanceSquared)
+        return index
+
+    cdef Py_ssize_t findNearestN_LowLevel(self, Vector3* point, Py_ssize_t amount,
+                                          double* distances, long* indices):
+        '''
+        Writes up to amount internal indices and squared distances into the arrays.
+        They are sorted by distance. Returns the amount of found points.
+        '''
+        cdef BoundedHeap heap
+        if amount <= 0:
+            return 0
+        heap.distances = distances
+        heap.indices = indices
+        heap.length = 0
+        heap.capacity = amount
+        searchNearestN(self.points.data, self.axes.data, 0, self.getLength(), point, &heap)
+        sortHeap(distances, indices, heap.length)
+        return heap.length
+
+    cdef void findInRadius_LowLevel(self, Vector3* point, float radius,
+                                    DoubleList distances, LongList indices):
+        '''Appends the internal indices and squared distances sorted by distance.'''
+        cdef Py_ssize_t start = indices.length
+        searchInRadius(self.points.data, self.axes.data, 0, self.getLength(),
+                       point, radius * radius, distances, indices)
+        heapify(distances.data + start, indices.data + start, indices.length - start)
+        sortHeap(distances.data + start, indices.data + start, indices.length - start)
+
+
+# Tree Traversal
+###############################################
+
+cdef inline float getCoordinate(Vector3* v, char axis):
+    return (<float*>v)[axis]
+
+cdef void searchNearest(Vector3* points, char* axes, Py_ssize_t start, Py_ssize_t end,
+                        Vector3* point, Py_ssize_t* bestIndex, float* bestDistance):
+    cdef Py_ssize_t middle
+    cdef float distance, difference
+    while start < end:
+        middle = (start + end) // 2
+        distance = distanceSquaredVec3(points + middle, point)
+        if distance < bestDistance[0]:
+            bestDistance[0] = distance
+            bestIndex[0] = middle
+
+        difference = getCoordinate(point, axes[middle]) - getCoordinate(points + middle, axes[middle])
+        if difference < 0:
+            searchNearest(points, axes, start, middle, point, bestIndex, bestDistance)
+            if difference * difference >= bestDistance[0]: return
+            start = middle + 1
+        else:
+            searchNearest(points, axes, middle + 1, end, point, bestIndex, bestDistance)
+            if difference * difference >= bestDistance[0]: return
+            end = middle
+
+cdef struct BoundedHeap:
+    double* distances
+    long* indices
+    Py_ssize_t length
+    Py_ssize_t capacity
+
+cdef inline double getHeapLimit(BoundedHeap* heap):
+    if heap.length < heap.capacity:
+        return INFINITY
+    return heap.distances[0]
+
+cdef void searchNearestN(Vector3* points, char* axes, Py_ssize_t start, Py_ssize_t end,
+                         Vector3* point, BoundedHeap* heap):
+    cdef Py_ssize_t middle
+    cdef float distance, difference
+    while start < end:
+        middle = (start + end) // 2
+        distance = distanceSquaredVec3(points + middle, point)
+        if distance < getHeapLimit(heap):
+            pushBoundedHeap(heap, distance, middle)
+
+        difference = getCoordinate(point, axes[middle]) - getCoordinate(points + middle, axes[middle])
+        if difference < 0:
+            searchNearestN(points, axes, start, middle, point, heap)
+            if difference * difference >= getHeapLimit(heap): return
+            start = middle + 1
+        else:
+            searchNearestN(points, axes, middle + 1, end, point, heap)
+            if difference * difference >= getHeapLimit(heap): return
+            end = middle
+
+cdef void searchInRadius(Vector3* points, char* axes, Py_ssize_t start, Py_ssize_t end,
+                         Vector3* point, float radiusSquared,
+                         DoubleList distances, LongList indices):
+    cdef Py_ssize_t middle
+    cdef float distance, difference
+    while start < end:
+        middle = (start + end) // 2
+        distance = distanceSquaredVec3(points + middle, point)
+        if distance <= radiusSquared:
+            distances.append_LowLevel(distance)
+            indices.append_LowLevel(middle)
+
+        difference = getCoordinate(point, axes[middle]) - getCoordinate(points + middle, axes[middle])
+        if difference < 0:
+            searchInRadius(points, axes, start, middle, point, radiusSquared, distances, indices)
+            if difference * difference > radiusSquared: return
+            start = middle + 1
+        else:
+            searchInRadius(points, axes, middle + 1, end, point, radiusSquared, distances, indices)
+            if difference * difference > radiusSquared: return
+            end = middle
+
+
+# Median Selection
+###############################################
+
+cdef void selectNth(Vector3* points, long* indices,
+                    Py_ssize_t start, Py_ssize_t end, Py_ssize_t n, char axis):
+    '''
+    Reorders the points in the range so that the point at index n
+    is the one that would be there if the range was sorted along the axis.
+    A three-way partition is used, so that many equal coordinates stay fast.
+    '''
+    cdef Py_ssize_t left = start
+    cdef Py_ssize_t right = end - 1
+    cdef Py_ssize_t lower, upper, i
+    cdef float pivot, value
+
+    while left < right:
+        pivot = getCoordinate(points + (left + right) // 2, axis)
+        lower = left
+        upper = right
+        i = left
+        while i <= upper:
+            value = getCoordinate(points + i, axis)
+            if value < pivot:
+                swapPoints(points, indices, lower, i)
+                lower += 1
+                i += 1
+            elif value > pivot:
+                swapPoints(points, indices, i, upper)
+                upper -= 1
+            else:
+                i += 1
+
+        if n < lower: right = lower - 1
+        elif n > upper: left = upper + 1
+        else: return
+
+cdef inline void swapPoints(Vector3* points, long* indices, Py_ssize_t a, Py_ssize_t b):
+    points[a], points[b] = points[b], points[a]
+    indices[a], indices[b] = indices[b], indices[a]
+
+
+# Max Heap
+###############################################
+
+cdef void pushBoundedHeap(BoundedHeap* heap, double distance, long index):
+    cdef Py_ssize_t i, parent
+    if heap.length < heap.capacity:
+        i = heap.length
+        heap.length += 1
+        while i > 0:
+            parent = (i - 1) // 2
+            if heap.distances[parent] >= distance: break
+            heap.distances[i] = heap.distances[parent]
+            heap.indices[i] = heap.indices[parent]
+            i = parent
+        heap.distances[i] = distance
+        heap.indices[i] = index
+    else:
+        heap.distances[0] = distance
+        heap.indices[0] = index
+        siftDown(heap.distances, heap.indices, 0, heap.length)
+
+cdef void siftDown(double* distances, long* indices, Py_ssize_t i, Py_ssize_t length):
+    cdef Py_ssize_t child
+    while True:
+        child = 2 * i + 1
+        if child >= length: return
+        if child + 1 < length and distances[child + 1] > distances[child]:
+            child += 1
+        if distances[i] >= distances[child]: return
+        distances[i], distances[child] = distances[child], distances[i]
+        indices[i], indices[child] = indices[child], indices[i]
+        i = child
+
+cdef void heapify(double* distances, long* indices, Py_ssize_t length):
+    cdef Py_ssize_t i
+    for i in range(length // 2 - 1, -1, -1):
+        siftDown(distances, indices, i, length)
+
+cdef void sortHeap(double* distances, long* indices, Py_ssize_t length):
+    '''Turns a max heap into an array that is sorted in ascending order.'''
+    cdef Py_ssize_t end
+    for end in range(length - 1, 0, -1):
+        distances[0], distances[end] = distances[end], distances[0]
+        indices[0], indices[end] = indices[end], indices[0]
+        siftDown(distances, indices, 0, end)
@@ -16,6 +16,10 @@ cdef class CList:
     cdef Py_ssize_t getCapacity(self):
         raise NotImplementedError()
 
+    def getMemoryUsage(self):
+        '''Amount of bytes that are allocated for the elements.'''
+        return self.getCapacity() * self.getElementSize()
+
     def repeated(self, *, Py_ssize_t length = -1, Py_ssize_t amount = -1, default = None):
         if length < 0 and amount < 0:
             raise ValueError("'length' or 'amount' has to be non-negative")
@@ -16,6 +16,11 @@ cdef class PolygonIndicesList:
     cdef long getLength(self):
         return self.polyStarts.length
 
+    def getMemoryUsage(self):
+        return (self.indices.getMemoryUsage() +
+                self.polyStarts.getMemoryUsage() +
+                self.polyLengths.getMemoryUsage())
+
     def __getitem__(self, key):
         if isinstance(key, int):
             return self.getElementAtIndex(key)
@@ -101,6 +106,12 @@ cdef class PolygonIndicesList:
         newList.polyLengths.overwrite(self.polyLengths)
         return newList
 
+    def __reduce__(self):
+        return (PolygonIndicesList, (), (self.indices, self.polyStarts, self.polyLengths))
+
+    def __setstate__(self, state):
+        self.indices, self.polyStarts, self.polyLengths = state
+
     cpdef index(self, value):
         cdef:
             UIntegerList _value = UIntegerList.fromValues(value)
@@ -1,6 +1,7 @@
+import pickle
 from mathutils import Vector
 from unittest import TestCase
-from . base_lists import IntegerList, FloatList
+from . base_lists import IntegerList, FloatList, Vector3DList, BooleanList
 
 class TestInsertion(TestCase):
     def setUp(self):
@@ -96,6 +97,26 @@ class TestCopy(TestCase):
         self.assertEqual(len(a), 1)
         self.assertEqual(len(b), 0)
 
+class TestPickle(TestCase):
+    def testNumbers(self):
+        a = FloatList.fromValues([0, 1.5, -2])
+        self.assertEqual(pickle.loads(pickle.dumps(a)), a)
+
+    def testVectors(self):
+        a = Vector3DList.fromValues([(0, 1, 2), (3, 4, 5)])
+        b = pickle.loads(pickle.dumps(a))
+        self.assertIsInstance(b, Vector3DList)
+        self.assertEqual(b, a)
+
+    def testEmpty(self):
+        b = pickle.loads(pickle.dumps(BooleanList()))
+        self.assertIsInstance(b, BooleanList)
+        self.assertEqual(len(b), 0)
+
+    def testInvalidBytes(self):
+        with self.assertRaises(ValueError):
+            FloatList.fromBytes(b"abc")
+
 class TestAppend(TestCase):
     def testEmptyList(self):
         a = IntegerList()
@@ -118,6 +139,15 @@ class TestAppend(TestCase):
             a.append(i)
         self.assertEqual(a, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
 
+    def testPreallocated(self):
+        a = IntegerList(capacity = 10)
+        for i in range(3):
+            a.append(i)
+        self.assertEqual(a, [0, 1, 2])
+        a.freeUnusedMemory()
+        self.assertEqual(a, [0, 1, 2])
+        self.assertEqual(a.getMemoryUsage(), IntegerList.fromValues((0, 1, 2)).getMemoryUsage())
+
 class TestExtend(TestCase):
     def testEmptyList(self):
         a = IntegerList()
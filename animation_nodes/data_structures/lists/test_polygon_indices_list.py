@@ -1,3 +1,4 @@
+import pickle
 from unittest import TestCase
 from . base_lists import LongList
 from . polygon_indices_list import PolygonIndicesList
@@ -34,6 +35,14 @@ class TestCopy(TestCase):
         self.assertEqual(copy[0], (1, 2, 3))
         self.assertEqual(copy[1], (4, 5, 6, 7))
 
+class TestPickle(TestCase):
+    def testNormal(self):
+        polygons = PolygonIndicesList.fromValues([(1, 2, 3), (4, 5, 6, 7)])
+        result = pickle.loads(pickle.dumps(polygons))
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0], (1, 2, 3))
+        self.assertEqual(result[1], (4, 5, 6, 7))
+
 class TestReversed(TestCase):
     def testNormal(self):
         self.list = PolygonIndicesList.fromValues([
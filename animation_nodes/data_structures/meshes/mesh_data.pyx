@@ -1,7 +1,10 @@
 # cython: profile=True
+# setup: options = openmp
 import textwrap
 import functools
 from .. lists.clist cimport CList
+from cython.parallel cimport prange
+from ... utils.parallel cimport getThreadAmount
 from collections import OrderedDict
 from . validate import createValidEdgesList, checkMeshData, calculateLoopEdges
 from .. attributes.attribute import AttributeType, AttributeDomain, AttributeDataType
@@ -85,6 +88,21 @@ cdef class Mesh:
             self.vertexWeightAttributes,
         )
 
+    def getMemoryUsage(self):
+        '''Amount of bytes that are allocated for the mesh data and attributes.'''
+        cdef Attribute attribute
+        cdef Py_ssize_t memory = 0
+        memory += self.vertices.getMemoryUsage()
+        memory += self.edges.getMemoryUsage()
+        memory += self.polygons.getMemoryUsage()
+        for attributes in self.getAttributeDictionaries():
+            for attribute in attributes.values():
+                memory += attribute.data.getMemoryUsage()
+        for data in self.derivedMeshDataCache.values():
+            if hasattr(data, "getMemoryUsage"):
+                memory += data.getMemoryUsage()
+        return memory
+
     def verticesTransformed(self):
         self.derivedMeshDataCache.pop("Vertex Normals", None)
         self.derivedMeshDataCache.pop("Polygon Centers", None)
@@ -241,6 +259,14 @@ cdef class Mesh:
         mesh.copyAttributes(self)
         return mesh
 
+    def __reduce__(self):
+        # derived data is not stored, it can be calculated again
+        return (Mesh, (self.vertices, self.edges, self.polygons, True), self.getAttributeDictionaries())
+
+    def __setstate__(self, state):
+        for attributes, storedAttributes in zip(self.getAttributeDictionaries(), state):
+            attributes.update(storedAttributes)
+
     def copyAttributes(self, Mesh source):
         for (meshAttributes, sourceMeshAttributes) in zip(
              self.getAttributeDictionaries(), source.getAttributeDictionaries()):
@@ -354,50 +380,105 @@ def calculatePolygonNormals(Vector3DList vertices, PolygonIndicesList polygons):
     cdef unsigned int *indices = polygons.indices.data
     cdef unsigned int *polyStarts = polygons.polyStarts.data
     cdef unsigned int *polyLengths = polygons.polyLengths.data
-    cdef unsigned int start, length
-
-    cdef Py_ssize_t i
-    cdef Vector3 dirA, dirB
-    for i in range(polygons.getLength()):
-        start = polyStarts[i]
-        length = polyLengths[i]
 
-        subVec3(&dirA, _vertices + indices[start + 1], _vertices + indices[start])
-        subVec3(&dirB, _vertices + indices[start + length - 1], _vertices + indices[start])
-        crossVec3(_normals + i, &dirA, &dirB)
+    cdef Py_ssize_t i, amount = polygons.getLength()
+    for i in prange(amount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(amount, 20000)):
+        calculatePolygonNormal(_normals + i, _vertices, indices + polyStarts[i], polyLengths[i])
 
     return normals
 
+cdef void calculatePolygonNormal(Vector3 *normal, Vector3 *vertices,
+                                 unsigned int *polygon, unsigned int length) nogil:
+    cdef Vector3 dirA, dirB
+    subVec3(&dirA, vertices + polygon[1], vertices + polygon[0])
+    subVec3(&dirB, vertices + polygon[length - 1], vertices + polygon[0])
+    crossVec3(normal, &dirA, &dirB)
+
 
 def calculateVertexNormals(Vector3DList vertices, PolygonIndicesList polygons, Vector3DList polygonNormals):
     cdef Vector3DList vertexNormals = Vector3DList(length = vertices.length)
     cdef Vector3 *_vertexNormals = vertexNormals.data
     vertexNormals.fill(0)
 
-    cdef Vector3 *_polygonNormals = polygonNormals.data
+    cdef Py_ssize_t i, polygonAmount = polygons.getLength()
+    cdef Vector3DList normalizedNormals = Vector3DList(length = polygonAmount)
+    cdef Vector3 *_normalizedNormals = normalizedNormals.data
+    for i in prange(polygonAmount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(polygonAmount, 20000)):
+        normalizeVec3(_normalizedNormals + i, polygonNormals.data + i)
+
+    # Both ways sum up the normals of a vertex in the order of its polygons,
+    # so the result does not depend on the amount of threads.
+    cdef Py_ssize_t cornerAmount = polygons.indices.length
+    if getThreadAmount(cornerAmount, 100000) > 1:
+        sumPolygonNormalsPerVertex(vertices.length, polygons, _normalizedNormals, _vertexNormals)
+    else:
+        sumPolygonNormalsPerPolygon(vertices.length, polygons, _normalizedNormals, _vertexNormals)
+
+    for i in range(vertices.length):
+        if isExactlyZeroVec3(_vertexNormals + i):
+            # default: vertex location as normal
+            _vertexNormals[i] = vertices.data[i]
+
+    return vertexNormals
 
+cdef sumPolygonNormalsPerPolygon(Py_ssize_t vertexAmount, PolygonIndicesList polygons,
+                                 Vector3 *normalizedNormals, Vector3 *vertexNormals):
     cdef unsigned int *indices = polygons.indices.data
     cdef unsigned int *polyStarts = polygons.polyStarts.data
     cdef unsigned int *polyLengths = polygons.polyLengths.data
-    cdef unsigned int start, length
 
-    cdef Py_ssize_t i,j
-    cdef Vector3 normalizedNormal
+    cdef Py_ssize_t i, j
     for i in range(polygons.getLength()):
-        start = polyStarts[i]
-        length = polyLengths[i]
-        normalizeVec3(&normalizedNormal, _polygonNormals + i)
-
-        for j in range(start, start + length):
+        for j in range(polyStarts[i], polyStarts[i] + polyLengths[i]):
+            if indices[j] < vertexAmount:
+                # can be improved by weighting by angle
+                addVec3_Inplace(vertexNormals + indices[j], normalizedNormals + i)
+
+cdef sumPolygonNormalsPerVertex(Py_ssize_t vertexAmount, PolygonIndicesList polygons,
+                                Vector3 *normalizedNormals, Vector3 *vertexNormals):
+    # Every thread writes only to its own range of vertices.
+    cdef LongList polygonStarts, vertexPolygons
+    polygonStarts, vertexPolygons = getPolygonsOfVertices(vertexAmount, polygons)
+
+    cdef long *_polygonStarts = polygonStarts.data
+    cdef long *_vertexPolygons = vertexPolygons.data
+    cdef Py_ssize_t i, j, loopAmount = vertexPolygons.length
+    for i in prange(vertexAmount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(loopAmount, 100000)):
+        for j in range(_polygonStarts[i], _polygonStarts[i + 1]):
             # can be improved by weighting by angle
-            addVec3_Inplace(_vertexNormals + indices[j], &normalizedNormal)
+            addVec3_Inplace(vertexNormals + i, normalizedNormals + _vertexPolygons[j])
 
-    for i in range(vertices.length):
-        if isExactlyZeroVec3(_vertexNormals + i):
-            # default: vertex location as normal
-            _vertexNormals[i] = vertices.data[i]
+cdef getPolygonsOfVertices(Py_ssize_t vertexAmount, PolygonIndicesList polygons):
+    '''
+    Returns the indices of the polygons that use a vertex, sorted by vertex and polygon.
+    The polygons of vertex i are in the range polygonStarts[i] to polygonStarts[i + 1].
+    '''
+    cdef unsigned int *indices = polygons.indices.data
+    cdef unsigned int *polyStarts = polygons.polyStarts.data
+    cdef unsigned int *polyLengths = polygons.polyLengths.data
 
-    return vertexNormals
+    cdef LongList polygonStarts = LongList.fromValue(0, length = vertexAmount + 1)
+    cdef Py_ssize_t i, j
+    for i in range(polygons.indices.length):
+        if indices[i] < vertexAmount:
+            polygonStarts.data[indices[i] + 1] += 1
+    for i in range(vertexAmount):
+        polygonStarts.data[i + 1] += polygonStarts.data[i]
+
+    cdef LongList vertexPolygons = LongList(length = polygonStarts.data[vertexAmount])
+    cdef LongList usedSlots = LongList.fromValue(0, length = vertexAmount)
+    cdef unsigned int index
+    for i in range(polygons.polyStarts.length):
+        for j in range(polyStarts[i], polyStarts[i] + polyLengths[i]):
+            index = indices[j]
+            if index < vertexAmount:
+                vertexPolygons.data[polygonStarts.data[index] + usedSlots.data[index]] = i
+                usedSlots.data[index] += 1
+
+    return polygonStarts, vertexPolygons
 
 
 def calculatePolygonCenters(Vector3DList vertices, PolygonIndicesList polygons):
@@ -412,8 +493,9 @@ def calculatePolygonCenters(Vector3DList vertices, PolygonIndicesList polygons):
     cdef unsigned int *polyLengths = polygons.polyLengths.data
     cdef unsigned int start, length
 
-    cdef Py_ssize_t i, j
-    for i in range(polygons.getLength()):
+    cdef Py_ssize_t i, j, amount = polygons.getLength()
+    for i in prange(amount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(amount, 20000)):
         start = polyStarts[i]
         length = polyLengths[i]
 
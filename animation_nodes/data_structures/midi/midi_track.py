@@ -1,5 +1,7 @@
+import numpy
 from typing import List
 from . midi_note import MIDINote
+from . note_index import MIDINoteIndex
 from dataclasses import dataclass, field
 
 @dataclass
@@ -7,32 +9,53 @@ class MIDITrack:
     name: str = ""
     index: int = 0
     notes: List[MIDINote] = field(default_factory = list)
+    _noteIndex: MIDINoteIndex = field(default = None, init = False, repr = False, compare = False)
+    _indexedNotes: list = field(default = None, init = False, repr = False, compare = False)
+    _indexedNoteAmount: int = field(default = 0, init = False, repr = False, compare = False)
 
-    def evaluate(self, time, channel, noteNumber, 
-        attackTime, attackInterpolation, decayTime, decayInterpolation, sustainLevel, 
+    def evaluate(self, time, channel, noteNumber,
+        attackTime, attackInterpolation, decayTime, decayInterpolation, sustainLevel,
         releaseTime, releaseInterpolation, velocitySensitivity):
 
-        noteFilter = lambda note: note.channel == channel and note.noteNumber == noteNumber
-        timeFilter = lambda note: note.timeOff + releaseTime >= time >= note.timeOn
-        filteredNotes = filter(lambda note: noteFilter(note) and timeFilter(note), self.notes)
-        arguments = (time, attackTime, attackInterpolation, decayTime, decayInterpolation, 
-            sustainLevel, releaseTime, releaseInterpolation, velocitySensitivity)
-        return max((note.evaluate(*arguments) for note in filteredNotes), default = 0.0)
+        intervals = self.getNoteIndex().getNoteIntervals(channel, noteNumber)
+        indices = intervals.getActiveIndices(time, releaseTime)
+        if len(indices) == 0:
+            return 0.0
+        values = intervals.evaluate(indices, time, attackTime, attackInterpolation, decayTime,
+            decayInterpolation, sustainLevel, releaseTime, releaseInterpolation, velocitySensitivity)
+        return float(values.max())
 
-    def evaluateAll(self, time, channel, 
+    def evaluateAll(self, time, channel,
         attackTime, attackInterpolation, decayTime, decayInterpolation, sustainLevel,
         releaseTime, releaseInterpolation, velocitySensitivity):
-        channelFilter = lambda note: note.channel == channel
-        timeFilter = lambda note: note.timeOff + releaseTime >= time >= note.timeOn
-        filteredNotes = list(filter(lambda note: channelFilter(note) and timeFilter(note), self.notes))
-        arguments = (time, attackTime, attackInterpolation, decayTime, decayInterpolation, 
-            sustainLevel, releaseTime, releaseInterpolation, velocitySensitivity)
-        noteValues = []
-        for i in range(128):
-            filteredByNumberNotes = filter(lambda note: note.noteNumber == i, filteredNotes)
-            value = max((note.evaluate(*arguments) for note in filteredByNumberNotes), default = 0.0)
-            noteValues.append(value)
-        return noteValues
+
+        noteValues = numpy.full(128, -numpy.inf, dtype = numpy.float64)
+        intervals = self.getNoteIndex().getChannelIntervals(channel)
+        indices = intervals.getActiveIndices(time, releaseTime)
+        if len(indices) > 0:
+            values = intervals.evaluate(indices, time, attackTime, attackInterpolation, decayTime,
+                decayInterpolation, sustainLevel, releaseTime, releaseInterpolation, velocitySensitivity)
+            noteNumbers = intervals.noteNumber[indices]
+            isValid = (noteNumbers >= 0) & (noteNumbers < 128)
+            numpy.maximum.at(noteValues, noteNumbers[isValid], values[isValid])
+        noteValues[noteValues == -numpy.inf] = 0.0
+        return noteValues.tolist()
+
+    def getNoteIndex(self):
+        # The index is created again when the notes list has been replaced or when
+        # notes have been added or removed. The indexed list stays referenced,
+        # so a new list can never be mistaken for it.
+        if (self._noteIndex is None or self._indexedNotes is not self.notes
+                or self._indexedNoteAmount != len(self.notes)):
+            self._noteIndex = MIDINoteIndex(self.notes)
+            self._indexedNotes = self.notes
+            self._indexedNoteAmount = len(self.notes)
+        return self._noteIndex
+
+    def markChanged(self):
+        '''Has to be called after notes have been changed in place.'''
+        self._noteIndex = None
+        self._indexedNotes = None
 
     def copy(self):
         return MIDITrack(self.name, self.index, [n.copy() for n in self.notes])
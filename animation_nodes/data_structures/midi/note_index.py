@@ -0,0 +1,83 @@
+import numpy
+from operator import attrgetter
+from collections import defaultdict
+from .. lists.base_lists import DoubleList
+
+class MIDINoteIndex:
+    '''
+    Notes of a track grouped by channel and by channel and note number.
+    This allows finding the notes that are active at some time
+    without looking at all the notes of the track.
+    '''
+    def __init__(self, notes):
+        notesByChannel = defaultdict(list)
+        notesByNumber = defaultdict(list)
+        for note in notes:
+            notesByChannel[note.channel].append(note)
+            notesByNumber[(note.channel, note.noteNumber)].append(note)
+
+        self.intervalsByChannel = {key : NoteIntervals(value) for key, value in notesByChannel.items()}
+        self.intervalsByNumber = {key : NoteIntervals(value) for key, value in notesByNumber.items()}
+
+    def getChannelIntervals(self, channel):
+        return self.intervalsByChannel.get(channel, emptyIntervals)
+
+    def getNoteIntervals(self, channel, noteNumber):
+        return self.intervalsByNumber.get((channel, noteNumber), emptyIntervals)
+
+class NoteIntervals:
+    '''Note data as arrays that are sorted by the start time of the notes.'''
+    def __init__(self, notes):
+        notes = sorted(notes, key = attrgetter("timeOn"))
+        self.timeOn = numpy.array([note.timeOn for note in notes], dtype = numpy.float64)
+        self.timeOff = numpy.array([note.timeOff for note in notes], dtype = numpy.float64)
+        self.velocity = numpy.array([note.velocity for note in notes], dtype = numpy.float64)
+        self.noteNumber = numpy.array([note.noteNumber for note in notes], dtype = numpy.int64)
+
+        # Latest end of all notes up to some index. Notes before the first index
+        # at which this is too small to be active can be skipped.
+        self.maxTimeOff = numpy.maximum.accumulate(self.timeOff) if len(notes) > 0 else self.timeOff
+
+    def getActiveIndices(self, time, releaseTime):
+        end = numpy.searchsorted(self.timeOn, time, side = "right")
+        start = numpy.searchsorted(self.maxTimeOff, time - releaseTime, side = "left")
+        if start >= end:
+            return numpy.zeros(0, dtype = numpy.int64)
+        indices = numpy.arange(start, end)
+        return indices[self.timeOff[start:end] + releaseTime >= time]
+
+    def evaluate(self, indices, time, attackTime, attackInterpolation, decayTime, decayInterpolation,
+                 sustainLevel, releaseTime, releaseInterpolation, velocitySensitivity):
+        '''Vectorized version of MIDINote.evaluate for the notes at the given indices.'''
+        with numpy.errstate(divide = "ignore", invalid = "ignore"):
+            timeOn = self.timeOn[indices]
+            timeOff = self.timeOff[indices]
+
+            relativeTime = numpy.minimum(time, timeOff) - timeOn
+            values = numpy.full(len(indices), sustainLevel, dtype = numpy.float64)
+
+            isAttack = relativeTime < attackTime
+            values[isAttack] = evaluateInterpolation(attackInterpolation,
+                relativeTime[isAttack] / attackTime)
+
+            decayTimes = relativeTime - attackTime
+            isDecay = ~isAttack & (decayTimes < decayTime)
+            values[isDecay] = evaluateInterpolation(decayInterpolation,
+                1 - decayTimes[isDecay] / decayTime) * (1 - sustainLevel) + sustainLevel
+
+            values[relativeTime <= 0] = 0
+
+            isReleased = time > timeOff
+            values[isReleased] *= evaluateInterpolation(releaseInterpolation,
+                1 - (time - timeOff[isReleased]) / releaseTime)
+
+            return values * ((1 - velocitySensitivity) + velocitySensitivity * self.velocity[indices])
+
+emptyIntervals = NoteIntervals([])
+
+def evaluateInterpolation(interpolation, positions):
+    if len(positions) == 0:
+        return positions
+    # copy because the array does not keep the list alive
+    values = interpolation.evaluateList(DoubleList.fromNumpyArray(positions))
+    return values.asNumpyArray().copy()
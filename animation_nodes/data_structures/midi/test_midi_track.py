@@ -0,0 +1,31 @@
+from unittest import TestCase
+from . midi_note import MIDINote
+from . midi_track import MIDITrack
+from ... algorithms.interpolations import Linear
+
+envelope = (0, Linear(), 0, Linear(), 1, 0.5, Linear(), 0)
+
+class TestNoteIndex(TestCase):
+    def testReplacedNotes(self):
+        track = MIDITrack(notes = [MIDINote(0, 60, 0, 2, 1)])
+        self.assertEqual(track.evaluate(1, 0, 60, *envelope), 1)
+
+        track.notes = [MIDINote(0, 62, 0, 2, 1)]
+        self.assertEqual(track.evaluate(1, 0, 60, *envelope), 0)
+        self.assertEqual(track.evaluate(1, 0, 62, *envelope), 1)
+
+    def testAddedNotes(self):
+        track = MIDITrack(notes = [MIDINote(0, 60, 0, 2, 1)])
+        self.assertEqual(track.evaluate(5, 0, 60, *envelope), 0)
+
+        track.notes.append(MIDINote(0, 60, 4, 6, 1))
+        self.assertEqual(track.evaluate(5, 0, 60, *envelope), 1)
+
+    def testChangedNotes(self):
+        note = MIDINote(0, 60, 0, 2, 1)
+        track = MIDITrack(notes = [note])
+        self.assertEqual(track.evaluate(5, 0, 60, *envelope), 0)
+
+        note.timeOff = 6
+        track.markChanged()
+        self.assertEqual(track.evaluate(5, 0, 60, *envelope), 1)
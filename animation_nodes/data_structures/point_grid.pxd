@@ -0,0 +1,26 @@
+from .. math cimport Vector3
+from . lists.base_lists cimport Vector3DList, LongList, DoubleList, EdgeIndicesList
+
+cdef class PointGrid:
+    cdef readonly Vector3DList points
+    cdef LongList indices
+    cdef LongList positions
+    cdef LongList cellStarts
+    cdef Vector3 origin
+    cdef readonly float cellSize
+    cdef Py_ssize_t sizeX, sizeY, sizeZ
+
+    cdef Py_ssize_t getLength(self)
+    cdef void setBounds(self, Vector3DList points, float cellSize)
+    cdef sortPoints(self, Vector3DList points)
+    cdef Py_ssize_t getCellIndex(self, Vector3 *point)
+    cdef Py_ssize_t getCellCoordinate(self, float value, float low, Py_ssize_t size)
+
+    cdef void findInRadius_LowLevel(self, Py_ssize_t index, float radius,
+                                    LongList neighbours, DoubleList distances)
+    cdef Py_ssize_t findNearestN_LowLevel(self, Py_ssize_t index, Py_ssize_t amount,
+                                          double* distances, long* indices)
+    cdef Py_ssize_t searchCells(self, Vector3 *point, Py_ssize_t index,
+                                Py_ssize_t x, Py_ssize_t y, Py_ssize_t startZ, Py_ssize_t endZ,
+                                Py_ssize_t amount, Py_ssize_t foundAmount,
+                                double* distances, long* indices)
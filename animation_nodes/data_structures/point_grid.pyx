@@ -0,0 +1,313 @@
+from libc.math cimport sqrt, isfinite
+from .. math cimport distanceSquaredVec3
+from . kd_tree cimport heapify, sortHeap
+from . lists.base_lists cimport EdgeIndices
+
+cdef class PointGrid:
+    '''
+    Uniform grid over the bounding box of the points. The points are
+    sorted by their cell with a counting sort, so that the points of
+    every cell are stored next to each other.
+
+    The grid is meant to build neighbour graphs of all its points.
+    Every edge is only returned once, with the lower index first.
+    When no cell size is given, it is chosen so that there are
+    about two points per cell.
+    '''
+
+    def __cinit__(self, Vector3DList points = None, float cellSize = 0):
+        if points is None:
+            points = Vector3DList()
+
+        self.setBounds(points, cellSize)
+        self.sortPoints(points)
+
+    def __len__(self):
+        return self.getLength()
+
+    cdef Py_ssize_t getLength(self):
+        return self.points.length
+
+    def getMemoryUsage(self):
+        return (self.points.getMemoryUsage() +
+                self.indices.getMemoryUsage() +
+                self.positions.getMemoryUsage() +
+                self.cellStarts.getMemoryUsage())
+
+    def __repr__(self):
+        return "<AN PointGrid with {} points in {}x{}x{} cells>".format(
+            self.getLength(), self.sizeX, self.sizeY, self.sizeZ)
+
+
+    # Construction
+    ###############################################
+
+    cdef void setBounds(self, Vector3DList points, float cellSize):
+        # Points with infinite or nan coordinates are ignored here. They are sorted
+        # into border cells but never found, because their distances are not finite.
+        cdef Vector3 low = Vector3(0, 0, 0)
+        cdef Vector3 high = Vector3(0, 0, 0)
+        cdef Vector3 *point
+        cdef Py_ssize_t i
+        cdef bint foundFinitePoint = False
+        for i in range(points.length):
+            point = points.data + i
+            if not isFiniteVec3(point):
+                continue
+            if not foundFinitePoint:
+                low = high = point[0]
+                foundFinitePoint = True
+            low.x = min(low.x, point.x)
+            low.y = min(low.y, point.y)
+            low.z = min(low.z, point.z)
+            high.x = max(high.x, point.x)
+            high.y = max(high.y, point.y)
+            high.z = max(high.z, point.z)
+
+        cdef double extents[3]
+        extents[0] = high.x - low.x
+        extents[1] = high.y - low.y
+        extents[2] = high.z - low.z
+
+        # very small cells would need too much memory
+        cdef double maxCellAmount = max(points.length * 4, 64)
+        if not isfinite(cellSize) or cellSize <= 0:
+            cellSize = getCellSizeForAmount(extents, max(points.length // 2, 1))
+        if not isfinite(cellSize) or cellSize <= 0:
+            cellSize = 1
+        while getCellAmount(extents, cellSize) > maxCellAmount:
+            cellSize *= 2
+
+        self.origin = low
+        self.cellSize = cellSize
+        self.sizeX = getAxisSize(extents[0], cellSize)
+        self.sizeY = getAxisSize(extents[1], cellSize)
+        self.sizeZ = getAxisSize(extents[2], cellSize)
+
+    cdef sortPoints(self, Vector3DList points):
+        cdef Py_ssize_t i, cell, position
+        cdef Py_ssize_t amount = points.length
+        cdef Py_ssize_t cellAmount = self.sizeX * self.sizeY * self.sizeZ
+        cdef LongList cells = LongList(length = amount)
+        cdef LongList nextPositions = LongList(length = cellAmount)
+
+        self.cellStarts = LongList(length = cellAmount + 1)
+        self.cellStarts.fill(0)
+        for i in range(amount):
+            cell = self.getCellIndex(points.data + i)
+            cells.data[i] = cell
+            self.cellStarts.data[cell + 1] += 1
+
+        for cell in range(cellAmount):
+            self.cellStarts.data[cell + 1] += self.cellStarts.data[cell]
+            nextPositions.data[cell] = self.cellStarts.data[cell]
+
+        self.points = Vector3DList(length = amount)
+        self.indices = LongList(length = amount)
+        self.positions = LongList(length = amount)
+        for i in range(amount):
+            position = nextPositions.data[cells.data[i]]
+            nextPositions.data[cells.data[i]] += 1
+            self.points.data[position] = points.data[i]
+            self.indices.data[position] = i
+            self.positions.data[i] = position
+
+    cdef Py_ssize_t getCellIndex(self, Vector3 *point):
+        cdef Py_ssize_t x = self.getCellCoordinate(point.x, self.origin.x, self.sizeX)
+        cdef Py_ssize_t y = self.getCellCoordinate(point.y, self.origin.y, self.sizeY)
+        cdef Py_ssize_t z = self.getCellCoordinate(point.z, self.origin.z, self.sizeZ)
+        return (x * self.sizeY + y) * self.sizeZ + z
+
+    cdef Py_ssize_t getCellCoordinate(self, float value, float low, Py_ssize_t size):
+        cdef double coordinate = (<double>value - low) / self.cellSize
+        # also true for nan
+        if not coordinate >= 0: return 0
+        if coordinate >= size: return size - 1
+        return <Py_ssize_t>coordinate
+
+
+    # Neighbour Graphs
+    ###############################################
+
+    def findInRadiusEdges(self, float radius):
+        '''Connects all points whose distance is at most the radius.'''
+        cdef EdgeIndicesList edges = EdgeIndicesList()
+        cdef DoubleList distances = DoubleList()
+        cdef LongList neighbours = LongList()
+        cdef DoubleList neighbourDistances = DoubleList()
+        cdef Py_ssize_t i, j
+        if radius < 0:
+            return edges, distances
+
+        # the edges of every point are sorted by distance
+        for i in range(self.getLength()):
+            neighbours.length = 0
+            neighbourDistances.length = 0
+            self.findInRadius_LowLevel(i, radius, neighbours, neighbourDistances)
+            heapify(neighbourDistances.data, neighbours.data, neighbours.length)
+            sortHeap(neighbourDistances.data, neighbours.data, neighbours.length)
+            for j in range(neighbours.length):
+                edges.append_LowLevel(EdgeIndices(i, neighbours.data[j]))
+                distances.append_LowLevel(sqrt(neighbourDistances.data[j]))
+        return edges, distances
+
+    def findNearestNEdges(self, Py_ssize_t amount):
+        '''Connects every point with its n nearest other points.'''
+        cdef Py_ssize_t i, j, neighbour
+        cdef Py_ssize_t length = self.getLength()
+        amount = max(0, min(amount, length - 1))
+
+        cdef LongList neighbours = LongList(length = length * amount)
+        cdef DoubleList neighbourDistances = DoubleList(length = length * amount)
+        # fewer neighbours are found when there are points that are not finite
+        cdef LongList foundAmounts = LongList(length = length)
+        for i in range(length):
+            foundAmounts.data[i] = self.findNearestN_LowLevel(i, amount,
+                neighbourDistances.data + i * amount,
+                neighbours.data + i * amount)
+
+        # An edge is found twice when both points are in the neighbours of
+        # each other. It is only added when the point with the lower index is found.
+        cdef EdgeIndicesList edges = EdgeIndicesList(capacity = length * amount)
+        cdef DoubleList distances = DoubleList(capacity = length * amount)
+        for i in range(length):
+            for j in range(foundAmounts.data[i]):
+                neighbour = neighbours.data[i * amount + j]
+                if neighbour < i:
+                    if containsIndex(neighbours.data + neighbour * amount, foundAmounts.data[neighbour], i):
+                        continue
+                    edges.append_LowLevel(EdgeIndices(neighbour, i))
+                else:
+                    edges.append_LowLevel(EdgeIndices(i, neighbour))
+                distances.append_LowLevel(neighbourDistances.data[i * amount + j])
+        return edges, distances
+
+    cdef void findInRadius_LowLevel(self, Py_ssize_t index, float radius,
+                                    LongList neighbours, DoubleList distances):
+        '''Appends all points in the radius that have a higher index and their squared distances.'''
+        cdef Vector3 *point = self.points.data + self.positions.data[index]
+        cdef Py_ssize_t startX = self.getCellCoordinate(point.x - radius, self.origin.x, self.sizeX)
+        cdef Py_ssize_t startY = self.getCellCoordinate(point.y - radius, self.origin.y, self.sizeY)
+        cdef Py_ssize_t startZ = self.getCellCoordinate(point.z - radius, self.origin.z, self.sizeZ)
+        cdef Py_ssize_t endX = self.getCellCoordinate(point.x + radius, self.origin.x, self.sizeX)
+        cdef Py_ssize_t endY = self.getCellCoordinate(point.y + radius, self.origin.y, self.sizeY)
+        cdef Py_ssize_t endZ = self.getCellCoordinate(point.z + radius, self.origin.z, self.sizeZ)
+
+        cdef Py_ssize_t x, y, i, cell
+        cdef double distance, radiusSquared = radius * radius
+        for x in range(startX, endX + 1):
+            for y in range(startY, endY + 1):
+                cell = (x * self.sizeY + y) * self.sizeZ
+                # the cells along the z axis are stored next to each other
+                for i in range(self.cellStarts.data[cell + startZ], self.cellStarts.data[cell + endZ + 1]):
+                    if self.indices.data[i] <= index:
+                        continue
+                    distance = distanceSquaredVec3(point, self.points.data + i)
+                    if distance <= radiusSquared and isfinite(distance):
+                        neighbours.append_LowLevel(self.indices.data[i])
+                        distances.append_LowLevel(distance)
+
+    cdef Py_ssize_t findNearestN_LowLevel(self, Py_ssize_t index, Py_ssize_t amount,
+                                          double* distances, long* indices):
+        '''
+        Searches in rings of cells around the cell of the point. After a ring has
+        been searched, all other points are at least ring * cellSize away.
+        The results are sorted by distance, the point itself is not included.
+        '''
+        if amount <= 0:
+            return 0
+
+        cdef Vector3 *point = self.points.data + self.positions.data[index]
+        cdef Py_ssize_t centerX = self.getCellCoordinate(point.x, self.origin.x, self.sizeX)
+        cdef Py_ssize_t centerY = self.getCellCoordinate(point.y, self.origin.y, self.sizeY)
+        cdef Py_ssize_t centerZ = self.getCellCoordinate(point.z, self.origin.z, self.sizeZ)
+        cdef Py_ssize_t lastRing = max(centerX, self.sizeX - 1 - centerX,
+                                       centerY, self.sizeY - 1 - centerY,
+                                       centerZ, self.sizeZ - 1 - centerZ)
+
+        cdef Py_ssize_t ring, x, y, foundAmount = 0
+        cdef double ringDistance
+        for ring in range(lastRing + 1):
+            for x in range(max(centerX - ring, 0), min(centerX + ring, self.sizeX - 1) + 1):
+                for y in range(max(centerY - ring, 0), min(centerY + ring, self.sizeY - 1) + 1):
+                    if abs(x - centerX) == ring or abs(y - centerY) == ring:
+                        foundAmount = self.searchCells(point, index, x, y,
+                            max(centerZ - ring, 0), min(centerZ + ring, self.sizeZ - 1),
+                            amount, foundAmount, distances, indices)
+                    else:
+                        if centerZ - ring >= 0:
+                            foundAmount = self.searchCells(point, index, x, y,
+                                centerZ - ring, centerZ - ring,
+                                amount, foundAmount, distances, indices)
+                        if centerZ + ring < self.sizeZ:
+                            foundAmount = self.searchCells(point, index, x, y,
+                                centerZ + ring, centerZ + ring,
+                                amount, foundAmount, distances, indices)
+
+            ringDistance = ring * self.cellSize
+            if foundAmount == amount and distances[amount - 1] <= ringDistance * ringDistance:
+                break
+
+        for x in range(foundAmount):
+            distances[x] = sqrt(distances[x])
+        return foundAmount
+
+    cdef Py_ssize_t searchCells(self, Vector3 *point, Py_ssize_t index,
+                                Py_ssize_t x, Py_ssize_t y, Py_ssize_t startZ, Py_ssize_t endZ,
+                                Py_ssize_t amount, Py_ssize_t foundAmount,
+                                double* distances, long* indices):
+        '''Inserts the points of the cells into the sorted results and returns the new amount.'''
+        cdef Py_ssize_t i, j
+        cdef double distance
+        cdef Py_ssize_t cell = (x * self.sizeY + y) * self.sizeZ
+        for i in range(self.cellStarts.data[cell + startZ], self.cellStarts.data[cell + endZ + 1]):
+            if self.indices.data[i] == index:
+                continue
+            distance = distanceSquaredVec3(point, self.points.data + i)
+            if not isfinite(distance):
+                continue
+            if foundAmount == amount:
+                if distance >= distances[amount - 1]:
+                    continue
+                j = amount - 1
+            else:
+                j = foundAmount
+                foundAmount += 1
+            while j > 0 and distances[j - 1] > distance:
+                distances[j] = distances[j - 1]
+                indices[j] = indices[j - 1]
+                j -= 1
+            distances[j] = distance
+            indices[j] = self.indices.data[i]
+        return foundAmount
+
+cdef Py_ssize_t getAxisSize(double extent, double cellSize):
+    return <Py_ssize_t>(extent / cellSize) + 1
+
+cdef double getCellAmount(double* extents, double cellSize):
+    return ((extents[0] / cellSize + 1) *
+            (extents[1] / cellSize + 1) *
+            (extents[2] / cellSize + 1))
+
+cdef double getCellSizeForAmount(double* extents, Py_ssize_t amount):
+    '''Axes without extent are ignored, so that flat point sets get enough cells.'''
+    cdef double maxExtent = max(extents[0], extents[1], extents[2])
+    cdef double volume = 1
+    cdef int i, dimensions = 0
+    for i in range(3):
+        if extents[i] > maxExtent * 1e-6:
+            volume *= extents[i]
+            dimensions += 1
+    if dimensions == 0:
+        return 1
+    return (volume / amount) ** (1.0 / dimensions)
+
+cdef inline bint isFiniteVec3(Vector3 *v):
+    return isfinite(v.x) and isfinite(v.y) and isfinite(v.z)
+
+cdef bint containsIndex(long* indices, Py_ssize_t amount, long index):
+    cdef Py_ssize_t i
+    for i in range(amount):
+        if indices[i] == index:
+            return True
+    return False
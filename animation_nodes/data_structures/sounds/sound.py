@@ -1,7 +1,8 @@
 import numpy
-from math import ceil, log
+from math import ceil, log, floor
 from functools import lru_cache
 from . sound_sequence import sampleRate
+from . spectrum_cache import spectrumCache
 
 class Sound:
     def __init__(self, soundSequences):
@@ -9,7 +10,7 @@ class Sound:
 
     def getSamplesInRange(self, start, end):
         if end <= start: raise ValueError("Invaild range!")
-        start, end = int(start * sampleRate), int(end * sampleRate)
+        start, end = toSampleIndex(start), toSampleIndex(end)
         samples = numpy.zeros(end - start + 1)
 
         for sequence in self.soundSequences:
@@ -24,7 +25,20 @@ class Sound:
             samples[i - start:i - start + len(chunk)] += chunk
         return samples
 
+    def getCacheKey(self):
+        return tuple((sequence.data, sequence.start, sequence.startOffset, sequence.end, sequence.volume)
+                     for sequence in self.soundSequences)
+
     def computeSpectrum(self, start, end, beta = 6):
+        # the returned array is shared and must not be modified
+        key = (self.getCacheKey(), toSampleIndex(start), toSampleIndex(end), beta)
+        spectrum = spectrumCache.get(key)
+        if spectrum is None:
+            spectrum = self.computeSpectrum_Uncached(start, end, beta)
+            spectrumCache.set(key, spectrum)
+        return spectrum
+
+    def computeSpectrum_Uncached(self, start, end, beta = 6):
         samples = self.getSamplesInRange(start, end)
         chunk = numpy.zeros(2**ceil(log(len(samples), 2)))
         chunk[:len(samples)] = samples * getCachedKaiser(len(samples), beta)
@@ -37,10 +51,15 @@ class Sound:
             newFFT = self.computeSpectrum(start - i * duration, end - i * duration, beta = beta)
             if FFT is None: FFT = newFFT
             else:
-                factor = numpy.array((attack, release))[(newFFT < FFT).astype(int)]
+                factor = numpy.where(newFFT < FFT, release, attack)
                 FFT = FFT * factor + newFFT * (1 - factor)
         return FFT
 
+def toSampleIndex(time):
+    # The time is snapped to an eighth of a sample first, so that windows that are
+    # computed differently (e.g. frame / fps - 1 / fps and (frame - 1) / fps) use the same samples.
+    return floor(round(time * sampleRate * 8) / 8)
+
 @lru_cache(maxsize = 16)
 def getCachedKaiser(length, beta):
     return numpy.kaiser(length, beta)
@@ -0,0 +1,110 @@
+import threading
+from collections import OrderedDict
+from ... utils.handlers import eventHandler
+
+maxCacheSize = 256 * 1024 * 1024
+
+class SpectrumCache:
+    '''
+    Spectra of sound windows, shared by all nodes that read the same sound.
+    A spectrum is fully defined by the sound, the first and last sample
+    of the window and the kaiser beta, so that is used as key.
+    '''
+    def __init__(self, maxSize):
+        self.maxSize = maxSize
+        self.size = 0
+        self.spectra = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            spectrum = self.spectra.get(key)
+            if spectrum is not None:
+                self.spectra.move_to_end(key)
+            return spectrum
+
+    def set(self, key, spectrum):
+        spectrum.flags.writeable = False
+        with self.lock:
+            if key in self.spectra: return
+            self.spectra[key] = spectrum
+            self.size += spectrum.nbytes
+            while self.size > self.maxSize and len(self.spectra) > 1:
+                _, oldSpectrum = self.spectra.popitem(last = False)
+                self.size -= oldSpectrum.nbytes
+
+    def clear(self):
+        with self.lock:
+            self.spectra.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self.spectra)
+
+spectrumCache = SpectrumCache(maxCacheSize)
+
+@eventHandler("FILE_LOAD_POST")
+def clearSpectrumCache():
+    spectrumCache.clear()
+
+
+# Precomputation
+###############################################
+
+class PrecomputeJob(threading.Thread):
+    def __init__(self, sound, windows, beta):
+        super().__init__(daemon = True)
+        self.sound = sound
+        self.windows = windows
+        self.beta = beta
+        self.cancelled = False
+
+    def run(self):
+        for start, end in self.windows:
+            if self.cancelled: return
+            self.sound.computeSpectrum(start, end, self.beta)
+
+# Jobs of different nodes run side by side. Only the most recently requested
+# jobs are kept running, older ones are cancelled. Finished jobs are remembered
+# so that they are not started again.
+maxRunningJobs = 4
+maxRememberedJobs = 64
+jobs = OrderedDict()
+
+def precomputeSpectraInBackground(sound, frames, fps, duration, smoothingSamples, beta):
+    '''
+    Compute the spectra of all windows that are needed to evaluate
+    the smoothed spectrum at the given frames in a separate thread.
+    Nothing happens when the same job is running or has finished before.
+    '''
+    frames = tuple(frames)
+    if len(frames) == 0: return
+    jobKey = (sound.getCacheKey(), frames[0], frames[-1], fps, duration, smoothingSamples, beta)
+    if jobKey in jobs:
+        jobs.move_to_end(jobKey)
+        return
+
+    windows = []
+    for frame in frames:
+        start, end = frame / fps, frame / fps + duration
+        for i in range(smoothingSamples + 1):
+            windows.append((start - i * duration, end - i * duration))
+
+    job = PrecomputeJob(sound, windows, beta)
+    jobs[jobKey] = job
+    job.start()
+    removeOldJobs()
+
+def removeOldJobs():
+    runningKeys = [key for key, job in jobs.items() if job.is_alive()]
+    for key in runningKeys[:-maxRunningJobs]:
+        jobs.pop(key).cancelled = True
+    while len(jobs) > maxRememberedJobs:
+        _, job = jobs.popitem(last = False)
+        job.cancelled = True
+
+@eventHandler("FILE_LOAD_POST")
+def cancelPrecomputeJobs():
+    for job in jobs.values():
+        job.cancelled = True
+    jobs.clear()
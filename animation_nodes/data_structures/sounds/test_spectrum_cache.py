@@ -0,0 +1,57 @@
+import threading
+from unittest import TestCase
+from . import spectrum_cache
+from . spectrum_cache import precomputeSpectraInBackground, cancelPrecomputeJobs
+
+class FakeSound:
+    '''Blocks in computeSpectrum until it is released.'''
+    def __init__(self, name):
+        self.name = name
+        self.released = threading.Event()
+        self.computedWindows = []
+
+    def getCacheKey(self):
+        return self.name
+
+    def computeSpectrum(self, start, end, beta):
+        self.released.wait(5)
+        self.computedWindows.append((start, end))
+
+class TestPrecomputeJobs(TestCase):
+    def tearDown(self):
+        cancelPrecomputeJobs()
+
+    def testTwoSoundsAtTheSameTime(self):
+        soundA, soundB = FakeSound("A"), FakeSound("B")
+        for _ in range(3):
+            precomputeSpectraInBackground(soundA, range(1, 5), 25, 0.04, 0, 6)
+            precomputeSpectraInBackground(soundB, range(1, 5), 25, 0.04, 2, 6)
+
+        jobs = list(spectrum_cache.jobs.values())
+        self.assertEqual(len(jobs), 2)
+        self.assertFalse(any(job.cancelled for job in jobs))
+
+        soundA.released.set()
+        soundB.released.set()
+        for job in jobs:
+            job.join(5)
+        self.assertEqual(len(soundA.computedWindows), 4)
+        self.assertEqual(len(soundB.computedWindows), 12)
+
+    def testFinishedJobIsNotRestarted(self):
+        sound = FakeSound("A")
+        sound.released.set()
+        precomputeSpectraInBackground(sound, range(1, 5), 25, 0.04, 0, 6)
+        spectrum_cache.jobs[next(iter(spectrum_cache.jobs))].join(5)
+
+        precomputeSpectraInBackground(sound, range(1, 5), 25, 0.04, 0, 6)
+        self.assertEqual(len(sound.computedWindows), 4)
+
+    def testOldJobsAreCancelled(self):
+        sounds = [FakeSound(str(i)) for i in range(spectrum_cache.maxRunningJobs + 2)]
+        for sound in sounds:
+            precomputeSpectraInBackground(sound, range(1, 5), 25, 0.04, 0, 6)
+        self.assertEqual(len(spectrum_cache.jobs), spectrum_cache.maxRunningJobs)
+        self.assertNotIn("0", [key[0] for key in spectrum_cache.jobs])
+        for sound in sounds:
+            sound.released.set()
@@ -1,2 +1,3 @@
 from . poly_spline import PolySpline
 from . bezier_spline import BezierSpline
+from . spline_collection import SplineCollection
@@ -1,5 +1,6 @@
 from ... math.vector cimport Vector3
 from ... math.matrix cimport Matrix4
+from . segment_bvh cimport SegmentBVH
 from .. lists.base_lists cimport FloatList, Vector3DList, Matrix4x4List
 
 cdef class Spline:
@@ -8,6 +9,7 @@ cdef class Spline:
         public long materialIndex
         readonly str type
         FloatList uniformParameters
+        SegmentBVH segmentBVH
 
     # Generic
     #############################################
@@ -24,7 +26,7 @@ cdef class Spline:
     cpdef ensureUniformConverter(self, Py_ssize_t minResolution)
     cdef _updateUniformParameters(self, Py_ssize_t totalResolution)
 
-    cdef float toUniformParameter_LowLevel(self, float parameter)
+    cdef float toUniformParameter_LowLevel(self, float parameter) nogil
 
 
     # Normals
@@ -37,14 +39,14 @@ cdef class Spline:
     # Evaluate Single Parameter
     #############################################
 
-    cdef void evaluatePoint_LowLevel(self, float t, Vector3 *result)
-    cdef void evaluateTangent_LowLevel(self, float t, Vector3 *result)
-    cdef void evaluateNormal_LowLevel(self, float t, Vector3 *result)
-    cdef void evaluateNormal_Approximated(self, float t, Vector3 *result)
-    cdef float evaluateCurvature_LowLevel(self, float t)
-    cdef float evaluateRadius_LowLevel(self, float t)
-    cdef float evaluateTilt_LowLevel(self, float t)
-    cdef void evaluateMatrix_LowLevel(self, float t, Matrix4 *result)
+    cdef void evaluatePoint_LowLevel(self, float t, Vector3 *result) nogil
+    cdef void evaluateTangent_LowLevel(self, float t, Vector3 *result) nogil
+    cdef void evaluateNormal_LowLevel(self, float t, Vector3 *result) nogil
+    cdef void evaluateNormal_Approximated(self, float t, Vector3 *result) nogil
+    cdef float evaluateCurvature_LowLevel(self, float t) nogil
+    cdef float evaluateRadius_LowLevel(self, float t) nogil
+    cdef float evaluateTilt_LowLevel(self, float t) nogil
+    cdef void evaluateMatrix_LowLevel(self, float t, Matrix4 *result) nogil
 
 
     # Evaluate Multiple Parameters
@@ -76,6 +78,8 @@ cdef class Spline:
     # Projection
     #############################################
 
+    cdef SegmentBVH getSegmentBVH(self)
+    cdef SegmentBVH createSegmentBVH(self)
     cdef float project_LowLevel(self, Vector3 *point)
     cdef void projectExtended_LowLevel(self, Vector3 *point,
         Vector3 *resultPoint, Vector3 *resultTangent)
@@ -85,3 +89,5 @@ cdef class Spline:
     #############################################
 
     cdef Spline getTrimmedCopy_LowLevel(self, float start, float end)
+
+cdef Py_ssize_t getTrimmedPointAmount(Py_ssize_t pointAmount, bint cyclic, float start, float end)
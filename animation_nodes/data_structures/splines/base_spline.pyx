@@ -1,4 +1,7 @@
+# setup: options = openmp
+from cython.parallel cimport prange
 from ... utils.lists cimport findListSegment_LowLevel
+from ... utils.parallel cimport getThreadAmount
 from ... math cimport (
     distanceSquaredVec3, crossVec3, projectOnCenterPlaneVec3,
     almostZeroVec3, angleVec3, dotVec3, normalizeVec3_InPlace,
@@ -10,14 +13,15 @@ from ... math cimport (
     matrixFromNormalizedAxisData,
 )
 
-ctypedef void (*EvaluateVector)(Spline, float, Vector3*)
-ctypedef void (*EvaluateMatrix)(Spline, float, Matrix4*)
-ctypedef float (*EvaluateFloat)(Spline, float)
+ctypedef void (*EvaluateVector)(Spline, float, Vector3*) nogil
+ctypedef void (*EvaluateMatrix)(Spline, float, Matrix4*) nogil
+ctypedef float (*EvaluateFloat)(Spline, float) nogil
 
 cdef class Spline:
 
     cpdef void markChanged(self):
         self.uniformParameters = None
+        self.segmentBVH = None
 
 
     # Generic
@@ -29,6 +33,15 @@ cdef class Spline:
     def transform(self, matrix):
         raise NotImplementedError()
 
+    def getMemoryUsage(self):
+        '''Amount of bytes that are allocated for the spline data and its caches.'''
+        memory = 0
+        if self.uniformParameters is not None:
+            memory += self.uniformParameters.getMemoryUsage()
+        if self.segmentBVH is not None:
+            memory += self.segmentBVH.getMemoryUsage()
+        return memory
+
 
     # Evaluability
     #############################################
@@ -77,7 +90,7 @@ cdef class Spline:
             result.data[i] = self.toUniformParameter_LowLevel(parameters.data[i])
         return result
 
-    cdef float toUniformParameter_LowLevel(self, float t):
+    cdef float toUniformParameter_LowLevel(self, float t) nogil:
         cdef float factor
         cdef long indices[2]
         findListSegment_LowLevel(self.uniformParameters.length, False, t, indices, &factor)
@@ -279,13 +292,15 @@ cdef class Spline:
         return evaluateFunction_PyResult(self, self.evaluateMatrix_LowLevel, t)
 
 
-    cdef void evaluatePoint_LowLevel(self, float t, Vector3 *result):
-        raise NotImplementedError()
+    cdef void evaluatePoint_LowLevel(self, float t, Vector3 *result) nogil:
+        with gil:
+            raise NotImplementedError()
 
-    cdef void evaluateTangent_LowLevel(self, float t, Vector3 *result):
-        raise NotImplementedError()
+    cdef void evaluateTangent_LowLevel(self, float t, Vector3 *result) nogil:
+        with gil:
+            raise NotImplementedError()
 
-    cdef void evaluateNormal_LowLevel(self, float t, Vector3 *result):
+    cdef void evaluateNormal_LowLevel(self, float t, Vector3 *result) nogil:
         cdef Vector3 approx
         cdef Vector3 tangent
         self.evaluateNormal_Approximated(t, &approx)
@@ -295,19 +310,23 @@ cdef class Spline:
         rotateAroundAxisVec3(&rotated, &approx, &tangent, tilt)
         projectOnCenterPlaneVec3(result, &rotated, &tangent)
 
-    cdef void evaluateNormal_Approximated(self, float parameter, Vector3 *result):
-        raise NotImplementedError()
+    cdef void evaluateNormal_Approximated(self, float parameter, Vector3 *result) nogil:
+        with gil:
+            raise NotImplementedError()
 
-    cdef float evaluateCurvature_LowLevel(self, float t):
-        raise NotImplementedError()
+    cdef float evaluateCurvature_LowLevel(self, float t) nogil:
+        with gil:
+            raise NotImplementedError()
 
-    cdef float evaluateRadius_LowLevel(self, float t):
-        raise NotImplementedError()
+    cdef float evaluateRadius_LowLevel(self, float t) nogil:
+        with gil:
+            raise NotImplementedError()
 
-    cdef float evaluateTilt_LowLevel(self, float t):
-        raise NotImplementedError()
+    cdef float evaluateTilt_LowLevel(self, float t) nogil:
+        with gil:
+            raise NotImplementedError()
 
-    cdef void evaluateMatrix_LowLevel(self, float t, Matrix4 *result):
+    cdef void evaluateMatrix_LowLevel(self, float t, Matrix4 *result) nogil:
         cdef Vector3 point, tangent, normal, bitangent
         self.evaluatePoint_LowLevel(t, &point)
         self.evaluateTangent_LowLevel(t, &tangent)
@@ -335,6 +354,35 @@ cdef class Spline:
         self.projectExtended_LowLevel(&_point, &nearestPoint, &nearestTangent)
         return toPyVector3(&nearestPoint), toPyVector3(&nearestTangent)
 
+    def projectList(self, Vector3DList points):
+        if not self.isEvaluable():
+            raise Exception("spline is not evaluable")
+        cdef FloatList parameters = FloatList(length = points.length)
+        cdef Py_ssize_t i
+        for i in range(points.length):
+            parameters.data[i] = self.project_LowLevel(points.data + i)
+        return parameters
+
+    def projectExtendedList(self, Vector3DList points):
+        if not self.isEvaluable():
+            raise Exception("spline is not evaluable")
+        cdef Vector3DList nearestPoints = Vector3DList(length = points.length)
+        cdef Vector3DList nearestTangents = Vector3DList(length = points.length)
+        cdef Py_ssize_t i
+        for i in range(points.length):
+            self.projectExtended_LowLevel(points.data + i,
+                nearestPoints.data + i, nearestTangents.data + i)
+        return nearestPoints, nearestTangents
+
+    cdef SegmentBVH getSegmentBVH(self):
+        '''The hierarchy is created again after the spline has been changed.'''
+        if self.segmentBVH is None:
+            self.segmentBVH = self.createSegmentBVH()
+        return self.segmentBVH
+
+    cdef SegmentBVH createSegmentBVH(self):
+        raise NotImplementedError()
+
     cdef float project_LowLevel(self, Vector3 *point):
         raise NotImplementedError()
 
@@ -467,7 +515,8 @@ cdef evaluateDistributed(Spline spline, Py_ssize_t amount, EvaluateFunction eval
     cdef Py_ssize_t i
     cdef float t
     cdef bint convertToUniform = distributionType == "UNIFORM"
-    for i in range(amount):
+    for i in prange(amount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(amount, 5000)):
         t = start + i * step
         if t > 1: t = 1
         elif t < 0: t = 0
@@ -533,6 +582,21 @@ cdef evaluateFunction_Array(Spline spline, EvaluateFunction evaluate,
             evaluate(spline, parameters[i], <Matrix4*>results + i)
 
 
+# Trimming
+######################################################
+
+cdef Py_ssize_t getTrimmedPointAmount(Py_ssize_t pointAmount, bint cyclic, float start, float end):
+    cdef long startIndices[2]
+    cdef long endIndices[2]
+    cdef float startT, endT
+    findListSegment_LowLevel(pointAmount, cyclic, start, startIndices, &startT)
+    findListSegment_LowLevel(pointAmount, cyclic, end, endIndices, &endT)
+
+    if endIndices[1] == 0: # <- cyclic extension required
+        return pointAmount - startIndices[0] + 1
+    return endIndices[1] - startIndices[0] + 1
+
+
 # Calculate Normals
 ######################################################
 
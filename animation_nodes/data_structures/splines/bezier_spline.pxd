@@ -10,3 +10,9 @@ cdef class BezierSpline(Spline):
         public FloatList radii
         public FloatList tilts
         Vector3DList normalsCache
+
+cdef trimBezierSplineData(Vector3 *_oldPoints, Vector3 *_oldLeftHandles, Vector3 *_oldRightHandles,
+                          float *_oldRadii, float *_oldTilts,
+                          Py_ssize_t pointAmount, bint cyclic, float start, float end,
+                          Vector3 *_newPoints, Vector3 *_newLeftHandles, Vector3 *_newRightHandles,
+                          float *_newRadii, float *_newTilts, Py_ssize_t newPointAmount)
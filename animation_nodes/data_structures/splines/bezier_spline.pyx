@@ -1,14 +1,17 @@
 cimport cython
 import textwrap
+from libc.math cimport INFINITY
 from libc.string cimport memcpy
 from numpy.polynomial import Polynomial
+from . segment_bvh cimport SegmentBVH
 from ... utils.lists cimport findListSegment_LowLevel
 from ... math cimport (
     subVec3, normalizeVec3_InPlace, lengthVec3, crossVec3,
-    toPyVector3, mixVec3, isCloseVec3, lengthSquaredVec3,
+    toPyVector3, mixVec3, isCloseVec3, lengthSquaredVec3, distanceSquaredVec3,
 )
 
 from mathutils import Vector
+from . base_spline cimport getTrimmedPointAmount
 from . base_spline import calculateNormalsForTangents
 
 cdef Py_ssize_t normalsResolution = 5
@@ -76,12 +79,27 @@ cdef class BezierSpline(Spline):
                             self.cyclic,
                             self.materialIndex)
 
+    def __reduce__(self):
+        return (BezierSpline, (self.points, self.leftHandles, self.rightHandles,
+                               self.radii, self.tilts, self.cyclic, self.materialIndex))
+
     def transform(self, matrix):
         self.points.transform(matrix)
         self.leftHandles.transform(matrix)
         self.rightHandles.transform(matrix)
         self.markChanged()
 
+    def getMemoryUsage(self):
+        cdef Py_ssize_t memory = Spline.getMemoryUsage(self)
+        memory += self.points.getMemoryUsage()
+        memory += self.leftHandles.getMemoryUsage()
+        memory += self.rightHandles.getMemoryUsage()
+        memory += self.radii.getMemoryUsage()
+        memory += self.tilts.getMemoryUsage()
+        if self.normalsCache is not None:
+            memory += self.normalsCache.getMemoryUsage()
+        return memory
+
     # Normals
     ############################################################
 
@@ -112,7 +130,7 @@ cdef class BezierSpline(Spline):
 
         self.normalsCache = calculateNormalsForTangents(tangents, self.cyclic)
 
-    cdef void evaluateNormal_Approximated(self, float parameter, Vector3 *result):
+    cdef void evaluateNormal_Approximated(self, float parameter, Vector3 *result) nogil:
         cdef float t
         cdef Py_ssize_t segment
         getSegmentIndex(self, parameter, &segment, &t)
@@ -127,7 +145,7 @@ cdef class BezierSpline(Spline):
             self.normalsCache.data + offset + indices[1],
             f)
 
-    cdef float evaluateTilt_LowLevel(self, float parameter):
+    cdef float evaluateTilt_LowLevel(self, float parameter) nogil:
         cdef long indices[2]
         cdef float t
         findListSegment_LowLevel(self.tilts.length, self.cyclic, parameter, indices, &t)
@@ -136,69 +154,56 @@ cdef class BezierSpline(Spline):
     # Projection
     ############################################################
 
-    cdef float project_LowLevel(self, Vector3* _point):
-        # TODO: Speedup using cython
-        # slowest part here is the root finding using numpy
-        # maybe implement another numerical method to find the best parameter
-        # http://jazzros.blogspot.be/2011/03/projecting-point-on-bezier-curve.html
-        cdef:
-            int segmentAmount = getSegmentAmount(self)
-            Py_ssize_t i
-            Vector3 *w[4]
-            set possibleParameters = set()
-            list coeffs = [0] * 6
-
-        point = toPyVector3(_point)
-
+    cdef SegmentBVH createSegmentBVH(self):
+        # the segment is inside of the convex hull of its control points
+        cdef Py_ssize_t i, j, segmentAmount = getSegmentAmount(self)
+        cdef Vector3DList lows = Vector3DList(length = segmentAmount)
+        cdef Vector3DList highs = Vector3DList(length = segmentAmount)
+        cdef Vector3 *w[4]
         for i in range(segmentAmount):
             getSegmentData_Index(self, i, w)
-            p0 = toPyVector3(w[0]) - point
-            p1 = toPyVector3(w[1]) - point
-            p2 = toPyVector3(w[2]) - point
-            p3 = toPyVector3(w[3]) - point
-
-            a = p3 - 3 * p2 + 3 * p1 - p0
-            b = 3 * p2 - 6 * p1 + 3 * p0
-            c = 3 * (p1 - p0)
-
-            coeffs[0] = c.dot(p0)
-            coeffs[1] = c.dot(c) + b.dot(p0) * 2.0
-            coeffs[2] = b.dot(c) * 3.0 + a.dot(p0) * 3.0
-            coeffs[3] = a.dot(c) * 4.0 + b.dot(b) * 2.0
-            coeffs[4] = a.dot(b) * 5.0
-            coeffs[5] = a.dot(a) * 3.0
-
-            poly = Polynomial(coeffs, [0.0, 1.0], [0.0, 1.0])
-            roots = poly.roots()
-            realRoots = [float(min(max(root.real, 0), 1)) for root in roots]
-            segmentParameters = [(i + t) / segmentAmount for t in realRoots]
-            possibleParameters.update(segmentParameters)
-
-        sampledData = [(p, (point - self.evaluatePoint(p)).length_squared) for p in possibleParameters]
-        if len(sampledData) > 0:
-            return min(sampledData, key = lambda item: item[1])[0]
-        return 0
-
-
-    cdef void evaluatePoint_LowLevel(self, float parameter, Vector3 *result):
+            lows.data[i] = highs.data[i] = w[0][0]
+            for j in range(1, 4):
+                lows.data[i].x = min(lows.data[i].x, w[j].x)
+                lows.data[i].y = min(lows.data[i].y, w[j].y)
+                lows.data[i].z = min(lows.data[i].z, w[j].z)
+                highs.data[i].x = max(highs.data[i].x, w[j].x)
+                highs.data[i].y = max(highs.data[i].y, w[j].y)
+                highs.data[i].z = max(highs.data[i].z, w[j].z)
+        return SegmentBVH(lows, highs)
+
+    @cython.cdivision(True)
+    cdef float project_LowLevel(self, Vector3* _point):
+        # Only the segments that can contain the nearest point are projected on.
+        cdef int segmentAmount = getSegmentAmount(self)
+        cdef Py_ssize_t segment
+        cdef float t
+        if segmentAmount <= 0:
+            return 0
+
+        self.getSegmentBVH().findNearest_LowLevel(_point, projectOnSegment, self, &segment, &t)
+        return (t + segment) / <float>segmentAmount
+
+
+    cdef void evaluatePoint_LowLevel(self, float parameter, Vector3 *result) nogil:
         cdef float t
         cdef Vector3* w[4]
         getSegmentData_Parameter(self, parameter, &t, w)
         evaluateBezierSegment_Point(result, t, w)
 
-    cdef void evaluateTangent_LowLevel(self, float parameter, Vector3* result):
+    cdef void evaluateTangent_LowLevel(self, float parameter, Vector3* result) nogil:
         cdef float t
         cdef Vector3* w[4]
         getSegmentData_Parameter(self, parameter, &t, w)
         evaluateBezierSegment_Tangent(result, t, w)
 
-    cdef float evaluateCurvature_LowLevel(self, float parameter):
+    cdef float evaluateCurvature_LowLevel(self, float parameter) nogil:
         cdef float t
         cdef Vector3* w[4]
         getSegmentData_Parameter(self, parameter, &t, w)
         return evaluateBezierSegment_Curvature(t, w)
 
-    cdef float evaluateRadius_LowLevel(self, float parameter):
+    cdef float evaluateRadius_LowLevel(self, float parameter) nogil:
         cdef long indices[2]
         cdef float t
         findListSegment_LowLevel(self.points.length, self.cyclic, parameter, indices, &t)
@@ -217,104 +222,17 @@ cdef class BezierSpline(Spline):
         self.markChanged()
 
     cdef BezierSpline getTrimmedCopy_LowLevel(self, float start, float end):
-        cdef:
-            long startIndices[2]
-            long endIndices[2]
-            float startT, endT
-
-        findListSegment_LowLevel(self.points.length, self.cyclic, start, startIndices, &startT)
-        findListSegment_LowLevel(self.points.length, self.cyclic, end, endIndices, &endT)
-
-        cdef long newPointAmount
-        if endIndices[1] == 0: # <- cyclic extension required
-            newPointAmount = self.points.length - startIndices[0] + 1
-        else:
-            newPointAmount = endIndices[1] - startIndices[0] + 1
-
-        cdef:
-            Vector3DList newPoints = Vector3DList(length = newPointAmount)
-            Vector3* _newPoints = newPoints.data
-            Vector3* _oldPoints = self.points.data
-
-            Vector3DList newLeftHandles = Vector3DList(length = newPointAmount)
-            Vector3* _newLeftHandles = newLeftHandles.data
-            Vector3* _oldLeftHandles = self.leftHandles.data
-
-            Vector3DList newRightHandles = Vector3DList(length = newPointAmount)
-            Vector3* _newRightHandles = newRightHandles.data
-            Vector3* _oldRightHandles = self.rightHandles.data
-
-            FloatList newRadii = FloatList(length = newPointAmount)
-            float *_newRadii = newRadii.data
-            float *_oldRadii = self.radii.data
-
-            FloatList newTilts = FloatList(length = newPointAmount)
-            float *_newTilts = newTilts.data
-            float *_oldTilts = self.tilts.data
-
-            Vector3 tmp[4]
-
-        if startIndices[0] == endIndices[0]: # <- result will contain only one segment
-            if endT < 0.0001: # <- both parameters are (nearly) zero, avoid division by zero
-                _newPoints[0] = _oldPoints[startIndices[0]]
-                _newPoints[1] = _oldPoints[startIndices[0]]
-                _newLeftHandles[0] = _oldPoints[startIndices[0]]
-                _newLeftHandles[1] = _oldPoints[startIndices[0]]
-                _newRightHandles[0] = _oldPoints[startIndices[0]]
-                _newRightHandles[1] = _oldPoints[startIndices[0]]
-            else: # <- trim segment from both ends
-                calcRightTrimmedSegment(endT,
-                                   _oldPoints + startIndices[0], _oldRightHandles + startIndices[0],
-                                   _oldLeftHandles + startIndices[1], _oldPoints + startIndices[1],
-                                   tmp + 0, tmp + 1, tmp + 2, tmp + 3)
-                calcLeftTrimmedSegment(startT / endT,
-                                   tmp + 0, tmp + 1, tmp + 2, tmp + 3,
-                                   _newPoints + 0, _newRightHandles + 0,
-                                   _newLeftHandles + 1, _newPoints + 1)
-                _newLeftHandles[0] = _newPoints[0]
-                _newRightHandles[1] = _newPoints[1]
-        else: # <- resulting spline will contain multiple segments
-            # Copy segments which stay the same
-            memcpy(_newPoints + 1,
-                   _oldPoints + startIndices[1],
-                   sizeof(Vector3) * (newPointAmount - 2))
-            memcpy(_newLeftHandles + 1,
-                   _oldLeftHandles + startIndices[1],
-                   sizeof(Vector3) * (newPointAmount - 2))
-            memcpy(_newRightHandles + 1,
-                   _oldRightHandles + startIndices[1],
-                   sizeof(Vector3) * (newPointAmount - 2))
-            memcpy(_newRadii + 1,
-                   _oldRadii + startIndices[1],
-                   sizeof(float) * (newPointAmount - 2))
-            memcpy(_newTilts + 1,
-                   _oldTilts + startIndices[1],
-                   sizeof(float) * (newPointAmount - 2))
-
-            # Trim first segment
-            calcLeftTrimmedSegment(startT,
-                _oldPoints + startIndices[0], _oldRightHandles + startIndices[0],
-                _oldLeftHandles + startIndices[1], _oldPoints + startIndices[1],
-                _newPoints, _newRightHandles,
-                _newLeftHandles + 1, _newPoints + 1)
-            _newLeftHandles[0] = _newPoints[0]
-
-            # Trim last segment
-            calcRightTrimmedSegment(endT,
-                _oldPoints + endIndices[0], _oldRightHandles + endIndices[0],
-                _oldLeftHandles + endIndices[1], _oldPoints + endIndices[1],
-                _newPoints + newPointAmount - 2, _newRightHandles + newPointAmount - 2,
-                _newLeftHandles + newPointAmount - 1, _newPoints + newPointAmount - 1)
-            _newRightHandles[newPointAmount - 1] = _newPoints[newPointAmount - 1]
-
-        # calculate radius of first and last point
-        _newRadii[0] = _oldRadii[startIndices[0]] * (1 - startT) + _oldRadii[startIndices[1]] * startT
-        _newRadii[newPointAmount - 1] = _oldRadii[endIndices[0]] * (1 - endT) + _oldRadii[endIndices[1]] * endT
-
-        # calculate tilt of first and last point
-        _newTilts[0] = _oldTilts[startIndices[0]] * (1 - startT) + _oldTilts[startIndices[1]] * startT
-        _newTilts[newPointAmount - 1] = _oldTilts[endIndices[0]] * (1 - endT) + _oldTilts[endIndices[1]] * endT
-
+        cdef Py_ssize_t newPointAmount = getTrimmedPointAmount(self.points.length, self.cyclic, start, end)
+        cdef Vector3DList newPoints = Vector3DList(length = newPointAmount)
+        cdef Vector3DList newLeftHandles = Vector3DList(length = newPointAmount)
+        cdef Vector3DList newRightHandles = Vector3DList(length = newPointAmount)
+        cdef FloatList newRadii = FloatList(length = newPointAmount)
+        cdef FloatList newTilts = FloatList(length = newPointAmount)
+        trimBezierSplineData(self.points.data, self.leftHandles.data, self.rightHandles.data,
+                             self.radii.data, self.tilts.data,
+                             self.points.length, self.cyclic, start, end,
+                             newPoints.data, newLeftHandles.data, newRightHandles.data,
+                             newRadii.data, newTilts.data, newPointAmount)
         return BezierSpline(newPoints, newLeftHandles, newRightHandles, newRadii, newTilts, False, self.materialIndex)
 
     def improveStraightBezierSegments(self):
@@ -326,6 +244,81 @@ cdef class BezierSpline(Spline):
                 mixVec3(w[1], w[0], w[3], 1.0 / 3.0)
                 mixVec3(w[2], w[0], w[3], 2.0 / 3.0)
 
+cdef trimBezierSplineData(Vector3 *_oldPoints, Vector3 *_oldLeftHandles, Vector3 *_oldRightHandles,
+                          float *_oldRadii, float *_oldTilts,
+                          Py_ssize_t pointAmount, bint cyclic, float start, float end,
+                          Vector3 *_newPoints, Vector3 *_newLeftHandles, Vector3 *_newRightHandles,
+                          float *_newRadii, float *_newTilts, Py_ssize_t newPointAmount):
+    cdef:
+        long startIndices[2]
+        long endIndices[2]
+        float startT, endT
+        Vector3 tmp[4]
+
+    findListSegment_LowLevel(pointAmount, cyclic, start, startIndices, &startT)
+    findListSegment_LowLevel(pointAmount, cyclic, end, endIndices, &endT)
+
+    if startIndices[0] == endIndices[0]: # <- result will contain only one segment
+        if endT < 0.0001: # <- both parameters are (nearly) zero, avoid division by zero
+            _newPoints[0] = _oldPoints[startIndices[0]]
+            _newPoints[1] = _oldPoints[startIndices[0]]
+            _newLeftHandles[0] = _oldPoints[startIndices[0]]
+            _newLeftHandles[1] = _oldPoints[startIndices[0]]
+            _newRightHandles[0] = _oldPoints[startIndices[0]]
+            _newRightHandles[1] = _oldPoints[startIndices[0]]
+        else: # <- trim segment from both ends
+            calcRightTrimmedSegment(endT,
+                               _oldPoints + startIndices[0], _oldRightHandles + startIndices[0],
+                               _oldLeftHandles + startIndices[1], _oldPoints + startIndices[1],
+                               tmp + 0, tmp + 1, tmp + 2, tmp + 3)
+            calcLeftTrimmedSegment(startT / endT,
+                               tmp + 0, tmp + 1, tmp + 2, tmp + 3,
+                               _newPoints + 0, _newRightHandles + 0,
+                               _newLeftHandles + 1, _newPoints + 1)
+            _newLeftHandles[0] = _newPoints[0]
+            _newRightHandles[1] = _newPoints[1]
+    else: # <- resulting spline will contain multiple segments
+        # Copy segments which stay the same
+        memcpy(_newPoints + 1,
+               _oldPoints + startIndices[1],
+               sizeof(Vector3) * (newPointAmount - 2))
+        memcpy(_newLeftHandles + 1,
+               _oldLeftHandles + startIndices[1],
+               sizeof(Vector3) * (newPointAmount - 2))
+        memcpy(_newRightHandles + 1,
+               _oldRightHandles + startIndices[1],
+               sizeof(Vector3) * (newPointAmount - 2))
+        memcpy(_newRadii + 1,
+               _oldRadii + startIndices[1],
+               sizeof(float) * (newPointAmount - 2))
+        memcpy(_newTilts + 1,
+               _oldTilts + startIndices[1],
+               sizeof(float) * (newPointAmount - 2))
+
+        # Trim first segment
+        calcLeftTrimmedSegment(startT,
+            _oldPoints + startIndices[0], _oldRightHandles + startIndices[0],
+            _oldLeftHandles + startIndices[1], _oldPoints + startIndices[1],
+            _newPoints, _newRightHandles,
+            _newLeftHandles + 1, _newPoints + 1)
+        _newLeftHandles[0] = _newPoints[0]
+
+        # Trim last segment
+        calcRightTrimmedSegment(endT,
+            _oldPoints + endIndices[0], _oldRightHandles + endIndices[0],
+            _oldLeftHandles + endIndices[1], _oldPoints + endIndices[1],
+            _newPoints + newPointAmount - 2, _newRightHandles + newPointAmount - 2,
+            _newLeftHandles + newPointAmount - 1, _newPoints + newPointAmount - 1)
+        _newRightHandles[newPointAmount - 1] = _newPoints[newPointAmount - 1]
+
+    # calculate radius of first and last point
+    _newRadii[0] = _oldRadii[startIndices[0]] * (1 - startT) + _oldRadii[startIndices[1]] * startT
+    _newRadii[newPointAmount - 1] = _oldRadii[endIndices[0]] * (1 - endT) + _oldRadii[endIndices[1]] * endT
+
+    # calculate tilt of first and last point
+    _newTilts[0] = _oldTilts[startIndices[0]] * (1 - startT) + _oldTilts[startIndices[1]] * startT
+    _newTilts[newPointAmount - 1] = _oldTilts[endIndices[0]] * (1 - endT) + _oldTilts[endIndices[1]] * endT
+
 cdef smoothPoint(BezierSpline spline, Py_ssize_t index, float strength):
     if 0 < index < spline.points.length - 1:
         calculateSmoothControlPoints(spline.points.data + index,
@@ -441,8 +434,49 @@ cdef calcRightTrimmedSegment(float t,
     outP4.z = t3 * P4.z - 3 * t2 * (t-1) * P3.z + 3 * t * (t-1) ** 2 * P2.z - (t-1) ** 3 * P1.z
 
 
+cdef float projectOnSegment(object spline, Py_ssize_t index, Vector3 *_point, float *parameter):
+    # TODO: Speedup using cython
+    # slowest part here is the root finding using numpy
+    # maybe implement another numerical method to find the best parameter
+    # http://jazzros.blogspot.be/2011/03/projecting-point-on-bezier-curve.html
+    cdef:
+        Vector3 *w[4]
+        Vector3 projection
+        float t, distance
+        float smallestDistance = INFINITY
+        list coeffs = [0] * 6
+
+    getSegmentData_Index(<BezierSpline>spline, index, w)
+    point = toPyVector3(_point)
+    p0 = toPyVector3(w[0]) - point
+    p1 = toPyVector3(w[1]) - point
+    p2 = toPyVector3(w[2]) - point
+    p3 = toPyVector3(w[3]) - point
+
+    a = p3 - 3 * p2 + 3 * p1 - p0
+    b = 3 * p2 - 6 * p1 + 3 * p0
+    c = 3 * (p1 - p0)
+
+    coeffs[0] = c.dot(p0)
+    coeffs[1] = c.dot(c) + b.dot(p0) * 2.0
+    coeffs[2] = b.dot(c) * 3.0 + a.dot(p0) * 3.0
+    coeffs[3] = a.dot(c) * 4.0 + b.dot(b) * 2.0
+    coeffs[4] = a.dot(b) * 5.0
+    coeffs[5] = a.dot(a) * 3.0
+
+    poly = Polynomial(coeffs, [0.0, 1.0], [0.0, 1.0])
+    parameter[0] = 0
+    for root in poly.roots():
+        t = min(max(root.real, 0), 1)
+        evaluateBezierSegment_Point(&projection, t, w)
+        distance = distanceSquaredVec3(_point, &projection)
+        if distance < smallestDistance:
+            smallestDistance = distance
+            parameter[0] = t
+    return smallestDistance
+
 cdef inline void getSegmentData_Parameter(BezierSpline spline, float parameter,
-                                          float *t, Vector3 **w):
+                                          float *t, Vector3 **w) nogil:
     cdef long indices[2]
     findListSegment_LowLevel(spline.points.length, spline.cyclic, parameter, indices, t)
     w[0] = spline.points.data + indices[0]
@@ -461,7 +495,7 @@ cdef inline void getSegmentData_Index(BezierSpline spline, Py_ssize_t index, Vec
     w[2] = spline.leftHandles.data + i2
     w[3] = spline.points.data + i2
 
-cdef inline void getSegmentIndex(BezierSpline spline, float parameter, Py_ssize_t *index, float *t):
+cdef inline void getSegmentIndex(BezierSpline spline, float parameter, Py_ssize_t *index, float *t) nogil:
     cdef long indices[2]
     findListSegment_LowLevel(spline.points.length, spline.cyclic, parameter, indices, t)
     index[0] = indices[0]
@@ -469,7 +503,7 @@ cdef inline void getSegmentIndex(BezierSpline spline, float parameter, Py_ssize_
 cdef inline int getSegmentAmount(BezierSpline spline):
     return spline.points.length - 1 + spline.cyclic
 
-cdef inline void evaluateBezierSegment_Point(Vector3 *result, float t, Vector3 **w):
+cdef inline void evaluateBezierSegment_Point(Vector3 *result, float t, Vector3 **w) nogil:
     cdef:
         float t2 = t * t
         float t3 = t2 * t
@@ -482,7 +516,7 @@ cdef inline void evaluateBezierSegment_Point(Vector3 *result, float t, Vector3 *
     result.y = w[0].y*mt3 + w[1].y*coeff1 + w[2].y*coeff2 + w[3].y*t3
     result.z = w[0].z*mt3 + w[1].z*coeff1 + w[2].z*coeff2 + w[3].z*t3
 
-cdef inline void evaluateBezierSegment_Tangent(Vector3 *result, float t, Vector3 **w):
+cdef inline void evaluateBezierSegment_Tangent(Vector3 *result, float t, Vector3 **w) nogil:
     cdef:
         float t2 = t * t
         float coeff0 = -3 +  6 * t - 3 * t2
@@ -493,13 +527,13 @@ cdef inline void evaluateBezierSegment_Tangent(Vector3 *result, float t, Vector3
     result.y = w[0].y*coeff0 + w[1].y*coeff1 + w[2].y*coeff2 + w[3].y*coeff3
     result.z = w[0].z*coeff0 + w[1].z*coeff1 + w[2].z*coeff2 + w[3].z*coeff3
 
-cdef inline void evaluateBezierSegment_Normal(Vector3 *result, float t, Vector3 **w):
+cdef inline void evaluateBezierSegment_Normal(Vector3 *result, float t, Vector3 **w) nogil:
     result.x = 6 * (1 - t) * (w[2].x - 2 * w[1].x + w[0].x) + 6 * t * (w[3].x - 2 * w[2].x + w[1].x)
     result.y = 6 * (1 - t) * (w[2].y - 2 * w[1].y + w[0].y) + 6 * t * (w[3].y - 2 * w[2].y + w[1].y)
     result.z = 6 * (1 - t) * (w[2].z - 2 * w[1].z + w[0].z) + 6 * t * (w[3].z - 2 * w[2].z + w[1].z)
 
 @cython.cdivision(True)
-cdef inline float evaluateBezierSegment_Curvature(float t, Vector3 **w):
+cdef inline float evaluateBezierSegment_Curvature(float t, Vector3 **w) nogil:
     cdef Vector3 tangent
     evaluateBezierSegment_Tangent(&tangent, t, w)
     cdef Vector3 normal
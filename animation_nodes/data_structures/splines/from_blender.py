@@ -1,6 +1,8 @@
+from itertools import accumulate
 from . poly_spline import PolySpline
-from .. import FloatList, Vector3DList
 from . bezier_spline import BezierSpline
+from . spline_collection import SplineCollection
+from .. import FloatList, Vector3DList, LongList, BooleanList
 
 def createSplinesFromBlenderObject(bObject, applyModifiers = False):
     curve = bObject.an.getCurve(applyModifiers)
@@ -54,3 +56,101 @@ def createPolySpline(bSpline):
     spline.cyclic = bSpline.use_cyclic_u
     spline.materialIndex = bSpline.material_index
     return spline
+
+def createTransformedSplinesFromBlenderObject(bObject, matrix = None, applyModifiers = False):
+    '''
+    Like createSplinesFromBlenderObject, but when all supported splines
+    have the same type, they are loaded and transformed in bulk.
+    '''
+    curve = bObject.an.getCurve(applyModifiers)
+    if curve is None: return []
+
+    bSplines = getSupportedBlenderSplines(curve)
+    if len({bSpline.type for bSpline in bSplines}) == 1:
+        splines = createSplineCollectionFromBlenderSplines(bSplines, bSplines[0].type)
+        if matrix is not None:
+            splines.transform(matrix)
+        return splines.toSplines()
+
+    splines = [createSplineFromBlenderSpline(bSpline) for bSpline in bSplines]
+    if matrix is not None:
+        for spline in splines:
+            spline.transform(matrix)
+    return splines
+
+def createSplineCollectionFromBlenderObject(bObject, applyModifiers = False, splineType = None):
+    '''
+    Only splines of one type are loaded. When no type is given,
+    the type of the first poly or bezier spline is used.
+    '''
+    curve = bObject.an.getCurve(applyModifiers)
+    bSplines = [] if curve is None else getSupportedBlenderSplines(curve)
+    if splineType is None:
+        splineType = bSplines[0].type if len(bSplines) > 0 else "BEZIER"
+    return createSplineCollectionFromBlenderSplines(bSplines, splineType)
+
+def getSupportedBlenderSplines(curve):
+    return [bSpline for bSpline in curve.splines if bSpline.type in ("POLY", "BEZIER")]
+
+def createSplineCollectionFromBlenderSplines(bSplines, splineType):
+    bSplines = [bSpline for bSpline in bSplines if bSpline.type == splineType]
+
+    if splineType == "BEZIER":
+        pointAmounts = [len(bSpline.bezier_points) for bSpline in bSplines]
+    else:
+        pointAmounts = [len(bSpline.points) for bSpline in bSplines]
+    offsets = LongList.fromValues(list(accumulate([0] + pointAmounts)))
+    cyclics = BooleanList.fromValues([bSpline.use_cyclic_u for bSpline in bSplines])
+    materialIndices = LongList.fromValues([bSpline.material_index for bSpline in bSplines])
+
+    if splineType == "BEZIER":
+        return createBezierSplineCollection(bSplines, offsets, cyclics, materialIndices)
+    else:
+        return createPolySplineCollection(bSplines, offsets, cyclics, materialIndices)
+
+def createBezierSplineCollection(bSplines, offsets, cyclics, materialIndices):
+    amount = offsets[-1]
+    points = Vector3DList(length = amount)
+    leftHandles = Vector3DList(length = amount)
+    rightHandles = Vector3DList(length = amount)
+    radii = FloatList(length = amount)
+    tilts = FloatList(length = amount)
+
+    # all splines are loaded into slices of the same buffers
+    pointsView = points.asMemoryView()
+    leftHandlesView = leftHandles.asMemoryView()
+    rightHandlesView = rightHandles.asMemoryView()
+    radiiView = radii.asMemoryView()
+    tiltsView = tilts.asMemoryView()
+
+    for i, bSpline in enumerate(bSplines):
+        start, end = offsets[i], offsets[i + 1]
+        bSpline.bezier_points.foreach_get("co", pointsView[start * 3:end * 3])
+        bSpline.bezier_points.foreach_get("handle_left", leftHandlesView[start * 3:end * 3])
+        bSpline.bezier_points.foreach_get("handle_right", rightHandlesView[start * 3:end * 3])
+        bSpline.bezier_points.foreach_get("radius", radiiView[start:end])
+        bSpline.bezier_points.foreach_get("tilt", tiltsView[start:end])
+
+    return SplineCollection("BEZIER", points, leftHandles, rightHandles, radii, tilts,
+                            offsets, cyclics, materialIndices)
+
+def createPolySplineCollection(bSplines, offsets, cyclics, materialIndices):
+    amount = offsets[-1]
+    pointArray = FloatList(length = 4 * amount)
+    radii = FloatList(length = amount)
+    tilts = FloatList(length = amount)
+
+    pointArrayView = pointArray.asMemoryView()
+    radiiView = radii.asMemoryView()
+    tiltsView = tilts.asMemoryView()
+
+    for i, bSpline in enumerate(bSplines):
+        start, end = offsets[i], offsets[i + 1]
+        bSpline.points.foreach_get("co", pointArrayView[start * 4:end * 4])
+        bSpline.points.foreach_get("radius", radiiView[start:end])
+        bSpline.points.foreach_get("tilt", tiltsView[start:end])
+
+    del pointArray[3::4]
+    points = Vector3DList.fromFloatList(pointArray)
+    return SplineCollection("POLY", points, None, None, radii, tilts,
+                            offsets, cyclics, materialIndices)
@@ -8,3 +8,8 @@ cdef class PolySpline(Spline):
         public FloatList radii
         public FloatList tilts
         Vector3DList normalsCache
+
+cdef void trimPolySplineData(Vector3 *_oldPoints, float *_oldRadii, float *_oldTilts,
+                             Py_ssize_t pointAmount, bint cyclic, float start, float end,
+                             Vector3 *_newPoints, float *_newRadii, float *_newTilts,
+                             Py_ssize_t newPointAmount)
@@ -2,6 +2,8 @@ cimport cython
 import textwrap
 from libc.math cimport floor
 from libc.string cimport memcpy
+from . segment_bvh cimport SegmentBVH
+from . base_spline cimport getTrimmedPointAmount
 from . base_spline import calculateNormalsForTangents
 from ... utils.lists cimport findListSegment_LowLevel
 
@@ -63,10 +65,22 @@ cdef class PolySpline(Spline):
                           self.cyclic,
                           self.materialIndex)
 
+    def __reduce__(self):
+        return (PolySpline, (self.points, self.radii, self.tilts, self.cyclic, self.materialIndex))
+
     def transform(self, matrix):
         self.points.transform(matrix)
         self.markChanged()
 
+    def getMemoryUsage(self):
+        cdef Py_ssize_t memory = Spline.getMemoryUsage(self)
+        memory += self.points.getMemoryUsage()
+        memory += self.radii.getMemoryUsage()
+        memory += self.tilts.getMemoryUsage()
+        if self.normalsCache is not None:
+            memory += self.normalsCache.getMemoryUsage()
+        return memory
+
     def getLength(self, int resolution = 0):
         cdef double length = distanceSumOfVector3DList(self.points)
         if self.cyclic and self.points.length >= 2:
@@ -98,11 +112,11 @@ cdef class PolySpline(Spline):
 
         self.normalsCache = calculateNormalsForTangents(tangents, self.cyclic)
 
-    cdef void evaluateNormal_Approximated(self, float parameter, Vector3 *result):
+    cdef void evaluateNormal_Approximated(self, float parameter, Vector3 *result) nogil:
         cdef Py_ssize_t index = getSegmentIndex(self, parameter)
         result[0] = self.normalsCache.data[index]
 
-    cdef float evaluateTilt_LowLevel(self, float parameter):
+    cdef float evaluateTilt_LowLevel(self, float parameter) nogil:
         cdef long indices[2]
         cdef float t
         findListSegment_LowLevel(self.tilts.length, self.cyclic, parameter, indices, &t)
@@ -111,84 +125,42 @@ cdef class PolySpline(Spline):
     # Projection
     #################################################
 
-    @cython.cdivision(True)
-    cdef float project_LowLevel(self, Vector3* point):
-        cdef:
-            float closestParameter = 0
-            float smallestDistance = 1e9
-            float lineParameter, lineDistance
-            int segmentAmount = getSegmentAmount(self)
-            int i, pointAmount = self.points.length
-            Vector3 lineDirection, projectionOnLine
-            Vector3 *_points = self.points.data
-            int endIndex
-
+    cdef SegmentBVH createSegmentBVH(self):
+        cdef Py_ssize_t i, segmentAmount = getSegmentAmount(self)
+        cdef Vector3DList lows = Vector3DList(length = segmentAmount)
+        cdef Vector3DList highs = Vector3DList(length = segmentAmount)
+        cdef Vector3 *start
+        cdef Vector3 *end
         for i in range(segmentAmount):
-            endIndex = (i + 1) % pointAmount
-
-            # find closest t value on current segment
-            subVec3(&lineDirection, _points + endIndex, _points + i)
-            lineParameter = findNearestLineParameter(_points + i, &lineDirection, point)
-            lineParameter = min(max(lineParameter, 0.0), 1.0)
+            start = self.points.data + i
+            end = self.points.data + (i + 1) % self.points.length
+            lows.data[i] = Vector3(min(start.x, end.x), min(start.y, end.y), min(start.z, end.z))
+            highs.data[i] = Vector3(max(start.x, end.x), max(start.y, end.y), max(start.z, end.z))
+        return SegmentBVH(lows, highs)
 
-            # calculate closest point on the current segment
-            mixVec3(&projectionOnLine, _points + i, _points + endIndex, lineParameter)
-
-            # check if it is closer than all previously calculated points
-            lineDistance = distanceSquaredVec3(point, &projectionOnLine)
-            if lineDistance < smallestDistance:
-                smallestDistance = lineDistance
-                closestParameter = (lineParameter + i) / <float>segmentAmount
+    @cython.cdivision(True)
+    cdef float project_LowLevel(self, Vector3* point):
+        cdef int segmentAmount = getSegmentAmount(self)
+        cdef Py_ssize_t segment
+        cdef float lineParameter
+        if segmentAmount <= 0:
+            return 0
 
-        return closestParameter
+        self.getSegmentBVH().findNearest_LowLevel(point, projectOnSegment, self, &segment, &lineParameter)
+        return (lineParameter + segment) / <float>segmentAmount
 
     cdef PolySpline getTrimmedCopy_LowLevel(self, float start, float end):
-        cdef:
-            long startIndices[2]
-            long endIndices[2]
-            float startT, endT
-
-        findListSegment_LowLevel(self.points.length, self.cyclic, start, startIndices, &startT)
-        findListSegment_LowLevel(self.points.length, self.cyclic, end, endIndices, &endT)
-
-        cdef long newPointAmount
-        if endIndices[1] > 0:
-            newPointAmount = endIndices[1] - startIndices[0] + 1
-        elif endIndices[1] == 0: # <- cyclic extension required
-            newPointAmount = self.points.length - startIndices[0] + 1
-
-        cdef:
-            Vector3DList newPoints = Vector3DList(length = newPointAmount)
-            Vector3 *_newPoints = newPoints.data
-            Vector3 *_oldPoints = self.points.data
-
-            FloatList newRadii = FloatList(length = newPointAmount)
-            float *_newRadii = newRadii.data
-            float *_oldRadii = self.radii.data
-
-            FloatList newTilts = FloatList(length = newPointAmount)
-            float *_newTilts = newTilts.data
-            float *_oldTilts = self.tilts.data
-
-        # First Point
-        mixVec3(_newPoints, _oldPoints + startIndices[0], _oldPoints + startIndices[1], startT)
-        _newRadii[0] = _oldRadii[startIndices[0]] * (1 - startT) + _oldRadii[startIndices[1]] * startT
-        _newTilts[0] = _oldTilts[startIndices[0]] * (1 - startT) + _oldTilts[startIndices[1]] * startT
-
-        # Last Point
-        mixVec3(_newPoints + newPointAmount - 1, _oldPoints + endIndices[0], _oldPoints + endIndices[1], endT)
-        _newRadii[newPointAmount - 1] = _oldRadii[endIndices[0]] * (1 - endT) + _oldRadii[endIndices[1]] * endT
-        _newTilts[newPointAmount - 1] = _oldTilts[endIndices[0]] * (1 - endT) + _oldTilts[endIndices[1]] * endT
-
-        # In between
-        memcpy(_newPoints + 1, _oldPoints + startIndices[1], sizeof(Vector3) * (newPointAmount - 2))
-        memcpy(_newRadii + 1, _oldRadii + startIndices[1], sizeof(float) * (newPointAmount - 2))
-        memcpy(_newTilts + 1, _oldTilts + startIndices[1], sizeof(float) * (newPointAmount - 2))
-
+        cdef Py_ssize_t newPointAmount = getTrimmedPointAmount(self.points.length, self.cyclic, start, end)
+        cdef Vector3DList newPoints = Vector3DList(length = newPointAmount)
+        cdef FloatList newRadii = FloatList(length = newPointAmount)
+        cdef FloatList newTilts = FloatList(length = newPointAmount)
+        trimPolySplineData(self.points.data, self.radii.data, self.tilts.data,
+                           self.points.length, self.cyclic, start, end,
+                           newPoints.data, newRadii.data, newTilts.data, newPointAmount)
         return PolySpline(newPoints, newRadii, newTilts, False, self.materialIndex)
 
 
-    cdef void evaluatePoint_LowLevel(self, float parameter, Vector3 *result):
+    cdef void evaluatePoint_LowLevel(self, float parameter, Vector3 *result) nogil:
         cdef:
             Vector3 *_points = self.points.data
             long indices[2]
@@ -196,7 +168,7 @@ cdef class PolySpline(Spline):
         findListSegment_LowLevel(self.points.length, self.cyclic, parameter, indices, &t)
         mixVec3(result, _points + indices[0], _points + indices[1], t)
 
-    cdef void evaluateTangent_LowLevel(self, float parameter, Vector3 *result):
+    cdef void evaluateTangent_LowLevel(self, float parameter, Vector3 *result) nogil:
         cdef:
             Vector3 *_points = self.points.data
             long indices[2]
@@ -204,10 +176,10 @@ cdef class PolySpline(Spline):
         findListSegment_LowLevel(self.points.length, self.cyclic, parameter, indices, &t)
         subVec3(result, _points + indices[1], _points + indices[0])
 
-    cdef float evaluateCurvature_LowLevel(self, float parameter):
+    cdef float evaluateCurvature_LowLevel(self, float parameter) nogil:
         return 0
 
-    cdef float evaluateRadius_LowLevel(self, float parameter):
+    cdef float evaluateRadius_LowLevel(self, float parameter) nogil:
         cdef long indices[2]
         cdef float t
         findListSegment_LowLevel(self.points.length, self.cyclic, parameter, indices, &t)
@@ -261,10 +233,52 @@ cdef class PolySpline(Spline):
         return parameters
 
 
+cdef void trimPolySplineData(Vector3 *_oldPoints, float *_oldRadii, float *_oldTilts,
+                             Py_ssize_t pointAmount, bint cyclic, float start, float end,
+                             Vector3 *_newPoints, float *_newRadii, float *_newTilts,
+                             Py_ssize_t newPointAmount):
+    cdef:
+        long startIndices[2]
+        long endIndices[2]
+        float startT, endT
+
+    findListSegment_LowLevel(pointAmount, cyclic, start, startIndices, &startT)
+    findListSegment_LowLevel(pointAmount, cyclic, end, endIndices, &endT)
+
+    # First Point
+    mixVec3(_newPoints, _oldPoints + startIndices[0], _oldPoints + startIndices[1], startT)
+    _newRadii[0] = _oldRadii[startIndices[0]] * (1 - startT) + _oldRadii[startIndices[1]] * startT
+    _newTilts[0] = _oldTilts[startIndices[0]] * (1 - startT) + _oldTilts[startIndices[1]] * startT
+
+    # Last Point
+    mixVec3(_newPoints + newPointAmount - 1, _oldPoints + endIndices[0], _oldPoints + endIndices[1], endT)
+    _newRadii[newPointAmount - 1] = _oldRadii[endIndices[0]] * (1 - endT) + _oldRadii[endIndices[1]] * endT
+    _newTilts[newPointAmount - 1] = _oldTilts[endIndices[0]] * (1 - endT) + _oldTilts[endIndices[1]] * endT
+
+    # In between
+    memcpy(_newPoints + 1, _oldPoints + startIndices[1], sizeof(Vector3) * (newPointAmount - 2))
+    memcpy(_newRadii + 1, _oldRadii + startIndices[1], sizeof(float) * (newPointAmount - 2))
+    memcpy(_newTilts + 1, _oldTilts + startIndices[1], sizeof(float) * (newPointAmount - 2))
+
+cdef float projectOnSegment(object spline, Py_ssize_t index, Vector3 *point, float *lineParameter):
+    cdef PolySpline _spline = spline
+    cdef Vector3 *_points = _spline.points.data
+    cdef Py_ssize_t endIndex = (index + 1) % _spline.points.length
+    cdef Vector3 lineDirection, projectionOnLine
+
+    # find closest t value on the segment
+    subVec3(&lineDirection, _points + endIndex, _points + index)
+    lineParameter[0] = findNearestLineParameter(_points + index, &lineDirection, point)
+    lineParameter[0] = min(max(lineParameter[0], 0.0), 1.0)
+
+    # calculate closest point on the segment
+    mixVec3(&projectionOnLine, _points + index, _points + endIndex, lineParameter[0])
+    return distanceSquaredVec3(point, &projectionOnLine)
+
 cdef inline int getSegmentAmount(PolySpline spline):
     return spline.points.length - 1 + spline.cyclic
 
-cdef inline Py_ssize_t getSegmentIndex(PolySpline spline, float parameter):
+cdef inline Py_ssize_t getSegmentIndex(PolySpline spline, float parameter) nogil:
     cdef long indices[2]
     cdef float t
     findListSegment_LowLevel(spline.points.length, spline.cyclic, parameter, indices, &t)
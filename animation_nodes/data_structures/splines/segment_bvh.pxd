@@ -0,0 +1,26 @@
+from ... math cimport Vector3
+from .. lists.base_lists cimport Vector3DList, LongList
+
+# Returns the squared distance to the nearest point on the segment
+# and writes the parameter of that point on the segment into t.
+ctypedef float (*SegmentDistanceFunction)(object, Py_ssize_t, Vector3*, float*)
+
+cdef struct SegmentBVHNode:
+    Vector3 low, high
+    Py_ssize_t start, end
+    Py_ssize_t firstChild
+
+cdef class SegmentBVH:
+    cdef Vector3DList lows
+    cdef Vector3DList highs
+    cdef LongList segments
+    cdef SegmentBVHNode *nodes
+    cdef Py_ssize_t nodeAmount
+
+    cdef Py_ssize_t getSegmentAmount(self)
+    cdef void buildNode(self, Py_ssize_t nodeIndex, Vector3DList centers)
+    cdef void calculateBounds(self, SegmentBVHNode *node)
+
+    cdef float findNearest_LowLevel(self, Vector3 *point,
+                                    SegmentDistanceFunction function, object spline,
+                                    Py_ssize_t *segment, float *t)
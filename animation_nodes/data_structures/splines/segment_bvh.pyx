@@ -0,0 +1,218 @@
+from libc.math cimport INFINITY
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+
+cdef enum:
+    LEAF_SIZE = 4
+    STACK_SIZE = 128
+
+cdef class SegmentBVH:
+    '''
+    Bounding volume hierarchy over the segments of a spline.
+    Every segment is given by the bounding box of its control points.
+    The distance to the segments themselves is calculated by a function
+    of the spline, so that the same hierarchy works for all spline types.
+    '''
+
+    def __cinit__(self, Vector3DList lows, Vector3DList highs):
+        cdef Py_ssize_t i, amount = lows.length
+        if highs.length != amount:
+            raise ValueError("lows and highs need the same length")
+
+        self.lows = lows.copy()
+        self.highs = highs.copy()
+        self.segments = LongList(length = amount)
+        cdef Vector3DList centers = Vector3DList(length = amount)
+        for i in range(amount):
+            self.segments.data[i] = i
+            centers.data[i].x = (lows.data[i].x + highs.data[i].x) / 2
+            centers.data[i].y = (lows.data[i].y + highs.data[i].y) / 2
+            centers.data[i].z = (lows.data[i].z + highs.data[i].z) / 2
+
+        self.nodes = <SegmentBVHNode*>PyMem_Malloc(sizeof(SegmentBVHNode) * max(2 * amount, 1))
+        if self.nodes == NULL:
+            raise MemoryError()
+        self.nodes[0].start = 0
+        self.nodes[0].end = amount
+        self.nodeAmount = 1
+        self.buildNode(0, centers)
+
+    def __dealloc__(self):
+        if self.nodes != NULL:
+            PyMem_Free(self.nodes)
+
+    cdef Py_ssize_t getSegmentAmount(self):
+        return self.segments.length
+
+    def getMemoryUsage(self):
+        return (self.lows.getMemoryUsage() +
+                self.highs.getMemoryUsage() +
+                self.segments.getMemoryUsage() +
+                self.nodeAmount * sizeof(SegmentBVHNode))
+
+    def __repr__(self):
+        return "<AN SegmentBVH with {} segments>".format(self.getSegmentAmount())
+
+
+    # Construction
+    ###############################################
+
+    cdef void buildNode(self, Py_ssize_t nodeIndex, Vector3DList centers):
+        cdef SegmentBVHNode *node = self.nodes + nodeIndex
+        self.calculateBounds(node)
+        node.firstChild = -1
+        if node.end - node.start <= LEAF_SIZE:
+            return
+
+        cdef char axis = getLargestExtentAxis(centers.data, node.start, node.end)
+        cdef Py_ssize_t middle = (node.start + node.end) // 2
+        selectNthSegment(self.lows.data, self.highs.data, self.segments.data, centers.data,
+                         node.start, node.end, middle, axis)
+
+        cdef Py_ssize_t firstChild = self.nodeAmount
+        self.nodeAmount += 2
+        node.firstChild = firstChild
+        self.nodes[firstChild].start = node.start
+        self.nodes[firstChild].end = middle
+        self.nodes[firstChild + 1].start = middle
+        self.nodes[firstChild + 1].end = node.end
+        self.buildNode(firstChild, centers)
+        self.buildNode(firstChild + 1, centers)
+
+    cdef void calculateBounds(self, SegmentBVHNode *node):
+        cdef Py_ssize_t i
+        if node.start == node.end:
+            node.low = node.high = Vector3(0, 0, 0)
+            return
+
+        node.low = self.lows.data[node.start]
+        node.high = self.highs.data[node.start]
+        for i in range(node.start + 1, node.end):
+            node.low.x = min(node.low.x, self.lows.data[i].x)
+            node.low.y = min(node.low.y, self.lows.data[i].y)
+            node.low.z = min(node.low.z, self.lows.data[i].z)
+            node.high.x = max(node.high.x, self.highs.data[i].x)
+            node.high.y = max(node.high.y, self.highs.data[i].y)
+            node.high.z = max(node.high.z, self.highs.data[i].z)
+
+
+    # Search
+    ###############################################
+
+    cdef float findNearest_LowLevel(self, Vector3 *point,
+                                    SegmentDistanceFunction function, object spline,
+                                    Py_ssize_t *segment, float *t):
+        '''
+        Returns the squared distance to the nearest segment. When multiple
+        segments have the same distance, the one with the lowest index is used.
+        '''
+        cdef Py_ssize_t stack[STACK_SIZE]
+        cdef Py_ssize_t i, first, second, stackSize = 1
+        cdef SegmentBVHNode *node
+        cdef float distanceSquared, segmentT
+        cdef float smallestDistance = INFINITY
+
+        segment[0] = -1
+        t[0] = 0
+        if self.getSegmentAmount() == 0:
+            return smallestDistance
+
+        stack[0] = 0
+        while stackSize > 0:
+            stackSize -= 1
+            node = self.nodes + stack[stackSize]
+            if boxDistanceSquared(point, &node.low, &node.high) > smallestDistance:
+                continue
+            if node.firstChild == -1:
+                for i in range(node.start, node.end):
+                    if boxDistanceSquared(point, self.lows.data + i, self.highs.data + i) > smallestDistance:
+                        continue
+                    distanceSquared = function(spline, self.segments.data[i], point, &segmentT)
+                    if (distanceSquared < smallestDistance or
+                            (distanceSquared == smallestDistance and self.segments.data[i] < segment[0])):
+                        smallestDistance = distanceSquared
+                        segment[0] = self.segments.data[i]
+                        t[0] = segmentT
+            else:
+                # the nearer child is searched first
+                first, second = node.firstChild, node.firstChild + 1
+                if (boxDistanceSquared(point, &self.nodes[first].low, &self.nodes[first].high) <
+                        boxDistanceSquared(point, &self.nodes[second].low, &self.nodes[second].high)):
+                    first, second = second, first
+                stack[stackSize] = first
+                stack[stackSize + 1] = second
+                stackSize += 2
+
+        return smallestDistance
+
+cdef inline float boxDistanceSquared(Vector3 *point, Vector3 *low, Vector3 *high):
+    cdef float dx = max(low.x - point.x, 0, point.x - high.x)
+    cdef float dy = max(low.y - point.y, 0, point.y - high.y)
+    cdef float dz = max(low.z - point.z, 0, point.z - high.z)
+    return dx * dx + dy * dy + dz * dz
+
+
+# Construction Utilities
+###############################################
+
+cdef char getLargestExtentAxis(Vector3* points, Py_ssize_t start, Py_ssize_t end):
+    cdef Vector3 low = points[start]
+    cdef Vector3 high = points[start]
+    cdef Py_ssize_t i
+    for i in range(start + 1, end):
+        low.x = min(low.x, points[i].x)
+        low.y = min(low.y, points[i].y)
+        low.z = min(low.z, points[i].z)
+        high.x = max(high.x, points[i].x)
+        high.y = max(high.y, points[i].y)
+        high.z = max(high.z, points[i].z)
+
+    cdef float extentX = high.x - low.x
+    cdef float extentY = high.y - low.y
+    cdef float extentZ = high.z - low.z
+    if extentX >= extentY and extentX >= extentZ: return 0
+    if extentY >= extentZ: return 1
+    return 2
+
+cdef void selectNthSegment(Vector3* lows, Vector3* highs, long* segments, Vector3* centers,
+                           Py_ssize_t start, Py_ssize_t end, Py_ssize_t n, char axis):
+    '''
+    Reorders the segments so that the one at index n is the one
+    that would be there if they were sorted by their centers along the axis.
+    '''
+    cdef Py_ssize_t left = start
+    cdef Py_ssize_t right = end - 1
+    cdef Py_ssize_t lower, upper, i
+    cdef float pivot, value
+
+    while left < right:
+        pivot = getCoordinate(centers + (left + right) // 2, axis)
+        lower = left
+        upper = right
+        i = left
+        while i <= upper:
+            value = getCoordinate(centers + i, axis)
+            if value < pivot:
+                swapSegments(lows, highs, segments, centers, lower, i)
+                lower += 1
+                i += 1
+            elif value > pivot:
+                swapSegments(lows, highs, segments, centers, i, upper)
+                upper -= 1
+            else:
+                i += 1
+
+        if n < lower: right = lower - 1
+        elif n > upper: left = upper + 1
+        else: return
+
+cdef inline void swapSegments(Vector3* lows, Vector3* highs, long* segments, Vector3* centers,
+                              Py_ssize_t a, Py_ssize_t b):
+    lows[a], lows[b] = lows[b], lows[a]
+    highs[a], highs[b] = highs[b], highs[a]
+    segments[a], segments[b] = segments[b], segments[a]
+    centers[a], centers[b] = centers[b], centers[a]
+
+cdef inline float getCoordinate(Vector3* vector, char axis):
+    if axis == 0: return vector.x
+    if axis == 1: return vector.y
+    return vector.z
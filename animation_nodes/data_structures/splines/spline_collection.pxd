@@ -0,0 +1,21 @@
+from ... math cimport Vector3
+from .. lists.base_lists cimport Vector3DList, FloatList, LongList, BooleanList
+
+cdef class SplineCollection:
+    cdef:
+        readonly str type
+        readonly Vector3DList points
+        readonly Vector3DList leftHandles
+        readonly Vector3DList rightHandles
+        readonly FloatList radii
+        readonly FloatList tilts
+        readonly LongList offsets
+        readonly BooleanList cyclics
+        readonly LongList materialIndices
+
+    cdef Py_ssize_t getLength(self)
+    cdef Py_ssize_t getPointAmount(self, Py_ssize_t index)
+    cdef getSpline(self, Py_ssize_t index)
+    cdef setSplineData(self, Py_ssize_t index, spline)
+    cpdef bint isEvaluable(self)
+    cdef trimSpline(self, Py_ssize_t index, float start, float end, SplineCollection result)
@@ -0,0 +1,297 @@
+from libc.string cimport memcpy
+from . base_spline cimport getTrimmedPointAmount
+from . poly_spline cimport PolySpline, trimPolySplineData
+from . bezier_spline cimport BezierSpline, trimBezierSplineData
+from .. lists.base_lists cimport Matrix4x4List
+from ... math cimport Matrix4, transformVec3AsPoint
+
+cdef class SplineCollection:
+    '''
+    Many splines of the same type whose data is stored in shared lists.
+    The points of spline i are in the range offsets[i] to offsets[i + 1]
+    of all point lists. Only bezier collections have handles.
+    '''
+
+    def __cinit__(self, str type = "POLY",
+                        Vector3DList points = None,
+                        Vector3DList leftHandles = None,
+                        Vector3DList rightHandles = None,
+                        FloatList radii = None,
+                        FloatList tilts = None,
+                        LongList offsets = None,
+                        BooleanList cyclics = None,
+                        LongList materialIndices = None):
+        if type not in ("POLY", "BEZIER"):
+            raise ValueError("type has to be 'POLY' or 'BEZIER'")
+        if points is None: points = Vector3DList()
+        if radii is None: radii = FloatList.fromValue(0.1, length = points.length)
+        if tilts is None: tilts = FloatList.fromValue(0, length = points.length)
+        if offsets is None:
+            offsets = LongList.fromValues([0, points.length] if points.length > 0 else [0])
+
+        if type == "BEZIER":
+            if leftHandles is None: leftHandles = points.copy()
+            if rightHandles is None: rightHandles = points.copy()
+            if not (points.length == leftHandles.length == rightHandles.length):
+                raise ValueError("list lengths have to be equal")
+        elif leftHandles is not None or rightHandles is not None:
+            raise ValueError("poly splines have no handles")
+
+        if not (points.length == radii.length == tilts.length):
+            raise ValueError("list lengths have to be equal")
+        checkOffsets(offsets, points.length)
+
+        cdef Py_ssize_t splineAmount = offsets.length - 1
+        if cyclics is None: cyclics = BooleanList.fromValue(False, length = splineAmount)
+        if materialIndices is None: materialIndices = LongList.fromValue(0, length = splineAmount)
+        if not (cyclics.length == materialIndices.length == splineAmount):
+            raise ValueError("there has to be one cyclic state and material index per spline")
+
+        self.type = type
+        self.points = points
+        self.leftHandles = leftHandles
+        self.rightHandles = rightHandles
+        self.radii = radii
+        self.tilts = tilts
+        self.offsets = offsets
+        self.cyclics = cyclics
+        self.materialIndices = materialIndices
+
+    @classmethod
+    def fromSplines(cls, list splines not None):
+        '''All splines need to have the same type.'''
+        cdef str type = splines[0].type if len(splines) > 0 else "POLY"
+        cdef Py_ssize_t i, splineAmount = len(splines)
+        cdef LongList offsets = LongList(length = splineAmount + 1)
+        cdef BooleanList cyclics = BooleanList(length = splineAmount)
+        cdef LongList materialIndices = LongList(length = splineAmount)
+
+        offsets.data[0] = 0
+        for i in range(splineAmount):
+            spline = splines[i]
+            if spline.type != type:
+                raise ValueError("all splines need to have the same type")
+            offsets.data[i + 1] = offsets.data[i] + len(spline.points)
+            cyclics.data[i] = spline.cyclic
+            materialIndices.data[i] = spline.materialIndex
+
+        cdef SplineCollection collection = SplineCollection.fromOffsets(type, offsets)
+        collection.cyclics = cyclics
+        collection.materialIndices = materialIndices
+        for i in range(splineAmount):
+            collection.setSplineData(i, splines[i])
+        return collection
+
+    @classmethod
+    def fromOffsets(cls, str type, LongList offsets not None):
+        '''Creates a collection whose point data is not initialized.'''
+        cdef Py_ssize_t pointAmount = offsets.data[offsets.length - 1] if offsets.length > 0 else 0
+        return SplineCollection(type,
+            Vector3DList(length = pointAmount),
+            Vector3DList(length = pointAmount) if type == "BEZIER" else None,
+            Vector3DList(length = pointAmount) if type == "BEZIER" else None,
+            FloatList(length = pointAmount),
+            FloatList(length = pointAmount),
+            offsets.copy())
+
+    def __len__(self):
+        return self.getLength()
+
+    cdef Py_ssize_t getLength(self):
+        return self.offsets.length - 1
+
+    cdef Py_ssize_t getPointAmount(self, Py_ssize_t index):
+        return self.offsets.data[index + 1] - self.offsets.data[index]
+
+    def getMemoryUsage(self):
+        memory = (self.points.getMemoryUsage() +
+                  self.radii.getMemoryUsage() +
+                  self.tilts.getMemoryUsage() +
+                  self.offsets.getMemoryUsage() +
+                  self.cyclics.getMemoryUsage() +
+                  self.materialIndices.getMemoryUsage())
+        if self.type == "BEZIER":
+            memory += self.leftHandles.getMemoryUsage() + self.rightHandles.getMemoryUsage()
+        return memory
+
+    def __repr__(self):
+        return "<AN SplineCollection with {} {} splines and {} points>".format(
+            self.getLength(), self.type.lower(), self.points.length)
+
+    def copy(self):
+        return SplineCollection(self.type,
+            self.points.copy(),
+            self.leftHandles.copy() if self.type == "BEZIER" else None,
+            self.rightHandles.copy() if self.type == "BEZIER" else None,
+            self.radii.copy(),
+            self.tilts.copy(),
+            self.offsets.copy(),
+            self.cyclics.copy(),
+            self.materialIndices.copy())
+
+
+    # Conversion
+    ###############################################
+
+    def __getitem__(self, Py_ssize_t index):
+        if index < 0: index += self.getLength()
+        if not (0 <= index < self.getLength()):
+            raise IndexError("index is out of bounds")
+        return self.getSpline(index)
+
+    def toSplines(self):
+        cdef Py_ssize_t i
+        return [self.getSpline(i) for i in range(self.getLength())]
+
+    cdef getSpline(self, Py_ssize_t index):
+        cdef Py_ssize_t start = self.offsets.data[index]
+        cdef Py_ssize_t end = self.offsets.data[index + 1]
+        if self.type == "BEZIER":
+            return BezierSpline(self.points[start:end],
+                                self.leftHandles[start:end],
+                                self.rightHandles[start:end],
+                                self.radii[start:end],
+                                self.tilts[start:end],
+                                self.cyclics.data[index],
+                                self.materialIndices.data[index])
+        else:
+            return PolySpline(self.points[start:end],
+                              self.radii[start:end],
+                              self.tilts[start:end],
+                              self.cyclics.data[index],
+                              self.materialIndices.data[index])
+
+    cdef setSplineData(self, Py_ssize_t index, spline):
+        cdef Py_ssize_t start = self.offsets.data[index]
+        cdef Py_ssize_t amount = self.getPointAmount(index)
+        cdef BezierSpline bezierSpline
+        cdef PolySpline polySpline
+        if self.type == "BEZIER":
+            bezierSpline = spline
+            memcpy(self.points.data + start, bezierSpline.points.data, amount * sizeof(Vector3))
+            memcpy(self.leftHandles.data + start, bezierSpline.leftHandles.data, amount * sizeof(Vector3))
+            memcpy(self.rightHandles.data + start, bezierSpline.rightHandles.data, amount * sizeof(Vector3))
+            memcpy(self.radii.data + start, bezierSpline.radii.data, amount * sizeof(float))
+            memcpy(self.tilts.data + start, bezierSpline.tilts.data, amount * sizeof(float))
+        else:
+            polySpline = spline
+            memcpy(self.points.data + start, polySpline.points.data, amount * sizeof(Vector3))
+            memcpy(self.radii.data + start, polySpline.radii.data, amount * sizeof(float))
+            memcpy(self.tilts.data + start, polySpline.tilts.data, amount * sizeof(float))
+
+
+    # Transformation
+    ###############################################
+
+    def transform(self, matrix):
+        self.points.transform(matrix)
+        if self.type == "BEZIER":
+            self.leftHandles.transform(matrix)
+            self.rightHandles.transform(matrix)
+
+    def replicate(self, Matrix4x4List transformations not None):
+        '''Returns a collection with a transformed copy of all splines for every matrix.'''
+        cdef Py_ssize_t i, j, amount = transformations.length
+        cdef Py_ssize_t splineAmount = self.getLength()
+        cdef Py_ssize_t pointAmount = self.points.length
+        cdef LongList offsets = LongList(length = amount * splineAmount + 1)
+        offsets.data[0] = 0
+        for i in range(amount):
+            for j in range(splineAmount):
+                offsets.data[i * splineAmount + j + 1] = i * pointAmount + self.offsets.data[j + 1]
+
+        cdef SplineCollection result = SplineCollection.fromOffsets(self.type, offsets)
+        cdef Matrix4 *matrix
+        for i in range(amount):
+            matrix = transformations.data + i
+            transformPoints(self.points.data, result.points.data + i * pointAmount, pointAmount, matrix)
+            if self.type == "BEZIER":
+                transformPoints(self.leftHandles.data, result.leftHandles.data + i * pointAmount, pointAmount, matrix)
+                transformPoints(self.rightHandles.data, result.rightHandles.data + i * pointAmount, pointAmount, matrix)
+            memcpy(result.radii.data + i * pointAmount, self.radii.data, pointAmount * sizeof(float))
+            memcpy(result.tilts.data + i * pointAmount, self.tilts.data, pointAmount * sizeof(float))
+
+        result.cyclics = self.cyclics * amount
+        result.materialIndices = self.materialIndices * amount
+        return result
+
+
+    # Trimming
+    ###############################################
+
+    cpdef bint isEvaluable(self):
+        '''All splines need at least two points.'''
+        cdef Py_ssize_t i
+        for i in range(self.getLength()):
+            if self.getPointAmount(i) < 2:
+                return False
+        return True
+
+    def getTrimmedCopy(self, float start = 0.0, float end = 1.0):
+        '''Trims all splines with the same parameters, like Spline.getTrimmedCopy.'''
+        if not self.isEvaluable():
+            raise Exception("not all splines are evaluable")
+        if start < 0 or end < 0 or start > 1 or end > 1:
+            raise ValueError("start and end have to be between 0 and 1")
+
+        cdef Py_ssize_t i, splineAmount = self.getLength()
+        cdef LongList offsets = LongList(length = splineAmount + 1)
+        offsets.fill(0)
+        if start == end:
+            return SplineCollection(self.type, offsets = offsets,
+                                    materialIndices = self.materialIndices.copy())
+
+        cdef float _start, _end
+        if start < end:
+            _start, _end = start, end
+        else:
+            _start, _end = start, start
+
+        for i in range(splineAmount):
+            offsets.data[i + 1] = offsets.data[i] + getTrimmedPointAmount(
+                self.getPointAmount(i), self.cyclics.data[i], _start, _end)
+
+        cdef SplineCollection result = SplineCollection.fromOffsets(self.type, offsets)
+        result.materialIndices = self.materialIndices.copy()
+        for i in range(splineAmount):
+            self.trimSpline(i, _start, _end, result)
+        return result
+
+    cdef trimSpline(self, Py_ssize_t index, float start, float end, SplineCollection result):
+        cdef Py_ssize_t oldStart = self.offsets.data[index]
+        cdef Py_ssize_t newStart = result.offsets.data[index]
+        if self.type == "BEZIER":
+            trimBezierSplineData(
+                self.points.data + oldStart, self.leftHandles.data + oldStart, self.rightHandles.data + oldStart,
+                self.radii.data + oldStart, self.tilts.data + oldStart,
+                self.getPointAmount(index), self.cyclics.data[index], start, end,
+                result.points.data + newStart, result.leftHandles.data + newStart, result.rightHandles.data + newStart,
+                result.radii.data + newStart, result.tilts.data + newStart, result.getPointAmount(index))
+        else:
+            trimPolySplineData(
+                self.points.data + oldStart, self.radii.data + oldStart, self.tilts.data + oldStart,
+                self.getPointAmount(index), self.cyclics.data[index], start, end,
+                result.points.data + newStart, result.radii.data + newStart, result.tilts.data + newStart,
+                result.getPointAmount(index))
+
+def haveSameSplineType(list splines not None):
+    '''Returns True when the splines can be stored in one collection.'''
+    if len(splines) == 0: return True
+    cdef type splineType = type(splines[0])
+    if splineType not in (PolySpline, BezierSpline): return False
+    return all(type(spline) is splineType for spline in splines)
+
+cdef checkOffsets(LongList offsets, Py_ssize_t pointAmount):
+    if offsets.length == 0 or offsets.data[0] != 0:
+        raise ValueError("offsets have to start with zero")
+    cdef Py_ssize_t i
+    for i in range(offsets.length - 1):
+        if offsets.data[i] > offsets.data[i + 1]:
+            raise ValueError("offsets must not decrease")
+    if offsets.data[offsets.length - 1] != pointAmount:
+        raise ValueError("last offset has to be the amount of points")
+
+cdef void transformPoints(Vector3 *source, Vector3 *target, Py_ssize_t amount, Matrix4 *matrix):
+    cdef Py_ssize_t i
+    for i in range(amount):
+        transformVec3AsPoint(target + i, source + i, matrix)
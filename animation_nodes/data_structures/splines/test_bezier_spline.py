@@ -159,6 +159,15 @@ class TestProjectOnSpline(TestCase):
         parameter = spline.project((0, 0, 1))
         self.assertAlmostEqual(parameter, 0.5)
 
+    def testMultipleSegments(self):
+        spline = BezierSpline()
+        spline.appendPoint((0, 0, 0), (0, -1, 0), (0, 1, 0))
+        spline.appendPoint((2, 2, 0), (1, 2, 0), (3, 2, 0))
+        spline.appendPoint((4, 0, 0), (4, 1, 0), (4, -1, 0))
+        self.assertAlmostEqual(spline.project((-1, -3, 0)), 0)
+        self.assertAlmostEqual(spline.project((2, 5, 0)), 0.5)
+        self.assertAlmostEqual(spline.project((5, -3, 0)), 1)
+
 def testEqual(testCase, vector1, vector2):
     testCase.assertAlmostEqual(vector1[0], vector2[0], places = 5)
     testCase.assertAlmostEqual(vector1[1], vector2[1], places = 5)
@@ -1,6 +1,7 @@
 from mathutils import Vector
 from unittest import TestCase
 from . poly_spline import PolySpline
+from .. lists.base_lists import Vector3DList
 
 class TestInitialisation(TestCase):
     def testNormal(self):
@@ -378,6 +379,28 @@ class TestProject(TestCase):
         self.assertAlmostEqual(spline.project((0, 0, 10)), 2/3)
         self.assertAlmostEqual(spline.project((0, 2, 2)), 5/6)
 
+    def testChangedSpline(self):
+        spline = self.getTestSpline()
+        self.assertAlmostEqual(spline.project((3, 0, 5)), 1)
+        spline.appendPoint((3, 0, 4))
+        self.assertAlmostEqual(spline.project((3, 0, 5)), 1)
+        self.assertAlmostEqual(spline.project((1, 0, 0)), 1/3)
+
+    def testManySegments(self):
+        spline = PolySpline()
+        for i in range(100):
+            spline.appendPoint((i, 0, 0))
+        for i in range(99):
+            self.assertAlmostEqual(spline.project((i + 0.3, 2, 1)), (i + 0.3) / 99, places = 5)
+
+    def testList(self):
+        spline = self.getTestSpline()
+        points = Vector3DList.fromValues([(0, 0, 0.3), (1, 0.4, 2), (-3, 0.1, 10)])
+        parameters = spline.projectList(points)
+        self.assertEqual(len(parameters), 3)
+        for point, parameter in zip(points, parameters):
+            self.assertAlmostEqual(parameter, spline.project(point))
+
     def getTestSpline(self):
         spline = PolySpline()
         spline.appendPoint((-1, 0, 0))
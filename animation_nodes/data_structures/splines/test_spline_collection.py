@@ -0,0 +1,187 @@
+import bpy
+from mathutils import Matrix
+from unittest import TestCase
+from . poly_spline import PolySpline
+from . bezier_spline import BezierSpline
+from . spline_collection import SplineCollection, haveSameSplineType
+from . to_blender import setSplinesOnBlenderObject, setSplineCollectionOnBlenderObject
+from . from_blender import createSplineCollectionFromBlenderObject, createTransformedSplinesFromBlenderObject
+from .. lists.base_lists import Vector3DList, FloatList, LongList, Matrix4x4List
+
+def getPolySplines():
+    splines = []
+    for i in range(4):
+        points = Vector3DList.fromValues([(j, i * j * 0.3, (i + j) % 3) for j in range(i + 2)])
+        radii = FloatList.fromValues([0.1 * j for j in range(i + 2)])
+        splines.append(PolySpline(points, radii, cyclic = i % 2 == 1, materialIndex = i))
+    return splines
+
+def getBezierSplines():
+    splines = []
+    for i in range(3):
+        spline = BezierSpline(cyclic = i == 1, materialIndex = i)
+        for j in range(i + 3):
+            point = (j, i * 0.5, (i * j) % 2)
+            spline.appendPoint(point, (j - 0.3, i * 0.5 + 0.2, 0), (j + 0.3, i * 0.5 - 0.2, 1), 0.1 * j, j)
+        splines.append(spline)
+    return splines
+
+class TestInitialisation(TestCase):
+    def testEmpty(self):
+        splines = SplineCollection()
+        self.assertEqual(len(splines), 0)
+        self.assertEqual(splines.type, "POLY")
+
+    def testSingleSpline(self):
+        splines = SplineCollection("BEZIER", Vector3DList.fromValues([(0, 0, 0), (1, 0, 0)]))
+        self.assertEqual(len(splines), 1)
+        self.assertEqual(len(splines.leftHandles), 2)
+
+    def testInvalidOffsets(self):
+        points = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (2, 0, 0)])
+        with self.assertRaises(ValueError):
+            SplineCollection("POLY", points, offsets = LongList.fromValues([0, 2]))
+        with self.assertRaises(ValueError):
+            SplineCollection("POLY", points, offsets = LongList.fromValues([0, 2, 1, 3]))
+
+    def testPolyWithHandles(self):
+        points = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0)])
+        with self.assertRaises(ValueError):
+            SplineCollection("POLY", points, points.copy())
+
+class TestConversion(TestCase):
+    def testPolySplines(self):
+        self.checkRoundTrip(getPolySplines())
+
+    def testBezierSplines(self):
+        self.checkRoundTrip(getBezierSplines())
+
+    def testMixedTypes(self):
+        with self.assertRaises(ValueError):
+            SplineCollection.fromSplines(getPolySplines() + getBezierSplines())
+
+    def testIndex(self):
+        splines = SplineCollection.fromSplines(getPolySplines())
+        self.assertEqual(splines[-1].points, getPolySplines()[-1].points)
+        with self.assertRaises(IndexError):
+            splines[4]
+
+    def checkRoundTrip(self, splines):
+        collection = SplineCollection.fromSplines(splines)
+        self.assertEqual(len(collection), len(splines))
+        self.assertEqual(len(collection.points), sum(len(spline.points) for spline in splines))
+        for original, spline in zip(splines, collection.toSplines()):
+            self.assertEqual(spline.type, original.type)
+            self.assertEqual(spline.points, original.points)
+            self.assertEqual(spline.radii, original.radii)
+            self.assertEqual(spline.tilts, original.tilts)
+            self.assertEqual(spline.cyclic, original.cyclic)
+            self.assertEqual(spline.materialIndex, original.materialIndex)
+            if spline.type == "BEZIER":
+                self.assertEqual(spline.leftHandles, original.leftHandles)
+                self.assertEqual(spline.rightHandles, original.rightHandles)
+
+class TestSameSplineType(TestCase):
+    def testSameType(self):
+        self.assertTrue(haveSameSplineType([]))
+        self.assertTrue(haveSameSplineType(getPolySplines()))
+        self.assertTrue(haveSameSplineType(getBezierSplines()))
+
+    def testMixedTypes(self):
+        self.assertFalse(haveSameSplineType(getPolySplines() + getBezierSplines()))
+
+class TestBlenderConversion(TestCase):
+    def setUp(self):
+        curve = bpy.data.curves.new("AN Spline Collection Test", "CURVE")
+        self.object = bpy.data.objects.new("AN Spline Collection Test", curve)
+
+    def tearDown(self):
+        curve = self.object.data
+        bpy.data.objects.remove(self.object)
+        bpy.data.curves.remove(curve)
+
+    def testPolySplines(self):
+        self.checkRoundTrip(getPolySplines())
+
+    def testBezierSplines(self):
+        self.checkRoundTrip(getBezierSplines())
+
+    def testMixedTypes(self):
+        splines = getPolySplines() + getBezierSplines()
+        setSplinesOnBlenderObject(self.object, splines)
+        result = createTransformedSplinesFromBlenderObject(self.object)
+        self.assertEqual([spline.type for spline in result], [spline.type for spline in splines])
+
+        collection = createSplineCollectionFromBlenderObject(self.object, splineType = "BEZIER")
+        self.assertEqual(len(collection), 3)
+
+    def testTransformation(self):
+        splines = getBezierSplines()
+        setSplineCollectionOnBlenderObject(self.object, SplineCollection.fromSplines(splines))
+        result = createTransformedSplinesFromBlenderObject(self.object, Matrix.Translation((0, 0, 2)))
+        for original, spline in zip(splines, result):
+            for a, b in zip(original.rightHandles, spline.rightHandles):
+                testEqual(self, (a[0], a[1], a[2] + 2), b)
+
+    def checkRoundTrip(self, splines):
+        setSplineCollectionOnBlenderObject(self.object, SplineCollection.fromSplines(splines))
+        self.assertEqual(len(self.object.data.splines), len(splines))
+
+        collection = createSplineCollectionFromBlenderObject(self.object)
+        self.assertEqual(collection.type, splines[0].type)
+        for original, spline in zip(splines, collection.toSplines()):
+            self.assertEqual(spline.points, original.points)
+            self.assertEqual(spline.radii, original.radii)
+            self.assertEqual(spline.tilts, original.tilts)
+            self.assertEqual(spline.cyclic, original.cyclic)
+            self.assertEqual(spline.materialIndex, original.materialIndex)
+            if spline.type == "BEZIER":
+                self.assertEqual(spline.leftHandles, original.leftHandles)
+                self.assertEqual(spline.rightHandles, original.rightHandles)
+
+class TestReplicate(TestCase):
+    def testReplicate(self):
+        splines = getBezierSplines()
+        matrices = Matrix4x4List.fromValues([Matrix(), Matrix.Translation((2, 0, 0))])
+        result = SplineCollection.fromSplines(splines).replicate(matrices)
+        self.assertEqual(len(result), 6)
+        replicated = result.toSplines()
+        for original, first, second in zip(splines, replicated[:3], replicated[3:]):
+            self.assertEqual(first.points, original.points)
+            self.assertEqual(second.cyclic, original.cyclic)
+            for a, b in zip(original.leftHandles, second.leftHandles):
+                testEqual(self, (a[0] + 2, a[1], a[2]), b)
+
+    def testNoMatrices(self):
+        result = SplineCollection.fromSplines(getPolySplines()).replicate(Matrix4x4List())
+        self.assertEqual(len(result), 0)
+
+class TestTrim(TestCase):
+    def testPolySplines(self):
+        self.checkTrimming(getPolySplines())
+
+    def testBezierSplines(self):
+        self.checkTrimming(getBezierSplines())
+
+    def testSameParameters(self):
+        trimmed = SplineCollection.fromSplines(getPolySplines()).getTrimmedCopy(0.5, 0.5)
+        self.assertEqual(len(trimmed), 4)
+        self.assertEqual(len(trimmed.points), 0)
+
+    def checkTrimming(self, splines):
+        collection = SplineCollection.fromSplines(splines)
+        for start, end in ((0, 1), (0.2, 0.7), (0.1, 0.15), (0.6, 1)):
+            trimmed = collection.getTrimmedCopy(start, end).toSplines()
+            for spline, result in zip(splines, trimmed):
+                expected = spline.getTrimmedCopy(start, end)
+                self.assertEqual(len(result.points), len(expected.points))
+                for a, b in zip(result.points, expected.points):
+                    testEqual(self, a, b)
+                for a, b in zip(result.radii, expected.radii):
+                    self.assertAlmostEqual(a, b, places = 5)
+                self.assertFalse(result.cyclic)
+
+def testEqual(testCase, vector1, vector2):
+    testCase.assertAlmostEqual(vector1[0], vector2[0], places = 5)
+    testCase.assertAlmostEqual(vector1[1], vector2[1], places = 5)
+    testCase.assertAlmostEqual(vector1[2], vector2[2], places = 5)
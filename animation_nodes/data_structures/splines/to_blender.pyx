@@ -2,6 +2,7 @@ from libc.string cimport memcpy
 from . base_spline cimport Spline
 from . poly_spline cimport PolySpline
 from . bezier_spline cimport BezierSpline
+from . spline_collection cimport SplineCollection
 from .. lists.base_lists cimport FloatList, Vector3DList
 
 def setSplinesOnBlenderObject(object, list splines):
@@ -55,3 +56,73 @@ cdef appendPolySpline(object bSplines, PolySpline spline):
     points.foreach_set("co", bPoints.asMemoryView())
     points.foreach_set("radius", spline.radii.asMemoryView())
     points.foreach_set("tilt", spline.tilts.asMemoryView())
+
+
+# Spline Collections
+###############################################
+
+def setSplineCollectionOnBlenderObject(object, SplineCollection splines):
+    if object is None: return
+    if object.type != "CURVE": return
+
+    bSplines = object.data.splines
+    bSplines.clear()
+    if splines.type == "BEZIER":
+        appendBezierSplineCollection(bSplines, splines)
+    else:
+        appendPolySplineCollection(bSplines, splines)
+
+cdef appendBezierSplineCollection(object bSplines, SplineCollection splines):
+    # all splines are set from slices of the same buffers
+    points = splines.points.asMemoryView()
+    leftHandles = splines.leftHandles.asMemoryView()
+    rightHandles = splines.rightHandles.asMemoryView()
+    radii = splines.radii.asMemoryView()
+    tilts = splines.tilts.asMemoryView()
+
+    cdef Py_ssize_t i, start, end
+    for i in range(splines.getLength()):
+        start, end = splines.offsets.data[i], splines.offsets.data[i + 1]
+        if start == end: continue
+
+        bSpline = bSplines.new("BEZIER")
+        bSpline.use_cyclic_u = splines.cyclics.data[i]
+        bSpline.material_index = splines.materialIndices.data[i]
+
+        # one point is already there
+        bPoints = bSpline.bezier_points
+        bPoints.add(end - start - 1)
+        bPoints.foreach_set("co", points[start * 3:end * 3])
+        bPoints.foreach_set("handle_left", leftHandles[start * 3:end * 3])
+        bPoints.foreach_set("handle_right", rightHandles[start * 3:end * 3])
+        bPoints.foreach_set("radius", radii[start:end])
+        bPoints.foreach_set("tilt", tilts[start:end])
+
+cdef appendPolySplineCollection(object bSplines, SplineCollection splines):
+    # Blender stores 4 values for each point of a poly spline
+    cdef FloatList bPointList = FloatList(length = splines.points.length * 4)
+    cdef Py_ssize_t i, start, end
+    for i in range(splines.points.length):
+        memcpy(bPointList.data + i * 4,
+               splines.points.data + i,
+               sizeof(float) * 3)
+        bPointList.data[i * 4 + 3] = 1
+
+    points = bPointList.asMemoryView()
+    radii = splines.radii.asMemoryView()
+    tilts = splines.tilts.asMemoryView()
+
+    for i in range(splines.getLength()):
+        start, end = splines.offsets.data[i], splines.offsets.data[i + 1]
+        if start == end: continue
+
+        bSpline = bSplines.new("POLY")
+        bSpline.use_cyclic_u = splines.cyclics.data[i]
+        bSpline.material_index = splines.materialIndices.data[i]
+
+        # one point is already there
+        bPoints = bSpline.points
+        bPoints.add(end - start - 1)
+        bPoints.foreach_set("co", points[start * 4:end * 4])
+        bPoints.foreach_set("radius", radii[start:end])
+        bPoints.foreach_set("tilt", tilts[start:end])
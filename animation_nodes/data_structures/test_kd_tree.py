@@ -0,0 +1,63 @@
+from mathutils import Vector
+from unittest import TestCase
+from . kd_tree import KDTree
+from . lists.base_lists import Vector3DList
+
+def bruteForceDistances(points, searchPoint):
+    return sorted((point - Vector(searchPoint)).length for point in points)
+
+class TestEmptyTree(TestCase):
+    def setUp(self):
+        self.tree = KDTree()
+
+    def testFind(self):
+        self.assertEqual(self.tree.find((0, 0, 0)), (None, None, None))
+
+    def testFindNearestList(self):
+        vectors, indices, distances = self.tree.findNearestList(Vector3DList.fromValues([(1, 2, 3)]))
+        self.assertEqual(list(indices), [0])
+        self.assertEqual(list(distances), [-1])
+
+    def testFindNearestNList(self):
+        vectors, indices, distances, offsets = self.tree.findNearestNList(
+            Vector3DList.fromValues([(1, 2, 3), (4, 5, 6)]), 3)
+        self.assertEqual(len(indices), 0)
+        self.assertEqual(list(offsets), [0, 0, 0])
+
+class TestSearch(TestCase):
+    def setUp(self):
+        self.points = Vector3DList.fromValues([
+            (x, y, z) for x in range(-3, 4) for y in range(-2, 3) for z in range(0, 2)])
+        self.tree = KDTree(self.points)
+
+    def testFind(self):
+        vector, index, distance = self.tree.find((1.1, -0.9, 0.2))
+        self.assertEqual(tuple(vector), (1, -1, 0))
+        self.assertEqual(tuple(self.points[index]), (1, -1, 0))
+        self.assertAlmostEqual(distance, (0.01 + 0.01 + 0.04) ** 0.5, places = 5)
+
+    def testFindNearestN(self):
+        searchPoint = (-2.7, -2, 0)
+        vectors, indices, distances = self.tree.findNearestN(searchPoint, 5)
+        expected = bruteForceDistances(self.points, searchPoint)[:5]
+        for distance, expectedDistance in zip(distances, expected):
+            self.assertAlmostEqual(distance, expectedDistance, places = 5)
+        for vector, index in zip(vectors, indices):
+            self.assertEqual(vector, self.points[index])
+
+    def testFindInRadiusList(self):
+        searchPoints = Vector3DList.fromValues([(0, 0, 0), (2.5, 1.5, 0.5), (10, 10, 10)])
+        vectors, indices, distances, offsets = self.tree.findInRadiusList(searchPoints, 1.2)
+        self.assertEqual(len(offsets), 4)
+        for i, searchPoint in enumerate(searchPoints):
+            found = distances[offsets[i]:offsets[i + 1]]
+            expected = [d for d in bruteForceDistances(self.points, searchPoint) if d <= 1.2]
+            self.assertEqual(len(found), len(expected))
+            for distance, expectedDistance in zip(found, expected):
+                self.assertAlmostEqual(distance, expectedDistance, places = 5)
+
+    def testAmountLargerThanTree(self):
+        vectors, indices, distances, offsets = self.tree.findNearestNList(
+            Vector3DList.fromValues([(0, 0, 0)]), 1000)
+        self.assertEqual(len(indices), len(self.points))
+        self.assertEqual(sorted(indices), list(range(len(self.points))))
@@ -0,0 +1,111 @@
+from math import inf, nan
+from unittest import TestCase
+from . point_grid import PointGrid
+from . lists.base_lists import Vector3DList
+
+def bruteForceRadiusEdges(points, radius):
+    edges = set()
+    for i in range(len(points)):
+        for j in range(i + 1, len(points)):
+            if (points[i] - points[j]).length <= radius:
+                edges.add((i, j))
+    return edges
+
+def bruteForceNearestNEdges(points, amount):
+    edges = set()
+    for i, point in enumerate(points):
+        others = sorted(((point - other).length, j) for j, other in enumerate(points) if j != i)
+        for distance, j in others[:amount]:
+            edges.add((min(i, j), max(i, j)))
+    return edges
+
+class TestEmptyGrid(TestCase):
+    def setUp(self):
+        self.grid = PointGrid()
+
+    def testRadiusEdges(self):
+        edges, distances = self.grid.findInRadiusEdges(1)
+        self.assertEqual(len(edges), 0)
+        self.assertEqual(len(distances), 0)
+
+    def testNearestNEdges(self):
+        edges, distances = self.grid.findNearestNEdges(3)
+        self.assertEqual(len(edges), 0)
+
+class TestNeighbourGraphs(TestCase):
+    def setUp(self):
+        # irregular spacing, so that the nearest points are unique
+        self.points = Vector3DList.fromValues([
+            (x * 0.7 + x * x * 0.02, y * 1.1 + y * y * 0.03 + x * 0.05, z * 0.4)
+            for x in range(-3, 4) for y in range(-2, 3) for z in range(0, 2)])
+
+    def testRadiusEdges(self):
+        for radius in (0, 0.5, 1.2, 3):
+            edges, distances = PointGrid(self.points, radius).findInRadiusEdges(radius)
+            self.assertEqual({tuple(edge) for edge in edges}, bruteForceRadiusEdges(self.points, radius))
+            self.assertEqual(len(edges), len(distances))
+
+    def testRadiusEdgesWithOtherCellSize(self):
+        edges, distances = PointGrid(self.points).findInRadiusEdges(1.5)
+        self.assertEqual({tuple(edge) for edge in edges}, bruteForceRadiusEdges(self.points, 1.5))
+
+    def testRadiusEdgeOrder(self):
+        # like in the kdtree based version, the edges of every point are sorted by distance
+        edges, distances = PointGrid(self.points, 0.5).findInRadiusEdges(2)
+        expected = []
+        for i in range(len(self.points)):
+            neighbours = sorted(((self.points[i] - self.points[j]).length, j)
+                                for j in range(i + 1, len(self.points))
+                                if (self.points[i] - self.points[j]).length <= 2)
+            expected.extend((i, j) for distance, j in neighbours)
+        self.assertEqual([tuple(edge) for edge in edges], expected)
+
+    def testDistances(self):
+        edges, distances = PointGrid(self.points).findInRadiusEdges(1)
+        for (i, j), distance in zip(edges, distances):
+            self.assertAlmostEqual(distance, (self.points[i] - self.points[j]).length, places = 5)
+
+    def testNearestNEdges(self):
+        for amount in (1, 2, 5):
+            edges, distances = PointGrid(self.points).findNearestNEdges(amount)
+            edgeSet = {tuple(edge) for edge in edges}
+            self.assertEqual(len(edgeSet), len(edges))
+            self.assertEqual(edgeSet, bruteForceNearestNEdges(self.points, amount))
+
+    def testAmountLargerThanGrid(self):
+        points = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (0, 2, 0)])
+        edges, distances = PointGrid(points).findNearestNEdges(10)
+        self.assertEqual({tuple(edge) for edge in edges}, {(0, 1), (0, 2), (1, 2)})
+
+    def testFlatPoints(self):
+        points = Vector3DList.fromValues([(x * 0.3, (x * 7 % 5) * 0.2, 0) for x in range(40)])
+        edges, distances = PointGrid(points).findInRadiusEdges(0.45)
+        self.assertEqual({tuple(edge) for edge in edges}, bruteForceRadiusEdges(points, 0.45))
+
+class TestNotFinitePoints(TestCase):
+    def setUp(self):
+        self.finitePoints = [(0, 0, 0), (1, 0, 0), (0, 1.5, 0), (3, 3, 3)]
+        self.points = Vector3DList.fromValues(self.finitePoints[:2] +
+            [(nan, 0, 0), (inf, 0, 0), (0, -inf, nan)] + self.finitePoints[2:])
+
+    def testRadiusEdges(self):
+        edges, distances = PointGrid(self.points).findInRadiusEdges(2)
+        self.assertEqual({tuple(edge) for edge in edges}, {(0, 1), (0, 5), (1, 5)})
+
+    def testInfiniteRadius(self):
+        edges, distances = PointGrid(self.points).findInRadiusEdges(inf)
+        self.assertEqual(len(edges), 6)
+
+    def testNearestNEdges(self):
+        edges, distances = PointGrid(self.points).findNearestNEdges(1)
+        self.assertEqual({tuple(edge) for edge in edges}, {(0, 1), (0, 5), (5, 6)})
+
+    def testInvalidCellSize(self):
+        for cellSize in (nan, inf):
+            edges, distances = PointGrid(self.points, cellSize).findInRadiusEdges(2)
+            self.assertEqual({tuple(edge) for edge in edges}, {(0, 1), (0, 5), (1, 5)})
+
+    def testOnlyNotFinitePoints(self):
+        points = Vector3DList.fromValues([(nan, nan, nan), (inf, 0, 0), (-inf, 0, 0)])
+        self.assertEqual(len(PointGrid(points).findInRadiusEdges(1)[0]), 0)
+        self.assertEqual(len(PointGrid(points).findNearestNEdges(2)[0]), 0)
@@ -0,0 +1,57 @@
+from unittest import TestCase
+from . triangle_bvh import TriangleBVH
+from . lists.base_lists import Vector3DList
+from . lists.polygon_indices_list import PolygonIndicesList
+
+def getCubeBVH():
+    vertices = Vector3DList.fromValues([
+        (-1, -1, -1), (1, -1, -1), (1, 1, -1), (-1, 1, -1),
+        (-1, -1, 1), (1, -1, 1), (1, 1, 1), (-1, 1, 1)])
+    polygons = PolygonIndicesList.fromValues([
+        (0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4),
+        (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)])
+    return TriangleBVH(vertices, polygons)
+
+class TestEmptyTree(TestCase):
+    def testQueries(self):
+        bvh = TriangleBVH()
+        self.assertEqual(bvh.ray_cast((0, 0, 0), (0, 0, 1)), (None, None, None, None))
+        self.assertEqual(bvh.find_nearest((0, 0, 0)), (None, None, None, None))
+        self.assertFalse(bvh.isInside((0, 0, 0)))
+
+    def testInvalidPolygons(self):
+        with self.assertRaises(IndexError):
+            TriangleBVH(Vector3DList.fromValues([(0, 0, 0)]),
+                        PolygonIndicesList.fromValues([(0, 1, 2)]))
+
+class TestCube(TestCase):
+    def setUp(self):
+        self.bvh = getCubeBVH()
+
+    def testRayCast(self):
+        location, normal, index, distance = self.bvh.ray_cast((0.5, 0.25, 5), (0, 0, -2))
+        self.assertEqual(tuple(location), (0.5, 0.25, 1))
+        self.assertEqual(tuple(normal), (0, 0, 1))
+        self.assertEqual(index, 1)
+        self.assertAlmostEqual(distance, 4, places = 5)
+
+    def testRayCastList(self):
+        starts = Vector3DList.fromValues([(0, 0, 0), (0, 0, 0), (5, 5, 5)])
+        directions = Vector3DList.fromValues([(1, 0, 0), (0, 0, -1), (0, 0, 1)])
+        locations, normals, distances, polygonIndices, hits = self.bvh.rayCastList(starts, directions)
+        self.assertEqual(list(hits), [True, True, False])
+        self.assertEqual(list(polygonIndices), [3, 0, -1])
+        self.assertEqual(list(distances), [1, 1, 0])
+
+    def testFindNearestList(self):
+        points = Vector3DList.fromValues([(0, 0, 3), (2, 2, 0), (0.5, 0, 0)])
+        locations, normals, distances, polygonIndices, hits = self.bvh.findNearestList(points)
+        self.assertEqual(tuple(locations[0]), (0, 0, 1))
+        self.assertEqual(tuple(locations[1]), (1, 1, 0))
+        self.assertEqual(tuple(locations[2]), (1, 0, 0))
+        self.assertAlmostEqual(distances[1], 2 ** 0.5, places = 5)
+        self.assertAlmostEqual(distances[2], 0.5, places = 5)
+
+    def testIsInsideList(self):
+        points = Vector3DList.fromValues([(0, 0, 0), (0.9, -0.9, 0.5), (1.1, 0, 0), (0, 0, -3)])
+        self.assertEqual(list(self.bvh.isInsideList(points)), [True, True, False, False])
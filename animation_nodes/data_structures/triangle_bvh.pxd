@@ -0,0 +1,40 @@
+from .. math cimport Vector3
+from . lists.base_lists cimport Vector3DList, LongList
+from . lists.polygon_indices_list cimport PolygonIndicesList
+
+cdef struct BVHNode:
+    Vector3 low, high
+    Py_ssize_t start, end
+    Py_ssize_t firstChild
+
+cdef struct RayHit:
+    float distance
+    Py_ssize_t triangle
+
+cdef struct NearestHit:
+    Vector3 location
+    float distanceSquared
+    Py_ssize_t triangle
+
+cdef class TriangleBVH:
+    cdef readonly Vector3DList vertices
+    cdef readonly PolygonIndicesList polygons
+    cdef readonly float epsilon
+
+    cdef Vector3DList triangles
+    cdef LongList polygonIndices
+    cdef BVHNode* nodes
+    cdef Py_ssize_t nodeAmount
+    cdef object mathutilsTree
+
+    cdef Py_ssize_t getTriangleAmount(self)
+    cdef void triangulatePolygons(self)
+    cdef void buildNode(self, Py_ssize_t nodeIndex, Vector3DList centers)
+    cdef void calculateBounds(self, BVHNode* node)
+
+    cdef bint rayCast_LowLevel(self, Vector3* origin, Vector3* direction,
+                               float minDistance, float maxDistance, RayHit* hit)
+    cdef bint findNearest_LowLevel(self, Vector3* point, float maxDistance, NearestHit* hit)
+    cdef bint isInside_LowLevel(self, Vector3* point)
+    cdef Py_ssize_t countHits(self, Vector3* origin, Vector3* direction, bint* isAmbiguous)
+    cdef void getTriangleNormal(self, Py_ssize_t triangle, Vector3* normal)
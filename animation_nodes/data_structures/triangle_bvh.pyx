@@ -0,0 +1,605 @@
+import cython
+from libc.math cimport sqrt, fabs, INFINITY
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from . lists.base_lists cimport DoubleList, BooleanList
+from .. math cimport (
+    toVector3, toPyVector3,
+    subVec3, dotVec3, crossVec3, normalizeVec3_InPlace, distanceSquaredVec3
+)
+
+cdef enum:
+    LEAF_SIZE = 4
+    STACK_SIZE = 128
+
+# the inside test is repeated with another direction,
+# when a ray hits an edge or vertex of the mesh
+cdef Vector3 insideDirections[3]
+
+cdef void setInsideDirections():
+    cdef Py_ssize_t i
+    insideDirections[0] = Vector3(0.5469, 0.4317, 0.7172)
+    insideDirections[1] = Vector3(-0.6381, 0.2943, 0.7114)
+    insideDirections[2] = Vector3(0.3112, -0.8047, 0.5056)
+    for i in range(3):
+        normalizeVec3_InPlace(insideDirections + i)
+
+setInsideDirections()
+
+cdef class TriangleBVH:
+    '''
+    Bounding volume hierarchy over the triangulated polygons of a mesh.
+
+    ray_cast and find_nearest behave like the methods of mathutils.bvhtree.BVHTree.
+    All other attributes of that type are forwarded to a mathutils tree,
+    that is only created when it is needed.
+    The list methods process many points at once and return packed lists.
+    '''
+
+    def __cinit__(self, Vector3DList vertices = None, PolygonIndicesList polygons = None,
+                  float epsilon = 0):
+        if vertices is None: vertices = Vector3DList()
+        if polygons is None: polygons = PolygonIndicesList()
+        if len(polygons) > 0 and polygons.getMaxIndex() >= len(vertices):
+            raise IndexError("polygons use vertices that don't exist")
+
+        self.vertices = vertices.copy()
+        self.polygons = polygons.copy()
+        self.epsilon = max(epsilon, 0)
+        self.triangulatePolygons()
+
+        cdef Py_ssize_t i, triangleAmount = self.getTriangleAmount()
+        cdef Vector3DList centers = Vector3DList(length = triangleAmount)
+        cdef Vector3 *corners
+        for i in range(triangleAmount):
+            corners = self.triangles.data + 3 * i
+            centers.data[i].x = (corners[0].x + corners[1].x + corners[2].x) / 3
+            centers.data[i].y = (corners[0].y + corners[1].y + corners[2].y) / 3
+            centers.data[i].z = (corners[0].z + corners[1].z + corners[2].z) / 3
+
+        self.nodes = <BVHNode*>PyMem_Malloc(sizeof(BVHNode) * max(2 * triangleAmount, 1))
+        if self.nodes == NULL:
+            raise MemoryError()
+        self.nodes[0].start = 0
+        self.nodes[0].end = triangleAmount
+        self.nodeAmount = 1
+        self.buildNode(0, centers)
+
+    def __dealloc__(self):
+        if self.nodes != NULL:
+            PyMem_Free(self.nodes)
+
+    @classmethod
+    def fromBMesh(cls, bm, float epsilon = 0):
+        bm.verts.index_update()
+        vertices = Vector3DList.fromValues([vertex.co for vertex in bm.verts])
+        polygons = PolygonIndicesList.fromValues([[vertex.index for vertex in face.verts]
+                                                  for face in bm.faces])
+        return cls(vertices, polygons, epsilon)
+
+    cdef Py_ssize_t getTriangleAmount(self):
+        return self.polygonIndices.length
+
+    def getMemoryUsage(self):
+        return (self.vertices.getMemoryUsage() +
+                self.polygons.getMemoryUsage() +
+                self.triangles.getMemoryUsage() +
+                self.polygonIndices.getMemoryUsage() +
+                self.nodeAmount * sizeof(BVHNode))
+
+    def __repr__(self):
+        return "<AN TriangleBVH with {} triangles>".format(self.getTriangleAmount())
+
+
+    # Construction
+    ###############################################
+
+    cdef void triangulatePolygons(self):
+        cdef Py_ssize_t i, j, start, length, triangleAmount = 0
+        cdef PolygonIndicesList polygons = self.polygons
+        for i in range(polygons.getLength()):
+            triangleAmount += max(polygons.polyLengths.data[i] - 2, 0)
+
+        self.triangles = Vector3DList(length = 3 * triangleAmount)
+        self.polygonIndices = LongList(length = triangleAmount)
+
+        cdef Vector3 *corners = self.triangles.data
+        cdef unsigned int *indices = polygons.indices.data
+        cdef Py_ssize_t triangleIndex = 0
+        for i in range(polygons.getLength()):
+            start = polygons.polyStarts.data[i]
+            length = polygons.polyLengths.data[i]
+            for j in range(1, length - 1):
+                corners[0] = self.vertices.data[indices[start]]
+                corners[1] = self.vertices.data[indices[start + j]]
+                corners[2] = self.vertices.data[indices[start + j + 1]]
+                self.polygonIndices.data[triangleIndex] = i
+                corners += 3
+                triangleIndex += 1
+
+    cdef void buildNode(self, Py_ssize_t nodeIndex, Vector3DList centers):
+        cdef BVHNode *node = self.nodes + nodeIndex
+        self.calculateBounds(node)
+        node.firstChild = -1
+        if node.end - node.start <= LEAF_SIZE:
+            return
+
+        cdef char axis = getLargestExtentAxis(centers.data, node.start, node.end)
+        cdef Py_ssize_t middle = (node.start + node.end) // 2
+        selectNthTriangle(self.triangles.data, self.polygonIndices.data, centers.data,
+                          node.start, node.end, middle, axis)
+
+        cdef Py_ssize_t firstChild = self.nodeAmount
+        self.nodeAmount += 2
+        node.firstChild = firstChild
+        self.nodes[firstChild].start = node.start
+        self.nodes[firstChild].end = middle
+        self.nodes[firstChild + 1].start = middle
+        self.nodes[firstChild + 1].end = node.end
+        self.buildNode(firstChild, centers)
+        self.buildNode(firstChild + 1, centers)
+
+    cdef void calculateBounds(self, BVHNode *node):
+        cdef Py_ssize_t i
+        cdef Vector3 *corner
+        node.low = Vector3(INFINITY, INFINITY, INFINITY)
+        node.high = Vector3(-INFINITY, -INFINITY, -INFINITY)
+        for i in range(3 * node.start, 3 * node.end):
+            corner = self.triangles.data + i
+            node.low.x = min(node.low.x, corner.x - self.epsilon)
+            node.low.y = min(node.low.y, corner.y - self.epsilon)
+            node.low.z = min(node.low.z, corner.z - self.epsilon)
+            node.high.x = max(node.high.x, corner.x + self.epsilon)
+            node.high.y = max(node.high.y, corner.y + self.epsilon)
+            node.high.z = max(node.high.z, corner.z + self.epsilon)
+
+
+    # mathutils.bvhtree.BVHTree Compatibility
+    ###############################################
+
+    def ray_cast(self, origin, direction, float distance = INFINITY):
+        cdef Vector3 _origin = toVector3(origin)
+        cdef Vector3 _direction = toVector3(direction)
+        cdef RayHit hit
+        normalizeVec3_InPlace(&_direction)
+        if not self.rayCast_LowLevel(&_origin, &_direction, 0, distance, &hit):
+            return None, None, None, None
+
+        cdef Vector3 location, normal
+        location.x = _origin.x + _direction.x * hit.distance
+        location.y = _origin.y + _direction.y * hit.distance
+        location.z = _origin.z + _direction.z * hit.distance
+        self.getTriangleNormal(hit.triangle, &normal)
+        return (toPyVector3(&location), toPyVector3(&normal),
+                self.polygonIndices.data[hit.triangle], hit.distance)
+
+    def find_nearest(self, origin, float distance = INFINITY):
+        cdef Vector3 _origin = toVector3(origin)
+        cdef NearestHit hit
+        if not self.findNearest_LowLevel(&_origin, distance, &hit):
+            return None, None, None, None
+
+        cdef Vector3 normal
+        self.getTriangleNormal(hit.triangle, &normal)
+        return (toPyVector3(&hit.location), toPyVector3(&normal),
+                self.polygonIndices.data[hit.triangle], sqrt(hit.distanceSquared))
+
+    def overlap(self, other):
+        if isinstance(other, TriangleBVH):
+            other = other.getMathutilsTree()
+        return self.getMathutilsTree().overlap(other)
+
+    def getMathutilsTree(self):
+        from mathutils.bvhtree import BVHTree
+        if self.mathutilsTree is None:
+            self.mathutilsTree = BVHTree.FromPolygons(self.vertices, self.polygons,
+                                                      epsilon = self.epsilon)
+        return self.mathutilsTree
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.getMathutilsTree(), name)
+
+
+    # List Queries
+    ###############################################
+
+    def isInside(self, point):
+        cdef Vector3 _point = toVector3(point)
+        return self.isInside_LowLevel(&_point)
+
+    def isInsideList(self, Vector3DList points):
+        cdef Py_ssize_t i
+        cdef BooleanList result = BooleanList(length = points.length)
+        for i in range(points.length):
+            result.data[i] = self.isInside_LowLevel(points.data + i)
+        return result
+
+    def rayCastList(self, Vector3DList starts, Vector3DList directions,
+                    float minDistance = 0, float maxDistance = INFINITY):
+        '''
+        Cast one ray for every pair of start and direction.
+        The distances are measured from the start, so that negative
+        minimal distances find hits behind the start.
+        Returns locations, normals, distances, polygon indices and hits.
+        '''
+        if starts.length != directions.length:
+            raise ValueError("the amount of starts and directions has to be equal")
+
+        cdef Py_ssize_t i, amount = starts.length
+        cdef Vector3 direction
+        cdef RayHit hit
+        cdef SearchResult result = SearchResult(amount)
+
+        for i in range(amount):
+            direction = directions.data[i]
+            normalizeVec3_InPlace(&direction)
+            if self.rayCast_LowLevel(starts.data + i, &direction, minDistance, maxDistance, &hit):
+                result.locations.data[i].x = starts.data[i].x + direction.x * hit.distance
+                result.locations.data[i].y = starts.data[i].y + direction.y * hit.distance
+                result.locations.data[i].z = starts.data[i].z + direction.z * hit.distance
+                self.getTriangleNormal(hit.triangle, result.normals.data + i)
+                result.distances.data[i] = hit.distance
+                result.polygonIndices.data[i] = self.polygonIndices.data[hit.triangle]
+                result.hits.data[i] = True
+            else:
+                result.setMiss(i)
+        return result.asTuple()
+
+    def findNearestList(self, Vector3DList points, float maxDistance = INFINITY):
+        '''
+        Find the nearest surface point for every point.
+        Returns locations, normals, distances, polygon indices and hits.
+        '''
+        cdef Py_ssize_t i
+        cdef NearestHit hit
+        cdef SearchResult result = SearchResult(points.length)
+
+        for i in range(points.length):
+            if self.findNearest_LowLevel(points.data + i, maxDistance, &hit):
+                result.locations.data[i] = hit.location
+                self.getTriangleNormal(hit.triangle, result.normals.data + i)
+                result.distances.data[i] = sqrt(hit.distanceSquared)
+                result.polygonIndices.data[i] = self.polygonIndices.data[hit.triangle]
+                result.hits.data[i] = True
+            else:
+                result.setMiss(i)
+        return result.asTuple()
+
+
+    # Low Level Queries
+    ###############################################
+
+    cdef bint rayCast_LowLevel(self, Vector3* origin, Vector3* direction,
+                               float minDistance, float maxDistance, RayHit* hit):
+        '''The direction has to be normalized.'''
+        cdef Py_ssize_t stack[STACK_SIZE]
+        cdef Py_ssize_t i, stackSize = 1
+        cdef BVHNode *node
+        cdef float t, u, v
+
+        hit.triangle = -1
+        hit.distance = maxDistance
+        if self.getTriangleAmount() == 0:
+            return False
+
+        stack[0] = 0
+        while stackSize > 0:
+            stackSize -= 1
+            node = self.nodes + stack[stackSize]
+            if not rayIntersectsBox(origin, direction, node, minDistance, hit.distance):
+                continue
+            if node.firstChild == -1:
+                for i in range(node.start, node.end):
+                    if intersectTriangle(origin, direction, self.triangles.data + 3 * i, &t, &u, &v):
+                        if minDistance <= t < hit.distance:
+                            hit.distance = t
+                            hit.triangle = i
+            else:
+                stack[stackSize] = node.firstChild
+                stack[stackSize + 1] = node.firstChild + 1
+                stackSize += 2
+
+        return hit.triangle != -1
+
+    cdef bint findNearest_LowLevel(self, Vector3* point, float maxDistance, NearestHit* hit):
+        cdef Py_ssize_t stack[STACK_SIZE]
+        cdef Py_ssize_t i, first, second, stackSize = 1
+        cdef BVHNode *node
+        cdef Vector3 closest
+        cdef float distanceSquared
+
+        hit.triangle = -1
+        hit.distanceSquared = maxDistance * maxDistance
+        if self.getTriangleAmount() == 0:
+            return False
+
+        stack[0] = 0
+        while stackSize > 0:
+            stackSize -= 1
+            node = self.nodes + stack[stackSize]
+            if boxDistanceSquared(point, node) > hit.distanceSquared:
+                continue
+            if node.firstChild == -1:
+                for i in range(node.start, node.end):
+                    closestPointOnTriangle(&closest, point, self.triangles.data + 3 * i)
+                    distanceSquared = distanceSquaredVec3(&closest, point)
+                    if distanceSquared <= hit.distanceSquared:
+                        hit.distanceSquared = distanceSquared
+                        hit.location = closest
+                        hit.triangle = i
+            else:
+                # the nearer child is searched first
+                first, second = node.firstChild, node.firstChild + 1
+                if (boxDistanceSquared(point, self.nodes + first) <
+                        boxDistanceSquared(point, self.nodes + second)):
+                    first, second = second, first
+                stack[stackSize] = first
+                stack[stackSize + 1] = second
+                stackSize += 2
+
+        return hit.triangle != -1
+
+    cdef bint isInside_LowLevel(self, Vector3* point):
+        '''A point is inside when a ray starting at it crosses the surface an odd number of times.'''
+        cdef bint isAmbiguous
+        cdef Py_ssize_t i, hits = 0
+        for i in range(3):
+            hits = self.countHits(point, insideDirections + i, &isAmbiguous)
+            if not isAmbiguous:
+                break
+        return hits % 2 == 1
+
+    cdef Py_ssize_t countHits(self, Vector3* origin, Vector3* direction, bint* isAmbiguous):
+        cdef Py_ssize_t stack[STACK_SIZE]
+        cdef Py_ssize_t i, stackSize = 1, hits = 0
+        cdef BVHNode *node
+        cdef float t, u, v
+
+        isAmbiguous[0] = False
+        if self.getTriangleAmount() == 0:
+            return 0
+
+        stack[0] = 0
+        while stackSize > 0:
+            stackSize -= 1
+            node = self.nodes + stack[stackSize]
+            if not rayIntersectsBox(origin, direction, node, 0, INFINITY):
+                continue
+            if node.firstChild == -1:
+                for i in range(node.start, node.end):
+                    if intersectTriangle(origin, direction, self.triangles.data + 3 * i, &t, &u, &v):
+                        if t > 0:
+                            hits += 1
+                            if min(u, v, 1 - u - v) < 1e-5:
+                                isAmbiguous[0] = True
+            else:
+                stack[stackSize] = node.firstChild
+                stack[stackSize + 1] = node.firstChild + 1
+                stackSize += 2
+
+        return hits
+
+    cdef void getTriangleNormal(self, Py_ssize_t triangle, Vector3* normal):
+        cdef Vector3 *corners = self.triangles.data + 3 * triangle
+        cdef Vector3 edge1, edge2
+        subVec3(&edge1, corners + 1, corners)
+        subVec3(&edge2, corners + 2, corners)
+        crossVec3(normal, &edge1, &edge2)
+        normalizeVec3_InPlace(normal)
+
+
+cdef class SearchResult:
+    cdef Vector3DList locations, normals
+    cdef DoubleList distances
+    cdef LongList polygonIndices
+    cdef BooleanList hits
+
+    def __cinit__(self, Py_ssize_t amount):
+        self.locations = Vector3DList(length = amount)
+        self.normals = Vector3DList(length = amount)
+        self.distances = DoubleList(length = amount)
+        self.polygonIndices = LongList(length = amount)
+        self.hits = BooleanList(length = amount)
+
+    cdef void setMiss(self, Py_ssize_t i):
+        self.locations.data[i] = Vector3(0, 0, 0)
+        self.normals.data[i] = Vector3(0, 0, 0)
+        self.distances.data[i] = 0
+        self.polygonIndices.data[i] = -1
+        self.hits.data[i] = False
+
+    cdef tuple asTuple(self):
+        return self.locations, self.normals, self.distances, self.polygonIndices, self.hits
+
+
+# Geometry
+###############################################
+
+cdef inline float getCoordinate(Vector3* v, char axis):
+    return (<float*>v)[axis]
+
+@cython.cdivision(True)
+cdef bint rayIntersectsBox(Vector3* origin, Vector3* direction, BVHNode* node,
+                           float minDistance, float maxDistance):
+    cdef char axis
+    cdef float start, step, low, high, t1, t2
+    for axis in range(3):
+        start = getCoordinate(origin, axis)
+        step = getCoordinate(direction, axis)
+        low = getCoordinate(&node.low, axis)
+        high = getCoordinate(&node.high, axis)
+        if step == 0:
+            if start < low or start > high:
+                return False
+        else:
+            t1 = (low - start) / step
+            t2 = (high - start) / step
+            if t1 > t2:
+                t1, t2 = t2, t1
+            minDistance = max(minDistance, t1)
+            maxDistance = min(maxDistance, t2)
+            if minDistance > maxDistance:
+                return False
+    return True
+
+cdef float boxDistanceSquared(Vector3* point, BVHNode* node):
+    cdef float dx = max(node.low.x - point.x, 0, point.x - node.high.x)
+    cdef float dy = max(node.low.y - point.y, 0, point.y - node.high.y)
+    cdef float dz = max(node.low.z - point.z, 0, point.z - node.high.z)
+    return dx * dx + dy * dy + dz * dz
+
+@cython.cdivision(True)
+cdef bint intersectTriangle(Vector3* origin, Vector3* direction, Vector3* corners,
+                            float* t, float* u, float* v):
+    '''Möller-Trumbore ray triangle intersection.'''
+    cdef Vector3 edge1, edge2, p, s, q
+    subVec3(&edge1, corners + 1, corners)
+    subVec3(&edge2, corners + 2, corners)
+    crossVec3(&p, direction, &edge2)
+    cdef float determinant = dotVec3(&edge1, &p)
+    if fabs(determinant) < 1e-12:
+        return False
+
+    cdef float inverseDeterminant = 1 / determinant
+    subVec3(&s, origin, corners)
+    u[0] = dotVec3(&s, &p) * inverseDeterminant
+    if u[0] < 0 or u[0] > 1:
+        return False
+
+    crossVec3(&q, &s, &edge1)
+    v[0] = dotVec3(direction, &q) * inverseDeterminant
+    if v[0] < 0 or u[0] + v[0] > 1:
+        return False
+
+    t[0] = dotVec3(&edge2, &q) * inverseDeterminant
+    return True
+
+@cython.cdivision(True)
+cdef void closestPointOnTriangle(Vector3* result, Vector3* point, Vector3* corners):
+    '''Based on "Real-Time Collision Detection" by Christer Ericson.'''
+    cdef Vector3 *a = corners
+    cdef Vector3 *b = corners + 1
+    cdef Vector3 *c = corners + 2
+    cdef Vector3 ab, ac, ap, bp, cp
+    cdef float d1, d2, d3, d4, d5, d6, va, vb, vc, v, w, denominator
+
+    subVec3(&ab, b, a)
+    subVec3(&ac, c, a)
+    subVec3(&ap, point, a)
+    d1 = dotVec3(&ab, &ap)
+    d2 = dotVec3(&ac, &ap)
+    if d1 <= 0 and d2 <= 0:
+        result[0] = a[0]
+        return
+
+    subVec3(&bp, point, b)
+    d3 = dotVec3(&ab, &bp)
+    d4 = dotVec3(&ac, &bp)
+    if d3 >= 0 and d4 <= d3:
+        result[0] = b[0]
+        return
+
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0 and d1 >= 0 and d3 <= 0:
+        v = d1 / (d1 - d3) if d1 != d3 else 0
+        setPointOnEdge(result, a, &ab, v)
+        return
+
+    subVec3(&cp, point, c)
+    d5 = dotVec3(&ab, &cp)
+    d6 = dotVec3(&ac, &cp)
+    if d6 >= 0 and d5 <= d6:
+        result[0] = c[0]
+        return
+
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0 and d2 >= 0 and d6 <= 0:
+        w = d2 / (d2 - d6) if d2 != d6 else 0
+        setPointOnEdge(result, a, &ac, w)
+        return
+
+    va = d3 * d6 - d5 * d4
+    if va <= 0 and d4 - d3 >= 0 and d5 - d6 >= 0:
+        w = (d4 - d3) / ((d4 - d3) + (d5 - d6)) if d4 - d3 + d5 - d6 != 0 else 0
+        subVec3(&bp, c, b)
+        setPointOnEdge(result, b, &bp, w)
+        return
+
+    denominator = va + vb + vc
+    if denominator == 0:
+        result[0] = a[0]
+        return
+    v = vb / denominator
+    w = vc / denominator
+    result.x = a.x + ab.x * v + ac.x * w
+    result.y = a.y + ab.y * v + ac.y * w
+    result.z = a.z + ab.z * v + ac.z * w
+
+cdef inline void setPointOnEdge(Vector3* result, Vector3* start, Vector3* edge, float factor):
+    result.x = start.x + edge.x * factor
+    result.y = start.y + edge.y * factor
+    result.z = start.z + edge.z * factor
+
+
+# Construction Utilities
+###############################################
+
+cdef char getLargestExtentAxis(Vector3* points, Py_ssize_t start, Py_ssize_t end):
+    cdef Vector3 low = points[start]
+    cdef Vector3 high = points[start]
+    cdef Py_ssize_t i
+    for i in range(start + 1, end):
+        low.x = min(low.x, points[i].x)
+        low.y = min(low.y, points[i].y)
+        low.z = min(low.z, points[i].z)
+        high.x = max(high.x, points[i].x)
+        high.y = max(high.y, points[i].y)
+        high.z = max(high.z, points[i].z)
+
+    cdef float extentX = high.x - low.x
+    cdef float extentY = high.y - low.y
+    cdef float extentZ = high.z - low.z
+    if extentX >= extentY and extentX >= extentZ: return 0
+    if extentY >= extentZ: return 1
+    return 2
+
+cdef void selectNthTriangle(Vector3* corners, long* polygonIndices, Vector3* centers,
+                            Py_ssize_t start, Py_ssize_t end, Py_ssize_t n, char axis):
+    '''
+    Reorders the triangles so that the one at index n is the one
+    that would be there if they were sorted by their centers along the axis.
+    '''
+    cdef Py_ssize_t left = start
+    cdef Py_ssize_t right = end - 1
+    cdef Py_ssize_t lower, upper, i
+    cdef float pivot, value
+
+    while left < right:
+        pivot = getCoordinate(centers + (left + right) // 2, axis)
+        lower = left
+        upper = right
+        i = left
+        while i <= upper:
+            value = getCoordinate(centers + i, axis)
+            if value < pivot:
+                swapTriangles(corners, polygonIndices, centers, lower, i)
+                lower += 1
+                i += 1
+            elif value > pivot:
+                swapTriangles(corners, polygonIndices, centers, i, upper)
+                upper -= 1
+            else:
+                i += 1
+
+        if n < lower: right = lower - 1
+        elif n > upper: left = upper + 1
+        else: return
+
+cdef inline void swapTriangles(Vector3* corners, long* polygonIndices, Vector3* centers,
+                               Py_ssize_t a, Py_ssize_t b):
+    cdef Py_ssize_t k
+    for k in range(3):
+        corners[3 * a + k], corners[3 * b + k] = corners[3 * b + k], corners[3 * a + k]
+    polygonIndices[a], polygonIndices[b] = polygonIndices[b], polygonIndices[a]
+    centers[a], centers[b] = centers[b], centers[a]
@@ -1,6 +1,7 @@
 import bpy
 import itertools
 from . import problems
+from . import tree_info
 from . update import updateEverything
 from . utils.recursion import noRecursion
 from . utils.nodes import iterNodesInAnimationNodeTrees, getAnimationNodeTrees
@@ -13,7 +14,11 @@ def update(events):
         print("Skip event: cannot write to ID classes")
         return
 
-    if didNameChange() or events.intersection({"File", "Addon", "Tree"}):
+    if didNameChange():
+        # node names are part of the identifiers in the tree info
+        tree_info.treeChanged()
+        updateEverything()
+    elif events.intersection({"File", "Addon", "Tree"}):
         updateEverything()
 
     if not problems.canAutoExecute(): return
@@ -3,6 +3,7 @@ from . import tree_info
 from . import event_handler
 from . update import updateEverything
 from . utils.handlers import eventHandler
+from . utils.mesh_input_cache import removeChangedMeshInputs
 from . execution.measurements import resetMeasurements
 
 class EventState:
@@ -57,6 +58,7 @@ def renderPre(scene):
 def sceneChanged(scene, depsgraph):
     global evaluatedDepsgraph
     evaluatedDepsgraph = depsgraph
+    removeChangedMeshInputs(depsgraph)
     event_handler.update(event.getActives().union({"Scene"}))
     evaluatedDepsgraph = None
 
@@ -79,6 +81,11 @@ def fileLoaded():
     if bpy.app.background:
         updateEverything()
 
+@eventHandler("UNDO_REDO_POST")
+def undoOrRedo():
+    # node trees might have changed without an update notification
+    treeChanged()
+
 @eventHandler("ADDON_LOAD_POST")
 def addonChanged():
     event.addonChanged = True
@@ -100,6 +107,10 @@ def treeChanged(self = None, context = None):
     event.treeChanged = True
     tree_info.treeChanged()
 
+def nodeTreeChanged(nodeTree):
+    event.treeChanged = True
+    tree_info.treeChanged(nodeTree.name)
+
 
 @eventHandler("RENDER_INIT")
 def renderInitialized():
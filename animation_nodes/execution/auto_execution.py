@@ -2,8 +2,11 @@ import bpy
 from .. preferences import getPreferences
 from .. utils.blender_ui import redrawAll
 from .. utils.nodes import getAnimationNodeTrees
+from . frame_cache import isBakingFrameCache
 
 def iterAutoExecutionNodeTrees(events):
+    # the frame cache bake executes the node trees itself
+    if isBakingFrameCache(): return
     for nodeTree in getAnimationNodeTrees():
         if nodeTree.canAutoExecute(events):
             yield nodeTree
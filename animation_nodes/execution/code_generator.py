@@ -57,7 +57,9 @@ def getModulesNeededByNodes(nodes):
     return list(moduleNames)
 
 def get_LoadMeasurementsDict():
-    return "_node_execution_times = animation_nodes.execution.measurements.getMeasurementsDict()"
+    return ("_node_execution_times = animation_nodes.execution.measurements.getMeasurementsDict()\n"
+            "_node_memory_usage = animation_nodes.execution.measurements.getMemoryMeasurementsDict()\n"
+            "from animation_nodes.execution.measurements import beginMemoryMeasurement, endMemoryMeasurement")
 
 def iter_GetNodeReferences(nodes):
     yield "nodes = bpy.data.node_groups[{}].nodes".format(repr(nodes[0].nodeTree.name))
@@ -106,8 +108,14 @@ def getFunction_IterNodeExecutionLines():
         return iterNodeExecutionLines_Monitored
     elif mode == "MEASURE":
         return iterNodeExecutionLines_MeasureTimes
+    elif mode == "MEASURE_MEMORY":
+        return iterNodeExecutionLines_MeasureMemory
     elif mode == "BAKE":
         return iterNodeExecutionLines_Bake
+    elif mode == "INCREMENTAL":
+        return iterNodeExecutionLines_Basic
+    elif mode == "FRAME_CACHE":
+        return iterNodeExecutionLines_FrameCache
 
 def iterNodeExecutionLines_Basic(node, variables):
     yield from iterNodeCommentLines(node)
@@ -145,6 +153,24 @@ def iterNodeExecutionLines_MeasureTimes(node, variables):
     except:
         handleExecutionCodeCreationException(node)
 
+def iterNodeExecutionLines_MeasureMemory(node, variables):
+    yield from iterNodeCommentLines(node)
+    yield "beginMemoryMeasurement()"
+    yield "try:"
+    try:
+        for line in setupNodeForExecution(node, variables):
+            yield "    " + line
+        for line in iterRealNodeExecutionLines(node, variables):
+            yield "    " + line
+        yield "    pass"
+        yield "finally:"
+        yield "    _memory_peak, _memory_retained = endMemoryMeasurement()"
+        outputs = "".join(variables[socket] + ", " for socket in node.linkedOutputs)
+        yield "_node_memory_usage[{}].registerMemory(_memory_peak, _memory_retained, ({}))".format(
+            repr(node.identifier), outputs)
+    except:
+        handleExecutionCodeCreationException(node)
+
 def iterNodeExecutionLines_Bake(node, variables):
     yield from iterNodeCommentLines(node)
     yield from setupNodeForExecution(node, variables)
@@ -153,6 +179,14 @@ def iterNodeExecutionLines_Bake(node, variables):
     except:
         handleExecutionCodeCreationException(node)
 
+def iterNodeExecutionLines_FrameCache(node, variables):
+    yield from iterNodeCommentLines(node)
+    yield from setupNodeForExecution(node, variables)
+    try:
+        yield from iterRealNodeExecutionLines(node, variables, frameCache = True)
+    except:
+        handleExecutionCodeCreationException(node)
+
 def iterNodeCommentLines(node):
     yield ""
     yield "# Node: {} - {}".format(repr(node.nodeTree.name), repr(node.name))
@@ -188,9 +222,9 @@ def iterInputCopyLines(node, variables):
             variables[socket] = newName
             yield line
 
-def iterRealNodeExecutionLines(node, variables, bake = False):
+def iterRealNodeExecutionLines(node, variables, bake = False, frameCache = False):
     requiredOutputs = getRequiredOutputIdentifiers(node)
-    localCode = node.getLocalExecutionCode(requiredOutputs, bake)
+    localCode = node.getLocalExecutionCode(requiredOutputs, bake, frameCache)
     globalCode = makeGlobalExecutionCode(localCode, node, variables)
     yield from globalCode.splitlines()
 
@@ -256,3 +290,56 @@ def getCopyLine(fromSocket, targetName, variables):
 
 def getCopyExpression(socket, variables):
     return socket.getCopyExpression().replace("value", variables[socket])
+
+
+
+# Incremental Execution
+##########################################
+
+def isVolatileNode(node):
+    '''
+    Volatile nodes are executed every time in incremental mode because their
+    result can depend on data that is not part of the node tree
+    (e.g. the current frame or the state of an object).
+    '''
+    if "VOLATILE" in node.options: return True
+    if len(node.inputs) == 0: return True
+    for socket in node.inputs:
+        if not socket.storable: return True
+        if hasattr(socket, "getValue") and not socket.comparable:
+            if not isSocketLinked(socket, node): return True
+    return False
+
+def getUnlinkedInputValueVariables(node, variables):
+    return tuple(variables[socket] for socket in node.unlinkedInputs
+                 if hasattr(socket, "getValue"))
+
+def iterNodeExecutionLines_Incremental(node, variables, nodeByID, deferredCopies):
+    yield from iterDeferredCopyLines(node, variables, deferredCopies)
+    yield from iterNodeExecutionLines_Basic(node, variables)
+    linkOutputSocketsToTargets_Incremental(node, variables, nodeByID, deferredCopies)
+
+def iterDeferredCopyLines(node, variables, deferredCopies):
+    for socket in node.inputs:
+        if socket in deferredCopies:
+            yield "{} = {}".format(variables[socket], deferredCopies.pop(socket))
+
+def linkOutputSocketsToTargets_Incremental(node, variables, nodeByID, deferredCopies):
+    '''
+    Outputs of nodes that are not executed again have to stay unchanged.
+    Therefore every target that modifies the data gets its own copy, which
+    is created when the target node is executed.
+    '''
+    for socket in node.linkedOutputs:
+        targets = tuple(iterLinkedSocketsWithInfo(socket, node, nodeByID))
+        if socket.isCopyable():
+            needACopy = [target for target in targets if target.dataIsModified]
+        else:
+            needACopy = []
+        socket.execution.neededCopies = len(needACopy)
+
+        for target in targets:
+            if target in needACopy:
+                deferredCopies[target] = getCopyExpression(socket, variables)
+            else:
+                variables[target] = variables[socket]
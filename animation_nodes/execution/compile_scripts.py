@@ -1,20 +1,57 @@
+import os
 import sys
+import marshal
+import hashlib
+import importlib.util
+from collections import OrderedDict
 from .. problems import InvalidSyntax
+from .. utils.operators import makeOperator
+from .. utils.path import getPrivateDirectory, ensurePrivateDirectory
+from .. preferences import getExecutionCodeType, getExecutionCodeSettings
 
-cache = {}
+# compiled code objects by digest, the last used entry is at the end
+cache = OrderedDict()
+maxMemoryCacheSize = 500
 
-def compileScript(script, name = "<string>"):
-    # clear the cache once in a while
-    if len(cache) == 500:
-        cache.clear()
+class CodeCacheStatistics:
+    __slots__ = ("memoryHits", "diskHits", "misses", "evictions")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.memoryHits = 0
+        self.diskHits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        return "Memory Hits: {}, Disk Hits: {}, Misses: {}, Evictions: {}".format(
+            self.memoryHits, self.diskHits, self.misses, self.evictions)
 
+statistics = CodeCacheStatistics()
+
+def compileScript(script, name = "<string>"):
     try:
-        scriptHash = hash(script)
-        if scriptHash not in cache:
+        digest = getScriptDigest(script, name)
+        if digest in cache:
+            statistics.memoryHits += 1
+            cache.move_to_end(digest)
+            return cache[digest]
+
+        compiledCode = loadCodeFromDisk(digest)
+        if compiledCode is None:
+            statistics.misses += 1
             compiledCode = compile(script, name, "exec")
-            cache[scriptHash] = compiledCode
+            saveCodeOnDisk(digest, compiledCode)
+        else:
+            statistics.diskHits += 1
 
-        return cache[scriptHash]
+        cache[digest] = compiledCode
+        if len(cache) > maxMemoryCacheSize:
+            cache.popitem(last = False)
+            statistics.evictions += 1
+        return compiledCode
 
     except SyntaxError:
         lines = script.split("\n")
@@ -29,3 +66,127 @@ def compileScript(script, name = "<string>"):
         print("\n"*5)
 
         InvalidSyntax().report()
+
+def getScriptDigest(script, name):
+    # the name is stored in the code object and shows up in tracebacks
+    digest = hashlib.sha256()
+    digest.update(getExecutionCodeType().encode())
+    digest.update(b"\0")
+    digest.update(name.encode())
+    digest.update(b"\0")
+    digest.update(script.encode())
+    return digest.hexdigest()
+
+@makeOperator("an.clear_code_cache", "Clear Code Cache", redraw = True)
+def clearCodeCache():
+    cache.clear()
+    statistics.reset()
+    directory = getCacheDirectory()
+    if directory is None: return
+    for path in iterCacheFiles(directory):
+        try: os.remove(path)
+        except OSError: pass
+    diskCacheSizes.pop(directory, None)
+
+def getCodeCacheStatistics():
+    return statistics
+
+
+# Disk Cache
+##########################################
+
+def loadCodeFromDisk(digest):
+    directory = getCacheDirectory()
+    if directory is None: return None
+
+    path = os.path.join(directory, digest + ".ancode")
+    try:
+        with open(path, "rb") as f:
+            code = marshal.load(f)
+        # the modification time is used to find the least recently used files
+        os.utime(path)
+        return code
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+def saveCodeOnDisk(digest, code):
+    directory = getCacheDirectory()
+    if directory is None: return
+
+    path = os.path.join(directory, digest + ".ancode")
+    try:
+        temporaryPath = path + ".tmp"
+        with open(temporaryPath, "wb") as f:
+            marshal.dump(code, f)
+            size = f.tell()
+        os.replace(temporaryPath, path)
+    except OSError:
+        return
+
+    if directory not in diskCacheSizes:
+        diskCacheSizes[directory] = calculateDiskCacheSize(directory)
+    else:
+        diskCacheSizes[directory] += size
+    if diskCacheSizes[directory] > getMaxDiskCacheSize():
+        limitDiskCacheSize(directory)
+
+# The size of the files on disk is only calculated once per directory
+# and updated when files are written. Going through all files again
+# is only necessary when the cache has become too large.
+diskCacheSizes = {}
+
+def calculateDiskCacheSize(directory):
+    totalBytes = 0
+    for path in iterCacheFiles(directory):
+        try: totalBytes += os.stat(path).st_size
+        except OSError: pass
+    return totalBytes
+
+def getMaxDiskCacheSize():
+    return getExecutionCodeSettings().codeCacheSize * 1024 * 1024
+
+def limitDiskCacheSize(directory):
+    # remove more than necessary, so that this does not happen on every miss
+    targetBytes = getMaxDiskCacheSize() * 3 // 4
+    files = []
+    totalBytes = 0
+    for path in iterCacheFiles(directory):
+        try: info = os.stat(path)
+        except OSError: continue
+        files.append((info.st_mtime, info.st_size, path))
+        totalBytes += info.st_size
+
+    files.sort()
+    for _, size, path in files:
+        if totalBytes <= targetBytes: break
+        try: os.remove(path)
+        except OSError: continue
+        totalBytes -= size
+        statistics.evictions += 1
+    diskCacheSizes[directory] = totalBytes
+
+def iterCacheFiles(directory):
+    try: names = os.listdir(directory)
+    except OSError: return
+    for name in names:
+        if name.endswith(".ancode"):
+            yield os.path.join(directory, name)
+
+def getCacheDirectory():
+    '''
+    The loaded code is executed, so the directory must not be writable by other users.
+    Returns None when the persistent cache is disabled or the directory is not private.
+    '''
+    settings = getExecutionCodeSettings()
+    if not settings.usePersistentCodeCache: return None
+
+    # marshal data can only be loaded in the same Python version
+    version = importlib.util.MAGIC_NUMBER.hex()
+    if settings.codeCacheDirectory == "":
+        return getPrivateDirectory("code_cache", version)
+
+    directory = os.path.join(settings.codeCacheDirectory, version)
+    try:
+        if ensurePrivateDirectory(directory): return directory
+    except OSError: pass
+    return None
@@ -0,0 +1,271 @@
+import os
+import bpy
+import mmap
+import json
+import numpy
+import struct
+
+# A baked frame is stored in a single file per node tree and frame:
+#
+#     magic (4 bytes), version (uint32), header length (uint32), json header, data
+#
+# The header contains the names of the changed objects and the offsets of
+# their arrays in the data part. All arrays are aligned to 16 bytes, so that
+# they can be used directly from the memory mapped file during playback.
+#
+# Only the final object matrices and the mesh geometry are stored.
+
+magic = b"ANFC"
+version = 1
+prefix = struct.Struct("<4sII")
+alignment = 16
+
+# Set while a node tree is executed by the frame cache bake.
+activeRecorder = None
+bakingFrameCache = False
+
+def isBakingFrameCache():
+    return bakingFrameCache
+
+def getFramePath(directory, frame):
+    return os.path.join(directory, "frame_{:06d}.anfc".format(frame))
+
+
+# Supported Nodes
+##########################################
+
+# Nodes that change data outside of the node tree are not executed when a frame
+# is loaded from the cache. Only the changes of nodes that implement
+# getFrameCacheCode are stored, so trees with other such nodes can't be cached.
+
+internalOutputNodeTypes = {"an_GroupOutputNode", "an_LoopGeneratorOutputNode"}
+
+externalDataNodeTypes = {
+    "an_ObjectInstancerNode",
+    "an_SetKeyframesNode",
+    "an_TextBlockWriterNode",
+    "an_SetVertexWeightNode",
+    "an_SetBevelVertexWeightNode",
+    "an_SetBevelEdgeWeightNode",
+    "an_SetEdgeCreaseNode",
+    "an_SetUVMapNode",
+    "an_SetVertexColorNode",
+    "an_SetPolygonMaterialIndexNode",
+    "an_SetCustomAttributeNode",
+    "an_SetGPLayerAttributesNode",
+    "an_SetGPStrokeAttributesNode"
+}
+
+def getUnsupportedNodes(tree):
+    '''Returns the nodes whose changes can't be restored from the frame cache.'''
+    from .. base_types import AnimationNode
+    unsupportedNodes = []
+    checkedSubprograms = set()
+    nodes = list(tree.nodes)
+    while len(nodes) > 0:
+        node = nodes.pop()
+        if node.bl_idname == "an_InvokeSubprogramNode":
+            # subprograms can be in other trees
+            if node.subprogramIdentifier not in checkedSubprograms:
+                checkedSubprograms.add(node.subprogramIdentifier)
+                network = node.subprogramNetwork
+                if network is not None:
+                    nodes.extend(network.getAnimationNodes())
+        elif changesExternalData(node) and not implementsFrameCache(node, AnimationNode):
+            if node not in unsupportedNodes:
+                unsupportedNodes.append(node)
+    return unsupportedNodes
+
+def changesExternalData(node):
+    idName = node.bl_idname
+    if idName in externalDataNodeTypes: return True
+    return idName.endswith("OutputNode") and idName not in internalOutputNodeTypes
+
+def implementsFrameCache(node, baseClass):
+    return type(node).getFrameCacheCode is not baseClass.getFrameCacheCode
+
+
+# Recording
+##########################################
+
+# These functions are called from the execution code when the
+# execution code type is FRAME_CACHE. The objects are only remembered,
+# their data is read after all node trees have been executed.
+
+def recordObjectMatrices(objects):
+    if activeRecorder is not None:
+        activeRecorder.matrixObjects.update(o.name for o in objects if o is not None)
+
+def recordObjectMeshes(objects):
+    if activeRecorder is not None:
+        activeRecorder.meshObjects.update(o.name for o in objects
+            if o is not None and o.type == "MESH")
+
+class FrameRecorder:
+    def __init__(self):
+        self.matrixObjects = set()
+        self.meshObjects = set()
+
+    def __enter__(self):
+        global activeRecorder
+        activeRecorder = self
+        return self
+
+    def __exit__(self, exceptionType, exceptionValue, traceback):
+        global activeRecorder
+        activeRecorder = None
+
+    def write(self, path):
+        writer = FrameWriter()
+
+        objects = [bpy.data.objects[name] for name in sorted(self.matrixObjects) if name in bpy.data.objects]
+        if len(objects) > 0:
+            matrices = numpy.empty((len(objects), 16), dtype = numpy.float32)
+            for i, object in enumerate(objects):
+                matrices[i] = numpy.array(object.matrix_world, dtype = numpy.float32).ravel()
+            writer.header["matrices"] = {
+                "objects" : [object.name for object in objects],
+                "offset" : writer.addArray(matrices)}
+
+        meshes = []
+        for name in sorted(self.meshObjects):
+            object = bpy.data.objects.get(name)
+            if object is None or object.type != "MESH": continue
+            meshes.append(writeMeshData(writer, object.name, object.data))
+        writer.header["meshes"] = meshes
+
+        writer.save(path)
+
+def writeMeshData(writer, objectName, mesh):
+    vertices = numpy.empty(len(mesh.vertices) * 3, dtype = numpy.float32)
+    edges = numpy.empty(len(mesh.edges) * 2, dtype = numpy.int32)
+    loopStarts = numpy.empty(len(mesh.polygons), dtype = numpy.int32)
+    loopTotals = numpy.empty(len(mesh.polygons), dtype = numpy.int32)
+    vertexIndices = numpy.empty(len(mesh.loops), dtype = numpy.int32)
+
+    mesh.vertices.foreach_get("co", vertices)
+    mesh.edges.foreach_get("vertices", edges)
+    mesh.polygons.foreach_get("loop_start", loopStarts)
+    mesh.polygons.foreach_get("loop_total", loopTotals)
+    mesh.loops.foreach_get("vertex_index", vertexIndices)
+
+    return {
+        "object" : objectName,
+        "vertices" : writer.addArray(vertices),
+        "edges" : writer.addArray(edges),
+        "loopStarts" : writer.addArray(loopStarts),
+        "loopTotals" : writer.addArray(loopTotals),
+        "vertexIndices" : writer.addArray(vertexIndices)}
+
+class FrameWriter:
+    def __init__(self):
+        self.header = {}
+        self.arrays = []
+        self.size = 0
+
+    def addArray(self, array):
+        '''Returns the location of the array that is stored in the header.'''
+        offset = self.size
+        self.arrays.append(array)
+        self.size += alignedSize(array.nbytes)
+        return [offset, array.size, array.dtype.str]
+
+    def save(self, path):
+        header = json.dumps(self.header).encode("utf-8")
+        header += b" " * (alignedSize(prefix.size + len(header)) - prefix.size - len(header))
+
+        os.makedirs(os.path.dirname(path), exist_ok = True)
+        # write to another file first, so that playback never sees half written frames
+        tempPath = path + ".tmp"
+        with open(tempPath, "wb") as f:
+            f.write(prefix.pack(magic, version, len(header)))
+            f.write(header)
+            for array in self.arrays:
+                f.write(array.tobytes())
+                f.write(b"\0" * (alignedSize(array.nbytes) - array.nbytes))
+        os.replace(tempPath, path)
+
+def alignedSize(size):
+    return (size + alignment - 1) // alignment * alignment
+
+
+# Playback
+##########################################
+
+def loadFrame(path):
+    '''Returns False when there is no valid cached frame at this path.'''
+    try: f = open(path, "rb")
+    except OSError: return False
+
+    with f:
+        if os.fstat(f.fileno()).st_size < prefix.size: return False
+        with mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ) as data:
+            fileMagic, fileVersion, headerLength = prefix.unpack_from(data, 0)
+            if fileMagic != magic or fileVersion != version: return False
+            header = json.loads(bytes(data[prefix.size:prefix.size + headerLength]))
+            applyFrame(header, FrameReader(data, prefix.size + headerLength))
+    return True
+
+class FrameReader:
+    def __init__(self, data, dataStart):
+        self.data = data
+        self.dataStart = dataStart
+
+    def getArray(self, location):
+        offset, length, dtype = location
+        return numpy.frombuffer(self.data, dtype = numpy.dtype(dtype),
+            count = length, offset = self.dataStart + offset)
+
+def applyFrame(header, reader):
+    objects = bpy.data.objects
+
+    if "matrices" in header:
+        matrices = reader.getArray(header["matrices"]["offset"]).reshape(-1, 4, 4)
+        for name, matrix in zip(header["matrices"]["objects"], matrices):
+            object = objects.get(name)
+            if object is not None:
+                object.matrix_world = matrix.tolist()
+
+    for meshInfo in header.get("meshes", []):
+        object = objects.get(meshInfo["object"])
+        if object is None or object.type != "MESH" or object.mode != "OBJECT": continue
+        setMeshData(object.data, meshInfo, reader)
+
+def setMeshData(outMesh, meshInfo, reader):
+    vertices = reader.getArray(meshInfo["vertices"])
+    edges = reader.getArray(meshInfo["edges"])
+    loopStarts = reader.getArray(meshInfo["loopStarts"])
+    loopTotals = reader.getArray(meshInfo["loopTotals"])
+    vertexIndices = reader.getArray(meshInfo["vertexIndices"])
+
+    if not hasSameTopology(outMesh, vertices, edges, loopStarts, loopTotals, vertexIndices):
+        outMesh.clear_geometry()
+        outMesh.vertices.add(len(vertices) // 3)
+        outMesh.edges.add(len(edges) // 2)
+        outMesh.loops.add(len(vertexIndices))
+        outMesh.polygons.add(len(loopStarts))
+        outMesh.edges.foreach_set("vertices", edges)
+        outMesh.polygons.foreach_set("loop_start", loopStarts)
+        outMesh.polygons.foreach_set("loop_total", loopTotals)
+        outMesh.loops.foreach_set("vertex_index", vertexIndices)
+
+    outMesh.vertices.foreach_set("co", vertices)
+    outMesh.update(calc_edges = len(edges) == 0 and len(loopStarts) > 0)
+
+def hasSameTopology(mesh, vertices, edges, loopStarts, loopTotals, vertexIndices):
+    if len(mesh.vertices) * 3 != len(vertices): return False
+    if len(mesh.edges) * 2 != len(edges): return False
+    if len(mesh.polygons) != len(loopStarts): return False
+    if len(mesh.loops) != len(vertexIndices): return False
+
+    currentIndices = numpy.empty(len(vertexIndices), dtype = numpy.int32)
+    mesh.loops.foreach_get("vertex_index", currentIndices)
+    if not numpy.array_equal(currentIndices, vertexIndices): return False
+
+    currentLoopStarts = numpy.empty(len(loopStarts), dtype = numpy.int32)
+    mesh.polygons.foreach_get("loop_start", currentLoopStarts)
+    if not numpy.array_equal(currentLoopStarts, loopStarts): return False
+
+    currentEdges = numpy.empty(len(edges), dtype = numpy.int32)
+    mesh.edges.foreach_get("vertices", currentEdges)
+    return numpy.array_equal(currentEdges, edges)
@@ -0,0 +1,48 @@
+class IncrementalNodeBlock:
+    '''
+    Execution code of a single node in incremental mode.
+    The block remembers the state it has been executed with last time,
+    so that it is only executed again when something changed.
+    '''
+    __slots__ = ("identifier", "codeObject", "originIndices", "isVolatile",
+                 "inputVariables", "lastInputValues", "lastProperties")
+
+    def __init__(self, identifier, codeObject, originIndices, isVolatile, inputVariables):
+        self.identifier = identifier
+        self.codeObject = codeObject
+        self.originIndices = originIndices
+        self.isVolatile = isVolatile
+        self.inputVariables = inputVariables
+        self.reset()
+
+    def reset(self):
+        self.lastInputValues = None
+        self.lastProperties = None
+
+    def needsExecution(self, executionData, changedBlocks):
+        if self.isVolatile: return True
+        if self.lastInputValues is None: return True
+        if any(changedBlocks[index] for index in self.originIndices): return True
+        if self.inputValuesChanged(executionData): return True
+        return self.propertiesChanged(executionData)
+
+    def inputValuesChanged(self, executionData):
+        values = tuple(executionData[name] for name in self.inputVariables)
+        try: return values != self.lastInputValues
+        except: return True
+
+    def propertiesChanged(self, executionData):
+        return getNodePropertiesFingerprint(executionData[self.identifier]) != self.lastProperties
+
+    def storeState(self, executionData):
+        self.lastInputValues = tuple(executionData[name] for name in self.inputVariables)
+        self.lastProperties = getNodePropertiesFingerprint(executionData[self.identifier])
+
+
+def getNodePropertiesFingerprint(node):
+    return tuple((key, toComparableValue(value)) for key, value in node.items())
+
+def toComparableValue(value):
+    if hasattr(value, "to_dict"): return repr(value.to_dict())
+    if hasattr(value, "to_list"): return tuple(value.to_list())
+    return value
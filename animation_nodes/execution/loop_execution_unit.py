@@ -2,6 +2,7 @@ from .. sockets.info import toIdName
 from .. tree_info import getNodesByType
 from . compile_scripts import compileScript
 from .. problems import ExecutionUnitNotSetup
+from . loop_vectorization import getLoopVectorization, ignoredNodeTypes
 from . code_generator import (getInitialVariables,
                               iterSetupCodeLines,
                               getCopyExpression,
@@ -10,14 +11,24 @@ from . code_generator import (getInitialVariables,
                               getLoadSocketValueLine,
                               iterInputConversionLines,
                               linkOutputSocketsToTargets,
+                              iterNodeExecutionLines_Basic,
                               getFunction_IterNodeExecutionLines)
 
+# Generators of these types get a list with enough memory
+# for all iterations instead of growing it while appending.
+preallocatedGeneratorTypes = {
+    "Float List" : "DoubleList",
+    "Vector List" : "Vector3DList",
+    "Matrix List" : "Matrix4x4List"
+}
+
 class LoopExecutionUnit:
     def __init__(self, network, nodeByID):
         self.network = network
         self.setupScript = ""
         self.setupCodeObject = None
         self.executionData = {}
+        self.isVectorized = False
 
         self.generateScript(nodeByID)
         self.compileScript()
@@ -46,32 +57,41 @@ class LoopExecutionUnit:
         try: nodes = self.network.getSortedAnimationNodes(nodeByID)
         except: return
 
-        variables = getInitialVariables(nodes)
-        self.setupScript = "\n".join(self.iterSetupScriptLines(nodes, variables, nodeByID))
-
-    def iterSetupScriptLines(self, nodes, variables, nodeByID):
         inputNode = self.network.getLoopInputNode(nodeByID)
+        vectorization = getLoopVectorization(inputNode, nodes, nodeByID)
+        self.isVectorized = vectorization is not None
 
+        variables = getInitialVariables(nodes)
+        self.setupScript = "\n".join(self.iterSetupScriptLines(inputNode, nodes, variables, vectorization, nodeByID))
+
+    def iterSetupScriptLines(self, inputNode, nodes, variables, vectorization, nodeByID):
         yield from iterSetupCodeLines(nodes, variables)
         yield "\n\n"
 
+        if vectorization is None:
+            yield from self.iter_IterativeMain(inputNode, nodes, variables, nodeByID, "main")
+        else:
+            yield from self.iter_VectorizedMain(inputNode, nodes, variables, vectorization, nodeByID, "main")
+
+    def iter_IterativeMain(self, inputNode, nodes, variables, nodeByID, functionName):
         if inputNode.iterateThroughLists:
-            yield from self.iter_IteratorLength(inputNode, nodes, variables, nodeByID)
+            yield from self.iter_IteratorLength(inputNode, nodes, variables, nodeByID, functionName)
         else:
-            yield from self.iter_IterationsAmount(inputNode, nodes, variables, nodeByID)
+            yield from self.iter_IterationsAmount(inputNode, nodes, variables, nodeByID, functionName)
 
 
-    def iter_IterationsAmount(self, inputNode, nodes, variables, nodeByID):
-        yield self.get_IterationsAmount_Header(inputNode, variables)
+    def iter_IterationsAmount(self, inputNode, nodes, variables, nodeByID, functionName):
+        yield self.get_IterationsAmount_Header(inputNode, variables, functionName)
         yield "    " + getGlobalizeStatement(nodes, variables)
         yield from iterIndented(self.iter_InitializeGeneratorsLines(inputNode, variables, nodeByID))
         yield from iterIndented(self.iter_InitializeParametersLines(inputNode, variables))
         yield from iterIndented(self.iter_IterationsAmount_PrepareLoop(inputNode, variables))
         yield from iterIndented(self.iter_LoopBody(inputNode, nodes, variables, nodeByID), amount = 2)
+        yield from iterIndented(self.iter_FinishGeneratorsLines(inputNode, variables, nodeByID))
         yield from iterIndented(self.iter_UpdateLoopViewerNodes(nodeByID))
         yield "    " + self.get_ReturnStatement(inputNode, variables, nodeByID)
 
-    def get_IterationsAmount_Header(self, inputNode, variables):
+    def get_IterationsAmount_Header(self, inputNode, variables, functionName):
         variables[inputNode.iterationsSocket] = "loop_iterations"
         parameterNames = ["loop_iterations"]
         for i, socket in enumerate(inputNode.getParameterSockets()):
@@ -80,7 +100,7 @@ class LoopExecutionUnit:
                 variables[socket] = name
                 parameterNames.append(name)
 
-        header = "def main({}):".format(", ".join(parameterNames))
+        header = "def {}({}):".format(functionName, ", ".join(parameterNames))
         return header
 
     def iter_IterationsAmount_PrepareLoop(self, inputNode, variables):
@@ -88,17 +108,20 @@ class LoopExecutionUnit:
         yield "for current_loop_index in range(loop_iterations):"
 
 
-    def iter_IteratorLength(self, inputNode, nodes, variables, nodeByID):
-        yield self.get_IteratorLength_Header(inputNode, variables)
+    def iter_IteratorLength(self, inputNode, nodes, variables, nodeByID, functionName):
+        yield self.get_IteratorLength_Header(inputNode, variables, functionName)
         yield "    " + getGlobalizeStatement(nodes, variables)
+        if inputNode.iterationsSocket.isLinked or self.hasPreallocatedGenerators(inputNode, nodeByID):
+            yield "    " + self.get_IteratorLength_IterationsAmountLine(inputNode)
         yield from iterIndented(self.iter_InitializeGeneratorsLines(inputNode, variables, nodeByID))
         yield from iterIndented(self.iter_InitializeParametersLines(inputNode, variables))
         yield from iterIndented(self.iter_IteratorLength_PrepareLoopLines(inputNode, variables))
         yield from iterIndented(self.iter_LoopBody(inputNode, nodes, variables, nodeByID), amount = 2)
+        yield from iterIndented(self.iter_FinishGeneratorsLines(inputNode, variables, nodeByID))
         yield from iterIndented(self.iter_UpdateLoopViewerNodes(nodeByID))
         yield "    " + self.get_ReturnStatement(inputNode, variables, nodeByID)
 
-    def get_IteratorLength_Header(self, inputNode, variables):
+    def get_IteratorLength_Header(self, inputNode, variables, functionName):
         parameterNames = []
         for i, socket in enumerate(inputNode.getIteratorSockets()):
             name = "loop_iterator_" + str(i)
@@ -109,20 +132,19 @@ class LoopExecutionUnit:
                 variables[socket] = name
                 parameterNames.append(name)
 
-        header = "def main({}):".format(", ".join(parameterNames))
+        header = "def {}({}):".format(functionName, ", ".join(parameterNames))
         return header
 
+    def get_IteratorLength_IterationsAmountLine(self, inputNode):
+        lengths = ["len(loop_iterator_{})".format(i) for i in range(len(inputNode.getIteratorSockets()))]
+        if len(lengths) == 1: return "loop_iterations = " + lengths[0]
+        else: return "loop_iterations = min({})".format(", ".join(lengths))
+
     def iter_IteratorLength_PrepareLoopLines(self, inputNode, variables):
         iterators = inputNode.getIteratorSockets()
         iteratorNames = ["loop_iterator_" + str(i) for i in range(len(iterators))]
 
-        if inputNode.iterationsSocket.isLinked:
-            yield "zipped_iterators = list(zip({}))".format(", ".join(iteratorNames))
-            yield "loop_iterations = len(zipped_iterators)"
-        else:
-            # loop_iterations doesn't have to be calculated
-            #  -> no need to make a list of the zip object
-            yield "zipped_iterators = zip({})".format(", ".join(iteratorNames))
+        yield "zipped_iterators = zip({})".format(", ".join(iteratorNames))
 
         names = []
         for i, socket in enumerate(iterators):
@@ -141,13 +163,35 @@ class LoopExecutionUnit:
                 yield "{}.updateTextBlock()".format(node.identifier)
                 yield "{}.clearOutputLines()".format(node.identifier)
 
-    def iter_InitializeGeneratorsLines(self, inputNode, variables, nodeByID):
+    def iter_InitializeGeneratorsLines(self, inputNode, variables, nodeByID, preallocate = True):
+        # the amount of iterations is unknown when the loop can stop early
+        preallocate = preallocate and not self.canStopEarly(inputNode, nodeByID)
         for i, node in enumerate(inputNode.getSortedGeneratorNodes(nodeByID)):
             name = "loop_generator_output_" + str(i)
             variables[node] = name
-            yield "{} = AN.sockets.info.getDefaultValue({})".format(name, repr(node.listDataType))
+            if preallocate and self.canPreallocateGenerator(node):
+                yield "{} = {}(capacity = loop_iterations)".format(name, preallocatedGeneratorTypes[node.listDataType])
+            else:
+                yield "{} = AN.sockets.info.getDefaultValue({})".format(name, repr(node.listDataType))
             yield "{0}_{1} = {1}.{0}".format(node.generatorType, name)
 
+    def iter_FinishGeneratorsLines(self, inputNode, variables, nodeByID):
+        if self.canStopEarly(inputNode, nodeByID): return
+        for node in inputNode.getSortedGeneratorNodes(nodeByID):
+            # not all iterations appended a value
+            if self.canPreallocateGenerator(node) and node.conditionSocket.isLinked:
+                yield "{}.freeUnusedMemory()".format(variables[node])
+
+    def hasPreallocatedGenerators(self, inputNode, nodeByID):
+        if self.canStopEarly(inputNode, nodeByID): return False
+        return any(self.canPreallocateGenerator(node) for node in inputNode.getSortedGeneratorNodes(nodeByID))
+
+    def canPreallocateGenerator(self, node):
+        return node.generatorType == "append" and node.listDataType in preallocatedGeneratorTypes
+
+    def canStopEarly(self, inputNode, nodeByID):
+        return len(inputNode.getBreakNodes(nodeByID)) > 0
+
     def iter_InitializeParametersLines(self, inputNode, variables):
         for socket in inputNode.getParameterSockets():
             if not socket.loop.useAsInput:
@@ -158,9 +202,8 @@ class LoopExecutionUnit:
         yield from linkOutputSocketsToTargets(inputNode, variables, nodeByID)
 
         iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
-        ignoreNodes = {"an_LoopInputNode", "an_LoopGeneratorOutputNode", "an_ReassignLoopParameterNode", "an_LoopBreakNode"}
         for node in nodes:
-            if node.bl_idname in ignoreNodes: continue
+            if node.bl_idname in ignoredNodeTypes: continue
             yield from iterNodeExecutionLines(node, variables)
             yield from linkOutputSocketsToTargets(node, variables, nodeByID)
 
@@ -198,6 +241,57 @@ class LoopExecutionUnit:
             yield "{}{} = {}".format(conditionPrefix, variables[node.linkedParameterSocket], expression)
 
 
+    def iter_VectorizedMain(self, inputNode, nodes, variables, vectorization, nodeByID, functionName):
+        if inputNode.iterateThroughLists:
+            yield self.get_IteratorLength_Header(inputNode, variables, functionName)
+        else:
+            yield self.get_IterationsAmount_Header(inputNode, variables, functionName)
+        yield "    " + getGlobalizeStatement(nodes, variables)
+        if inputNode.iterateThroughLists:
+            yield "    " + self.get_IteratorLength_IterationsAmountLine(inputNode)
+        yield from iterIndented(self.iter_InitializeGeneratorsLines(inputNode, variables, nodeByID, preallocate = False))
+        yield from iterIndented(self.iter_InitializeParametersLines(inputNode, variables))
+        yield from iterIndented(self.iter_Vectorized_PrepareLines(inputNode, variables))
+        yield "    if loop_iterations > 0:"
+        yield from iterIndented(self.iter_Vectorized_Body(inputNode, nodes, variables, vectorization, nodeByID), amount = 2)
+        yield from iterIndented(self.iter_UpdateLoopViewerNodes(nodeByID))
+        yield "    " + self.get_ReturnStatement(inputNode, variables, nodeByID)
+
+    def iter_Vectorized_PrepareLines(self, inputNode, variables):
+        iterators = inputNode.getIteratorSockets()
+        iteratorNames = ["loop_iterator_" + str(i) for i in range(len(iterators))]
+
+        if inputNode.iterateThroughLists:
+            variables[inputNode.iterationsSocket] = "loop_iterations"
+
+        # slicing creates new lists, so the nodes can't modify the iterated lists
+        for i, (socket, name) in enumerate(zip(iterators, iteratorNames)):
+            elementsName = "loop_iterator_element_" + str(i)
+            variables[socket] = elementsName
+            yield "{} = {}[:loop_iterations]".format(elementsName, name)
+
+        variables[inputNode.indexSocket] = "current_loop_index"
+        if inputNode.indexSocket.isLinked:
+            yield "current_loop_index = LongList.fromValues(range(loop_iterations))"
+
+    def iter_Vectorized_Body(self, inputNode, nodes, variables, vectorization, nodeByID):
+        yield from linkOutputSocketsToTargets(inputNode, variables, nodeByID)
+
+        for node in nodes:
+            if node.bl_idname in ignoredNodeTypes: continue
+            if vectorization.isVectorized(node):
+                yield from vectorization.iterNodeExecutionLines(node, variables)
+            else:
+                yield from iterNodeExecutionLines_Basic(node, variables)
+            yield from linkOutputSocketsToTargets(node, variables, nodeByID)
+
+        for node in inputNode.getSortedGeneratorNodes(nodeByID):
+            yield from iterNodeCommentLines(node)
+            yield "if {}:".format(variables[node.conditionSocket])
+            yield "    {} = {}.copy()".format(variables[node], variables[node.dataInputSocket])
+        yield "pass"
+
+
     def get_ReturnStatement(self, inputNode, variables, nodeByID):
         names = []
         names.extend(["loop_iterator_" + str(i) for i, socket in enumerate(inputNode.getIteratorSockets()) if socket.loop.useAsOutput])
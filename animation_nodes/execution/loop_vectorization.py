@@ -0,0 +1,106 @@
+from .. preferences import getExecutionCodeType
+from .. sockets.info import isBase, toListDataType
+from .. tree_info import iterLinkedSocketsWithInfo, isSocketLinked, iterLinkedInputSocketsWithOriginDataType
+from .. sockets.implicit_conversion import getConversionCode, iterTypesThatCanConvertTo
+from . code_generator import (resolveInnerLinks,
+                              iterInputCopyLines,
+                              getConvertInputLine,
+                              iterNodeCommentLines,
+                              makeGlobalExecutionCode,
+                              getRequiredOutputIdentifiers)
+
+# A loop can be vectorized when every iteration executes the same pure data-flow.
+# Instead of executing every node once per iteration, every node is executed
+# only once and gets lists that contain the values of all iterations.
+#
+# Sockets that get a different value in every iteration are called varying.
+# These are the iterator elements, the index and everything that depends on them.
+# Nodes that have a varying input have to implement
+#
+#     getVectorizedExecutionCode(self, required, varyingInputs) -> list of lines or None
+#
+# The code uses the same variable names as the normal execution code. Inputs whose
+# identifiers are in varyingInputs are lists, all other inputs have a single value.
+# All required outputs have to be lists with one element per iteration.
+# None has to be returned when the node can't do this with its current settings.
+#
+# Nodes without varying inputs are executed once with their normal code,
+# but only nodes that implement the method above are allowed in the loop.
+
+ignoredNodeTypes = {"an_LoopInputNode", "an_LoopGeneratorOutputNode",
+                    "an_ReassignLoopParameterNode", "an_LoopBreakNode"}
+
+class LoopVectorization:
+    def __init__(self, varyingSockets, codeByNode):
+        self.varyingSockets = varyingSockets
+        self.codeByNode = codeByNode
+
+    def iterNodeExecutionLines(self, node, variables):
+        yield from iterNodeCommentLines(node)
+        yield from self.iterInputConversionLines(node, variables)
+        yield from iterInputCopyLines(node, variables)
+        resolveInnerLinks(node, variables)
+        yield from makeGlobalExecutionCode(self.codeByNode[node], node, variables).splitlines()
+
+    def iterInputConversionLines(self, node, variables):
+        for socket, originType in iterLinkedInputSocketsWithOriginDataType(node):
+            if socket.dataType != originType:
+                if socket in self.varyingSockets:
+                    convertCode = getConversionCode(toListDataType(originType), toListDataType(socket.dataType))
+                else:
+                    convertCode = getConversionCode(originType, socket.dataType)
+                if convertCode is not None:
+                    yield getConvertInputLine(node, socket, convertCode, variables)
+
+    def isVectorized(self, node):
+        return node in self.codeByNode
+
+def getLoopVectorization(inputNode, nodes, nodeByID):
+    '''Returns None when the loop has to be executed iteration by iteration.'''
+    if not inputNode.vectorize: return None
+    if getExecutionCodeType() not in ("DEFAULT", "INCREMENTAL"): return None
+    if len(inputNode.getBreakNodes(nodeByID)) > 0: return None
+    if len(inputNode.getReassignParameterNodes(nodeByID)) > 0: return None
+
+    varyingSockets = set()
+    def markTargetsAsVarying(socket, node):
+        varyingSockets.update(iterLinkedSocketsWithInfo(socket, node, nodeByID))
+
+    for socket in inputNode.getIteratorSockets():
+        markTargetsAsVarying(socket, inputNode)
+    markTargetsAsVarying(inputNode.indexSocket, inputNode)
+
+    codeByNode = {}
+    for node in nodes:
+        if node.bl_idname in ignoredNodeTypes: continue
+        if not hasattr(node, "getVectorizedExecutionCode"): return None
+
+        varyingInputs = {socket.identifier for socket in node.inputs if socket in varyingSockets}
+        if len(varyingInputs) == 0: continue
+
+        for socket, originType in iterLinkedInputSocketsWithOriginDataType(node):
+            if socket in varyingSockets and not canConvertLists(originType, socket.dataType):
+                return None
+
+        required = getRequiredOutputIdentifiers(node)
+        lines = node.getVectorizedExecutionCode(required, varyingInputs)
+        if lines is None: return None
+        codeByNode[node] = node.applyCodeEffects("\n".join(lines), required)
+
+        for socket in node.linkedOutputs:
+            markTargetsAsVarying(socket, node)
+
+    for node in inputNode.getSortedGeneratorNodes(nodeByID):
+        if node.generatorType != "append": return None
+        if isSocketLinked(node.conditionSocket, node): return None
+        if node.dataInputSocket not in varyingSockets: return None
+        for socket, originType in iterLinkedInputSocketsWithOriginDataType(node):
+            if socket == node.dataInputSocket and originType != socket.dataType:
+                return None
+
+    return LoopVectorization(varyingSockets, codeByNode)
+
+def canConvertLists(fromType, toType):
+    if fromType == toType: return True
+    if not (isBase(fromType) and isBase(toType)): return False
+    return toListDataType(fromType) in iterTypesThatCanConvertTo(toListDataType(toType))
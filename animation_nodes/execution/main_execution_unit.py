@@ -1,11 +1,17 @@
 import sys, traceback
 from .. import problems
+from .. tree_info import getOriginNodes
 from . compile_scripts import compileScript
+from .. preferences import getExecutionCodeType
+from . incremental import IncrementalNodeBlock
 from .. problems import ExecutionUnitNotSetup, ExceptionDuringExecution
 from . code_generator import (getInitialVariables,
                               iterSetupCodeLines,
+                              isVolatileNode,
                               linkOutputSocketsToTargets,
-                              getFunction_IterNodeExecutionLines)
+                              getUnlinkedInputValueVariables,
+                              getFunction_IterNodeExecutionLines,
+                              iterNodeExecutionLines_Incremental)
 
 class MainExecutionUnit:
     def __init__(self, network, nodeByID):
@@ -15,6 +21,9 @@ class MainExecutionUnit:
         self.setupCodeObject = None
         self.executeCodeObject = None
         self.executionData = {}
+        self.isIncremental = getExecutionCodeType() == "INCREMENTAL"
+        self.nodeBlocks = []
+        self.executedNodesAmount = 0
 
         self.generateScripts(nodeByID)
         self.compileScripts()
@@ -22,15 +31,21 @@ class MainExecutionUnit:
 
 
     def setup(self):
-        self.executionData = {}
-        exec(self.setupCodeObject, self.executionData, self.executionData)
-        self.execute = self.executeUnit
+        if self.isIncremental:
+            # keep the outputs of the last execution
+            exec(self.setupCodeObject, self.executionData, self.executionData)
+            self.execute = self.executeUnit_Incremental
+        else:
+            self.executionData = {}
+            exec(self.setupCodeObject, self.executionData, self.executionData)
+            self.execute = self.executeUnit
 
     def insertSubprogramFunctions(self, data):
         self.executionData.update(data)
 
     def finish(self):
-        self.executionData.clear()
+        if not self.isIncremental:
+            self.executionData.clear()
         self.execute = self.raiseNotSetupException
 
     def executeUnit(self):
@@ -43,6 +58,28 @@ class MainExecutionUnit:
             ExceptionDuringExecution().report()
             return False
 
+    def executeUnit_Incremental(self):
+        data = self.executionData
+        changedBlocks = [False] * len(self.nodeBlocks)
+        try:
+            for index, block in enumerate(self.nodeBlocks):
+                if block.needsExecution(data, changedBlocks):
+                    exec(block.codeObject, data, data)
+                    block.storeState(data)
+                    changedBlocks[index] = True
+            self.executedNodesAmount = sum(changedBlocks)
+            return True
+        except:
+            self.resetNodeBlocks()
+            print("\n"*5)
+            traceback.print_exc()
+            ExceptionDuringExecution().report()
+            return False
+
+    def resetNodeBlocks(self):
+        for block in self.nodeBlocks:
+            block.reset()
+
 
     def getCodes(self):
         return [self.setupScript, self.executeScript]
@@ -55,7 +92,10 @@ class MainExecutionUnit:
 
         variables = getInitialVariables(nodes)
         self.setupScript = "\n".join(iterSetupCodeLines(nodes, variables))
-        self.executeScript = "\n".join(self.iterExecutionScriptLines(nodes, variables, nodeByID))
+        if self.isIncremental:
+            self.generateNodeBlocks(nodes, variables, nodeByID)
+        else:
+            self.executeScript = "\n".join(self.iterExecutionScriptLines(nodes, variables, nodeByID))
 
     def iterExecutionScriptLines(self, nodes, variables, nodeByID):
         iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
@@ -64,9 +104,31 @@ class MainExecutionUnit:
             yield from iterNodeExecutionLines(node, variables)
             yield from linkOutputSocketsToTargets(node, variables, nodeByID)
 
+    def generateNodeBlocks(self, nodes, variables, nodeByID):
+        indexByNode = {node.identifier : index for index, node in enumerate(nodes)}
+        deferredCopies = {}
+        blockScripts = []
+
+        for node in nodes:
+            inputVariables = getUnlinkedInputValueVariables(node, variables)
+            script = "\n".join(iterNodeExecutionLines_Incremental(node, variables, nodeByID, deferredCopies))
+            codeObject = compileScript(script, name = "execution: {} - {}".format(
+                repr(self.network.treeName), repr(node.name)))
+
+            originIndices = tuple(indexByNode[originNode.identifier]
+                for originNode in getOriginNodes(node, nodeByID)
+                if originNode.identifier in indexByNode)
+
+            self.nodeBlocks.append(IncrementalNodeBlock(node.identifier, codeObject,
+                originIndices, isVolatileNode(node), inputVariables))
+            blockScripts.append(script)
+
+        self.executeScript = "\n".join(blockScripts)
+
     def compileScripts(self):
         self.setupCodeObject = compileScript(self.setupScript, name = "setup: {}".format(repr(self.network.treeName)))
-        self.executeCodeObject = compileScript(self.executeScript, name = "execution: {}".format(repr(self.network.treeName)))
+        if not self.isIncremental:
+            self.executeCodeObject = compileScript(self.executeScript, name = "execution: {}".format(repr(self.network.treeName)))
 
 
     def raiseNotSetupException(self, *args, **kwargs):
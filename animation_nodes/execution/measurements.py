@@ -1,10 +1,16 @@
 import bpy
+import csv
+import sys
+import json
 import textwrap
+import tracemalloc
+from bpy.props import *
 from collections import defaultdict
 from .. utils.timing import prettyTime
 from .. draw_handler import drawHandler
 from .. graphics.text_box import TextBox
 from .. utils.operators import makeOperator
+from .. utils.handlers import eventHandler
 from .. preferences import getExecutionCodeType
 
 class NodeMeasurements:
@@ -30,15 +36,108 @@ class NodeMeasurements:
                        prettyTime(self.totalTime),
                        self.calls))
 
+class NodeMemoryMeasurements:
+    '''
+    Memory usage of a node aggregated over multiple executions.
+    peak:     highest amount of memory that has been allocated while the node was executed
+    retained: memory that is still allocated after the node has been executed
+    output:   size of the data in the linked output sockets
+    '''
+    __slots__ = ("calls", "maxPeak", "totalPeak", "maxRetained", "totalRetained",
+                 "lastOutputSize", "maxOutputSize")
+
+    def __init__(self):
+        self.calls = 0
+        self.maxPeak = 0
+        self.totalPeak = 0
+        self.maxRetained = 0
+        self.totalRetained = 0
+        self.lastOutputSize = 0
+        self.maxOutputSize = 0
+
+    def registerMemory(self, peak, retained, outputs):
+        outputSize = sum(getDataSize(value) for value in outputs)
+        self.calls += 1
+        self.maxPeak = max(self.maxPeak, peak)
+        self.totalPeak += peak
+        self.maxRetained = max(self.maxRetained, retained)
+        self.totalRetained += retained
+        self.lastOutputSize = outputSize
+        self.maxOutputSize = max(self.maxOutputSize, outputSize)
+
+    def toDict(self):
+        return {name : getattr(self, name) for name in self.__slots__}
+
+    def __repr__(self):
+        return textwrap.dedent("""\
+            Peak: {}
+            Retained: {}
+            Output: {}
+            Calls: {:,d}\
+            """.format(prettyBytes(self.maxPeak),
+                       prettyBytes(self.maxRetained),
+                       prettyBytes(self.lastOutputSize),
+                       self.calls))
+
+def getDataSize(value):
+    if hasattr(value, "getMemoryUsage"):
+        return value.getMemoryUsage()
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(getDataSize(element) for element in value)
+    return sys.getsizeof(value)
+
+def prettyBytes(amount):
+    for unit in ("B", "KB", "MB"):
+        if abs(amount) < 1024: return "{:.1f} {}".format(amount, unit)
+        amount /= 1024
+    return "{:.2f} GB".format(amount)
+
 measurementsByNodeIdentifier = defaultdict(NodeMeasurements)
+memoryMeasurementsByNodeIdentifier = defaultdict(NodeMemoryMeasurements)
+
+# [startMemory, peakMemory] of every node that is currently being measured.
+# tracemalloc only knows a single peak, so every node stores the peak that has
+# been reached before a nested node resets it and merges it back afterwards.
+memoryMeasurementStack = []
+
+def beginMemoryMeasurement():
+    current, peak = tracemalloc.get_traced_memory()
+    if len(memoryMeasurementStack) > 0:
+        outer = memoryMeasurementStack[-1]
+        outer[1] = max(outer[1], peak)
+    memoryMeasurementStack.append([current, current])
+    tracemalloc.reset_peak()
+
+def endMemoryMeasurement():
+    '''Has to be called for every begun measurement, also when the node raised an exception.'''
+    current, peak = tracemalloc.get_traced_memory()
+    start, innerPeak = memoryMeasurementStack.pop()
+    peak = max(peak, innerPeak)
+    if len(memoryMeasurementStack) > 0:
+        outer = memoryMeasurementStack[-1]
+        outer[1] = max(outer[1], peak)
+    return peak - start, current - start
 
 @makeOperator("an.reset_measurements", "Reset Measurements", redraw = True)
 def resetMeasurements():
     measurementsByNodeIdentifier.clear()
+    memoryMeasurementsByNodeIdentifier.clear()
+    memoryMeasurementStack.clear()
 
 def getMeasurementsDict():
     return measurementsByNodeIdentifier
 
+def getMemoryMeasurementsDict():
+    return memoryMeasurementsByNodeIdentifier
+
+@eventHandler("ADDON_LOAD_POST")
+def updateMemoryTracing():
+    if getExecutionCodeType() == "MEASURE_MEMORY":
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+    elif tracemalloc.is_tracing():
+        tracemalloc.stop()
+
 def getMinExecutionTimeString(node):
     measure = measurementsByNodeIdentifier[node.identifier]
     if measure.calls > 0:
@@ -50,3 +149,54 @@ def getMeasurementResultString(node):
     result = measurementsByNodeIdentifier[node.identifier]
     if result.calls == 0: return "Not Measured"
     else: return str(result)
+
+def getPeakMemoryUsageString(node):
+    measure = memoryMeasurementsByNodeIdentifier[node.identifier]
+    if measure.calls > 0:
+        return prettyBytes(measure.maxPeak)
+    else:
+        return "Not Measured"
+
+def getMemoryMeasurementResultString(node):
+    result = memoryMeasurementsByNodeIdentifier[node.identifier]
+    if result.calls == 0: return "Not Measured"
+    else: return str(result)
+
+
+class ExportMemoryMeasurements(bpy.types.Operator):
+    bl_idname = "an.export_memory_measurements"
+    bl_label = "Export Memory Measurements"
+    bl_description = "Write the memory measurements of all nodes to a .json or .csv file"
+
+    filepath: StringProperty(subtype = "FILE_PATH")
+
+    def invoke(self, context, event):
+        if self.filepath == "":
+            self.filepath = "memory_measurements.csv"
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        rows = list(iterMemoryMeasurementRows())
+        path = bpy.path.abspath(self.filepath)
+        if path.lower().endswith(".json"):
+            with open(path, "w") as f:
+                json.dump(rows, f, indent = 2)
+        else:
+            with open(path, "w", newline = "") as f:
+                fieldNames = ["tree", "node", "identifier"] + list(NodeMemoryMeasurements.__slots__)
+                writer = csv.DictWriter(f, fieldnames = fieldNames)
+                writer.writeheader()
+                writer.writerows(rows)
+        self.report({"INFO"}, "Exported measurements of {} nodes".format(len(rows)))
+        return {"FINISHED"}
+
+def iterMemoryMeasurementRows():
+    from .. tree_info import getNodeByIdentifier
+    for identifier, measure in memoryMeasurementsByNodeIdentifier.items():
+        if measure.calls == 0: continue
+        try: node = getNodeByIdentifier(identifier)
+        except: continue
+        row = {"tree" : node.id_data.name, "node" : node.name, "identifier" : identifier}
+        row.update(measure.toDict())
+        yield row
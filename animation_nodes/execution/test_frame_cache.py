@@ -0,0 +1,80 @@
+import os
+import bpy
+import shutil
+import tempfile
+from mathutils import Matrix
+from unittest import TestCase
+from . frame_cache import (
+    FrameRecorder, getFramePath, loadFrame, getUnsupportedNodes,
+    recordObjectMatrices, recordObjectMeshes
+)
+
+class TestRoundTrip(TestCase):
+    def setUp(self):
+        mesh = bpy.data.meshes.new("AN Frame Cache Test")
+        mesh.from_pydata([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0), (0, 0, 1)], [], [(0, 1, 2, 3), (0, 1, 4)])
+        self.object = bpy.data.objects.new("AN Frame Cache Test", mesh)
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        mesh = self.object.data
+        bpy.data.objects.remove(self.object)
+        bpy.data.meshes.remove(mesh)
+        shutil.rmtree(self.directory)
+
+    def testBakeAndLoad(self):
+        matrix = Matrix.Translation((1, 2, 3))
+        self.object.matrix_world = matrix
+        vertices = [tuple(vertex.co) for vertex in self.object.data.vertices]
+        polygons = [tuple(polygon.vertices) for polygon in self.object.data.polygons]
+
+        path = self.bake(7)
+
+        self.object.matrix_world = Matrix()
+        self.object.data.clear_geometry()
+
+        self.assertTrue(loadFrame(path))
+        self.assertEqual(self.object.matrix_world, matrix)
+        self.assertEqual([tuple(vertex.co) for vertex in self.object.data.vertices], vertices)
+        self.assertEqual([tuple(polygon.vertices) for polygon in self.object.data.polygons], polygons)
+
+    def testLoadWithSameTopology(self):
+        path = self.bake(1)
+        self.object.data.vertices[4].co = (5, 5, 5)
+        self.assertTrue(loadFrame(path))
+        self.assertEqual(tuple(self.object.data.vertices[4].co), (0, 0, 1))
+
+    def testMissingFrame(self):
+        self.assertFalse(loadFrame(getFramePath(self.directory, 3)))
+
+    def testInvalidFile(self):
+        path = getFramePath(self.directory, 3)
+        with open(path, "wb") as f:
+            f.write(b"not a frame")
+        self.assertFalse(loadFrame(path))
+
+    def bake(self, frame):
+        with FrameRecorder() as recorder:
+            recordObjectMatrices((self.object, ))
+            recordObjectMeshes((self.object, ))
+        path = getFramePath(self.directory, frame)
+        recorder.write(path)
+        self.assertTrue(os.path.isfile(path))
+        return path
+
+class TestUnsupportedNodes(TestCase):
+    def setUp(self):
+        self.tree = bpy.data.node_groups.new("AN Frame Cache Test", "an_AnimationNodeTree")
+
+    def tearDown(self):
+        bpy.data.node_groups.remove(self.tree)
+
+    def testSupportedOutputNodes(self):
+        self.tree.nodes.new("an_ObjectMatrixOutputNode")
+        self.tree.nodes.new("an_MeshObjectOutputNode")
+        self.assertEqual(getUnsupportedNodes(self.tree), [])
+
+    def testUnsupportedOutputNodes(self):
+        self.tree.nodes.new("an_ObjectTransformsOutputNode")
+        node = self.tree.nodes.new("an_ObjectVisibilityOutputNode")
+        self.assertEqual(getUnsupportedNodes(self.tree), [node])
@@ -0,0 +1,33 @@
+import tracemalloc
+from unittest import TestCase
+from . measurements import beginMemoryMeasurement, endMemoryMeasurement, memoryMeasurementStack
+
+class TestMemoryMeasurements(TestCase):
+    def setUp(self):
+        self.wasTracing = tracemalloc.is_tracing()
+        if not self.wasTracing:
+            tracemalloc.start()
+
+    def tearDown(self):
+        memoryMeasurementStack.clear()
+        if not self.wasTracing:
+            tracemalloc.stop()
+
+    def testRaisingNodeIsClosed(self):
+        beginMemoryMeasurement()
+        try:
+            beginMemoryMeasurement()
+            try:
+                data = bytearray(10 ** 6)
+                raise ValueError()
+            finally:
+                endMemoryMeasurement()
+        except ValueError:
+            pass
+        self.assertEqual(len(memoryMeasurementStack), 1)
+
+        del data
+        peak, retained = endMemoryMeasurement()
+        self.assertEqual(len(memoryMeasurementStack), 0)
+        self.assertGreaterEqual(peak, 10 ** 6)
+        self.assertLess(retained, 10 ** 6)
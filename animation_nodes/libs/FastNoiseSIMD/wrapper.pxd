@@ -1,6 +1,6 @@
 from ... math cimport Vector3
 
-cdef extern from "FastNoiseSIMD.h":
+cdef extern from "FastNoiseSIMD.h" nogil:
     cdef cppclass FastNoiseSIMD:
 
         @staticmethod
@@ -88,6 +88,11 @@ cdef class PyNoise:
     cdef FastNoiseSIMD *fn
     cdef Vector3 offset
     cdef float amplitude
+    cdef FastNoiseVectorSet *vectorSets
+    cdef int vectorSetAmount
+
+    cdef FastNoiseVectorSet *getVectorSets(self, int amount)
+    cdef freeVectorSets(self)
 
     cdef calculateList_LowLevel(self, Vector3 *vectors, Py_ssize_t amount, float *target)
     cdef calculateSingle_LowLevel(self, Vector3 *vector)
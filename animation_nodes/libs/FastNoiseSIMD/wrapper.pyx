@@ -1,9 +1,14 @@
 # distutils: language = c++
-# setup: options = c++11
+# setup: options = c++11 openmp
 
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cython.parallel cimport prange, threadid
+from ... utils.parallel cimport getThreadAmount
 from ... math cimport toVector3
 from ... data_structures cimport Vector3DList, FloatList
 
+cdef Py_ssize_t chunkSize = 4096
+
 cdef dict simdLevels = {
     0 : "Fallback",
     1 : "SSE2",
@@ -70,10 +75,36 @@ fractalTypesList = list(sorted(fractalTypes.keys()))
 cdef class PyNoise:
     def __cinit__(self):
         self.fn = FastNoiseSIMD.NewFastNoiseSIMD()
+        self.vectorSets = NULL
+        self.vectorSetAmount = 0
 
     def __dealloc__(self):
+        self.freeVectorSets()
         del self.fn
 
+    cdef FastNoiseVectorSet *getVectorSets(self, int amount):
+        '''The vector sets are reused in every call, one is needed per thread.'''
+        cdef int i
+        if amount > self.vectorSetAmount:
+            self.freeVectorSets()
+            self.vectorSets = <FastNoiseVectorSet*>PyMem_Malloc(amount * sizeof(FastNoiseVectorSet))
+            if self.vectorSets == NULL:
+                raise MemoryError()
+            for i in range(amount):
+                self.vectorSets[i].xSet = NULL
+                self.vectorSets[i].SetSize(chunkSize)
+                self.vectorSets[i].sampleScale = 0
+            self.vectorSetAmount = amount
+        return self.vectorSets
+
+    cdef freeVectorSets(self):
+        cdef int i
+        for i in range(self.vectorSetAmount):
+            self.vectorSets[i].Free()
+        PyMem_Free(self.vectorSets)
+        self.vectorSets = NULL
+        self.vectorSetAmount = 0
+
     def getSIMDLevelName(self):
         cdef int level = self.fn.GetSIMDLevel()
         return simdLevels[level]
@@ -145,22 +176,41 @@ cdef class PyNoise:
         return result
 
 
-cdef void calcNoise(PyNoise noise, float *results, Vector3 *vectors, Py_ssize_t amount):
-    cdef FastNoiseVectorSet vectorSet
-    vectorSet.SetSize(amount)
-    vectorSet.sampleScale = 0
+# The vectors are processed in chunks. Every chunk is copied into a vector set,
+# filled with noise and scaled, while it is still in the cache.
+# Larger inputs are split between multiple threads, every thread uses its own
+# vector set. The noise generator itself is only read while filling a set.
+cdef calcNoise(PyNoise noise, float *results, Vector3 *vectors, Py_ssize_t amount):
+    cdef Py_ssize_t chunkAmount = (amount + chunkSize - 1) // chunkSize
+    cdef int threads = <int>min(getThreadAmount(amount, 20000), chunkAmount)
+    cdef FastNoiseVectorSet *vectorSets = noise.getVectorSets(max(threads, 1))
 
-    cdef Py_ssize_t i
-    for i in range(amount):
-        vectorSet.xSet[i] = vectors[i].x
-        vectorSet.ySet[i] = vectors[i].y
-        vectorSet.zSet[i] = vectors[i].z
+    cdef FastNoiseSIMD *fn = noise.fn
+    cdef Vector3 *offset = &noise.offset
+    cdef float amplitude = noise.amplitude
+    cdef Py_ssize_t chunk
 
-    cdef Vector3 offset = noise.offset
-    noise.fn.FillNoiseSet(results, &vectorSet, offset.x, offset.y, offset.z)
+    if threads <= 1:
+        for chunk in range(chunkAmount):
+            calcNoiseChunk(fn, vectorSets, results, vectors, amount, chunk, offset, amplitude)
+    else:
+        for chunk in prange(chunkAmount, nogil = True, schedule = "static", num_threads = threads):
+            calcNoiseChunk(fn, vectorSets + threadid(), results, vectors, amount, chunk, offset, amplitude)
 
-    vectorSet.Free()
+cdef void calcNoiseChunk(FastNoiseSIMD *fn, FastNoiseVectorSet *vectorSet,
+                         float *results, Vector3 *vectors, Py_ssize_t amount,
+                         Py_ssize_t chunk, Vector3 *offset, float amplitude) nogil:
+    cdef Py_ssize_t start = chunk * chunkSize
+    cdef Py_ssize_t size = min(chunkSize, amount - start)
 
-    cdef float amplitude = noise.amplitude
-    for i in range(amount):
-        results[i] *= amplitude
+    cdef Py_ssize_t i
+    for i in range(size):
+        vectorSet.xSet[i] = vectors[start + i].x
+        vectorSet.ySet[i] = vectors[start + i].y
+        vectorSet.zSet[i] = vectors[start + i].z
+
+    vectorSet.size = <int>size
+    fn.FillNoiseSet(results + start, vectorSet, offset.x, offset.y, offset.z)
+
+    for i in range(size):
+        results[start + i] *= amplitude
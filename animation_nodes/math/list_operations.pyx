@@ -1,3 +1,7 @@
+# setup: options = openmp
+
+from cython.parallel cimport prange
+from .. utils.parallel cimport getThreadAmount
 from . conversion cimport toMatrix4
 from . vector cimport distanceVec3, mixVec3
 from . matrix cimport (transformVec3AsPoint_InPlace, transformVec3AsDirection_InPlace,
@@ -10,11 +14,12 @@ cpdef void transformVector3DList(Vector3DList vectors, matrix, bint ignoreTransl
 
 cdef void transformVector3DListAsPoints(Vector3* vectors, long arrayLength, Matrix4* matrix, bint ignoreTranslation):
     cdef long i
+    cdef int threads = getThreadAmount(arrayLength, 50000)
     if ignoreTranslation:
-        for i in range(arrayLength):
+        for i in prange(arrayLength, nogil = True, schedule = "static", num_threads = threads):
             transformVec3AsDirection_InPlace(vectors + i, matrix)
     else:
-        for i in range(arrayLength):
+        for i in prange(arrayLength, nogil = True, schedule = "static", num_threads = threads):
             transformVec3AsPoint_InPlace(vectors + i, matrix)
 
 
@@ -23,9 +28,10 @@ cpdef Matrix4x4List composeMatrixList(Vector3DList locations, EulerList rotation
         raise ValueError("lists have different lengths")
     cdef:
         Matrix4x4List newList = Matrix4x4List(length = len(locations))
-        Py_ssize_t i
+        Py_ssize_t i, amount = len(locations)
 
-    for i in range(len(locations)):
+    for i in prange(amount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(amount, 20000)):
         setComposedMatrix(newList.data + i, locations.data + i, rotations.data + i, scales.data + i)
     return newList
 
@@ -41,7 +47,8 @@ cpdef double distanceSumOfVector3DList(Vector3DList vectors):
 
 cdef void mixVec3Arrays(Vector3* target, Vector3* a, Vector3* b, long arrayLength, float factor):
     cdef long i
-    for i in range(arrayLength):
+    for i in prange(arrayLength, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(arrayLength, 100000)):
         mixVec3(target + i, a + i, b + i, factor)
 
 def scaleVector3DList(Vector3DList vectors, float factor):
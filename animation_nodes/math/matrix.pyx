@@ -1,36 +1,36 @@
 from libc.math cimport sin, cos, sqrt
 
-cdef void transformVec3AsPoint_InPlace(Vector3* v, Matrix4* m):
+cdef void transformVec3AsPoint_InPlace(Vector3* v, Matrix4* m) nogil:
     cdef float newX, newY, newZ
     newX = v.x * m.a11 + v.y * m.a12 + v.z * m.a13 + m.a14
     newY = v.x * m.a21 + v.y * m.a22 + v.z * m.a23 + m.a24
     newZ = v.x * m.a31 + v.y * m.a32 + v.z * m.a33 + m.a34
     v.x, v.y, v.z = newX, newY, newZ
 
-cdef void transformVec3AsPoint(Vector3* target, Vector3* v, Matrix4* m):
+cdef void transformVec3AsPoint(Vector3* target, Vector3* v, Matrix4* m) nogil:
     target.x = v.x * m.a11 + v.y * m.a12 + v.z * m.a13 + m.a14
     target.y = v.x * m.a21 + v.y * m.a22 + v.z * m.a23 + m.a24
     target.z = v.x * m.a31 + v.y * m.a32 + v.z * m.a33 + m.a34
 
-cdef void transformVec3AsDirection_InPlace(Vector3* v, Matrix3_or_Matrix4* m):
+cdef void transformVec3AsDirection_InPlace(Vector3* v, Matrix3_or_Matrix4* m) nogil:
     cdef float newX, newY, newZ
     newX = v.x * m.a11 + v.y * m.a12 + v.z * m.a13
     newY = v.x * m.a21 + v.y * m.a22 + v.z * m.a23
     newZ = v.x * m.a31 + v.y * m.a32 + v.z * m.a33
     v.x, v.y, v.z = newX, newY, newZ
 
-cdef void transformVec3AsDirection(Vector3* target, Vector3* v, Matrix3_or_Matrix4* m):
+cdef void transformVec3AsDirection(Vector3* target, Vector3* v, Matrix3_or_Matrix4* m) nogil:
     target.x = v.x * m.a11 + v.y * m.a12 + v.z * m.a13
     target.y = v.x * m.a21 + v.y * m.a22 + v.z * m.a23
     target.z = v.x * m.a31 + v.y * m.a32 + v.z * m.a33
 
-cdef void multMatrix4AndVec4(Vector4* target, Matrix4* m, Vector4* v):
+cdef void multMatrix4AndVec4(Vector4* target, Matrix4* m, Vector4* v) nogil:
     target.x = v.x * m.a11 + v.y * m.a12 + v.z * m.a13 + v.w * m.a14
     target.y = v.x * m.a21 + v.y * m.a22 + v.z * m.a23 + v.w * m.a24
     target.z = v.x * m.a31 + v.y * m.a32 + v.z * m.a33 + v.w * m.a34
     target.w = v.x * m.a41 + v.y * m.a42 + v.z * m.a43 + v.w * m.a44
 
-cdef void setIdentityMatrix(Matrix3_or_Matrix4* m):
+cdef void setIdentityMatrix(Matrix3_or_Matrix4* m) nogil:
     m.a12 = m.a13 = 0
     m.a21 = m.a23 = 0
     m.a31 = m.a32 = 0
@@ -40,7 +40,7 @@ cdef void setIdentityMatrix(Matrix3_or_Matrix4* m):
         m.a41 = m.a42 = m.a43 = 0
         m.a44 = 1
 
-cdef void setTranslationMatrix(Matrix4* m, Vector3* v):
+cdef void setTranslationMatrix(Matrix4* m, Vector3* v) nogil:
     m.a14, m.a24, m.a34 = v.x, v.y, v.z
     m.a11 = m.a22 = m.a33 = m.a44 = 1
     m.a12 = m.a13 = 0
@@ -48,10 +48,10 @@ cdef void setTranslationMatrix(Matrix4* m, Vector3* v):
     m.a31 = m.a32 = 0
     m.a41 = m.a42 = m.a43 = 0
 
-cdef void setMatrixTranslation(Matrix4* m, Vector3* v):
+cdef void setMatrixTranslation(Matrix4* m, Vector3* v) nogil:
     m.a14, m.a24, m.a34 = v.x, v.y, v.z
 
-cdef void setTranslationScaleMatrix(Matrix4* m, Vector3* t, Vector3* s):
+cdef void setTranslationScaleMatrix(Matrix4* m, Vector3* t, Vector3* s) nogil:
     m.a11, m.a22, m.a33 = s.x, s.y, s.z
     m.a14, m.a24, m.a34 = t.x, t.y, t.z
     m.a44 = 1
@@ -60,7 +60,7 @@ cdef void setTranslationScaleMatrix(Matrix4* m, Vector3* t, Vector3* s):
     m.a31 = m.a32 = 0
     m.a41 = m.a42 = m.a43 = 0
 
-cdef void setRotationMatrix(Matrix3_or_Matrix4* m, Euler3* e):
+cdef void setRotationMatrix(Matrix3_or_Matrix4* m, Euler3* e) nogil:
     if e.order == 0:
         setRotationXYZMatrix(m, e)
         return
@@ -76,7 +76,7 @@ cdef void setRotationMatrix(Matrix3_or_Matrix4* m, Euler3* e):
         joinRotationMatricesInOrder(e.order, &xMat, &yMat, &zMat, &rotation)
         convertMatrix3ToMatrix4(m, &rotation)
 
-cdef void setRotationScaleMatrix(Matrix3_or_Matrix4* m, Euler3* e, Vector3* s):
+cdef void setRotationScaleMatrix(Matrix3_or_Matrix4* m, Euler3* e, Vector3* s) nogil:
     cdef Matrix3 rotation, scale, rotationScale
     setScaleMatrix(&scale, s)
     setRotationMatrix(&rotation, e)
@@ -87,11 +87,11 @@ cdef void setRotationScaleMatrix(Matrix3_or_Matrix4* m, Euler3* e, Vector3* s):
         multMatrix3(&rotationScale, &rotation, &scale)
         convertMatrix3ToMatrix4(m, &rotationScale)
 
-cdef void setTranslationRotationScaleMatrix(Matrix4* m, Vector3* t, Euler3* e, Vector3* s):
+cdef void setTranslationRotationScaleMatrix(Matrix4* m, Vector3* t, Euler3* e, Vector3* s) nogil:
     setRotationScaleMatrix(m, e, s)
     m.a14, m.a24, m.a34 = t.x, t.y, t.z
 
-cdef void setScaleMatrix(Matrix3_or_Matrix4* m, Vector3* s):
+cdef void setScaleMatrix(Matrix3_or_Matrix4* m, Vector3* s) nogil:
     m.a11, m.a22, m.a33 = s.x, s.y, s.z
     m.a12 = m.a13 = 0
     m.a21 = m.a23 = 0
@@ -101,18 +101,18 @@ cdef void setScaleMatrix(Matrix3_or_Matrix4* m, Vector3* s):
         m.a41 = m.a42 = m.a43 = 0
         m.a44 = 1
 
-cdef void convertMatrix3ToMatrix4(Matrix4* t, Matrix3* s):
+cdef void convertMatrix3ToMatrix4(Matrix4* t, Matrix3* s) nogil:
     t.a11, t.a12, t.a13, t.a14 = s.a11, s.a12, s.a13, 0
     t.a21, t.a22, t.a23, t.a24 = s.a21, s.a22, s.a23, 0
     t.a31, t.a32, t.a33, t.a34 = s.a31, s.a32, s.a33, 0
     t.a41, t.a42, t.a43, t.a44 = 0, 0, 0, 1
 
-cdef void convertMatrix4ToMatrix3(Matrix3* t, Matrix4* s):
+cdef void convertMatrix4ToMatrix3(Matrix3* t, Matrix4* s) nogil:
     t.a11, t.a12, t.a13 = s.a11, s.a12, s.a13
     t.a21, t.a22, t.a23 = s.a21, s.a22, s.a23
     t.a31, t.a32, t.a33 = s.a31, s.a32, s.a33
 
-cdef void joinRotationMatricesInOrder(char order, Matrix3* x, Matrix3* y, Matrix3* z, Matrix3* target):
+cdef void joinRotationMatricesInOrder(char order, Matrix3* x, Matrix3* y, Matrix3* z, Matrix3* target) nogil:
     if order == 0:   mult3xMatrix_Reversed(target, x, y, z)
     elif order == 1: mult3xMatrix_Reversed(target, x, z, y)
     elif order == 2: mult3xMatrix_Reversed(target, y, x, z)
@@ -120,7 +120,7 @@ cdef void joinRotationMatricesInOrder(char order, Matrix3* x, Matrix3* y, Matrix
     elif order == 4: mult3xMatrix_Reversed(target, z, x, y)
     elif order == 5: mult3xMatrix_Reversed(target, z, y, x)
 
-cdef void setRotationXMatrix(Matrix3_or_Matrix4* m, float angle):
+cdef void setRotationXMatrix(Matrix3_or_Matrix4* m, float angle) nogil:
     cdef float sinValue = sin(angle)
     cdef float cosValue = cos(angle)
     m.a11 = 1
@@ -133,7 +133,7 @@ cdef void setRotationXMatrix(Matrix3_or_Matrix4* m, float angle):
         m.a41 = m.a42 = m.a43 = 0
         m.a44 = 1
 
-cdef void setRotationYMatrix(Matrix3_or_Matrix4* m, float angle):
+cdef void setRotationYMatrix(Matrix3_or_Matrix4* m, float angle) nogil:
     cdef float sinValue = sin(angle)
     cdef float cosValue = cos(angle)
     m.a22 = 1
@@ -146,7 +146,7 @@ cdef void setRotationYMatrix(Matrix3_or_Matrix4* m, float angle):
         m.a41 = m.a42 = m.a43 = 0
         m.a44 = 1
 
-cdef void setRotationZMatrix(Matrix3_or_Matrix4* m, float angle):
+cdef void setRotationZMatrix(Matrix3_or_Matrix4* m, float angle) nogil:
     cdef float sinValue = sin(angle)
     cdef float cosValue = cos(angle)
     m.a33 = 1
@@ -159,7 +159,7 @@ cdef void setRotationZMatrix(Matrix3_or_Matrix4* m, float angle):
         m.a41 = m.a42 = m.a43 = 0
         m.a44 = 1
 
-cdef void setRotationXYZMatrix(Matrix3_or_Matrix4 *m, Euler3 *rotation):
+cdef void setRotationXYZMatrix(Matrix3_or_Matrix4 *m, Euler3 *rotation) nogil:
     cdef float sx, sy, sz
     cdef float cx, cy, cz
     cdef float cc, cs, sc, ss
@@ -187,12 +187,12 @@ cdef void setRotationXYZMatrix(Matrix3_or_Matrix4 *m, Euler3 *rotation):
         m.a41 = m.a42 = m.a43 = 0
         m.a44 = 1
 
-cdef void setComposedMatrix(Matrix4* m, Vector3* t, Euler3* e, Vector3* s):
+cdef void setComposedMatrix(Matrix4* m, Vector3* t, Euler3* e, Vector3* s) nogil:
     setRotationScaleMatrix(m, e, s)
     m.a14, m.a24, m.a34 = t.x, t.y, t.z
 
 
-cdef void multMatrix4(Matrix4* target, Matrix4* x, Matrix4* y):
+cdef void multMatrix4(Matrix4* target, Matrix4* x, Matrix4* y) nogil:
     target.a11 = x.a11 * y.a11  +  x.a12 * y.a21  +  x.a13 * y.a31  +  x.a14 * y.a41
     target.a12 = x.a11 * y.a12  +  x.a12 * y.a22  +  x.a13 * y.a32  +  x.a14 * y.a42
     target.a13 = x.a11 * y.a13  +  x.a12 * y.a23  +  x.a13 * y.a33  +  x.a14 * y.a43
@@ -213,7 +213,7 @@ cdef void multMatrix4(Matrix4* target, Matrix4* x, Matrix4* y):
     target.a43 = x.a41 * y.a13  +  x.a42 * y.a23  +  x.a43 * y.a33  +  x.a44 * y.a43
     target.a44 = x.a41 * y.a14  +  x.a42 * y.a24  +  x.a43 * y.a34  +  x.a44 * y.a44
 
-cdef void multMatrix3(Matrix3_or_Matrix4* target, Matrix3_or_Matrix4* x, Matrix3_or_Matrix4* y):
+cdef void multMatrix3(Matrix3_or_Matrix4* target, Matrix3_or_Matrix4* x, Matrix3_or_Matrix4* y) nogil:
     target.a11 = x.a11 * y.a11  +  x.a12 * y.a21  +  x.a13 * y.a31
     target.a12 = x.a11 * y.a12  +  x.a12 * y.a22  +  x.a13 * y.a32
     target.a13 = x.a11 * y.a13  +  x.a12 * y.a23  +  x.a13 * y.a33
@@ -226,7 +226,7 @@ cdef void multMatrix3(Matrix3_or_Matrix4* target, Matrix3_or_Matrix4* x, Matrix3
     target.a32 = x.a31 * y.a12  +  x.a32 * y.a22  +  x.a33 * y.a32
     target.a33 = x.a31 * y.a13  +  x.a32 * y.a23  +  x.a33 * y.a33
 
-cdef void multMatrix3Parts(Matrix4* target, Matrix4* x, Matrix4* y, bint keepFirst = True):
+cdef void multMatrix3Parts(Matrix4* target, Matrix4* x, Matrix4* y, bint keepFirst = True) nogil:
     multMatrix3(target, x, y)
     cdef Matrix4* k = x if keepFirst else y
     target.a14, target.a24, target.a34 = k.a14, k.a24, k.a34
@@ -236,7 +236,7 @@ cdef void multMatrix3Parts(Matrix4* target, Matrix4* x, Matrix4* y, bint keepFir
 cdef void mult3xMatrix_Reversed(Matrix3_or_Matrix4* target,
             Matrix3_or_Matrix4* m1,
             Matrix3_or_Matrix4* m2,
-            Matrix3_or_Matrix4* m3):
+            Matrix3_or_Matrix4* m3) nogil:
     cdef Matrix3_or_Matrix4 tmp
     if Matrix3_or_Matrix4 is Matrix3:
         multMatrix3(&tmp, m3, m2)
@@ -245,7 +245,7 @@ cdef void mult3xMatrix_Reversed(Matrix3_or_Matrix4* target,
         multMatrix4(&tmp, m3, m2)
         multMatrix4(target, &tmp, m1)
 
-cdef void normalizeMatrix_3x3_Part(Matrix3_or_Matrix4* t, Matrix3_or_Matrix4* m):
+cdef void normalizeMatrix_3x3_Part(Matrix3_or_Matrix4* t, Matrix3_or_Matrix4* m) nogil:
     cdef float len1, len2, len3
     len1 = sqrt(m.a11 * m.a11 + m.a21 * m.a21 + m.a31 * m.a31)
     len2 = sqrt(m.a12 * m.a12 + m.a22 * m.a22 + m.a32 * m.a32)
@@ -264,7 +264,7 @@ cdef void normalizeMatrix_3x3_Part(Matrix3_or_Matrix4* t, Matrix3_or_Matrix4* m)
         t.a14, t.a24, t.a34 = m.a14, m.a24, m.a34
         t.a41, t.a42, t.a43, t.a44 = m.a41, m.a42, m.a43, m.a44
 
-cdef void transposeMatrix_Inplace(Matrix3_or_Matrix4 *m):
+cdef void transposeMatrix_Inplace(Matrix3_or_Matrix4 *m) nogil:
     m.a12, m.a21 = m.a21, m.a12
     m.a13, m.a31 = m.a31, m.a13
     m.a23, m.a32 = m.a32, m.a23
@@ -274,7 +274,7 @@ cdef void transposeMatrix_Inplace(Matrix3_or_Matrix4 *m):
         m.a24, m.a42 = m.a42, m.a24
         m.a34, m.a43 = m.a43, m.a34
 
-cdef void transposeMatrix(Matrix3_or_Matrix4 *t, Matrix3_or_Matrix4 *m):
+cdef void transposeMatrix(Matrix3_or_Matrix4 *t, Matrix3_or_Matrix4 *m) nogil:
     transpose3x3Part(t, m)
 
     if Matrix3_or_Matrix4 is Matrix4:
@@ -282,19 +282,19 @@ cdef void transposeMatrix(Matrix3_or_Matrix4 *t, Matrix3_or_Matrix4 *m):
         t.a41, t.a42, t.a43 = m.a14, m.a24, m.a34
         t.a44 = m.a44
 
-cdef void invertOrthogonalTransformation(Matrix4* t, Matrix4* m):
+cdef void invertOrthogonalTransformation(Matrix4* t, Matrix4* m) nogil:
     transpose3x3Part(t, m)
     t.a14 = -(m.a11 * m.a14 + m.a21 * m.a24 + m.a31 * m.a34)
     t.a24 = -(m.a12 * m.a14 + m.a22 * m.a24 + m.a32 * m.a34)
     t.a34 = -(m.a13 * m.a14 + m.a23 * m.a24 + m.a33 * m.a34)
     t.a41, t.a42, t.a43, t.a44 = 0, 0, 0, 1
 
-cdef inline void transpose3x3Part(Matrix3_or_Matrix4 *t, Matrix3_or_Matrix4 *m):
+cdef inline void transpose3x3Part(Matrix3_or_Matrix4 *t, Matrix3_or_Matrix4 *m) nogil:
     t.a11, t.a21, t.a31 = m.a11, m.a12, m.a13
     t.a12, t.a22, t.a32 = m.a21, m.a22, m.a23
     t.a13, t.a23, t.a33 = m.a31, m.a32, m.a33
 
-cdef void scaleMatrix3x3Part(Matrix3_or_Matrix4 *m, float s):
+cdef void scaleMatrix3x3Part(Matrix3_or_Matrix4 *m, float s) nogil:
     m.a11 *= s
     m.a21 *= s
     m.a31 *= s
@@ -307,7 +307,7 @@ cdef void scaleMatrix3x3Part(Matrix3_or_Matrix4 *m, float s):
     m.a23 *= s
     m.a33 *= s
 
-cdef float getMatrix3x3PartDeterminant(Matrix3_or_Matrix4 *m):
+cdef float getMatrix3x3PartDeterminant(Matrix3_or_Matrix4 *m) nogil:
     return (
         m.a11 * m.a22 * m.a33 +
         m.a12 * m.a23 * m.a31 +
@@ -318,7 +318,7 @@ cdef float getMatrix3x3PartDeterminant(Matrix3_or_Matrix4 *m):
     )
 
 cdef void matrixFromNormalizedAxisData(Matrix4 *m, Vector3 *center, Vector3 *tangent,
-                                       Vector3 *bitangent, Vector3 *normal):
+                                       Vector3 *bitangent, Vector3 *normal) nogil:
     m.a11, m.a12, m.a13, m.a14 = tangent.x, bitangent.x, normal.x, center.x
     m.a21, m.a22, m.a23, m.a24 = tangent.y, bitangent.y, normal.y, center.y
     m.a31, m.a32, m.a33, m.a34 = tangent.z, bitangent.z, normal.z, center.z
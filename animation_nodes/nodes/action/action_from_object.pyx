@@ -1,9 +1,14 @@
 import bpy
+import numpy
+from libc.math cimport floor, ceil
 from ... base_types import AnimationNode
+from ... utils.handlers import eventHandler
+from cpython cimport PyMem_Malloc, PyMem_Free
 from ... utils.attributes import pathBelongsToArray
 from ... data_structures cimport (
     BoundedAction, BoundedActionEvaluator,
-    PathActionChannel, PathIndexActionChannel
+    PathActionChannel, PathIndexActionChannel,
+    FloatList
 )
 
 class ActionFromObjectNode(AnimationNode, bpy.types.Node):
@@ -54,8 +59,17 @@ cdef class FCurveAction(BoundedAction):
         fCurves = [self.fCurveByChannel[c] for c in channels]
         return FCurveActionEvaluator(fCurves)
 
+ctypedef struct FCurveSamples:
+    float *data
+    Py_ssize_t amount
+    float start
+    float samplesPerFrame
+    bint isConstantOutside
+
 cdef class FCurveActionEvaluator(BoundedActionEvaluator):
     cdef list fCurves
+    cdef list sampledFCurves
+    cdef FCurveSamples *samples
     cdef float start, end, length
 
     def __cinit__(self, list fCurves):
@@ -63,6 +77,24 @@ cdef class FCurveActionEvaluator(BoundedActionEvaluator):
         self.channelAmount = len(fCurves)
         self.start, self.end = self.calculateRange(fCurves)
         self.length = self.end - self.start
+        self.prepareSamples(fCurves)
+
+    def __dealloc__(self):
+        PyMem_Free(self.samples)
+
+    cdef prepareSamples(self, list fCurves):
+        cdef Py_ssize_t i
+        cdef SampledFCurve sampled
+        self.sampledFCurves = [getSampledFCurve(fCurve) for fCurve in fCurves]
+        self.samples = <FCurveSamples*>PyMem_Malloc(max(1, len(fCurves)) * sizeof(FCurveSamples))
+        if self.samples == NULL:
+            raise MemoryError()
+        for i, sampled in enumerate(self.sampledFCurves):
+            self.samples[i].data = sampled.values.data
+            self.samples[i].amount = sampled.values.length
+            self.samples[i].start = sampled.start
+            self.samples[i].samplesPerFrame = sampled.samplesPerFrame
+            self.samples[i].isConstantOutside = sampled.isConstantOutside
 
     cdef calculateRange(self, list fCurves):
         if len(fCurves) == 0:
@@ -87,7 +119,8 @@ cdef class FCurveActionEvaluator(BoundedActionEvaluator):
     cdef void evaluate(self, float frame, Py_ssize_t index, float *target):
         cdef Py_ssize_t i
         for i in range(self.channelAmount):
-            target[i] = self.fCurves[i].evaluate(frame)
+            if not evaluateSamples(self.samples + i, frame, target + i):
+                target[i] = self.fCurves[i].evaluate(frame)
 
     cpdef float getStart(self, Py_ssize_t index):
         return self.start
@@ -97,3 +130,114 @@ cdef class FCurveActionEvaluator(BoundedActionEvaluator):
 
     cpdef float getLength(self, Py_ssize_t index):
         return self.length
+
+
+# FCurve Sampling
+###########################################
+
+# Calling fCurve.evaluate() for every channel, instance and frame is slow.
+# Therefore the FCurves are sampled once and evaluated by interpolating
+# between the samples. There is always an integer amount of samples per frame,
+# so integer frames are evaluated exactly. FCurves with modifiers or with
+# interpolation types whose curves can't be approximated well by linear
+# interpolation between samples (e.g. CONSTANT, BOUNCE, ELASTIC) are always
+# evaluated by Blender. The samples are cached until the FCurve changes.
+
+cdef int defaultSamplesPerFrame = 8
+cdef Py_ssize_t maxSampleAmount = 200000
+sampledInterpolationTypes = {"BEZIER", "LINEAR"}
+
+cdef class SampledFCurve:
+    cdef FloatList values
+    cdef float start, samplesPerFrame
+    cdef bint isConstantOutside
+    cdef bytes fingerprint
+
+    def __cinit__(self, fCurve, bytes fingerprint):
+        self.fingerprint = fingerprint
+        self.values = FloatList()
+        self.start = 0
+        self.samplesPerFrame = 1
+        self.isConstantOutside = False
+
+        # modifiers can change the FCurve in ways that are not part of the fingerprint
+        if len(fCurve.modifiers) > 0 or len(fCurve.keyframe_points) == 0:
+            return
+        if any(keyframe.interpolation not in sampledInterpolationTypes
+               for keyframe in fCurve.keyframe_points):
+            return
+
+        cdef float start, end
+        start, end = fCurve.range()
+        if end < start:
+            start, end = end, start
+        start, end = floor(start), ceil(end)
+
+        cdef Py_ssize_t frameAmount = <Py_ssize_t>(end - start)
+        cdef Py_ssize_t samplesPerFrame = defaultSamplesPerFrame
+        if frameAmount * samplesPerFrame + 1 > maxSampleAmount:
+            samplesPerFrame = (maxSampleAmount - 1) // max(frameAmount, 1)
+            if samplesPerFrame == 0:
+                return
+
+        cdef Py_ssize_t amount = frameAmount * samplesPerFrame + 1
+        self.values = FloatList(length = amount)
+        cdef Py_ssize_t i
+        for i in range(amount):
+            self.values.data[i] = fCurve.evaluate(start + i / <double>samplesPerFrame)
+
+        self.start = start
+        self.samplesPerFrame = samplesPerFrame
+        self.isConstantOutside = fCurve.extrapolation == "CONSTANT"
+
+cdef bint evaluateSamples(FCurveSamples *samples, float frame, float *target):
+    '''Returns False when the FCurve has to be evaluated by Blender.'''
+    if samples.amount == 0:
+        return False
+
+    cdef float position = (frame - samples.start) * samples.samplesPerFrame
+    cdef Py_ssize_t lastIndex = samples.amount - 1
+    if position <= 0 or position >= lastIndex:
+        if not samples.isConstantOutside and (position < 0 or position > lastIndex):
+            return False
+        target[0] = samples.data[0] if position <= 0 else samples.data[lastIndex]
+        return True
+
+    cdef Py_ssize_t index = <Py_ssize_t>position
+    cdef float t = position - index
+    target[0] = samples.data[index] * (1 - t) + samples.data[index + 1] * t
+    return True
+
+cdef dict sampledFCurveByPointer = {}
+
+cdef SampledFCurve getSampledFCurve(fCurve):
+    cdef bytes fingerprint = getFCurveFingerprint(fCurve)
+    cdef SampledFCurve sampled = sampledFCurveByPointer.get(fCurve.as_pointer())
+    if sampled is None or sampled.fingerprint != fingerprint:
+        sampled = SampledFCurve(fCurve, fingerprint)
+        sampledFCurveByPointer[fCurve.as_pointer()] = sampled
+    return sampled
+
+cdef bytes getFCurveFingerprint(fCurve):
+    keyframes = fCurve.keyframe_points
+    data = numpy.zeros(len(keyframes) * 6 + 1, dtype = numpy.float32)
+    keyframes.foreach_get("co", data[0:len(keyframes) * 2])
+    keyframes.foreach_get("handle_left", data[len(keyframes) * 2:len(keyframes) * 4])
+    keyframes.foreach_get("handle_right", data[len(keyframes) * 4:len(keyframes) * 6])
+    data[-1] = len(fCurve.modifiers)
+    interpolations = numpy.zeros(len(keyframes), dtype = numpy.int32)
+    keyframes.foreach_get("interpolation", interpolations)
+    return data.tobytes() + interpolations.tobytes() + fCurve.extrapolation.encode()
+
+@eventHandler("DEPSGRAPH_UPDATE_POST")
+def clearSamplesOfChangedActions(scene, depsgraph):
+    # e.g. a modifier changed, which is not part of the fingerprint
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Action):
+            sampledFCurveByPointer.clear()
+            return
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_REDO_POST")
+def clearSampledFCurves():
+    sampledFCurveByPointer.clear()
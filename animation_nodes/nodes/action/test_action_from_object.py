@@ -0,0 +1,78 @@
+import math
+import numpy
+from unittest import TestCase
+from . action_from_object import FCurveActionEvaluator
+
+interpolationTypes = ["CONSTANT", "LINEAR", "BEZIER", "BACK", "BOUNCE", "ELASTIC"]
+
+class FakeKeyframes:
+    def __init__(self, frames, interpolation):
+        self.frames = frames
+        self.interpolation = interpolation
+
+    def __len__(self):
+        return len(self.frames)
+
+    def __iter__(self):
+        return iter(FakeKeyframe(self.interpolation) for _ in self.frames)
+
+    def foreach_get(self, attribute, target):
+        if attribute == "interpolation":
+            target[:] = interpolationTypes.index(self.interpolation)
+        else:
+            target[:] = numpy.repeat(self.frames, 2)
+
+class FakeKeyframe:
+    def __init__(self, interpolation):
+        self.interpolation = interpolation
+
+class FakeFCurve:
+    '''Smooth FCurve between the first and last frame.'''
+    def __init__(self, start, end, interpolation = "BEZIER", extrapolation = "CONSTANT"):
+        self.start = start
+        self.end = end
+        self.keyframe_points = FakeKeyframes([start, end], interpolation)
+        self.extrapolation = extrapolation
+        self.modifiers = []
+
+    def range(self):
+        return self.start, self.end
+
+    def evaluate(self, frame):
+        frame = min(max(frame, self.start), self.end)
+        return math.sin(frame * 0.3) * 5 + frame * 0.1
+
+    def as_pointer(self):
+        return id(self)
+
+class TestSampledEvaluation(TestCase):
+    def testIntegerFramesAreExact(self):
+        self.assertEvaluatesExactly(FakeFCurve(0, 100), range(-5, 106))
+
+    def testFractionalFramesAreAccurate(self):
+        fCurve = FakeFCurve(0, 100)
+        evaluator = FCurveActionEvaluator([fCurve])
+        for frame in numpy.linspace(0, 100, 777):
+            self.assertAlmostEqual(evaluator.pyEvaluate(frame)[0], fCurve.evaluate(frame), places = 2)
+
+    def testIntegerFramesOfLongCurvesAreExact(self):
+        # there are fewer samples per frame, but still an integer amount
+        self.assertEvaluatesExactly(FakeFCurve(0, 40000), range(0, 40000, 97))
+
+    def testVeryLongCurvesAreNotSampled(self):
+        self.assertEvaluatesExactly(FakeFCurve(0, 500000), numpy.linspace(0, 500000, 101) + 0.37)
+
+    def testUnsupportedInterpolationIsNotSampled(self):
+        for interpolation in ("CONSTANT", "BOUNCE", "ELASTIC", "BACK"):
+            self.assertEvaluatesExactly(FakeFCurve(0, 20, interpolation), numpy.linspace(-2, 22, 97))
+
+    def testLinearExtrapolation(self):
+        fCurve = FakeFCurve(0, 20, extrapolation = "LINEAR")
+        fCurve.evaluate = lambda frame: frame * 2.5
+        self.assertEvaluatesExactly(fCurve, [-10.3, -1, 0, 20, 21, 33.7])
+
+    def assertEvaluatesExactly(self, fCurve, frames):
+        evaluator = FCurveActionEvaluator([fCurve])
+        for frame in frames:
+            expected = float(numpy.float32(fCurve.evaluate(float(numpy.float32(frame)))))
+            self.assertEqual(evaluator.pyEvaluate(frame)[0], expected)
@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import *
-from mathutils.bvhtree import BVHTree
 from ... base_types import AnimationNode
+from ... data_structures import TriangleBVH
 from ... utils.depsgraph import getEvaluatedID
 
 sourceTypeItems = [
@@ -43,10 +43,10 @@ class ConstructBVHTreeNode(AnimationNode, bpy.types.Node):
         if len(mesh.polygons) == 0:
             return self.getFallbackBVHTree()
 
-        return BVHTree.FromPolygons(mesh.vertices, mesh.polygons, epsilon = max(epsilon, 0))
+        return TriangleBVH(mesh.vertices, mesh.polygons, epsilon = max(epsilon, 0))
 
     def execute_BMesh(self, bm, epsilon):
-        return BVHTree.FromBMesh(bm, epsilon = max(epsilon, 0))
+        return TriangleBVH.fromBMesh(bm, epsilon = max(epsilon, 0))
 
     def execute_Object(self, object, epsilon):
         if object is None:
@@ -62,7 +62,7 @@ class ConstructBVHTreeNode(AnimationNode, bpy.types.Node):
         vertices = mesh.an.getVertices()
         vertices.transform(evaluatedObject.matrix_world)
 
-        return BVHTree.FromPolygons(vertices, polygons, epsilon = max(epsilon, 0))
+        return TriangleBVH(vertices, polygons, epsilon = max(epsilon, 0))
 
     def getFallbackBVHTree(self):
         return self.outputs[0].getDefaultValue()
@@ -5,7 +5,6 @@ class FindNearestSurfacePointNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_FindNearestSurfacePointNode"
     bl_label = "Find Nearest Surface Point"
     bl_width_default = 160
-    codeEffects = [VectorizedSocket.CodeEffect]
 
     useVectorList: VectorizedSocket.newProperty()
 
@@ -35,11 +34,15 @@ class FindNearestSurfacePointNode(AnimationNode, bpy.types.Node):
             ("Hit", "hit"), ("Hits", "hits")))
 
     def getExecutionCode(self, required):
-        yield "location, normal, polygonIndex, distance = bvhTree.find_nearest(vector, maxDistance)"
-        yield "if location is None:"
-        yield "    location = Vector((0, 0, 0))"
-        yield "    normal = Vector((0, 0, 0))"
-        yield "    polygonIndex = -1"
-        yield "    distance = 0"
-        yield "    hit = False"
-        yield "else: hit = True"
+        if self.useVectorList:
+            yield ("locations, normals, distances, polygonIndices, hits = "
+                   "AN.utils.bvh.findNearestList(bvhTree, vectors, maxDistance)")
+        else:
+            yield "location, normal, polygonIndex, distance = bvhTree.find_nearest(vector, maxDistance)"
+            yield "if location is None:"
+            yield "    location = Vector((0, 0, 0))"
+            yield "    normal = Vector((0, 0, 0))"
+            yield "    polygonIndex = -1"
+            yield "    distance = 0"
+            yield "    hit = False"
+            yield "else: hit = True"
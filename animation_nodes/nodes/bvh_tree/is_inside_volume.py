@@ -4,7 +4,6 @@ from ... base_types import AnimationNode, VectorizedSocket
 class IsInsideVolumeBVHTreeNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_IsInsideVolumeBVHTreeNode"
     bl_label = "Is Inside Volume"
-    codeEffects = [VectorizedSocket.CodeEffect]
 
     useVectorList: VectorizedSocket.newProperty()
 
@@ -19,4 +18,7 @@ class IsInsideVolumeBVHTreeNode(AnimationNode, bpy.types.Node):
             ("Is Inside", "isInside"), ("Are Inside", "areInside")))
 
     def getExecutionCode(self, required):
-        return "isInside = AN.utils.bvh.isInsideVolume(bvhTree, vector)"
+        if self.useVectorList:
+            return "areInside = AN.utils.bvh.isInsideVolumeList(bvhTree, vectors)"
+        else:
+            return "isInside = AN.utils.bvh.isInsideVolume(bvhTree, vector)"
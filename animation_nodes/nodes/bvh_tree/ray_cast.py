@@ -2,12 +2,13 @@ import bpy
 from bpy.props import *
 from ... events import executionCodeChanged
 from ... base_types import AnimationNode, VectorizedSocket
+from ... utils.bvh import rayCastList
+from ... data_structures import VirtualVector3DList
 
 class RayCastBVHTreeNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_RayCastBVHTreeNode"
     bl_label = "Ray Cast BVHTree"
     bl_width_default = 160
-    codeEffects = [VectorizedSocket.CodeEffect]
 
     useStartList: VectorizedSocket.newProperty()
     useDirectionList: VectorizedSocket.newProperty()
@@ -48,11 +49,17 @@ class RayCastBVHTreeNode(AnimationNode, bpy.types.Node):
         layout.prop(self, "startInInfinity")
 
     def getExecutionCode(self, required):
-        yield "_direction = direction.normalized()"
-        if self.startInInfinity:
-            yield from self.iterStartInInfinityCode()
+        if self.useStartList or self.useDirectionList:
+            startName = "starts" if self.useStartList else "start"
+            directionName = "directions" if self.useDirectionList else "direction"
+            yield ("locations, normals, distances, polygonIndices, hits = self.rayCastList("
+                   "bvhTree, {}, {}, minDistance, maxDistance)".format(startName, directionName))
         else:
-            yield from self.iterStartAtLocationCode()
+            yield "_direction = direction.normalized()"
+            if self.startInInfinity:
+                yield from self.iterStartInInfinityCode()
+            else:
+                yield from self.iterStartAtLocationCode()
 
     def iterStartAtLocationCode(self):
         yield "location, normal, polygonIndex, distance = bvhTree.ray_cast(start + _direction * minDistance, _direction, maxDistance - minDistance)"
@@ -77,3 +84,17 @@ class RayCastBVHTreeNode(AnimationNode, bpy.types.Node):
         yield "    hit = False"
         yield "else:"
         yield "    hit = True"
+
+    def rayCastList(self, bvhTree, starts, directions, minDistance, maxDistance):
+        _starts, _directions = VirtualVector3DList.createMultiple(
+            (starts, (0, 0, 0)), (directions, (0, 0, -1)))
+        amount = VirtualVector3DList.getMaxRealLength(_starts, _directions)
+        starts = _starts.materialize(amount)
+        directions = _directions.materialize(amount)
+
+        if self.startInInfinity:
+            locations, normals, distances, polygonIndices, hits = rayCastList(
+                bvhTree, starts, directions, -100000, 1e30)
+            distances.fill(0)
+            return locations, normals, distances, polygonIndices, hits
+        return rayCastList(bvhTree, starts, directions, minDistance, maxDistance)
@@ -1,10 +1,12 @@
 import bpy
 import cython
+from libc.math cimport sqrt
 from mathutils import Vector
 from ... math cimport Vector3
 from ... utils.bvh import isInsideVolume
 from ... base_types import AnimationNode
-from ... data_structures cimport BaseFalloff
+from ... data_structures cimport BaseFalloff, TriangleBVH
+from ... data_structures.triangle_bvh cimport NearestHit
 from . constant_falloff import ConstantFalloff
 
 class MeshFalloffNode(AnimationNode, bpy.types.Node):
@@ -26,6 +28,7 @@ class MeshFalloffNode(AnimationNode, bpy.types.Node):
 cdef class MeshFalloff(BaseFalloff):
     cdef:
         bvhTree
+        TriangleBVH nativeTree
         float factor
         bint fillInside
         float minDistance, maxDistance
@@ -33,6 +36,8 @@ cdef class MeshFalloff(BaseFalloff):
     @cython.cdivision(True)
     def __cinit__(self, bvhTree,float size, float falloffWidth, bint fillInside):
         self.bvhTree = bvhTree
+        if isinstance(bvhTree, TriangleBVH):
+            self.nativeTree = bvhTree
         self.fillInside = fillInside
         if falloffWidth < 0:
             size += falloffWidth
@@ -53,14 +58,23 @@ cdef class MeshFalloff(BaseFalloff):
         cdef Vector3* v
         v = <Vector3*>value
         if self.fillInside:
-            strength = <float>isInsideVolume(self.bvhTree, Vector((v.x, v.y, v.z)))
+            if self.nativeTree is not None:
+                strength = <float>self.nativeTree.isInside_LowLevel(v)
+            else:
+                strength = <float>isInsideVolume(self.bvhTree, Vector((v.x, v.y, v.z)))
             distance = calculateDistance(self, v)
             return max(distance, strength)
         else:
             return calculateDistance(self, <Vector3*>value)
 
 cdef inline float calculateDistance(MeshFalloff self, Vector3 *v):
-    cdef float distance = self.bvhTree.find_nearest(Vector((v.x, v.y, v.z)), 1e10)[3]
+    cdef NearestHit hit
+    cdef float distance
+    if self.nativeTree is not None:
+        if not self.nativeTree.findNearest_LowLevel(v, 1e10, &hit): return 0
+        distance = sqrt(hit.distanceSquared)
+    else:
+        distance = self.bvhTree.find_nearest(Vector((v.x, v.y, v.z)), 1e10)[3]
     if distance <= self.minDistance: return 1
     if distance <= self.maxDistance: return 1 - (distance - self.minDistance) * self.factor
     return 0
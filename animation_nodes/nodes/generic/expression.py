@@ -1,14 +1,32 @@
 import re
 import bpy
+import numpy
 from bpy.props import *
 from ... utils.code import isCodeValid
 from ... base_types import AnimationNode
 from ... utils.layout import splitAlignment
 from ... events import executionCodeChanged
 from ... execution.code_generator import iter_Imports
+from ... data_structures import (DoubleList, LongList, BooleanList, Vector2DList, Vector3DList,
+                                 QuaternionList, ColorList, Matrix4x4List)
 
 variableNames = list("xyzabcdefghijklmnopqrstuvw")
 
+# the size of long depends on the platform (e.g. 32 bit on Windows)
+longType = LongList().asNumpyArray().dtype
+
+# list data type : (list type, numpy data type, shape of one element)
+numpyListTypes = {
+    "Float List" : (DoubleList, numpy.float64, ()),
+    "Integer List" : (LongList, longType, ()),
+    "Boolean List" : (BooleanList, numpy.bool_, ()),
+    "Vector 2D List" : (Vector2DList, numpy.float32, (2, )),
+    "Vector List" : (Vector3DList, numpy.float32, (3, )),
+    "Quaternion List" : (QuaternionList, numpy.float32, (4, )),
+    "Color List" : (ColorList, numpy.float32, (4, )),
+    "Matrix List" : (Matrix4x4List, numpy.float32, (4, 4))
+}
+
 expressionByIdentifier = {}
 
 class ExpressionNode(AnimationNode, bpy.types.Node):
@@ -16,6 +34,7 @@ class ExpressionNode(AnimationNode, bpy.types.Node):
     bl_label = "Expression"
     bl_width_default = 200
     dynamicLabelType = "HIDDEN_ONLY"
+    options = {"VOLATILE"}
 
     def settingChanged(self, context = None):
         self.errorMessage = ""
@@ -52,6 +71,11 @@ class ExpressionNode(AnimationNode, bpy.types.Node):
                        " (e.g. you will have to write math.sin(x) instead of just sin(x))"),
         update = executionCodeChanged)
 
+    vectorized: BoolProperty(name = "Vectorized", default = False,
+        description = ("Evaluate the expression only once for whole lists; Lists are given as "
+                       "NumPy arrays and the functions of NumPy can be used directly (e.g. sin(x))"),
+        update = settingChanged)
+
     def setup(self):
         self.newInput("Node Control", "New Input")
         self.newOutput("Generic", "Result", "result")
@@ -88,7 +112,11 @@ class ExpressionNode(AnimationNode, bpy.types.Node):
         col = layout.column(align = True)
         col.prop(self, "debugMode")
         col.prop(self, "correctType")
-        col.prop(self, "inlineExpression")
+        subcol = col.column(align = True)
+        subcol.active = not self.vectorized
+        subcol.prop(self, "inlineExpression")
+
+        layout.prop(self, "vectorized")
 
         layout.prop(self, "fixedOutputDataType")
 
@@ -130,18 +158,26 @@ class ExpressionNode(AnimationNode, bpy.types.Node):
             yield "result, self.lastCorrectionType = self.outputs[0].correctValue(result)"
 
     def getExpressionCode(self):
-        if self.inlineExpression:
+        parameterList = ", ".join(socket.text for socket in self.inputs[:-1])
+        if self.vectorized:
+            return "self.evaluateVectorized({})".format(parameterList)
+        elif self.inlineExpression:
             return self.expression
         else:
-            if len(self.inputs) == 1:
-                return "self.expressionFunction()"
-            else:
-                parameterList = ", ".join(socket.text for socket in self.inputs[:-1])
-                return "self.expressionFunction({})".format(parameterList)
+            return "self.expressionFunction({})".format(parameterList)
+
+    def evaluateVectorized(self, *args):
+        # the arrays are only views, so the lists have to exist until the result is converted
+        arrays = [toNumpyArray(value) for value in args]
+        result = self.expressionFunction(*arrays)
+        return fromNumpyArray(result, self.outputDataType)
 
     def getUsedModules(self):
         moduleNames = re.split("\W+", self.moduleNames)
         modules = [module for module in moduleNames if module != ""]
+        if self.vectorized:
+            # imported last, so that e.g. sin works with arrays
+            modules.append("numpy")
         return modules
 
     def clearErrorMessage(self):
@@ -233,3 +269,26 @@ def iterExpressionFunctionLines(expression, variables, modules):
     yield "def main({}):".format(", ".join(variables))
     yield "    __result__ = " + expression
     yield "    return __result__"
+
+def toNumpyArray(value):
+    for listType, dtype, shape in numpyListTypes.values():
+        if isinstance(value, listType):
+            return value.asNumpyArray().view(dtype).reshape((-1, ) + shape)
+    return value
+
+def fromNumpyArray(result, dataType):
+    '''Lists are created for list data types, other results are not changed.'''
+    if dataType not in numpyListTypes:
+        return result
+
+    listType, dtype, shape = numpyListTypes[dataType]
+    array = numpy.asarray(result, dtype = dtype)
+    if array.ndim == len(shape):
+        array = array.reshape((1, ) + shape)
+    if array.shape[1:] != shape:
+        raise ValueError("expected elements with shape {}, got {}".format(shape, array.shape[1:]))
+    if array.size == 0:
+        return listType()
+    if dtype is numpy.bool_:
+        array = array.view(numpy.int8)
+    return listType.fromNumpyArray(numpy.ascontiguousarray(array).ravel())
@@ -0,0 +1,52 @@
+import numpy
+from unittest import TestCase
+from . expression import toNumpyArray, fromNumpyArray
+from ... data_structures import (DoubleList, LongList, BooleanList, Vector2DList, Vector3DList,
+                                 QuaternionList, ColorList, Matrix4x4List)
+
+class TestNumpyConversion(TestCase):
+    def testFloatList(self):
+        self.checkRoundTrip(DoubleList.fromValues([1.5, -2, 3e10]), "Float List", ())
+
+    def testIntegerList(self):
+        values = [0, -5, 7, 2**31 - 1, -2**31]
+        result = self.checkRoundTrip(LongList.fromValues(values), "Integer List", ())
+        self.assertEqual(list(result), values)
+
+    def testBooleanList(self):
+        result = self.checkRoundTrip(BooleanList.fromValues([True, False, True]), "Boolean List", ())
+        self.assertEqual(list(result), [True, False, True])
+
+    def testVectorLists(self):
+        self.checkRoundTrip(Vector2DList.fromValues([(1, 2), (3, 4)]), "Vector 2D List", (2, ))
+        self.checkRoundTrip(Vector3DList.fromValues([(1, 2, 3), (4, 5, 6)]), "Vector List", (3, ))
+
+    def testQuaternionAndColorLists(self):
+        quaternions = QuaternionList.fromNumpyArray(numpy.arange(8, dtype = numpy.float32))
+        self.checkRoundTrip(quaternions, "Quaternion List", (4, ))
+        self.checkRoundTrip(ColorList.fromValues([(0.1, 0.2, 0.3, 1)]), "Color List", (4, ))
+
+    def testMatrixList(self):
+        matrices = Matrix4x4List.fromNumpyArray(numpy.arange(48, dtype = numpy.float32))
+        self.checkRoundTrip(matrices, "Matrix List", (4, 4))
+
+    def testIntegerResultsAreConverted(self):
+        result = fromNumpyArray(numpy.arange(5, dtype = numpy.int32) * 3, "Integer List")
+        self.assertIsInstance(result, LongList)
+        self.assertEqual(list(result), [0, 3, 6, 9, 12])
+
+    def testSingleElement(self):
+        result = fromNumpyArray(numpy.array([1, 2, 3]), "Vector List")
+        self.assertEqual(len(result), 1)
+
+    def testInvalidShape(self):
+        with self.assertRaises(ValueError):
+            fromNumpyArray(numpy.zeros((2, 2)), "Vector List")
+
+    def checkRoundTrip(self, values, dataType, shape):
+        array = toNumpyArray(values)
+        self.assertEqual(array.shape, (len(values), ) + shape)
+        result = fromNumpyArray(array, dataType)
+        self.assertIsInstance(result, type(values))
+        self.assertEqual(result, values)
+        return result
@@ -1,24 +1,29 @@
 import bpy
-from ... base_types import AnimationNode
+from ... base_types import AnimationNode, VectorizedSocket
 
 class FindNearestNPointsInKDTreeNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_FindNearestNPointsInKDTreeNode"
     bl_label = "Find Nearest Points"
 
+    useVectorList: VectorizedSocket.newProperty()
+
     def create(self):
         self.newInput("KDTree", "KDTree", "kdTree")
         self.newInput("Integer", "Amount", "amount", value = 5, minValue = 0)
-        self.newInput("Vector", "Vector", "searchVector", defaultDrawType = "PROPERTY_ONLY")
+        self.newInput(VectorizedSocket("Vector", "useVectorList",
+            ("Vector", "searchVector", dict(defaultDrawType = "PROPERTY_ONLY")),
+            ("Vectors", "searchVectors")))
+
         self.newOutput("Vector List", "Vectors", "nearestVectors")
         self.newOutput("Float List", "Distances", "distances")
         self.newOutput("Integer List", "Indices", "indices")
+        if self.useVectorList:
+            self.newOutput("Integer List", "Amounts", "amounts")
 
     def getExecutionCode(self, required):
-        yield "_amount = max(amount, 0)"
-        yield "nearestVectors = Vector3DList(capacity = _amount)"
-        yield "distances = DoubleList(capacity = _amount)"
-        yield "indices = LongList(capacity = _amount)"
-        yield "for vector, index, distance in kdTree.find_n(searchVector, _amount):"
-        yield "    nearestVectors.append(vector)"
-        yield "    indices.append(index)"
-        yield "    distances.append(distance)"
+        if self.useVectorList:
+            yield ("nearestVectors, indices, distances, amounts = "
+                   "AN.utils.kd_tree.findNearestNList(kdTree, searchVectors, amount)")
+        else:
+            yield ("nearestVectors, indices, distances = "
+                   "AN.utils.kd_tree.findNearestN(kdTree, searchVector, amount)")
@@ -4,7 +4,6 @@ from ... base_types import AnimationNode, VectorizedSocket
 class FindNearestPointInKDTreeNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_FindNearestPointInKDTreeNode"
     bl_label = "Find Nearest Point"
-    codeEffects = [VectorizedSocket.CodeEffect]
 
     useVectorList: VectorizedSocket.newProperty()
 
@@ -22,6 +21,10 @@ class FindNearestPointInKDTreeNode(AnimationNode, bpy.types.Node):
             ("Index", "index"), ("Indices", "indices")))
 
     def getExecutionCode(self, required):
-        yield "nearestVector, index, distance = kdTree.find(searchVector)"
-        yield "if nearestVector is None:"
-        yield "    nearestVector, index, distance = Vector((0, 0, 0)), 0.0, -1"
+        if self.useVectorList:
+            yield ("nearestVectors, indices, distances = "
+                   "AN.utils.kd_tree.findNearestList(kdTree, searchVectors)")
+        else:
+            yield "nearestVector, index, distance = kdTree.find(searchVector)"
+            yield "if nearestVector is None:"
+            yield "    nearestVector, index, distance = Vector((0, 0, 0)), 0, -1"
@@ -1,24 +1,29 @@
 import bpy
-from ... base_types import AnimationNode
+from ... base_types import AnimationNode, VectorizedSocket
 
 class FindPointsInRadiusInKDTreeNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_FindPointsInRadiusInKDTreeNode"
     bl_label = "Find Points in Radius"
 
+    useVectorList: VectorizedSocket.newProperty()
+
     def create(self):
         self.newInput("KDTree", "KDTree", "kdTree")
         self.newInput("Float", "Radius", "radius", value = 5, minValue = 0)
-        self.newInput("Vector", "Vector", "searchVector", defaultDrawType = "PROPERTY_ONLY")
+        self.newInput(VectorizedSocket("Vector", "useVectorList",
+            ("Vector", "searchVector", dict(defaultDrawType = "PROPERTY_ONLY")),
+            ("Vectors", "searchVectors")))
 
         self.newOutput("an_VectorListSocket", "Vectors", "nearestVectors")
         self.newOutput("an_FloatListSocket", "Distances", "distances")
         self.newOutput("an_IntegerListSocket", "Indices", "indices")
+        if self.useVectorList:
+            self.newOutput("an_IntegerListSocket", "Amounts", "amounts")
 
     def getExecutionCode(self, required):
-        yield "nearestVectors = Vector3DList()"
-        yield "distances = DoubleList()"
-        yield "indices = LongList()"
-        yield "for vector, index, distance in kdTree.find_range(searchVector, max(radius, 0)):"
-        yield "    nearestVectors.append(vector)"
-        yield "    indices.append(index)"
-        yield "    distances.append(distance)"
+        if self.useVectorList:
+            yield ("nearestVectors, indices, distances, amounts = "
+                   "AN.utils.kd_tree.findInRadiusList(kdTree, searchVectors, radius)")
+        else:
+            yield ("nearestVectors, indices, distances = "
+                   "AN.utils.kd_tree.findInRadius(kdTree, searchVector, radius)")
@@ -1,3 +1,7 @@
+# setup: options = openmp
+
+from cython.parallel cimport prange
+from ... utils.parallel cimport getThreadAmount
 from ... data_structures cimport (
     DoubleList, FloatList,
     Vector3DList, EulerList, Matrix4x4List, VirtualMatrix4x4List,
@@ -182,8 +186,9 @@ def extractMatricesZBasis(Matrix4x4List matrices):
 def replicateMatrixAtMatrices(matrix, Matrix4x4List transformations):
     cdef Matrix4 _matrix = toMatrix4(matrix)
     cdef Matrix4x4List result = Matrix4x4List(length = len(transformations))
-    cdef Py_ssize_t i
-    for i in range(len(result)):
+    cdef Py_ssize_t i, amount = len(result)
+    for i in prange(amount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(amount, 20000)):
         multMatrix4(result.data + i, transformations.data + i, &_matrix)
     return result
 
@@ -200,8 +205,9 @@ def replicateMatrixAtVectors(matrix, Vector3DList translations):
 
 def replicateMatricesAtMatrices(Matrix4x4List matrices, Matrix4x4List transformations):
     cdef Matrix4x4List result = Matrix4x4List(length = len(matrices) * len(transformations))
-    cdef Py_ssize_t i, j
-    for i in range(len(transformations)):
+    cdef Py_ssize_t i, j, amount = len(transformations)
+    cdef int threads = getThreadAmount(result.length, 20000)
+    for i in prange(amount, nogil = True, schedule = "static", num_threads = threads):
         for j in range(matrices.length):
             multMatrix4(result.data + i * matrices.length + j,
                         transformations.data + i,
@@ -239,12 +245,13 @@ def vectorizedMatrixMultiplication(matricesA, matricesB):
 def multiplyMatrixWithList(Matrix4x4List matrices, _transformation, str type):
     cdef Matrix4 transformation = toMatrix4(_transformation)
     cdef Matrix4x4List outMatrices = Matrix4x4List(length = len(matrices))
-    cdef Py_ssize_t i
+    cdef Py_ssize_t i, amount = len(outMatrices)
+    cdef int threads = getThreadAmount(amount, 20000)
     if type == "LEFT":
-        for i in range(len(outMatrices)):
+        for i in prange(amount, nogil = True, schedule = "static", num_threads = threads):
             multMatrix4(outMatrices.data + i, &transformation, matrices.data + i)
     elif type == "RIGHT":
-        for i in range(len(outMatrices)):
+        for i in prange(amount, nogil = True, schedule = "static", num_threads = threads):
             multMatrix4(outMatrices.data + i, matrices.data + i, &transformation)
     else:
         raise Exception("type has to be 'LEFT' or 'RIGHT'")
@@ -254,8 +261,9 @@ def multiplyMatrixLists(Matrix4x4List listA, Matrix4x4List listB):
     assert listA.length == listB.length
 
     cdef Matrix4x4List outMatrices = Matrix4x4List(length = len(listA))
-    cdef Py_ssize_t i
-    for i in range(len(listA)):
+    cdef Py_ssize_t i, amount = len(listA)
+    for i in prange(amount, nogil = True, schedule = "static",
+                    num_threads = getThreadAmount(amount, 20000)):
         multMatrix4(outMatrices.data + i, listA.data + i, listB.data + i)
     return outMatrices
 
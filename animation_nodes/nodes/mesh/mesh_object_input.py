@@ -1,6 +1,7 @@
 import bpy
 from bpy.props import *
 from ... base_types import AnimationNode, VectorizedSocket
+from ... utils.mesh_input_cache import removeOwner
 from ... data_structures import Mesh, Attribute, AttributeType, AttributeDomain, AttributeDataType, DoubleList
 
 class MeshObjectInputNode(AnimationNode, bpy.types.Node):
@@ -50,10 +51,10 @@ class MeshObjectInputNode(AnimationNode, bpy.types.Node):
         if len(required) == 0:
             return
 
-        yield "sourceMesh = object.an.getMesh(useModifiers) if object else None"
-        yield "if sourceMesh is not None:"
+        yield "meshInput = AN.utils.mesh_input_cache.getMeshInput(object, useModifiers, self.identifier)"
+        yield "if meshInput is not None:"
         yield from ("    " + line for line in self.iterGetMeshDataCodeLines(required))
-        yield "    if sourceMesh.users == 0: object.to_mesh_clear()"
+        yield "    meshInput.release()"
         yield "else:"
         yield "    meshName = ''"
         yield "    mesh = Mesh()"
@@ -71,94 +72,93 @@ class MeshObjectInputNode(AnimationNode, bpy.types.Node):
 
     def iterGetMeshDataCodeLines(self, required):
         if "meshName" in required:
-            yield "meshName = sourceMesh.name"
+            yield "meshName = meshInput.meshName"
 
         yield "evaluatedObject = AN.utils.depsgraph.getEvaluatedID(object)"
         meshRequired = "mesh" in required
 
         if "vertexLocations" in required or meshRequired:
-            yield "vertexLocations = self.getVertexLocations(sourceMesh, evaluatedObject, useWorldSpace)"
+            yield "vertexLocations = self.getVertexLocations(meshInput, evaluatedObject, useWorldSpace)"
         if "edgeIndices" in required or meshRequired:
-            yield "edgeIndices = sourceMesh.an.getEdgeIndices()"
+            yield "edgeIndices = meshInput.get('getEdgeIndices')"
         if "polygonIndices" in required or meshRequired:
-            yield "polygonIndices = sourceMesh.an.getPolygonIndices()"
+            yield "polygonIndices = meshInput.get('getPolygonIndices')"
         if "vertexNormals" in required or meshRequired:
-            yield "vertexNormals = self.getVertexNormals(sourceMesh, evaluatedObject, useWorldSpace)"
+            yield "vertexNormals = self.getVertexNormals(meshInput, evaluatedObject, useWorldSpace)"
         if "polygonNormals" in required or meshRequired:
-            yield "polygonNormals = self.getPolygonNormals(sourceMesh, evaluatedObject, useWorldSpace)"
+            yield "polygonNormals = self.getPolygonNormals(meshInput, evaluatedObject, useWorldSpace)"
         if "polygonCenters" in required:
-            yield "polygonCenters = self.getPolygonCenters(sourceMesh, evaluatedObject, useWorldSpace)"
+            yield "polygonCenters = self.getPolygonCenters(meshInput, evaluatedObject, useWorldSpace)"
         if "localPolygonAreas" in required:
-            yield "localPolygonAreas = DoubleList.fromValues(sourceMesh.an.getPolygonAreas())"
+            yield "localPolygonAreas = DoubleList.fromValues(meshInput.get('getPolygonAreas', copy = False))"
         if "materialIndices" in required or meshRequired:
-            yield "materialIndices = LongList.fromValues(sourceMesh.an.getPolygonMaterialIndices())"
+            yield "materialIndices = LongList.fromValues(meshInput.get('getPolygonMaterialIndices', copy = False))"
         if "bevelVertexWeights" in required or meshRequired:
-            yield "bevelVertexWeights = DoubleList.fromValues(sourceMesh.an.getBevelVertexWeights())"
+            yield "bevelVertexWeights = DoubleList.fromValues(meshInput.get('getBevelVertexWeights', copy = False))"
         if "bevelEdgeWeights" in required or meshRequired:
-            yield "bevelEdgeWeights = DoubleList.fromValues(sourceMesh.an.getBevelEdgeWeights())"
+            yield "bevelEdgeWeights = DoubleList.fromValues(meshInput.get('getBevelEdgeWeights', copy = False))"
         if "edgeCreases" in required or meshRequired:
-            yield "edgeCreases = DoubleList.fromValues(sourceMesh.an.getEdgeCreases())"
+            yield "edgeCreases = DoubleList.fromValues(meshInput.get('getEdgeCreases', copy = False))"
 
         if meshRequired:
             yield "mesh = Mesh(vertexLocations, edgeIndices, polygonIndices)"
             yield "mesh.setVertexNormals(vertexNormals)"
             yield "mesh.setPolygonNormals(polygonNormals)"
-            yield "mesh.setLoopEdges(sourceMesh.an.getLoopEdges())"
-            yield "self.loadBuiltInAttributes(mesh, sourceMesh, evaluatedObject)"
-            yield "if loadUVs: self.loadUVMaps(mesh, sourceMesh, object)"
-            yield "if loadVertexColors: self.loadVertexColors(mesh, sourceMesh, object)"
-            yield "if loadVertexWeights: self.loadVertexWeights(mesh, sourceMesh, object, useModifiers, scene)"
-            yield "if loadCustomAttributes: self.loadCustomAttributes(mesh, sourceMesh, evaluatedObject)"
-
-    def getVertexLocations(self, mesh, object, useWorldSpace):
-        vertices = mesh.an.getVertices()
+            yield "mesh.setLoopEdges(meshInput.get('getLoopEdges'))"
+            yield "self.loadBuiltInAttributes(mesh, meshInput, evaluatedObject)"
+            yield "if loadUVs: self.loadUVMaps(mesh, meshInput.sourceMesh, object)"
+            yield "if loadVertexColors: self.loadVertexColors(mesh, meshInput.sourceMesh, object)"
+            yield "if loadVertexWeights: self.loadVertexWeights(mesh, meshInput.sourceMesh, object, useModifiers, scene)"
+            yield "if loadCustomAttributes: self.loadCustomAttributes(mesh, meshInput.sourceMesh, evaluatedObject)"
+
+    def delete(self):
+        removeOwner(self.identifier)
+
+    def getVertexLocations(self, meshInput, object, useWorldSpace):
         if useWorldSpace:
-            vertices.transform(object.matrix_world)
-        return vertices
+            return meshInput.getTransformed("getVertices", object.matrix_world)
+        return meshInput.get("getVertices")
 
-    def getVertexNormals(self, mesh, object, useWorldSpace):
-        normals = mesh.an.getVertexNormals()
+    def getVertexNormals(self, meshInput, object, useWorldSpace):
         if useWorldSpace:
-            normals.transform(object.matrix_world, ignoreTranslation = True)
-        return normals
+            return meshInput.getTransformed("getVertexNormals", object.matrix_world, ignoreTranslation = True)
+        return meshInput.get("getVertexNormals")
 
-    def getPolygonNormals(self, mesh, object, useWorldSpace):
-        normals = mesh.an.getPolygonNormals()
+    def getPolygonNormals(self, meshInput, object, useWorldSpace):
         if useWorldSpace:
-            normals.transform(object.matrix_world, ignoreTranslation = True)
-        return normals
+            return meshInput.getTransformed("getPolygonNormals", object.matrix_world, ignoreTranslation = True)
+        return meshInput.get("getPolygonNormals")
 
-    def getPolygonCenters(self, mesh, object, useWorldSpace):
-        centers = mesh.an.getPolygonCenters()
+    def getPolygonCenters(self, meshInput, object, useWorldSpace):
         if useWorldSpace:
-            centers.transform(object.matrix_world)
-        return centers
+            return meshInput.getTransformed("getPolygonCenters", object.matrix_world)
+        return meshInput.get("getPolygonCenters")
 
-    def loadBuiltInAttributes(self, mesh, sourceMesh, object):
+    def loadBuiltInAttributes(self, mesh, meshInput, object):
         if object.mode != "EDIT":
             mesh.insertBuiltInAttribute(Attribute("Material Indices",
                                                   AttributeType.MATERIAL_INDEX,
                                                   AttributeDomain.FACE,
                                                   AttributeDataType.INT,
-                                                  sourceMesh.an.getPolygonMaterialIndices()))
+                                                  meshInput.get("getPolygonMaterialIndices")))
 
             mesh.insertBuiltInAttribute(Attribute("Bevel Edge Weights",
                                                   AttributeType.BEVEL_EDGE_WEIGHT,
                                                   AttributeDomain.EDGE,
                                                   AttributeDataType.FLOAT,
-                                                  sourceMesh.an.getBevelEdgeWeights()))
+                                                  meshInput.get("getBevelEdgeWeights")))
 
             mesh.insertBuiltInAttribute(Attribute("Bevel Vertex Weights",
                                                   AttributeType.BEVEL_VERTEX_WEIGHT,
                                                   AttributeDomain.POINT,
                                                   AttributeDataType.FLOAT,
-                                                  sourceMesh.an.getBevelVertexWeights()))
+                                                  meshInput.get("getBevelVertexWeights")))
 
             mesh.insertBuiltInAttribute(Attribute("Edge Creases",
                                                   AttributeType.EDGE_CREASE,
                                                   AttributeDomain.EDGE,
                                                   AttributeDataType.FLOAT,
-                                                  sourceMesh.an.getEdgeCreases()))
+                                                  meshInput.get("getEdgeCreases")))
 
         else:
             self.setErrorMessage("Object is in edit mode.")
@@ -1,9 +1,13 @@
 import bpy
+import numpy
 import bmesh
 from bpy.props import *
+from collections import OrderedDict
 from ... utils.layout import writeText
 from ... base_types import AnimationNode
 from ... utils.animation import isAnimated
+from ... utils.handlers import eventHandler
+from ... utils.vertex_groups import groupVerticesByWeight
 from ... data_structures import UShortList, AttributeType
 from ... events import propertyChanged, executionCodeChanged
 
@@ -12,6 +16,14 @@ meshDataTypeItems = [
     ("BMESH", "BMesh", "BMesh object", "", 1),
     ("VERTICES", "Vertices", "A list of vertex locations; The length of this list has to be equal to the amount of vertices the mesh already has", "", 2) ]
 
+# (node identifier, object name, group name) : (weights, batches)
+# least recently used entries are removed first
+vertexWeightBatchesCache = OrderedDict()
+maxVertexWeightCacheEntries = 64
+
+# (node identifier, object name) : MeshTopology
+meshTopologyCache = {}
+
 class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_MeshObjectOutputNode"
     bl_label = "Mesh Object Output"
@@ -87,10 +99,15 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
             yield "    self.setBMesh(mesh, bm)"
         elif self.meshDataType == "VERTICES":
             yield "    self.setVertices(mesh, vertices)"
+        yield "    AN.utils.mesh_input_cache.invalidateMesh(mesh)"
 
         yield "    if self.ensureAnimationData:"
         yield "        self.ensureThatMeshHasAnimationData(mesh)"
 
+    def getFrameCacheCode(self):
+        if self.isInputUsed():
+            yield "AN.execution.frame_cache.recordObjectMeshes((object, ))"
+
     def isInputUsed(self):
         if self.meshDataType == "MESH_DATA":
             return self.inputs["Mesh"].isUsed
@@ -112,6 +129,13 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
         return True
 
     def setMesh(self, outMesh, mesh, object):
+        if not self.validateMesh and self.hasSameTopology(outMesh, mesh, object):
+            self.updateMesh(outMesh, mesh, object)
+        else:
+            self.createMesh(outMesh, mesh, object)
+            self.storeTopology(outMesh, mesh, object)
+
+    def createMesh(self, outMesh, mesh, object):
         # clear existing mesh
         bmesh.new().to_mesh(outMesh)
 
@@ -134,13 +158,7 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
         outMesh.loops.foreach_set("vertex_index", mesh.polygons.indices.asMemoryView())
         outMesh.loops.foreach_set("edge_index", mesh.getLoopEdges().asMemoryView())
 
-        # Materials Indices
-        materialIndices = mesh.getBuiltInAttribute("Material Indices")
-        if materialIndices is not None:
-            indices = materialIndices.data
-            if len(indices) > 0 and indices.getMaxValue() > 0 and indices.getMinValue() >= 0:
-                indices = UShortList.fromValues(indices)
-                outMesh.polygons.foreach_set("material_index", indices.asMemoryView())
+        self.setMaterialIndices(outMesh, mesh, isNewMesh = True)
 
         # UV Maps
         for attribute in mesh.iterUVMapAttributes():
@@ -152,31 +170,15 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
             vertexColorLayer = outMesh.vertex_colors.new(name = attribute.name, do_init = False)
             vertexColorLayer.data.foreach_set("color", attribute.data.asMemoryView())
 
-        # Vertex Groups
-        vertexAmount = len(outMesh.vertices)
-        for attribute in mesh.iterVertexWeightAttributes():
-            vertexGroup = object.vertex_groups.get(attribute.name)
-            if vertexGroup is None:
-                vertexGroup = object.vertex_groups.new(name = attribute.name)
-            weights = attribute.data
-            for i in range(vertexAmount):
-                vertexGroup.add([i], weights[i], "REPLACE")
+        self.setVertexGroups(mesh, object)
         object.data.update()
 
         # Custom Attributes
         for attribute in mesh.iterCustomAttributes():
             domain = attribute.getDomainAsString()
             dataType = attribute.getListTypeAsString()
-            data = attribute.data
-
             attributeOut = outMesh.attributes.new(attribute.name, dataType, domain)
-
-            if dataType in ("FLOAT", "INT", "BOOLEAN"):
-                attributeOut.data.foreach_set("value", data.asMemoryView())
-            elif dataType in ("FLOAT2", "FLOAT_VECTOR"):
-                attributeOut.data.foreach_set("vector", data.asMemoryView())
-            else:
-                attributeOut.data.foreach_set("color", data.asMemoryView())
+            self.setCustomAttributeData(attributeOut, dataType, attribute.data)
 
         if self.validateMesh:
             outMesh.validate(verbose = self.validateMeshVerbose)
@@ -184,8 +186,90 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
         if self.calculateLooseEdges:
             outMesh.update(calc_edges_loose = True)
 
+    def updateMesh(self, outMesh, mesh, object):
+        # The topology and the layers are the same as in the last execution,
+        # so only the data of the existing elements and layers is replaced.
+        outMesh.vertices.foreach_set("co", mesh.vertices.asMemoryView())
+        outMesh.vertices.foreach_set("normal", mesh.getVertexNormals().asMemoryView())
+
+        self.setMaterialIndices(outMesh, mesh, isNewMesh = False)
+
+        for attribute in mesh.iterUVMapAttributes():
+            outMesh.uv_layers[attribute.name].data.foreach_set("uv", attribute.data.asMemoryView())
+
+        for attribute in mesh.iterVertexColorAttributes():
+            outMesh.vertex_colors[attribute.name].data.foreach_set("color", attribute.data.asMemoryView())
+
+        self.setVertexGroups(mesh, object, skipUnchanged = True)
+        object.data.update()
+
+        for attribute in mesh.iterCustomAttributes():
+            self.setCustomAttributeData(outMesh.attributes[attribute.name],
+                attribute.getListTypeAsString(), attribute.data)
+
+        if self.calculateLooseEdges:
+            outMesh.update(calc_edges_loose = True)
+
+    def setMaterialIndices(self, outMesh, mesh, isNewMesh):
+        materialIndices = mesh.getBuiltInAttribute("Material Indices")
+        if materialIndices is not None:
+            indices = materialIndices.data
+            # a new mesh has only zeros already, but old indices have to be overwritten
+            if len(indices) > 0 and indices.getMinValue() >= 0 and (indices.getMaxValue() > 0 or not isNewMesh):
+                indices = UShortList.fromValues(indices)
+                outMesh.polygons.foreach_set("material_index", indices.asMemoryView())
+
+    def setVertexGroups(self, mesh, object, skipUnchanged = False):
+        for attribute in mesh.iterVertexWeightAttributes():
+            vertexGroup = object.vertex_groups.get(attribute.name)
+            if vertexGroup is None:
+                vertexGroup = object.vertex_groups.new(name = attribute.name)
+            elif skipUnchanged and not self.haveVertexWeightsChanged(object, attribute):
+                continue
+            for weight, indices in self.getVertexWeightBatches(object, attribute):
+                vertexGroup.add(indices, weight, "REPLACE")
+
+    def setCustomAttributeData(self, attributeOut, dataType, data):
+        if dataType in ("FLOAT", "INT", "BOOLEAN"):
+            attributeOut.data.foreach_set("value", data.asMemoryView())
+        elif dataType in ("FLOAT2", "FLOAT_VECTOR"):
+            attributeOut.data.foreach_set("vector", data.asMemoryView())
+        else:
+            attributeOut.data.foreach_set("color", data.asMemoryView())
+
+    def hasSameTopology(self, outMesh, mesh, object):
+        cached = meshTopologyCache.get((self.identifier, object.name))
+        if cached is None: return False
+
+        if cached.meshPointer != outMesh.as_pointer(): return False
+        if cached.layers != getMeshLayers(mesh): return False
+        if cached.amounts != getElementAmounts(outMesh): return False
+        return cached.topologyEquals(mesh)
+
+    def storeTopology(self, outMesh, mesh, object):
+        meshTopologyCache[(self.identifier, object.name)] = MeshTopology(outMesh, mesh)
+
+    def haveVertexWeightsChanged(self, object, attribute):
+        key = (self.identifier, object.name, attribute.name)
+        cachedWeights, _ = vertexWeightBatchesCache.get(key, (None, None))
+        return cachedWeights is None or not numpy.array_equal(cachedWeights, attribute.data.asNumpyArray())
+
+    def getVertexWeightBatches(self, object, attribute):
+        # Grouping the vertices by weight is only done again when the weights changed.
+        key = (self.identifier, object.name, attribute.name)
+        weights = attribute.data.asNumpyArray()
+        cachedWeights, batches = vertexWeightBatchesCache.get(key, (None, None))
+        if cachedWeights is None or not numpy.array_equal(cachedWeights, weights):
+            batches = groupVerticesByWeight(attribute.data)
+            vertexWeightBatchesCache[key] = (weights.copy(), batches)
+            while len(vertexWeightBatchesCache) > maxVertexWeightCacheEntries:
+                vertexWeightBatchesCache.popitem(last = False)
+        vertexWeightBatchesCache.move_to_end(key)
+        return batches
+
     def setBMesh(self, mesh, bm):
         bm.to_mesh(mesh)
+        removeStoredTopology(mesh)
 
     def setVertices(self, mesh, vertices):
         if len(mesh.vertices) != len(vertices):
@@ -199,3 +283,47 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
         if not isAnimated(mesh):
             mesh['an_helper_property'] = 0
             mesh.keyframe_insert(data_path = '["an_helper_property"]')
+
+    def delete(self):
+        removeCachedDataOfNode(self.identifier)
+
+class MeshTopology:
+    '''Topology of the last mesh that has been created by a node.'''
+    def __init__(self, outMesh, mesh):
+        self.meshPointer = outMesh.as_pointer()
+        self.amounts = getElementAmounts(outMesh)
+        self.layers = getMeshLayers(mesh)
+        self.arrays = [array.copy() for array in getTopologyArrays(mesh)]
+
+    def topologyEquals(self, mesh):
+        return all(numpy.array_equal(a, b) for a, b in zip(self.arrays, getTopologyArrays(mesh)))
+
+def removeStoredTopology(outMesh):
+    pointer = outMesh.as_pointer()
+    for key in [key for key, topology in meshTopologyCache.items() if topology.meshPointer == pointer]:
+        del meshTopologyCache[key]
+
+def getTopologyArrays(mesh):
+    polygons = mesh.polygons
+    return (mesh.edges.asNumpyArray(), polygons.polyStarts.asNumpyArray(),
+            polygons.polyLengths.asNumpyArray(), polygons.indices.asNumpyArray())
+
+def getElementAmounts(mesh):
+    return (len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons))
+
+def getMeshLayers(mesh):
+    return (tuple(attribute.name for attribute in mesh.iterUVMapAttributes()),
+            tuple(attribute.name for attribute in mesh.iterVertexColorAttributes()),
+            tuple((attribute.name, attribute.getDomainAsString(), attribute.getListTypeAsString())
+                  for attribute in mesh.iterCustomAttributes()),
+            mesh.getBuiltInAttribute("Material Indices") is not None)
+
+def removeCachedDataOfNode(identifier):
+    for cache in (vertexWeightBatchesCache, meshTopologyCache):
+        for key in [key for key in cache if key[0] == identifier]:
+            del cache[key]
+
+@eventHandler("FILE_LOAD_POST")
+def clearMeshOutputCaches():
+    vertexWeightBatchesCache.clear()
+    meshTopologyCache.clear()
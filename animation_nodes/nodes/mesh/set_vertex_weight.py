@@ -1,6 +1,7 @@
 import bpy
 from bpy.props import *
 from ... events import propertyChanged
+from ... utils.vertex_groups import setVertexGroupWeights
 from ... data_structures import VirtualDoubleList
 from ... base_types import AnimationNode, VectorizedSocket
 
@@ -87,9 +88,8 @@ class SetVertexWeightNode(AnimationNode, bpy.types.Node):
         if object is None: return
         vertexGroup = self.getVertexGroup(object, identifier)
 
-        weights = VirtualDoubleList.create(weights, 0)
-        for i, index in enumerate(indices):
-            vertexGroup.add([index], weights[i], "REPLACE")
+        weights = VirtualDoubleList.create(weights, 0).materialize(len(indices))
+        setVertexGroupWeights(vertexGroup, weights, indices)
         object.data.update()    
         return object
 
@@ -107,9 +107,8 @@ class SetVertexWeightNode(AnimationNode, bpy.types.Node):
         if object is None: return
         vertexGroup = self.getVertexGroup(object, identifier)
 
-        weights = VirtualDoubleList.create(weights, 0)
-        for i in range(len(object.data.vertices)):
-            vertexGroup.add([i], weights[i], "REPLACE") 
+        weights = VirtualDoubleList.create(weights, 0).materialize(len(object.data.vertices))
+        setVertexGroupWeights(vertexGroup, weights)
         object.data.update()
         return object            
 
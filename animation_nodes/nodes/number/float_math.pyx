@@ -16,6 +16,9 @@ from ... math cimport (add, subtract, multiply, divide_Save, modulo_Save,
 ctypedef double (*SingleInputFunction)(double a)
 ctypedef double (*DoubleInputFunction)(double a, double b)
 
+cdef double atan2_BA(double a, double b):
+    return atan2(b, a)
+
 cdef class Operation:
     cdef:
         readonly str identifier
@@ -135,7 +138,7 @@ operations[21] = new("RECIPROCAL", "Reciprocal", "1 / A", "A",
 operations[22] = new("SNAP", "Snap", "snap A to Step", "A_Step",
     "result = round(a / step) * step if step != 0 else a", <void*>snap_Save)
 operations[23] = new("ARCTANGENT_B/A", "Arctangent B/A", "atan2 (B / A)", "A_B",
-    "result = math.atan2(b, a)", <void*>atan2)
+    "result = math.atan2(b, a)", <void*>atan2_BA)
 operations[24] = new("HYPOTENUSE", "Hypotenuse", "hypot A, B", "A_B",
     "result = math.hypot(a, b)", <void*>hypot)
 operations[25] = new("COPY_SIGN", "Copy Sign", "A gets sign of B", "A_B",
@@ -143,6 +146,11 @@ operations[25] = new("COPY_SIGN", "Copy Sign", "A gets sign of B", "A_B",
 operations[26] = new("FLOOR_DIVISION", "Floor Division", "floor(A / B)", "A_B",
     "result = a // b if b != 0 else 0", <void*>floorDivision_Save)
 
+# The expressions of these operations give different results than the list
+# functions in some cases (rounding of ties, exceptions instead of inf),
+# so loops that use them are not executed with lists.
+operationsWithoutListParity = {"POWER", "SNAP"}
+
 operationItems = [(op.identifier, op.name, op.label, "NONE", i) for i, op in operations.items()]
 operationByIdentifier = {op.identifier : op for op in operations.values()}
 
@@ -231,20 +239,29 @@ class FloatMathNode(AnimationNode, bpy.types.Node):
 
     def getExecutionCode(self, required):
         if self.generatesList:
-            currentType = self._operation.type
-            if currentType == "A":
-                yield "results = self._operation.execute_A(a)"
-            elif currentType == "A_B":
-                yield "results = self._operation.execute_A_B(a, b)"
-            elif currentType == "Base_Exponent":
-                yield "results = self._operation.execute_A_B(base, exponent)"
-            elif currentType == "A_Step":
-                yield "results = self._operation.execute_A_B(a, step)"
-            elif currentType == "A_Base":
-                yield "results = self._operation.execute_A_B(a, base)"
+            yield self.getListExecutionCode("results")
         else:
             yield self._operation.expression
 
+    def getVectorizedExecutionCode(self, required, varyingInputs):
+        if self.generatesList: return None
+        if self.operation in operationsWithoutListParity: return None
+        return [self.getListExecutionCode("result")]
+
+    def getListExecutionCode(self, resultName):
+        currentType = self._operation.type
+        if currentType == "A":
+            code = "self._operation.execute_A(a)"
+        elif currentType == "A_B":
+            code = "self._operation.execute_A_B(a, b)"
+        elif currentType == "Base_Exponent":
+            code = "self._operation.execute_A_B(base, exponent)"
+        elif currentType == "A_Step":
+            code = "self._operation.execute_A_B(a, step)"
+        elif currentType == "A_Base":
+            code = "self._operation.execute_A_B(a, base)"
+        return "{} = {}".format(resultName, code)
+
     def getUsedModules(self):
         return ["math"]
 
@@ -0,0 +1,34 @@
+import math
+from itertools import product
+from unittest import TestCase
+from ... data_structures import DoubleList
+from . float_math import operations, operationsWithoutListParity
+
+testValues = (-7.5, -3, -2.5, -1, -0.5, 0, 0.5, 1, 1.5, 2, 3, 7.5)
+
+class TestListParity(TestCase):
+    def testOperations(self):
+        for operation in operations.values():
+            if operation.identifier in operationsWithoutListParity: continue
+            names = [name.lower() for name in operation.type.split("_")]
+            for values in product(testValues, repeat = len(names)):
+                with self.subTest(operation = operation.identifier, values = values):
+                    self.assertAlmostEqual(executeList(operation, values),
+                                           executeExpression(operation, names, values),
+                                           places = 10)
+
+    def testNegativeModulo(self):
+        operation = operations[15]
+        self.assertEqual(executeList(operation, (-7.5, 2)), -7.5 % 2)
+        self.assertEqual(executeList(operation, (7.5, -2)), 7.5 % -2)
+
+def executeExpression(operation, names, values):
+    variables = dict(zip(names, values), math = math)
+    exec(operation.expression, variables)
+    return variables["result"]
+
+def executeList(operation, values):
+    lists = [DoubleList.fromValues([value]) for value in values]
+    if len(lists) == 1:
+        return operation.execute_A(*lists)[0]
+    return operation.execute_A_B(*lists)[0]
@@ -1,5 +1,7 @@
 import bpy
+import time
 from bpy.props import *
+from collections import defaultdict
 from ... events import propertyChanged
 from ... base_types import AnimationNode
 from ... utils.names import getRandomString
@@ -15,6 +17,32 @@ from ... utils.names import (getPossibleMeshName,
 lastSourceHashes = {}
 lastContainerHashes = {}
 
+# when hidden instances are kept, additional instances are created for later,
+# so that a slowly growing amount does not create new objects in every execution
+instanceGrowthFactor = 0.25
+
+class InstancerStatistics:
+    __slots__ = ("created", "removed", "hidden", "reused", "creationTime", "removalTime")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.created = 0
+        self.removed = 0
+        self.hidden = 0
+        self.reused = 0
+        self.creationTime = 0
+        self.removalTime = 0
+
+    def __repr__(self):
+        return ("Created: {}, Removed: {}, Hidden: {}, Reused: {}, "
+                "Creation Time: {:.3f} s, Removal Time: {:.3f} s").format(
+            self.created, self.removed, self.hidden, self.reused,
+            self.creationTime, self.removalTime)
+
+statisticsByNode = defaultdict(InstancerStatistics)
+
 objectTypeItems = [
     ("MESH", "Mesh", "", "MESH_DATA", 0),
     ("TEXT", "Text", "", "FONT_DATA", 1),
@@ -85,6 +113,14 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
     emptyDisplayType: EnumProperty(name = "Empty Draw Type", default = "PLAIN_AXES",
         items = emptyDisplayTypeItems, update = resetInstancesEvent)
 
+    keepHiddenInstances: BoolProperty(name = "Keep Hidden Instances", default = False,
+        description = ("Hide instances that are not needed anymore instead of removing them, "
+                       "so that they can be reused when the amount increases again"),
+        update = propertyChanged)
+
+    # the last instances in linkedObjects are hidden
+    hiddenInstancesAmount: IntProperty(default = 0)
+
     def create(self):
         self.newInput("Integer", "Instances", "instancesAmount", minValue = 0)
         if self.copyFromSource:
@@ -110,6 +146,14 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
     def drawAdvanced(self, layout):
         layout.prop(self, "containerType")
         layout.prop(self, "removeAnimationData")
+        layout.prop(self, "keepHiddenInstances")
+
+        statistics = statisticsByNode[self.identifier]
+        col = layout.column(align = True)
+        col.label(text = "Hidden Instances: {}".format(self.hiddenInstancesAmount))
+        col.label(text = "Created: {} ({:.3f} s)".format(statistics.created, statistics.creationTime))
+        col.label(text = "Removed: {} ({:.3f} s)".format(statistics.removed, statistics.removalTime))
+        col.label(text = "Hidden: {}, Reused: {}".format(statistics.hidden, statistics.reused))
 
         self.invokeFunction(layout, "resetObjectDataOnAllInstances",
             text = "Reset Source Data",
@@ -161,54 +205,84 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
             self.removeAllObjects()
             self.resetInstances = False
 
-        self.removeObjectsInRange(instancesAmount, len(self.linkedObjects))
-
+        self.updateActiveInstances(instancesAmount)
         return self.getOutputObjects(instancesAmount, sourceObject, containers)
 
+    def updateActiveInstances(self, instancesAmount):
+        self.removeDeletedObjects()
+        totalAmount = len(self.linkedObjects)
+        activeAmount = totalAmount - self.hiddenInstancesAmount
 
-    def getOutputObjects(self, instancesAmount, sourceObject, containers):
-        objects = []
+        self.setInstancesHidden(activeAmount, min(instancesAmount, totalAmount), False)
+        if self.keepHiddenInstances:
+            self.setInstancesHidden(instancesAmount, activeAmount, True)
+            self.hiddenInstancesAmount = max(totalAmount - instancesAmount, 0)
+        else:
+            self.removeObjectsInRange(instancesAmount, totalAmount)
+            self.hiddenInstancesAmount = 0
 
-        for i, objectGroup in enumerate(self.linkedObjects):
+    def setInstancesHidden(self, start, end, hide):
+        if start >= end: return
+        statistics = statisticsByNode[self.identifier]
+        for objectGroup in self.linkedObjects[start:end]:
             object = objectGroup.object
-            if object is None:
+            object.hide_viewport = hide
+            object.hide_render = hide
+        if hide: statistics.hidden += end - start
+        else: statistics.reused += end - start
+
+    def removeDeletedObjects(self):
+        activeAmount = len(self.linkedObjects) - self.hiddenInstancesAmount
+        for i in reversed(range(len(self.linkedObjects))):
+            if self.linkedObjects[i].object is None:
                 self.linkedObjects.remove(i)
-            else:
-                objects.append(object)
+                if i >= activeAmount:
+                    self.hiddenInstancesAmount -= 1
+
+    def getOutputObjects(self, instancesAmount, sourceObject, containers):
+        objects = [objectGroup.object for objectGroup in self.linkedObjects[:instancesAmount]]
 
         missingAmount = instancesAmount - len(objects)
         if missingAmount == 0:
             return objects
 
-        newObjects = self.createNewObjects(missingAmount, sourceObject, containers)
-        objects.extend(newObjects)
+        createAmount = missingAmount
+        if self.keepHiddenInstances:
+            createAmount = max(missingAmount, int(len(objects) * instanceGrowthFactor))
+
+        newObjects = self.createNewObjects(createAmount, sourceObject, containers)
+        objects.extend(newObjects[:missingAmount])
 
+        # the additional objects are kept for later
+        self.hiddenInstancesAmount = createAmount - missingAmount
+        self.setInstancesHidden(instancesAmount, instancesAmount + self.hiddenInstancesAmount, True)
         return objects
 
     def removeAllObjects(self):
-        for objectGroup in self.linkedObjects:
-            object = objectGroup.object
-            if object is not None:
-                self.removeObject(object)
-
-        self.linkedObjects.clear()
+        self.removeObjectsInRange(0, len(self.linkedObjects))
+        self.hiddenInstancesAmount = 0
 
     def removeObjectsInRange(self, start, end):
+        if start >= end: return
+        objects = [objectGroup.object for objectGroup in self.linkedObjects[start:end]]
+        self.removeObjects([object for object in objects if object is not None])
         for i in reversed(range(start, end)):
-            self.removeObjectAtIndex(i)
+            self.linkedObjects.remove(i)
+
+    def removeObjects(self, objects):
+        if len(objects) == 0: return
+        startTime = time.perf_counter()
 
-    def removeObjectAtIndex(self, index):
-        object = self.linkedObjects[index].object
-        if object is not None:
-            self.removeObject(object)
-        self.linkedObjects.remove(index)
+        dataBlocks = [(object.data, object.type) for object in objects]
+        for object in objects:
+            self.removeShapeKeys(object)
+        bpy.data.batch_remove(objects)
+        for data, type in dataBlocks:
+            self.removeObjectData(data, type)
 
-    def removeObject(self, object):
-        data = object.data
-        type = object.type
-        self.removeShapeKeys(object)
-        bpy.data.objects.remove(object)
-        self.removeObjectData(data, type)
+        statistics = statisticsByNode[self.identifier]
+        statistics.removed += len(objects)
+        statistics.removalTime += time.perf_counter() - startTime
 
     def removeObjectData(self, data, type):
         if data is None: return # the object was an empty
@@ -226,42 +300,35 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
             object.shape_key_remove(object.active_shape_key)
 
     def createNewObjects(self, amount, sourceObject, containers):
-        objects = []
+        startTime = time.perf_counter()
+
         nameSuffix = "instance_{}_".format(getRandomString(5))
-        for i in range(amount):
-            name = nameSuffix + str(i)
-            newObject = self.appendNewObject(name, sourceObject, containers)
-            objects.append(newObject)
-        return objects
+        objects = [self.newInstance(nameSuffix + str(i), sourceObject) for i in range(amount)]
+
+        for collection in self.getTargetCollections(containers):
+            link = collection.objects.link
+            for object in objects:
+                link(object)
 
-    def appendNewObject(self, name, sourceObject, containers):
-        object = self.newInstance(name, sourceObject)
-        self.linkObject(object, containers)
-        self.linkedObjects.add().object = object
-        return object
+        linkedObjects = self.linkedObjects
+        for object in objects:
+            linkedObjects.add().object = object
+
+        statistics = statisticsByNode[self.identifier]
+        statistics.created += amount
+        statistics.creationTime += time.perf_counter() - startTime
+        return objects
 
-    def linkObject(self, object, containers):
+    def getTargetCollections(self, containers):
+        containers = [container for container in containers if container is not None]
         if self.containerType == "MAIN_CONTAINER":
-            self.linkObjectToMainContainer(object, containers)
+            collections = [getMainObjectContainer(scene) for scene in containers]
         elif self.containerType == "SCENES":
-            self.linkObjectToScenes(object, containers)
+            collections = [scene.collection for scene in containers]
         else:
-            self.linkObjectToCollections(object, containers)
-
-    def linkObjectToMainContainer(self, object, scenes):
-        for scene in scenes:
-            if scene is None: continue
-            getMainObjectContainer(scene).objects.link(object)
-
-    def linkObjectToScenes(self, object, scenes):
-        for scene in scenes:
-            if scene is None: continue
-            scene.collection.objects.link(object)
-
-    def linkObjectToCollections(self, object, collections):
-        for collection in collections:
-            if collection is None: continue
-            collection.objects.link(object)
+            collections = containers
+        # every object can be linked only once to the same collection
+        return list(dict.fromkeys(collections))
 
     def newInstance(self, name, sourceObject):
         instanceData = self.getSourceObjectData(sourceObject)
@@ -310,6 +377,10 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
         self.resetInstances = True
 
     def unlinkInstancesFromNode(self):
+        # hidden instances are not visible to the user, so they are removed
+        totalAmount = len(self.linkedObjects)
+        self.removeObjectsInRange(totalAmount - self.hiddenInstancesAmount, totalAmount)
+        self.hiddenInstancesAmount = 0
         self.linkedObjects.clear()
         self.inputs.get("Instances").number = 0
 
@@ -318,3 +389,4 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
 
     def duplicate(self, sourceNode):
         self.linkedObjects.clear()
+        self.hiddenInstancesAmount = 0
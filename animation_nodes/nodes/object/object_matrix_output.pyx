@@ -94,3 +94,9 @@ class ObjectMatrixOutputNode(AnimationNode, bpy.types.Node):
         yield "    object.keyframe_insert('location')"
         yield "    object.keyframe_insert('rotation_euler')"
         yield "    object.keyframe_insert('scale')"
+
+    def getFrameCacheCode(self):
+        if self.useObjectList:
+            yield "AN.execution.frame_cache.recordObjectMatrices(objects)"
+        else:
+            yield "AN.execution.frame_cache.recordObjectMatrices((object, ))"
@@ -128,6 +128,9 @@ class ObjectTransformsOutputNode(AnimationNode, bpy.types.Node):
             if self.useScale[i]:
                 yield "    object.keyframe_insert('{}', index = {})".format(self.scalePath, i)
 
+    def getFrameCacheCode(self):
+        yield "AN.execution.frame_cache.recordObjectMatrices((object, ))"
+
     @property
     def locationPath(self):
         return "delta_location" if self.deltaTransforms else "location"
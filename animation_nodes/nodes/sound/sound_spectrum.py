@@ -5,6 +5,7 @@ from bpy.props import *
 from ... utils.scene import getFPS
 from ... base_types import AnimationNode
 from ... data_structures import DoubleList
+from ... data_structures.sounds.spectrum_cache import precomputeSpectraInBackground
 
 samplingMethodItems = [
     ("EXP", "Exponential", "Sample frequency bins exponentially", "", 0),
@@ -38,6 +39,9 @@ class SoundSpectrumNode(AnimationNode, bpy.types.Node):
     minDuration: FloatProperty(name = "Minimum Duration", default = 0, min = 0,
         description = ("The minimum duration of the sound used to compute the spectrum."
         " High value corresponds to higher spectral resolution but introduce overlapping spectrum"))
+    precomputeSpectra: BoolProperty(name = "Precompute Spectra", default = False,
+        description = ("Compute the spectra of the whole frame range of the scene in the background."
+        " The spectra are shared by all nodes that use the same sound"))
 
     samplingMethod: EnumProperty(name = "Sampling Method", default = "EXP",
         items = samplingMethodItems, update = AnimationNode.refresh)
@@ -75,6 +79,7 @@ class SoundSpectrumNode(AnimationNode, bpy.types.Node):
         layout.prop(self, "smoothingSamples")
         layout.prop(self, "kaiserBeta")
         layout.prop(self, "minDuration")
+        layout.prop(self, "precomputeSpectra")
 
     def getExecutionFunctionName(self):
         if self.samplingMethod == "EXP": return "executeExponential"
@@ -88,9 +93,7 @@ class SoundSpectrumNode(AnimationNode, bpy.types.Node):
         if not isValidRange(low, high): self.raiseErrorMessage("Invalid interval!")
         if count < 1: self.raiseErrorMessage("Invalid count!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         maxFrequency = len(spectrum) - 1
 
         scale = expm1(exponentialRate) / (high - low)
@@ -108,9 +111,7 @@ class SoundSpectrumNode(AnimationNode, bpy.types.Node):
         if len(sound.soundSequences) == 0: self.raiseErrorMessage("Empty sound!")
         if not isValidRange(low, high): self.raiseErrorMessage("Invalid interval!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         maxFrequency = len(spectrum) - 1
 
         reductionFunction = reductionFunctions[self.reductionFunction]
@@ -120,9 +121,7 @@ class SoundSpectrumNode(AnimationNode, bpy.types.Node):
         if len(sound.soundSequences) == 0: self.raiseErrorMessage("Empty sound!")
         if not isValidCustomList(pins): self.raiseErrorMessage("Invalid pins list!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         maxFrequency = len(spectrum) - 1
 
         bins = DoubleList(len(pins) - 1)
@@ -135,11 +134,19 @@ class SoundSpectrumNode(AnimationNode, bpy.types.Node):
     def executeFull(self, sound, frame, attack, release, amplitude, scene):
         if len(sound.soundSequences) == 0: self.raiseErrorMessage("Empty sound!")
 
-        spectrum = sound.computeTimeSmoothedSpectrum(frame / getFPS(scene),
-            frame / getFPS(scene) + max(1 / getFPS(scene), self.minDuration),
-            attack, release, self.smoothingSamples, self.kaiserBeta)
+        spectrum = self.computeSpectrum(sound, frame, attack, release, scene)
         return DoubleList.fromNumpyArray(spectrum * amplitude)
 
+    def computeSpectrum(self, sound, frame, attack, release, scene):
+        fps = getFPS(scene)
+        duration = max(1 / fps, self.minDuration)
+        if self.precomputeSpectra:
+            precomputeSpectraInBackground(sound, range(scene.frame_start, scene.frame_end + 1),
+                fps, duration, self.smoothingSamples, self.kaiserBeta)
+
+        return sound.computeTimeSmoothedSpectrum(frame / fps, frame / fps + duration,
+            attack, release, self.smoothingSamples, self.kaiserBeta)
+
 def isValidRange(low, high):
     if low >= high: return False
     if low < 0 or low > 1: return False
@@ -1,7 +1,9 @@
 import bpy
 from bpy.props import *
 from ... base_types import AnimationNode, VectorizedSocket
-from ... data_structures.splines.to_blender import setSplinesOnBlenderObject
+from ... data_structures.splines.spline_collection import SplineCollection, haveSameSplineType
+from ... data_structures.splines.to_blender import (setSplinesOnBlenderObject,
+                                                    setSplineCollectionOnBlenderObject)
 
 class CurveObjectOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_CurveObjectOutputNode"
@@ -66,7 +68,10 @@ class CurveObjectOutputNode(AnimationNode, bpy.types.Node):
         if s["Bevel Mode"].isUsed:          yield "    self.setBevelMode(curve, bevelMode)"
 
     def setSplines(self, object, splines):
-        setSplinesOnBlenderObject(object, splines)
+        if haveSameSplineType(splines):
+            setSplineCollectionOnBlenderObject(object, SplineCollection.fromSplines(splines))
+        else:
+            setSplinesOnBlenderObject(object, splines)
 
     def setTaperMode(self, curve, taperMode):
         if taperMode in ("OVERRIDE", "MULTIPLY", "ADD"):
@@ -1,7 +1,8 @@
 import bpy
 from bpy.props import *
 from mathutils import Matrix
-from ... data_structures import Spline
+from ... data_structures import Spline, Matrix4x4List
+from ... data_structures.splines.spline_collection import SplineCollection, haveSameSplineType
 from ... base_types import AnimationNode, VectorizedSocket
 
 transformationTypeItems = [
@@ -42,23 +43,22 @@ class ReplicateSplineNode(AnimationNode, bpy.types.Node):
     def execute_MatrixList(self, splines, matrices):
         if isinstance(splines, Spline):
             splines = [splines]
-
-        outSplines = []
-        for matrix in matrices:
-            for spline in splines:
-                newSpline = spline.copy()
-                newSpline.transform(matrix)
-                outSplines.append(newSpline)
-        return outSplines
+        return replicateSplines(splines, matrices)
 
     def execute_VectorList(self, splines, vectors):
         if isinstance(splines, Spline):
             splines = [splines]
+        matrices = Matrix4x4List.fromValues([Matrix.Translation(vector) for vector in vectors])
+        return replicateSplines(splines, matrices)
+
+def replicateSplines(splines, matrices):
+    if haveSameSplineType(splines):
+        return SplineCollection.fromSplines(splines).replicate(matrices).toSplines()
 
-        outSplines = []
-        for vector in vectors:
-            for spline in splines:
-                newSpline = spline.copy()
-                newSpline.transform(Matrix.Translation(vector))
-                outSplines.append(newSpline)
-        return outSplines
+    outSplines = []
+    for matrix in matrices:
+        for spline in splines:
+            newSpline = spline.copy()
+            newSpline.transform(matrix)
+            outSplines.append(newSpline)
+    return outSplines
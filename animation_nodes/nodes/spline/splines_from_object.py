@@ -4,7 +4,7 @@ from ... base_types import AnimationNode
 from ... utils.depsgraph import getEvaluatedID
 from ... data_structures.splines.bezier_spline import BezierSpline
 from ... data_structures.splines.from_blender import (
-    createSplinesFromBlenderObject,
+    createTransformedSplinesFromBlenderObject,
     createSplineFromBlenderSpline
 )
 
@@ -65,8 +65,5 @@ class SplinesFromObjectNode(AnimationNode, bpy.types.Node):
             self.raiseErrorMessage("Not a curve or a font object.")
 
         evaluatedObject = getEvaluatedID(bObject)
-        splines = createSplinesFromBlenderObject(evaluatedObject, applyModifiers)
-        if useWorldSpace:
-            for spline in splines:
-                spline.transform(evaluatedObject.matrix_world)
-        return splines
+        matrix = evaluatedObject.matrix_world if useWorldSpace else None
+        return createTransformedSplinesFromBlenderObject(evaluatedObject, matrix, applyModifiers)
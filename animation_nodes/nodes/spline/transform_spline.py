@@ -2,6 +2,7 @@ import bpy
 from mathutils import Matrix
 from ... base_types import AnimationNode, VectorizedSocket
 from ... data_structures import VirtualPyList, VirtualMatrix4x4List, Spline
+from ... data_structures.splines.spline_collection import SplineCollection, haveSameSplineType
 
 class TransformSplineNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_TransformSplineNode"
@@ -39,6 +40,9 @@ class TransformSplineNode(AnimationNode, bpy.types.Node):
         return spline
 
     def execute_SingleSpline_MultipleMatrix(self, spline, matrices):
+        if haveSameSplineType([spline]):
+            return SplineCollection.fromSplines([spline]).replicate(matrices).toSplines()
+
         outSplines = []
         for matrix in matrices:
             s = spline.copy()
@@ -1,11 +1,11 @@
 import bpy
 from . spline_evaluation_base import SplineEvaluationBase
 from ... base_types import AnimationNode, VectorizedSocket
+from ... data_structures.splines.spline_collection import SplineCollection, haveSameSplineType
 
 class TrimSplineNode(AnimationNode, bpy.types.Node, SplineEvaluationBase):
     bl_idname = "an_TrimSplineNode"
     bl_label = "Trim Spline"
-    codeEffects = [VectorizedSocket.CodeEffect]
 
     useSplineList: VectorizedSocket.newProperty()
     useStartList: VectorizedSocket.newProperty()
@@ -36,9 +36,31 @@ class TrimSplineNode(AnimationNode, bpy.types.Node, SplineEvaluationBase):
         col.active = self.parameterType == "UNIFORM"
         col.prop(self, "resolution")
 
+    def getCodeEffects(self):
+        if self.trimsWholeList:
+            return []
+        return [VectorizedSocket.CodeEffect(self)]
+
     def getExecutionCode(self, required):
+        if self.trimsWholeList:
+            return "trimmedSplines = self.trimSplineList(splines, start, end)"
         return "trimmedSpline = self.trimSpline(spline, start, end)"
 
+    @property
+    def trimsWholeList(self):
+        return self.useSplineList and not (self.useStartList or self.useEndList)
+
+    def trimSplineList(self, splines, start, end):
+        # all splines are trimmed in one pass when they have the same parameters
+        _start = min(max(start, 0.0), 1.0)
+        _end = min(max(end, 0.0), 1.0)
+        if (self.parameterType == "RESOLUTION" and _start != _end and
+                not (start < 0.00001 and end > 0.99999) and haveSameSplineType(splines)):
+            collection = SplineCollection.fromSplines(splines)
+            if collection.isEvaluable():
+                return collection.getTrimmedCopy(_start, _end).toSplines()
+        return [self.trimSpline(spline, start, end) for spline in splines]
+
     def trimSpline(self, spline, start, end):
         if not spline.isEvaluable() or (start < 0.00001 and end > 0.99999):
             return spline.copy()
@@ -3,7 +3,9 @@ from bpy.props import *
 from ... sockets.info import toDataType
 from ... base_types import AnimationNode
 from ... events import executionCodeChanged
+from . subprogram_cache import subprogramCache
 from ... utils.blender_ui import getDpiFactor
+from ... execution.measurements import prettyBytes
 from ... utils.enum_items import cacheEnumItems
 from ... tree_info import (getSubprogramNetworks,
                            getNodeByIdentifier,
@@ -15,15 +17,12 @@ cacheTypeItems = [
     ("FRAME_BASED", "Once per Frame", ""),
     ("INPUT_BASED", "Once per Input", "")]
 
-oneTimeCache = {}
-frameBasedCache = {}
-inputBasedCache = {}
-
 class InvokeSubprogramNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_InvokeSubprogramNode"
     bl_label = "Invoke Subprogram"
     bl_width_default = 160
     dynamicLabelType = "HIDDEN_ONLY"
+    options = {"VOLATILE"}
 
     subprogramIdentifier: StringProperty(name = "Subprogram Identifier", default = "",
         update = AnimationNode.refresh)
@@ -80,26 +79,18 @@ class InvokeSubprogramNode(AnimationNode, bpy.types.Node):
             return lines
 
     def getCachedData(self, *args):
+        return subprogramCache.get(self.getCacheKey(args), self.identifier)
+
+    def setCacheData(self, data, *args):
+        subprogramCache.set(self.getCacheKey(args), self.identifier, data)
+
+    def getCacheKey(self, args):
         if self.cacheType == "ONE_TIME":
-            try: return True, oneTimeCache[self.identifier]
-            except: pass
+            return ("ONE_TIME", self.identifier)
         if self.cacheType == "FRAME_BASED":
-            try: return True, frameBasedCache[self.identifier][str(self.nodeTree.scene.frame_current)]
-            except: pass
+            return ("FRAME_BASED", self.identifier, self.nodeTree.scene.frame_current)
         if self.cacheType == "INPUT_BASED":
-            try: return True, inputBasedCache[self.subprogramIdentifier][self.getArgsHash(args)]
-            except: pass
-
-        return False, None
-
-    def setCacheData(self, data, *args):
-        if self.cacheType == "ONE_TIME": oneTimeCache[self.identifier] = data
-        elif self.cacheType == "FRAME_BASED":
-            if self.identifier not in frameBasedCache: frameBasedCache[self.identifier] = {}
-            frameBasedCache[self.identifier][str(self.nodeTree.scene.frame_current)] = data
-        elif self.cacheType == "INPUT_BASED":
-            if self.subprogramIdentifier not in inputBasedCache: inputBasedCache[self.subprogramIdentifier] = {}
-            inputBasedCache[self.subprogramIdentifier][self.getArgsHash(args)] = data
+            return ("INPUT_BASED", self.subprogramIdentifier, self.getArgsHash(args))
 
     def getArgsHash(self, args):
         return tuple(hash(arg.freeze() if hasattr(arg, "freeze") else arg) for arg in args)
@@ -130,6 +121,8 @@ class InvokeSubprogramNode(AnimationNode, bpy.types.Node):
 
     def drawAdvanced(self, layout):
         self.drawCacheOptions(layout)
+        if self.cacheType != "DISABLED":
+            self.drawCacheStatistics(layout)
         col = layout.column()
         col.active = self.cacheType == "DISABLED"
         col.prop(self, "showCacheOptions")
@@ -145,14 +138,23 @@ class InvokeSubprogramNode(AnimationNode, bpy.types.Node):
             if not self.isInputComparable: col.label(text = "  - The input is not comparable")
         self.invokeFunction(layout, "clearCache", text = "Clear Cache")
 
+    def drawCacheStatistics(self, layout):
+        statistics = subprogramCache.statistics[self.identifier]
+        col = layout.column(align = True)
+        col.label(text = "Hits: {:,d}  Misses: {:,d}".format(statistics.hits, statistics.misses))
+        col.label(text = "Evictions: {:,d}  From Disk: {:,d}".format(statistics.evictions, statistics.diskHits))
+        col.label(text = "Size: {}".format(prettyBytes(subprogramCache.getOwnerSize(self.identifier))))
+        col.label(text = "All Nodes: {}".format(prettyBytes(subprogramCache.size)))
+
     def checkCachingPossibilities(self):
         self.isInputComparable = all(socket.comparable for socket in self.inputs)
         self.isOutputStorable = all(socket.storable for socket in self.outputs)
 
     def clearCache(self):
-        oneTimeCache.pop(self.identifier, None)
-        frameBasedCache.pop(self.identifier, None)
-        inputBasedCache.pop(self.subprogramIdentifier, None)
+        subprogramCache.removeGroup("ONE_TIME", self.identifier)
+        subprogramCache.removeGroup("FRAME_BASED", self.identifier)
+        subprogramCache.removeGroup("INPUT_BASED", self.subprogramIdentifier)
+        subprogramCache.statistics.pop(self.identifier, None)
 
 
     @property
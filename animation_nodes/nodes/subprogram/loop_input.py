@@ -2,11 +2,12 @@ import re
 import bpy
 from bpy.props import *
 from operator import attrgetter
-from ... events import networkChanged
+from ... events import networkChanged, executionCodeChanged
 from ... utils.names import getRandomString
 from ... utils.layout import splitAlignment
 from ... tree_info import getNodeByIdentifier
 from ... base_types import AnimationNode
+from ... execution.units import getSubprogramUnitByIdentifier
 from . subprogram_base import SubprogramBaseNode
 from ... utils.nodes import newNodeAtCursor, invokeTranslation
 from ... sockets.info import toListDataType, toIdName, isBase, toListIdName, toBaseDataType
@@ -17,6 +18,10 @@ class LoopInputNode(AnimationNode, bpy.types.Node, SubprogramBaseNode):
     bl_label = "Loop Input"
     bl_width_default = 180
 
+    vectorize: BoolProperty(name = "Vectorize", default = True,
+        description = "Execute all iterations at once with list operations when all nodes in the loop support this, otherwise iteration by iteration",
+        update = executionCodeChanged)
+
     def setup(self):
         self.randomizeNetworkColor()
         self.subprogramName = "My Loop"
@@ -32,12 +37,16 @@ class LoopInputNode(AnimationNode, bpy.types.Node, SubprogramBaseNode):
             dataTypes = "LIST", text = "", icon = "ADD", emboss = False)
         right.label(text = "New Generator Output")
         layout.prop(self, "subprogramName", text = "", icon = "GROUP_VERTEX")
+        if self.isVectorized:
+            layout.label(text = "Vectorized", icon = "MOD_ARRAY")
 
     def drawAdvanced(self, layout):
         col = layout.column()
         col.label(text = "Description:")
         col.prop(self, "subprogramDescription", text = "")
 
+        layout.prop(self, "vectorize")
+
         layout.separator()
 
         col = layout.column()
@@ -245,6 +254,11 @@ class LoopInputNode(AnimationNode, bpy.types.Node, SubprogramBaseNode):
     def iterationsSocket(self):
         return self.outputs["Iterations"]
 
+    @property
+    def isVectorized(self):
+        unit = getSubprogramUnitByIdentifier(self.identifier)
+        return getattr(unit, "isVectorized", False)
+
     @property
     def iterateThroughLists(self):
         return len(self.getIteratorSockets()) > 0
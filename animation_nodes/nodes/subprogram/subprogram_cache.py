@@ -0,0 +1,224 @@
+import os
+import time
+import atexit
+import pickle
+import shutil
+import hashlib
+import tempfile
+from itertools import islice
+from collections import OrderedDict, defaultdict
+from ... utils.handlers import eventHandler
+from ... preferences import getPerformanceSettings
+from ... execution.measurements import getDataSize
+
+# Results of all Invoke Subprogram nodes are stored in one cache with a
+# size limit that can be changed in the preferences. The key of a result is
+#
+#     ("ONE_TIME", nodeIdentifier)
+#     ("FRAME_BASED", nodeIdentifier, frame)
+#     ("INPUT_BASED", subprogramIdentifier, argsHash)
+#
+# When the cache is full, one of the least recently used results is evicted.
+# From these candidates the result that was the fastest to calculate compared
+# to its size is removed first.
+#
+# Evicted frame based results can be written to a private temporary folder.
+# This only works for results that can be pickled (lists, meshes, splines, ...),
+# all others are discarded. The folder has its own size limit, when it is full
+# the results that have been written first are deleted.
+
+evictionCandidateAmount = 8
+
+# misses that are not followed by a result (e.g. because of an exception)
+# would be kept forever otherwise
+maxPendingMisses = 64
+
+class CacheEntry:
+    __slots__ = ("data", "size", "cost", "owner")
+
+    def __init__(self, data, size, cost, owner):
+        self.data = data
+        self.size = size
+        self.cost = cost
+        self.owner = owner
+
+    @property
+    def costPerByte(self):
+        return self.cost / max(self.size, 1)
+
+class CacheStatistics:
+    __slots__ = ("hits", "misses", "evictions", "diskHits")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.diskHits = 0
+
+class SubprogramCache:
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.size = 0
+        self.statistics = defaultdict(CacheStatistics)
+        self.missTimes = {}
+        self.spilledEntries = OrderedDict()
+        self.spilledSize = 0
+
+    def get(self, key, owner):
+        '''owner is the identifier of the node the statistics are collected for.'''
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            self.statistics[owner].hits += 1
+            return True, entry.data
+
+        if key in self.spilledEntries:
+            path, cost, size = self.spilledEntries.pop(key)
+            self.spilledSize -= size
+            success, data = loadSpilledData(path)
+            if success:
+                self.statistics[owner].diskHits += 1
+                self.insert(key, CacheEntry(data, getDataSize(data), cost, owner))
+                return True, data
+
+        self.statistics[owner].misses += 1
+        self.missTimes.pop(key, None)
+        self.missTimes[key] = time.perf_counter()
+        while len(self.missTimes) > maxPendingMisses:
+            del self.missTimes[next(iter(self.missTimes))]
+        return False, None
+
+    def set(self, key, owner, data):
+        startTime = self.missTimes.pop(key, None)
+        cost = 0 if startTime is None else time.perf_counter() - startTime
+        self.insert(key, CacheEntry(data, getDataSize(data), cost, owner))
+
+    def insert(self, key, entry):
+        self.remove(key)
+        if entry.size > getMaxCacheSize(): return
+        self.entries[key] = entry
+        self.size += entry.size
+        self.evict()
+
+    def evict(self):
+        maxSize = getMaxCacheSize()
+        while self.size > maxSize and len(self.entries) > 1:
+            # the newest entry is never a candidate
+            candidates = islice(self.entries.items(), min(evictionCandidateAmount, len(self.entries) - 1))
+            key, entry = min(candidates, key = lambda item: item[1].costPerByte)
+            self.remove(key)
+            self.statistics[entry.owner].evictions += 1
+            if key[0] == "FRAME_BASED" and getPerformanceSettings().spillSubprogramCache:
+                self.spill(key, entry)
+
+    def spill(self, key, entry):
+        self.removeSpilled(key)
+        try: path = getSpillPath(key)
+        except OSError: return
+        size = writeSpilledData(path, entry.data)
+        if size is None: return
+        self.spilledEntries[key] = (path, entry.cost, size)
+        self.spilledSize += size
+        self.evictSpilled()
+
+    def evictSpilled(self):
+        maxSize = getMaxSpillSize()
+        while self.spilledSize > maxSize and len(self.spilledEntries) > 0:
+            self.removeSpilled(next(iter(self.spilledEntries)))
+
+    def removeSpilled(self, key):
+        spilled = self.spilledEntries.pop(key, None)
+        if spilled is not None:
+            removeFile(spilled[0])
+            self.spilledSize -= spilled[2]
+
+    def remove(self, key):
+        self.missTimes.pop(key, None)
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry.size
+
+    def removeGroup(self, cacheType, identifier):
+        '''Removes all results of one cache type and node or subprogram.'''
+        for key in [key for key in self.entries if key[:2] == (cacheType, identifier)]:
+            self.remove(key)
+        for key in [key for key in self.missTimes if key[:2] == (cacheType, identifier)]:
+            del self.missTimes[key]
+        for key in [key for key in self.spilledEntries if key[:2] == (cacheType, identifier)]:
+            self.removeSpilled(key)
+
+    def getOwnerSize(self, owner):
+        return sum(entry.size for entry in self.entries.values() if entry.owner == owner)
+
+    def clear(self):
+        self.entries.clear()
+        self.size = 0
+        self.statistics.clear()
+        self.missTimes.clear()
+        self.spilledEntries.clear()
+        self.spilledSize = 0
+        removeSpillDirectory()
+
+subprogramCache = SubprogramCache()
+
+def getMaxCacheSize():
+    return getPerformanceSettings().subprogramCacheSize * 1024 * 1024
+
+def getMaxSpillSize():
+    return getPerformanceSettings().subprogramSpillSize * 1024 * 1024
+
+@eventHandler("FILE_LOAD_POST")
+def clearSubprogramCache():
+    subprogramCache.clear()
+
+def unregister():
+    subprogramCache.clear()
+
+
+# Disk Spilling
+###############################################
+
+spillDirectory = None
+
+def getSpillDirectory():
+    '''The folder is only accessible by the current user and created on demand.'''
+    global spillDirectory
+    if spillDirectory is None or not os.path.isdir(spillDirectory):
+        spillDirectory = tempfile.mkdtemp(prefix = "an_subprogram_cache_")
+    return spillDirectory
+
+@atexit.register
+def removeSpillDirectory():
+    global spillDirectory
+    if spillDirectory is not None:
+        shutil.rmtree(spillDirectory, ignore_errors = True)
+        spillDirectory = None
+
+def getSpillPath(key):
+    name = hashlib.sha1(repr(key).encode()).hexdigest()
+    return os.path.join(getSpillDirectory(), name + ".pickle")
+
+def writeSpilledData(path, data):
+    '''Returns the size of the file or None when the data could not be written.'''
+    try: content = pickle.dumps(data, protocol = pickle.HIGHEST_PROTOCOL)
+    except (pickle.PicklingError, TypeError, AttributeError): return None
+
+    try:
+        with open(path, "wb") as f:
+            f.write(content)
+    except OSError:
+        removeFile(path)
+        return None
+    return len(content)
+
+def loadSpilledData(path):
+    try:
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+    except Exception: return False, None
+    finally: removeFile(path)
+    return True, data
+
+def removeFile(path):
+    try: os.remove(path)
+    except OSError: pass
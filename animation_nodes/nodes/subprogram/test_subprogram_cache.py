@@ -0,0 +1,108 @@
+import os
+import stat
+from unittest import TestCase
+from . subprogram_cache import (
+    SubprogramCache, CacheEntry, maxPendingMisses, getSpillPath, getSpillDirectory,
+    writeSpilledData, loadSpilledData
+)
+from ... preferences import getPerformanceSettings
+from ... data_structures import (
+    Mesh, PolySpline, BezierSpline, Vector3DList, EdgeIndicesList, PolygonIndicesList,
+    FloatList, LongList, Attribute, AttributeType, AttributeDomain, AttributeDataType
+)
+
+class TestSpilling(TestCase):
+    def testLists(self):
+        data = (FloatList.fromValues([1, 2, 3]), [Vector3DList.fromValues([(1, 2, 3)])])
+        result = self.roundTrip(data)
+        self.assertEqual(result[0], data[0])
+        self.assertEqual(result[1][0], data[1][0])
+
+    def testMesh(self):
+        mesh = Mesh(Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (1, 1, 0), (0, 1, 0)]),
+                    EdgeIndicesList.fromValues([(0, 1), (1, 2), (2, 3), (3, 0)]),
+                    PolygonIndicesList.fromValues([(0, 1, 2, 3)]))
+        mesh.insertBuiltInAttribute(Attribute("Material Indices",
+                                              AttributeType.MATERIAL_INDEX,
+                                              AttributeDomain.FACE,
+                                              AttributeDataType.INT,
+                                              LongList.fromValues([3])))
+
+        result = self.roundTrip(mesh)
+        self.assertEqual(result.vertices, mesh.vertices)
+        self.assertEqual(result.edges, mesh.edges)
+        self.assertEqual(list(result.polygons), list(mesh.polygons))
+        attribute = result.getBuiltInAttribute("Material Indices")
+        self.assertTrue(attribute.similar(mesh.getBuiltInAttribute("Material Indices")))
+        self.assertEqual(attribute.data, [3])
+
+    def testSplines(self):
+        points = Vector3DList.fromValues([(0, 0, 0), (1, 0, 0), (1, 1, 0)])
+        polySpline = PolySpline(points, cyclic = True, materialIndex = 2)
+        bezierSpline = BezierSpline(points, points.copy(), points.copy())
+
+        result = self.roundTrip([polySpline, bezierSpline])
+        self.assertEqual(result[0].points, points)
+        self.assertEqual(result[0].radii, polySpline.radii)
+        self.assertTrue(result[0].cyclic)
+        self.assertEqual(result[0].materialIndex, 2)
+        self.assertEqual(result[1].type, "BEZIER")
+        self.assertEqual(result[1].leftHandles, points)
+
+    def testNotPicklable(self):
+        self.assertIsNone(writeSpilledData(getSpillPath(("FRAME_BASED", "test", 2)), lambda: 0))
+
+    def testPrivateDirectory(self):
+        mode = os.stat(getSpillDirectory()).st_mode
+        self.assertEqual(mode & (stat.S_IRWXG | stat.S_IRWXO), 0)
+
+    def roundTrip(self, data):
+        path = getSpillPath(("FRAME_BASED", "test", 1))
+        self.assertIsNotNone(writeSpilledData(path, data))
+        success, result = loadSpilledData(path)
+        self.assertTrue(success)
+        self.assertFalse(os.path.exists(path))
+        return result
+
+class TestSpillLimit(TestCase):
+    def setUp(self):
+        self.settings = getPerformanceSettings()
+        self.oldSize = self.settings.subprogramSpillSize
+        self.settings.subprogramSpillSize = 1
+        self.cache = SubprogramCache()
+
+    def tearDown(self):
+        self.cache.clear()
+        self.settings.subprogramSpillSize = self.oldSize
+
+    def testOldestResultsAreRemoved(self):
+        data = FloatList(length = 100000)
+        for frame in range(5):
+            self.cache.spill(("FRAME_BASED", "node", frame), CacheEntry(data, 0, 0, "node"))
+
+        self.assertLessEqual(self.cache.spilledSize, 1024 * 1024)
+        self.assertEqual(list(self.cache.spilledEntries), [("FRAME_BASED", "node", 3),
+                                                           ("FRAME_BASED", "node", 4)])
+        self.assertEqual(len(os.listdir(getSpillDirectory())), 2)
+
+    def testClearRemovesDirectory(self):
+        self.cache.spill(("FRAME_BASED", "node", 1), CacheEntry(FloatList(length = 10), 0, 0, "node"))
+        directory = getSpillDirectory()
+        self.cache.clear()
+        self.assertFalse(os.path.exists(directory))
+        self.assertEqual(self.cache.spilledSize, 0)
+
+class TestMissTimes(TestCase):
+    def testPendingMissesAreLimited(self):
+        cache = SubprogramCache()
+        for i in range(maxPendingMisses * 2):
+            cache.get(("FRAME_BASED", "node", i), "node")
+        self.assertEqual(len(cache.missTimes), maxPendingMisses)
+        self.assertIn(("FRAME_BASED", "node", maxPendingMisses * 2 - 1), cache.missTimes)
+
+    def testRemoveGroup(self):
+        cache = SubprogramCache()
+        cache.get(("FRAME_BASED", "a", 1), "a")
+        cache.get(("FRAME_BASED", "b", 1), "b")
+        cache.removeGroup("FRAME_BASED", "a")
+        self.assertEqual(list(cache.missTimes), [("FRAME_BASED", "b", 1)])
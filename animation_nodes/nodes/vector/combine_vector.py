@@ -36,6 +36,10 @@ class CombineVectorNode(AnimationNode, bpy.types.Node):
         else:
             yield "vector = Vector((x, y, z))"
 
+    def getVectorizedExecutionCode(self, required, varyingInputs):
+        if self.generatesList: return None
+        return ["vector = self.createVectorList(x, y, z)"]
+
     def createVectorList(self, x, y, z):
         x, y, z = VirtualDoubleList.createMultiple((x, 0), (y, 0), (z, 0))
         amount = VirtualDoubleList.getMaxRealLength(x, y, z)
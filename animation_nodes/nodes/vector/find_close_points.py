@@ -1,9 +1,7 @@
 import bpy
 from bpy.props import *
-from mathutils.kdtree import KDTree
 from ... base_types import AnimationNode
-from ... data_structures import EdgeIndicesList
-from .. mesh.c_utils import calculateEdgeLengths
+from ... data_structures import PointGrid
 
 modeItems = [
     ("AMOUNT", "Amount", "Find a specific amount of neighbors for each point", "NONE", 0),
@@ -33,57 +31,13 @@ class FindClosePointsNode(AnimationNode, bpy.types.Node):
 
     def getExecutionCode(self, required):
         if self.mode == "AMOUNT":
-            yield "edges = self.execute_Amount(points, amount)"
+            yield "edges, distances = self.execute_Amount(points, amount)"
         elif self.mode == "DISTANCE":
-            yield "edges = self.execute_Distance(points, maxDistance)"
-
-        if self.outputs["Distances"].isLinked:
-            yield "distances = self.calculateEdgeLengths(points, edges)"
+            yield "edges, distances = self.execute_Distance(points, maxDistance)"
 
     def execute_Amount(self, points, amount):
-        kdTree = self.buildKDTree(points)
-        amount = max(0, amount)
-
-        edges = EdgeIndicesList()
-        edgeSet = set()
-
-        for index, point in enumerate(points):
-            for foundPoint, foundIndex, distance in kdTree.find_n(point, amount + 1):
-                if foundIndex == index:
-                    continue
-
-                edge = (foundIndex, index) if foundIndex < index else (index, foundIndex)
-                if edge not in edgeSet:
-                    edgeSet.add(edge)
-                    edges.append(edge)
-
-        return edges
+        return PointGrid(points).findNearestNEdges(max(0, amount))
 
     def execute_Distance(self, points, maxDistance):
-        kdTree = self.buildKDTree(points)
         maxDistance = max(0, maxDistance)
-
-        edges = EdgeIndicesList()
-        edgeSet = set()
-
-        for index, point in enumerate(points):
-            for foundPoint, foundIndex, distance in kdTree.find_range(point, maxDistance):
-                if foundIndex == index:
-                    continue
-
-                edge = (foundIndex, index) if foundIndex < index else (index, foundIndex)
-                if edge not in edgeSet:
-                    edgeSet.add(edge)
-                    edges.append(edge)
-
-        return edges
-
-    def buildKDTree(self, points):
-        kdTree = KDTree(len(points))
-        for i, vector in enumerate(points):
-            kdTree.insert(vector, i)
-        kdTree.balance()
-        return kdTree
-
-    def calculateEdgeLengths(self, points, edges):
-        return calculateEdgeLengths(points, edges)
+        return PointGrid(points, maxDistance).findInRadiusEdges(maxDistance)
@@ -25,5 +25,9 @@ class SeparateVectorNode(AnimationNode, bpy.types.Node):
                 else:
                     yield "{} = vector[{}]".format(axis, i)
 
+    def getVectorizedExecutionCode(self, required, varyingInputs):
+        if self.useList: return None
+        return ["{0} = self.getAxisList(vector, '{0}')".format(axis) for axis in "xyz" if axis in required]
+
     def getAxisList(self, vectors, axis):
         return getAxisListOfVectorList(vectors, axis)
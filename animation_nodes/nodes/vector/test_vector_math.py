@@ -0,0 +1,37 @@
+from itertools import product
+from mathutils import Vector
+from unittest import TestCase
+from ... data_structures import Vector3DList, DoubleList
+from . vector_math import operationByName, operationsWithoutListParity
+
+testVectors = ((0, 0, 0), (1, 0, 0), (-2, 0.5, 3), (0, -1.5, 0), (2.5, 2.5, -2.5))
+testFloats = (-2, -0.5, 0, 1, 3)
+
+class TestListParity(TestCase):
+    def testOperations(self):
+        for operation in operationByName.values():
+            if operation.name in operationsWithoutListParity: continue
+            sockets = operation.type.split("_")
+            names = [socket[1:].lower() for socket in sockets]
+            valueSets = [testVectors if socket[0] == "v" else testFloats for socket in sockets]
+            for values in product(*valueSets):
+                with self.subTest(operation = operation.name, values = values):
+                    expected = executeExpression(operation, names, values)
+                    result = executeList(operation, values)
+                    for i in range(3):
+                        self.assertAlmostEqual(result[i], expected[i], places = 4)
+
+def executeExpression(operation, names, values):
+    values = [Vector(value) if isinstance(value, tuple) else value for value in values]
+    variables = dict(zip(names, values), Vector = Vector)
+    exec(operation.expression, variables)
+    return variables["result"]
+
+def executeList(operation, values):
+    lists = [Vector3DList.fromValues([value]) if isinstance(value, tuple)
+             else DoubleList.fromValues([value]) for value in values]
+    if len(lists) == 1:
+        return operation.execute_vA(*lists)[0]
+    if isinstance(values[1], tuple):
+        return operation.execute_vA_vB(*lists)[0]
+    return operation.execute_vA_fB(*lists)[0]
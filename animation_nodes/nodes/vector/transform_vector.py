@@ -27,3 +27,10 @@ class TransformVectorNode(AnimationNode, bpy.types.Node):
             yield "transformedVectors = AN.nodes.vector.c_utils.transformVirtualVectorList(amount, _vectors, _matrices)"
         else:
             yield "transformedVector = matrix @ vector"
+
+    def getVectorizedExecutionCode(self, required, varyingInputs):
+        if any((self.useVectorList, self.useMatrixList)): return None
+        return ["_vectors = VirtualVector3DList.create(vector, (0,0,0))",
+                "_matrices = VirtualMatrix4x4List.create(matrix, Matrix.Identity(4))",
+                "amount = VirtualVector3DList.getMaxRealLength(_vectors, _matrices)",
+                "transformedVector = AN.nodes.vector.c_utils.transformVirtualVectorList(amount, _vectors, _matrices)"]
@@ -113,6 +113,11 @@ operations[10] = new("Snap", "snap A", "vA_vStep",
                         round(a.z / step.z) * step.z if step.z != 0 else a.z))''',
     <void*>snapVec3)
 
+# Loops that use these operations are not executed with lists:
+#   Snap: the expression rounds ties to even, the list function rounds them up.
+#   Project: the expression returns nan when B is zero, the list function zero.
+operationsWithoutListParity = {"Snap", "Project"}
+
 operationItems = [(op.name, op.name, op.label, i) for i, op in operations.items()]
 operationByName = {op.name : op for op in operations.values()}
 
@@ -167,20 +172,29 @@ class VectorMathNode(AnimationNode, bpy.types.Node):
 
     def getExecutionCode(self, required):
         if self.generatesList:
-            currentType = self._operation.type
-            if currentType == "vA":
-                yield "results = self._operation.execute_vA(a)"
-            if currentType == "vA_vB":
-                yield "results = self._operation.execute_vA_vB(a, b)"
-            elif currentType == "vA_fLength":
-                yield "results = self._operation.execute_vA_fB(a, length)"
-            elif currentType == "vA_fFactor":
-                yield "results = self._operation.execute_vA_fB(a, factor)"
-            elif currentType == "vA_vStep":
-                yield "results = self._operation.execute_vA_vB(a, step)"
+            yield self.getListExecutionCode("results")
         else:
             yield self._operation.expression
 
+    def getVectorizedExecutionCode(self, required, varyingInputs):
+        if self.generatesList: return None
+        if self.operation in operationsWithoutListParity: return None
+        return [self.getListExecutionCode("result")]
+
+    def getListExecutionCode(self, resultName):
+        currentType = self._operation.type
+        if currentType == "vA":
+            code = "self._operation.execute_vA(a)"
+        elif currentType == "vA_vB":
+            code = "self._operation.execute_vA_vB(a, b)"
+        elif currentType == "vA_fLength":
+            code = "self._operation.execute_vA_fB(a, length)"
+        elif currentType == "vA_fFactor":
+            code = "self._operation.execute_vA_fB(a, factor)"
+        elif currentType == "vA_vStep":
+            code = "self._operation.execute_vA_vB(a, step)"
+        return "{} = {}".format(resultName, code)
+
     @property
     def _operation(self):
         return operationByName[self.operation]
@@ -17,11 +17,22 @@ from ... graphics.import_shader import getShader
 from ... graphics.c_utils import getMatricesVBOandIBO
 
 dataByIdentifier = {}
+matrixShader = None
 
 class DrawData:
+    '''
+    The batch is created when the data is drawn the first time and
+    reused in every redraw until the node is executed again.
+    '''
     def __init__(self, data, drawFunction):
         self.data = data
         self.drawFunction = drawFunction
+        self.batch = None
+        self.totalAmount = 0 if isinstance(data, Spline) else len(data)
+        self.drawnAmount = self.totalAmount
+
+    def draw(self):
+        self.drawFunction(self)
 
 drawableDataTypes = (Vector3DList, Vector2DList, Matrix4x4List, Vector, Matrix, Spline)
 
@@ -49,6 +60,14 @@ class Viewer3DNode(AnimationNode, bpy.types.Node):
 
     pointAmount: IntProperty(name = "Amount", default = 50, update = drawPropertyChanged)
 
+    useLevelOfDetail: BoolProperty(name = "Level of Detail", default = True,
+        description = "Only draw a part of very long vector and matrix lists",
+        update = drawPropertyChanged)
+
+    maxDrawAmount: IntProperty(name = "Max Amount", default = 1000000, min = 1,
+        description = "Maximum amount of vectors or matrices that are drawn",
+        update = drawPropertyChanged)
+
     def create(self):
         self.newInput("Generic", "Data", "data")
 
@@ -72,6 +91,17 @@ class Viewer3DNode(AnimationNode, bpy.types.Node):
                 col.prop(self, "pointAmount")
             col.prop(self, "drawColor", text = "")
 
+        drawData = dataByIdentifier[self.identifier]
+        if drawData.drawnAmount < drawData.totalAmount:
+            col.label(text = "Drawing {:,d} of {:,d}".format(drawData.drawnAmount, drawData.totalAmount), icon = "INFO")
+
+    def drawAdvanced(self, layout):
+        col = layout.column(align = True)
+        col.prop(self, "useLevelOfDetail")
+        subcol = col.column(align = True)
+        subcol.active = self.useLevelOfDetail
+        subcol.prop(self, "maxDrawAmount")
+
     def execute(self, data):
         self.freeDrawingData()
         if not isinstance(data, drawableDataTypes):
@@ -91,45 +121,59 @@ class Viewer3DNode(AnimationNode, bpy.types.Node):
         elif isinstance(data, Spline):
             dataByIdentifier[self.identifier] = DrawData(data, self.drawSpline)
 
-    def drawVectors(self, vectors):
+    def drawVectors(self, drawData):
         shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
-        batch = batch_for_shader(shader, 'POINTS', {"pos": vectors.asNumpyArray().reshape(-1, 3)})
+        if drawData.batch is None:
+            vectors = self.getDecimatedList(drawData)
+            drawData.batch = batch_for_shader(shader, 'POINTS', {"pos": vectors.asNumpyArray().reshape(-1, 3)})
 
         shader.bind()
         shader.uniform_float("color", (*self.drawColor, 1))
 
         glPointSize(self.width)
-        batch.draw(shader)
+        drawData.batch.draw(shader)
 
-    def drawMatrices(self, matrices):
-        shader = getShader(os.path.join(os.path.dirname(__file__), "matrix_shader.glsl"))
-        vbo, ibo = getMatricesVBOandIBO(matrices, self.matrixScale)
-        batch = batch_for_shader(shader, 'LINES',
-            {"pos": vbo.asNumpyArray().reshape(-1, 3)},
-            indices = ibo.asNumpyArray().reshape(-1, 2))
+    def drawMatrices(self, drawData):
+        shader = getMatrixShader()
+        if drawData.batch is None:
+            matrices = self.getDecimatedList(drawData)
+            vbo, ibo = getMatricesVBOandIBO(matrices, self.matrixScale)
+            drawData.batch = batch_for_shader(shader, 'LINES',
+                {"pos": vbo.asNumpyArray().reshape(-1, 3)},
+                indices = ibo.asNumpyArray().reshape(-1, 2))
 
         shader.bind()
         viewMatrix = bpy.context.region_data.perspective_matrix
         shader.uniform_float("u_ViewProjectionMatrix", viewMatrix)
-        shader.uniform_int("u_Count", len(matrices))
+        shader.uniform_int("u_Count", drawData.drawnAmount)
 
         glLineWidth(self.width)
-        batch.draw(shader)
-
-    def drawSpline(self, spline):
-        vectors = spline.points
-        if spline.isEvaluable() and isinstance(spline, BezierSpline):
-            vectors = spline.getDistributedPoints(self.pointAmount, 0, 1, 'RESOLUTION')
-        lineType = 'LINE_LOOP' if spline.cyclic else 'LINE_STRIP'
+        drawData.batch.draw(shader)
 
+    def drawSpline(self, drawData):
         shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
-        batch = batch_for_shader(shader, lineType, {"pos": vectors.asNumpyArray().reshape(-1, 3)})
+        if drawData.batch is None:
+            spline = drawData.data
+            vectors = spline.points
+            if spline.isEvaluable() and isinstance(spline, BezierSpline):
+                vectors = spline.getDistributedPoints(self.pointAmount, 0, 1, 'RESOLUTION')
+            lineType = 'LINE_LOOP' if spline.cyclic else 'LINE_STRIP'
+            drawData.batch = batch_for_shader(shader, lineType, {"pos": vectors.asNumpyArray().reshape(-1, 3)})
 
         shader.bind()
         shader.uniform_float("color", (*self.drawColor, 1))
 
         glLineWidth(self.width)
-        batch.draw(shader)
+        drawData.batch.draw(shader)
+
+    def getDecimatedList(self, drawData):
+        '''Uses only every n-th element when the list is longer than the max amount.'''
+        data = drawData.data
+        if self.useLevelOfDetail and len(data) > self.maxDrawAmount:
+            step = -(-len(data) // self.maxDrawAmount)
+            data = data[::step]
+        drawData.drawnAmount = len(data)
+        return data
 
     def delete(self):
         self.freeDrawingData()
@@ -142,9 +186,14 @@ class Viewer3DNode(AnimationNode, bpy.types.Node):
         if self.identifier in dataByIdentifier:
             return dataByIdentifier[self.identifier].data
 
+def getMatrixShader():
+    global matrixShader
+    if matrixShader is None:
+        matrixShader = getShader(os.path.join(os.path.dirname(__file__), "matrix_shader.glsl"))
+    return matrixShader
+
 @drawHandler("SpaceView3D", "WINDOW", "POST_VIEW")
 def draw():
     for node in getNodesByType("an_Viewer3DNode"):
         if node.enabled and node.identifier in dataByIdentifier:
-            drawData = dataByIdentifier[node.identifier]
-            drawData.drawFunction(drawData.data)
+            dataByIdentifier[node.identifier].draw()
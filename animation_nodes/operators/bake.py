@@ -1,6 +1,12 @@
 import bpy
 from bpy.props import *
+from .. problems import canExecute
+from .. update import updateEverything
+from .. execution import frame_cache
+from .. execution.frame_cache import getUnsupportedNodes
 from .. preferences import getPreferences
+from .. utils.nodes import getAnimationNodeTrees
+from .. execution.units import setupExecutionUnits, finishExecutionUnits
 
 class BakeAnimation(bpy.types.Operator):
     bl_idname = "an.bake_to_keyframes"
@@ -39,3 +45,79 @@ class BakeAnimation(bpy.types.Operator):
         getPreferences().executionCode.type = "DEFAULT"
         bpy.context.window_manager.event_timer_remove(self.timer)
         return {"FINISHED"}
+
+class BakeFrameCache(bpy.types.Operator):
+    bl_idname = "an.bake_frame_cache"
+    bl_label = "Bake Frame Cache"
+    bl_description = ("Execute all node trees for every frame without redrawing and "
+                      "store the output objects and meshes so that they can be loaded later")
+
+    startFrame: IntProperty(default = 1)
+    endFrame: IntProperty(default = 250)
+
+    def execute(self, context):
+        scene = context.scene
+        oldFrame = scene.frame_current
+
+        settings = getPreferences().executionCode
+        oldType = settings.type
+        settings.type = "FRAME_CACHE"
+        updateEverything()
+
+        nodeTrees = [tree for tree in getAnimationNodeTrees()
+                     if tree.autoExecution.enabled and tree.hasMainExecutionUnits]
+        if len(nodeTrees) == 0 or not canExecute():
+            settings.type = oldType
+            self.report({"ERROR"}, "There is no node tree that can be executed")
+            return {"CANCELLED"}
+
+        # the changes of other output nodes would be lost when the cache is loaded
+        unsupportedTrees = [tree for tree in nodeTrees if not tree.frameCache.isSupported(tree)]
+        missingDirectoryTrees = [tree for tree in nodeTrees if tree.frameCache.getDirectory(tree) is None]
+        nodeTrees = [tree for tree in nodeTrees
+                     if tree not in unsupportedTrees and tree not in missingDirectoryTrees]
+        if len(nodeTrees) == 0:
+            settings.type = oldType
+            updateEverything()
+            self.reportSkippedTrees(unsupportedTrees, missingDirectoryTrees, {"ERROR"})
+            return {"CANCELLED"}
+
+        wm = context.window_manager
+        wm.progress_begin(self.startFrame, self.endFrame)
+        frame_cache.bakingFrameCache = True
+        setupExecutionUnits(nodeTrees)
+        try:
+            for frame in range(self.startFrame, self.endFrame + 1):
+                scene.frame_set(frame)
+                recorders = []
+                for tree in nodeTrees:
+                    with frame_cache.FrameRecorder() as recorder:
+                        tree._execute()
+                    recorders.append((tree, recorder))
+
+                # the world matrices are only correct after the update
+                context.view_layer.update()
+                for tree, recorder in recorders:
+                    recorder.write(tree.frameCache.getFramePath(tree, frame))
+                wm.progress_update(frame)
+        finally:
+            wm.progress_end()
+            finishExecutionUnits(nodeTrees)
+            frame_cache.bakingFrameCache = False
+            settings.type = oldType
+            updateEverything()
+
+        for tree in nodeTrees:
+            tree.frameCache.enabled = True
+        scene.frame_set(oldFrame)
+        self.reportSkippedTrees(unsupportedTrees, missingDirectoryTrees, {"WARNING"})
+        return {"FINISHED"}
+
+    def reportSkippedTrees(self, unsupportedTrees, missingDirectoryTrees, reportType):
+        for tree in unsupportedTrees:
+            nodeNames = ", ".join(node.name for node in getUnsupportedNodes(tree))
+            self.report(reportType, "{} has not been baked, because these nodes don't support the frame cache: {}".format(
+                repr(tree.name), nodeNames))
+        for tree in missingDirectoryTrees:
+            self.report(reportType, "{} has not been baked, because there is no frame cache directory; "
+                "save the file or set a directory".format(repr(tree.name)))
@@ -41,6 +41,8 @@ class ProfileAnimationNodes(bpy.types.Operator):
             execute_UpdateEverything()
         elif self.function == "SCRIPT_GENERATION":
             execute_ScriptGeneration()
+        elif self.function == "TREE_ANALYSIS_INCREMENTAL":
+            execute_TreeAnalysisIncremental()
 
     def getOutputTextBlock(self):
         textBlockName = "Profiling"
@@ -55,6 +57,12 @@ def execute_TreeExecutiong():
 
 def execute_TreeAnalysis():
     from .. import tree_info
+    tree_info.treeChanged()
+    tree_info.update()
+
+def execute_TreeAnalysisIncremental():
+    from .. import tree_info
+    tree_info.treeChanged(bpy.context.space_data.edit_tree.name)
     tree_info.update()
 
 def execute_UpdateEverything():
@@ -49,7 +49,8 @@ class ProfilingProperties(bpy.types.PropertyGroup):
         ("EXECUTION", "Execution", "", "NONE", 0),
         ("TREE_ANALYSIS", "Tree Analysis", "", "NONE", 1),
         ("UPDATE_EVERYTHING", "Update Everything", "", "NONE", 2),
-        ("SCRIPT_GENERATION", "Script Generation", "", "NONE", 3)]
+        ("SCRIPT_GENERATION", "Script Generation", "", "NONE", 3),
+        ("TREE_ANALYSIS_INCREMENTAL", "Tree Analysis (Active Tree)", "Only analyse the active node tree again", "NONE", 4)]
 
     profilingOutputTypeItems = [
         ("CONSOLE", "Console", "", "CONSOLE", 0),
@@ -86,14 +87,19 @@ class ExecutionCodeProperties(bpy.types.PropertyGroup):
     def settingChanged(self, context):
         from . events import executionCodeChanged
         from . base_types.nodes.base_node import updateNodeLabelMode
+        from . execution.measurements import updateMemoryTracing
         executionCodeChanged()
         updateNodeLabelMode()
+        updateMemoryTracing()
 
     executionCodeTypeItems = [
         ("DEFAULT", "Default", "", "NONE", 0),
         ("MONITOR", "Monitor Execution", "", "NONE", 1),
         ("MEASURE", "Measure Execution Times", "", "NONE", 2),
-        ("BAKE", "Bake", "", "NONE", 3)]
+        ("BAKE", "Bake", "", "NONE", 3),
+        ("INCREMENTAL", "Incremental Execution", "Only execute nodes whose inputs changed", "NONE", 4),
+        ("MEASURE_MEMORY", "Measure Memory Usage", "Measure memory allocations of the individual nodes", "NONE", 5),
+        ("FRAME_CACHE", "Frame Cache", "Record the output data for the frame cache", "NONE", 6)]
 
     type: EnumProperty(name = "Execution Code Type", default = "DEFAULT",
         description = "Different execution codes can be useful in different contexts",
@@ -111,6 +117,46 @@ class ExecutionCodeProperties(bpy.types.PropertyGroup):
         get = get_MeasureExecution, set = set_MeasureExecution,
         description = "Measure execution times of the individual nodes")
 
+    usePersistentCodeCache: BoolProperty(name = "Persistent Code Cache", default = True,
+        description = "Store compiled execution code on disk to reuse it after a restart")
+
+    codeCacheDirectory: StringProperty(name = "Code Cache Directory", default = "",
+        description = "Directory for the compiled execution code, it must only be writable by you (uses the Blender user directory when empty)",
+        subtype = "DIR_PATH")
+
+    codeCacheSize: IntProperty(name = "Code Cache Size", default = 64, min = 1,
+        description = "Maximum size of the compiled code on disk in MB")
+
+class PerformanceProperties(bpy.types.PropertyGroup):
+    bl_idname = "an_PerformanceProperties"
+
+    def threadAmountChanged(self, context):
+        from . utils.parallel import setThreadAmount
+        setThreadAmount(self.threadAmount)
+
+    threadAmount: IntProperty(name = "Threads", default = 0, min = 0, soft_max = 64,
+        description = "Maximum amount of threads used to process large lists (0 uses all cores)",
+        update = threadAmountChanged)
+
+    def subprogramCacheSizeChanged(self, context):
+        from . nodes.subprogram.subprogram_cache import subprogramCache
+        subprogramCache.evict()
+
+    subprogramCacheSize: IntProperty(name = "Subprogram Cache Size", default = 1024, min = 1,
+        description = "Maximum size of all results cached by Invoke Subprogram nodes in MB",
+        update = subprogramCacheSizeChanged)
+
+    spillSubprogramCache: BoolProperty(name = "Spill to Disk", default = False,
+        description = "Write evicted frame based subprogram results to a temporary folder instead of discarding them")
+
+    def subprogramSpillSizeChanged(self, context):
+        from . nodes.subprogram.subprogram_cache import subprogramCache
+        subprogramCache.evictSpilled()
+
+    subprogramSpillSize: IntProperty(name = "Subprogram Spill Size", default = 4096, min = 1,
+        description = "Maximum size of the subprogram results in the temporary folder in MB",
+        update = subprogramSpillSizeChanged)
+
 class DrawMeshIndicesProperties(bpy.types.PropertyGroup):
     bl_idname = "an_DrawMeshIndicesProperties"
     _drawVertices = _drawEdges = _drawPolygons = False
@@ -158,6 +204,7 @@ class AnimationNodesPreferences(bpy.types.AddonPreferences):
     nodeColors: PointerProperty(type = NodeColorProperties)
     developer: PointerProperty(type = DeveloperProperties)
     executionCode: PointerProperty(type = ExecutionCodeProperties)
+    performance: PointerProperty(type = PerformanceProperties)
     drawHandlers: PointerProperty(type = DrawHandlerProperties)
 
     showUninstallInfo: BoolProperty(name = "Show Deinstall Info", default = False,
@@ -180,6 +227,22 @@ class AnimationNodesPreferences(bpy.types.AddonPreferences):
         col.prop(self.developer, "debug")
         col.prop(self.developer, "runTests")
 
+        col = layout.column(align = True)
+        col.prop(self.executionCode, "usePersistentCodeCache")
+        subcol = col.column(align = True)
+        subcol.active = self.executionCode.usePersistentCodeCache
+        subcol.prop(self.executionCode, "codeCacheDirectory", text = "Directory")
+        row = subcol.row(align = True)
+        row.prop(self.executionCode, "codeCacheSize", text = "Size (MB)")
+        row.operator("an.clear_code_cache", text = "", icon = "TRASH")
+
+        layout.prop(self.performance, "threadAmount")
+        row = layout.row(align = True)
+        row.prop(self.performance, "subprogramCacheSize", text = "Subprogram Cache (MB)")
+        row.prop(self.performance, "spillSubprogramCache", toggle = True)
+        if self.performance.spillSubprogramCache:
+            layout.prop(self.performance, "subprogramSpillSize", text = "Spilled Results (MB)")
+
         col = layout.column(align = True)
         col.split(factor = 0.25).prop(self, "showUninstallInfo", text = "How to Uninstall?",
             toggle = True, icon = "INFO")
@@ -199,6 +262,9 @@ def getExecutionCodeSettings():
 def getExecutionCodeType():
     return getExecutionCodeSettings().type
 
+def getPerformanceSettings():
+    return getPreferences().performance
+
 def getColorSettings():
     return getPreferences().nodeColors
 
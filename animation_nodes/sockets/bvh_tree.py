@@ -1,6 +1,7 @@
 import bpy
 from bpy.props import *
 from mathutils.bvhtree import BVHTree
+from .. data_structures import TriangleBVH
 from .. events import propertyChanged
 from .. utils.depsgraph import getEvaluatedID
 from .. base_types import AnimationNodeSocket
@@ -41,7 +42,7 @@ class BVHTreeSocket(bpy.types.NodeSocket, AnimationNodeSocket):
         vertices = mesh.an.getVertices()
         if self.useWorldSpace:
             vertices.transform(evaluatedObject.matrix_world)
-        return BVHTree.FromPolygons(vertices, polygons)
+        return TriangleBVH(vertices, polygons)
 
     def setProperty(self, data):
         self.object, self.useWorldSpace = data
@@ -62,10 +63,10 @@ class BVHTreeSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def getDefaultValue(cls):
-        return BVHTree.FromPolygons(vertices = [], polygons = [])
+        return TriangleBVH()
 
     @classmethod
     def correctValue(cls, value):
-        if isinstance(value, BVHTree):
+        if isinstance(value, (TriangleBVH, BVHTree)):
             return value, 0
         return cls.getDefaultValue(), 2
@@ -1,5 +1,6 @@
 import bpy
-from mathutils.kdtree import KDTree
+from mathutils.kdtree import KDTree as MathutilsKDTree
+from .. data_structures import KDTree
 from .. base_types import AnimationNodeSocket
 
 class KDTreeSocket(bpy.types.NodeSocket, AnimationNodeSocket):
@@ -12,12 +13,10 @@ class KDTreeSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def getDefaultValue(cls):
-        kdTree = KDTree(0)
-        kdTree.balance()
-        return kdTree
+        return KDTree()
 
     @classmethod
     def correctValue(cls, value):
-        if isinstance(value, KDTree):
+        if isinstance(value, (KDTree, MathutilsKDTree)):
             return value, 0
         return cls.getDefaultValue(), 2
@@ -4,7 +4,7 @@ from .. events import propertyChanged
 from .. utils.depsgraph import getEvaluatedID
 from .. data_structures import BezierSpline, PolySpline
 from .. base_types import AnimationNodeSocket, PythonListSocket
-from .. data_structures.splines.from_blender import (createSplinesFromBlenderObject,
+from .. data_structures.splines.from_blender import (createTransformedSplinesFromBlenderObject,
                                                      createSplineFromBlenderSpline)
 
 class SplineSocket(bpy.types.NodeSocket, AnimationNodeSocket):
@@ -107,11 +107,8 @@ class SplineListSocket(bpy.types.NodeSocket, PythonListSocket):
     def getValue(self):
         if self.object is None: return []
         evaluatedObject = getEvaluatedID(self.object)
-        splines = createSplinesFromBlenderObject(evaluatedObject)
-        if self.useWorldSpace:
-            for spline in splines:
-                spline.transform(evaluatedObject.matrix_world)
-        return splines
+        matrix = evaluatedObject.matrix_world if self.useWorldSpace else None
+        return createTransformedSplinesFromBlenderObject(evaluatedObject, matrix)
 
     def setProperty(self, data):
         self.object, self.useWorldSpace = data
@@ -7,9 +7,10 @@ def __setup():
     from . forest_data import ForestData
     from . networks import NodeNetworks
 
-    global _needsUpdate, _forestData, _networks
+    global _needsUpdate, _changedTreeNames, _forestData, _networks
 
     _needsUpdate = True
+    _changedTreeNames = None
     _forestData = ForestData()
     _networks = NodeNetworks()
 
@@ -19,22 +20,36 @@ def __setup():
 
 @measureTime
 def update():
-    _forestData.update()
+    global _needsUpdate, _changedTreeNames
 
-    nodeByID = createNodeByIdDict()
-    _networks.update(_forestData, nodeByID)
+    if _changedTreeNames is None:
+        _forestData.update()
+        nodeByID = createNodeByIdDict()
+        _networks.update(_forestData, nodeByID)
+    else:
+        updatedTreeNames = _forestData.update(_changedTreeNames)
+        nodeByID = createNodeByIdDict()
+        _networks.update(_forestData, nodeByID, updatedTreeNames)
     nodeByID.clear()
 
-    global _needsUpdate
     _needsUpdate = False
+    _changedTreeNames = set()
 
 def updateIfNecessary():
     if _needsUpdate:
         update()
 
-def treeChanged():
-    global _needsUpdate
+def treeChanged(treeName = None):
+    '''
+    Only the given tree is analysed again in the next update.
+    All trees are analysed when no name is given.
+    '''
+    global _needsUpdate, _changedTreeNames
     _needsUpdate = True
+    if treeName is None:
+        _changedTreeNames = None
+    elif _changedTreeNames is not None:
+        _changedTreeNames.add(treeName)
 
 
 
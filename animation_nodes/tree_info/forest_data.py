@@ -8,6 +8,8 @@ class ForestData:
 
     def _reset(self):
         self.nodes = []
+        self.nodesByTree = dict()
+        self.identifiersByTree = dict()
         self.nodesByType = defaultdict(set)
         self.typeByNode = defaultdict(None)
         self.nodeByIdentifier = defaultdict(None)
@@ -21,19 +23,69 @@ class ForestData:
 
         self.dataTypeBySocket = dict()
 
-    def update(self):
+    def update(self, treeNames = None):
+        '''
+        Only the trees with the given names are analysed again when
+        treeNames is not None. Trees that have been added or removed are
+        always updated. Returns the names of all updated trees.
+        '''
+        if treeNames is None:
+            return self.updateAll()
+
+        trees = {tree.name : tree for tree in getAnimationNodeTrees()}
+        knownNames = set(self.nodesByTree.keys())
+        removedNames = knownNames - trees.keys()
+        addedNames = trees.keys() - knownNames
+        changedNames = (set(treeNames) & knownNames & trees.keys()) | addedNames
+
+        for treeName in chain(removedNames, changedNames - addedNames):
+            self.removeNodeTree(treeName)
+
+        self.rerouteNodes = self.nodesByType["NodeReroute"]
+        for treeName in changedNames:
+            self.insertNodeTree(trees[treeName])
+            self.findLinksSkippingReroutes(self.nodesByTree[treeName])
+
+        self.nodes = list(chain.from_iterable(self.nodesByTree.values()))
+        return changedNames | removedNames
+
+    def updateAll(self):
         self._reset()
         self.insertNodeTrees()
         self.rerouteNodes = self.nodesByType["NodeReroute"]
-        self.findLinksSkippingReroutes()
+        self.findLinksSkippingReroutes(self.nodes)
+        return set(self.nodesByTree.keys())
 
     def insertNodeTrees(self):
         for tree in getAnimationNodeTrees():
-            self.insertNodes(tree.nodes, tree.name)
-            self.insertLinks(tree.links, tree.name)
+            self.insertNodeTree(tree)
+
+    def insertNodeTree(self, tree):
+        self.nodesByTree[tree.name] = []
+        self.identifiersByTree[tree.name] = []
+        self.insertNodes(tree.nodes, tree.name)
+        self.insertLinks(tree.links, tree.name)
+
+    def removeNodeTree(self, treeName):
+        nodeIDs = self.nodesByTree.pop(treeName)
+        for nodeID in nodeIDs:
+            self.nodesByType[self.typeByNode.pop(nodeID)].discard(nodeID)
+            self.animationNodes.discard(nodeID)
+            for socketID in chain.from_iterable(self.socketsByNode.pop(nodeID)):
+                self.linkedSockets.pop(socketID, None)
+                self.linkedSocketsWithReroutes.pop(socketID, None)
+                self.reroutePairs.pop(socketID, None)
+                self.dataTypeBySocket.pop(socketID, None)
+
+        # the same identifier can exist in multiple trees
+        for identifier in self.identifiersByTree.pop(treeName):
+            if self.nodeByIdentifier.get(identifier, (None, ))[0] == treeName:
+                del self.nodeByIdentifier[identifier]
 
     def insertNodes(self, nodes, treeName):
         appendNode = self.nodes.append
+        appendTreeNode = self.nodesByTree[treeName].append
+        appendIdentifier = self.identifiersByTree[treeName].append
         nodesByType = self.nodesByType
         typeByNode = self.typeByNode
         nodeByIdentifier = self.nodeByIdentifier
@@ -49,6 +101,7 @@ class ForestData:
             outputIDs = [(nodeID, True, socket.identifier) for socket in node.outputs]
 
             appendNode(nodeID)
+            appendTreeNode(nodeID)
             typeByNode[nodeID] = node.bl_idname
             nodesByType[node.bl_idname].add(nodeID)
 
@@ -63,6 +116,7 @@ class ForestData:
                 if node.bl_idname != "NodeUndefined":
                     animationNodes.add(nodeID)
                     nodeByIdentifier[node.identifier] = nodeID
+                    appendIdentifier(node.identifier)
 
                 chainedSockets = chain(node.inputs, node.outputs)
                 chainedSocketIDs = chain(inputIDs, outputIDs)
@@ -85,9 +139,9 @@ class ForestData:
             linkedSocketsWithReroutes[originID].append(targetID)
             linkedSocketsWithReroutes[targetID].append(originID)
 
-    def findLinksSkippingReroutes(self):
+    def findLinksSkippingReroutes(self, nodes):
         rerouteNodes = self.rerouteNodes
-        nonRerouteNodes = filter(lambda n: n not in rerouteNodes, self.nodes)
+        nonRerouteNodes = filter(lambda n: n not in rerouteNodes, nodes)
 
         socketsByNode = self.socketsByNode
         linkedSockets = self.linkedSockets
@@ -9,38 +9,64 @@ class NodeNetworks:
     def _reset(self):
         self.networks = []
         self.networkByNode = {}
+        self.networksByTree = {}
+        self.joinedNetworks = {}
 
-    def update(self, forestData, nodeByID):
-        self._reset()
+    def update(self, forestData, nodeByID, treeNames = None):
+        '''
+        When treeNames is given, only the networks in these trees are
+        analysed again. The networks of all other trees are reused.
+        '''
+        if treeNames is None:
+            self._reset()
+            treeNames = forestData.nodesByTree.keys()
         self.forestData = forestData
 
-        networksByIdentifier = defaultdict(list)
-        for nodes in self.iterNodeGroups():
-            if not self.groupContainsAnimationNodes(nodes): continue
+        for treeName in set(treeNames):
+            self.networksByTree.pop(treeName, None)
+            if treeName not in forestData.nodesByTree: continue
+            self.networksByTree[treeName] = [
+                NodeNetwork(nodes, forestData, nodeByID)
+                for nodes in self.iterNodeGroups(forestData.nodesByTree[treeName])
+                if self.groupContainsAnimationNodes(nodes)]
 
-            network = NodeNetwork(nodes, self.forestData, nodeByID)
+        networksByIdentifier = defaultdict(list)
+        for network in chain.from_iterable(self.networksByTree.values()):
             networksByIdentifier[network.identifier].append(network)
 
+        self.networks = []
+        self.networkByNode = {}
+        joinedNetworks = {}
         for identifier, networks in networksByIdentifier.items():
             if identifier is None:
                 # this are the main networks
                 self.networks.extend(networks)
             else:
                 # join subprogram networks if they are not connected with links
-                self.networks.append(NodeNetwork.join(networks, nodeByID))
+                joinedNetwork = self.getJoinedNetwork(identifier, networks, nodeByID)
+                joinedNetworks[identifier] = (networks, joinedNetwork)
+                self.networks.append(joinedNetwork)
+        self.joinedNetworks = joinedNetworks
 
         for network in self.networks:
             for nodeID in network.nodeIDs:
                 self.networkByNode[nodeID] = network
 
+    def getJoinedNetwork(self, identifier, networks, nodeByID):
+        if identifier in self.joinedNetworks:
+            oldNetworks, joinedNetwork = self.joinedNetworks[identifier]
+            if len(oldNetworks) == len(networks) and all(a is b for a, b in zip(oldNetworks, networks)):
+                return joinedNetwork
+        return NodeNetwork.join(networks, nodeByID)
+
     def groupContainsAnimationNodes(self, nodes):
         typeByNode = self.forestData.typeByNode
         nonAnimationNodes = ("NodeFrame", "NodeReroute")
         return any(typeByNode[node] not in nonAnimationNodes for node in nodes)
 
-    def iterNodeGroups(self):
+    def iterNodeGroups(self, nodes):
         foundNodes = set()
-        for node in self.forestData.nodes:
+        for node in nodes:
             if node not in foundNodes:
                 nodeGroup = self.getAllConnectedNodes(node)
                 foundNodes.update(nodeGroup)
@@ -1,5 +1,6 @@
 import bpy
 from .. preferences import getPreferences
+from .. execution.compile_scripts import getCodeCacheStatistics
 from .. operators.output_execution_code import setupTextEditorCallback, executionCodeTextBlockName
 
 
@@ -24,7 +25,7 @@ class DeveloperPanel(bpy.types.Panel):
         preferences = getPreferences()
 
         col = layout.column()
-        self.drawExecutionCodeSettings(col, preferences)
+        self.drawExecutionCodeSettings(col, preferences, tree)
 
         layout.separator()
 
@@ -35,7 +36,7 @@ class DeveloperPanel(bpy.types.Panel):
 
         layout.prop(preferences.nodeColors, "nodeColorMode", text = "Color Mode")
 
-    def drawExecutionCodeSettings(self, layout, preferences):
+    def drawExecutionCodeSettings(self, layout, preferences, tree):
         executionCode = preferences.executionCode
         layout.label(text = "Execution Code:")
 
@@ -43,8 +44,15 @@ class DeveloperPanel(bpy.types.Panel):
 
         row = col.row(align = True)
         row.prop(executionCode, "type", text = "")
-        if executionCode.type == "MEASURE":
+        if executionCode.type in ("MEASURE", "MEASURE_MEMORY"):
             row.operator("an.reset_measurements", text = "", icon = "RECOVER_LAST")
+        if executionCode.type == "MEASURE_MEMORY":
+            row.operator("an.export_memory_measurements", text = "", icon = "EXPORT")
+        if executionCode.type == "INCREMENTAL":
+            units = tree.mainUnits
+            executedAmount = sum(unit.executedNodesAmount for unit in units)
+            totalAmount = sum(len(unit.nodeBlocks) for unit in units)
+            col.label(text = "Executed Nodes: {} / {}".format(executedAmount, totalAmount))
 
         row = col.row(align = True)
         row.operator("an.print_current_execution_code", text = "Print", icon = "CONSOLE")
@@ -53,6 +61,12 @@ class DeveloperPanel(bpy.types.Panel):
         subrow.active = executionCodeTextBlockName in bpy.data.texts
         subrow.operator("an.select_area", text = "", icon = "ZOOM_SELECTED").callback = setupTextEditorCallback
 
+        statistics = getCodeCacheStatistics()
+        col = layout.column(align = True)
+        col.label(text = "Code Cache Hits: {} (Disk: {})".format(
+            statistics.memoryHits + statistics.diskHits, statistics.diskHits))
+        col.label(text = "Code Cache Misses: {}".format(statistics.misses))
+
     def drawProfilingSettings(self, layout, preferences):
         profiling = preferences.developer.profiling
 
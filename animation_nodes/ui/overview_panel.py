@@ -30,9 +30,14 @@ class OverviewPanel(bpy.types.Panel):
 
             icon = "LAYER_ACTIVE" if tree.autoExecution.enabled else "LAYER_USED"
             row.prop(tree.autoExecution, "enabled", icon = icon, text = "", icon_only = True)
+            row.prop(tree.frameCache, "enabled", icon = "FILE_CACHE", text = "", icon_only = True)
 
         layout.operator("an.statistics_drawer", text = "Statistics", icon = "LINENUMBERS_ON")
 
         props = layout.operator("an.bake_to_keyframes", text = "Bake to Keyframes", icon = "DECORATE_KEYFRAME")
         props.startFrame = context.scene.frame_start
         props.endFrame = context.scene.frame_end
+
+        props = layout.operator("an.bake_frame_cache", text = "Bake Frame Cache", icon = "FILE_CACHE")
+        props.startFrame = context.scene.frame_start
+        props.endFrame = context.scene.frame_end
@@ -1,5 +1,8 @@
 from random import random
 from mathutils import Vector
+from .. data_structures import (
+    TriangleBVH, Vector3DList, DoubleList, LongList, BooleanList
+)
 
 # in some cases multiple tests have to done
 # to reduce the probability for errors
@@ -8,6 +11,9 @@ direction2 = Vector((random(), random(), random())).normalized()
 direction3 = Vector((random(), random(), random())).normalized()
 
 def isInsideVolume(bvhTree, vector):
+    if isinstance(bvhTree, TriangleBVH):
+        return bvhTree.isInside(vector)
+
     hits1 = countHits(bvhTree, vector, direction1)
     if hits1 == 0: return False
     if hits1 == 1: return True
@@ -29,3 +35,65 @@ def countHits(bvhTree, start, direction):
         location = bvhTree.ray_cast(location + offset, direction)[0]
 
     return hits
+
+
+# List Queries
+##################################
+
+# The native TriangleBVH processes all points at once.
+# Trees created by other means (e.g. in script nodes) are
+# still mathutils BVHTrees and are evaluated point by point.
+
+def isInsideVolumeList(bvhTree, vectors):
+    if isinstance(bvhTree, TriangleBVH):
+        return bvhTree.isInsideList(vectors)
+    return BooleanList.fromValues([isInsideVolume(bvhTree, vector) for vector in vectors])
+
+def rayCastList(bvhTree, starts, directions, minDistance, maxDistance):
+    if isinstance(bvhTree, TriangleBVH):
+        return bvhTree.rayCastList(starts, directions, minDistance, maxDistance)
+
+    result = SearchResultLists(len(starts))
+    for start, direction in zip(starts, directions):
+        direction = direction.normalized()
+        location, normal, polygonIndex, distance = bvhTree.ray_cast(
+            start + direction * minDistance, direction, maxDistance - minDistance)
+        if location is None:
+            result.appendMiss()
+        else:
+            result.append(location, normal, distance + minDistance, polygonIndex)
+    return result.asTuple()
+
+def findNearestList(bvhTree, vectors, maxDistance):
+    if isinstance(bvhTree, TriangleBVH):
+        return bvhTree.findNearestList(vectors, maxDistance)
+
+    result = SearchResultLists(len(vectors))
+    for vector in vectors:
+        location, normal, polygonIndex, distance = bvhTree.find_nearest(vector, maxDistance)
+        if location is None:
+            result.appendMiss()
+        else:
+            result.append(location, normal, distance, polygonIndex)
+    return result.asTuple()
+
+class SearchResultLists:
+    def __init__(self, capacity):
+        self.locations = Vector3DList(capacity = capacity)
+        self.normals = Vector3DList(capacity = capacity)
+        self.distances = DoubleList(capacity = capacity)
+        self.polygonIndices = LongList(capacity = capacity)
+        self.hits = BooleanList(capacity = capacity)
+
+    def append(self, location, normal, distance, polygonIndex, hit = True):
+        self.locations.append(location)
+        self.normals.append(normal)
+        self.distances.append(distance)
+        self.polygonIndices.append(polygonIndex)
+        self.hits.append(hit)
+
+    def appendMiss(self):
+        self.append((0, 0, 0), (0, 0, 0), 0, -1, hit = False)
+
+    def asTuple(self):
+        return self.locations, self.normals, self.distances, self.polygonIndices, self.hits
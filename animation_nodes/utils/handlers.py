@@ -19,6 +19,7 @@ versionUpdateHandlers = []
 addonLoadPostHandlers = []
 frameChangePostHandlers = []
 depsgraphUpdatePostHandlers = []
+undoRedoPostHandlers = []
 
 renderPreHandlers = []
 renderInitHandlers = []
@@ -34,6 +35,7 @@ def eventHandler(event):
         if event == "ADDON_LOAD_POST": addonLoadPostHandlers.append(function)
         if event == "FRAME_CHANGE_POST": frameChangePostHandlers.append(function)
         if event == "DEPSGRAPH_UPDATE_POST": depsgraphUpdatePostHandlers.append(function)
+        if event == "UNDO_REDO_POST": undoRedoPostHandlers.append(function)
 
         if event == "RENDER_INIT": renderInitHandlers.append(function)
         if event == "RENDER_PRE": renderPreHandlers.append(function)
@@ -84,6 +86,11 @@ def depsgraphUpdatePost(scene, depsgraph):
     for handler in depsgraphUpdatePostHandlers:
         handler(scene, depsgraph)
 
+@persistent
+def undoRedoPost(scene):
+    for handler in undoRedoPostHandlers:
+        handler()
+
 @persistent
 def renderInitialized(scene):
     for handler in renderInitHandlers:
@@ -106,6 +113,8 @@ def register():
     bpy.app.handlers.load_post.append(loadPost)
     bpy.app.handlers.version_update.append(versionUpdate)
     bpy.app.handlers.save_pre.append(savePre)
+    bpy.app.handlers.undo_post.append(undoRedoPost)
+    bpy.app.handlers.redo_post.append(undoRedoPost)
 
     bpy.app.handlers.render_complete.append(renderCompleted)
     bpy.app.handlers.render_init.append(renderInitialized)
@@ -122,6 +131,8 @@ def unregister():
     bpy.app.handlers.load_post.remove(loadPost)
     bpy.app.handlers.version_update.remove(versionUpdate)
     bpy.app.handlers.save_pre.remove(savePre)
+    bpy.app.handlers.undo_post.remove(undoRedoPost)
+    bpy.app.handlers.redo_post.remove(undoRedoPost)
     bpy.app.timers.unregister(always)
 
     bpy.app.handlers.render_complete.remove(renderCompleted)
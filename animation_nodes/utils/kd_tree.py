@@ -0,0 +1,75 @@
+import numpy
+from mathutils import Vector
+from .. data_structures import KDTree, Vector3DList, DoubleList, LongList
+
+# The native KDTree searches for all points at once.
+# Trees created by other means (e.g. in script nodes) are
+# mathutils KDTrees and are searched point by point.
+
+def findNearestN(kdTree, vector, amount):
+    if isinstance(kdTree, KDTree):
+        return kdTree.findNearestN(vector, amount)
+    return unpackSearchResult(kdTree.find_n(vector, max(amount, 0)))
+
+def findInRadius(kdTree, vector, radius):
+    if isinstance(kdTree, KDTree):
+        return kdTree.findInRadius(vector, radius)
+    return unpackSearchResult(kdTree.find_range(vector, max(radius, 0)))
+
+def findNearestList(kdTree, vectors):
+    if isinstance(kdTree, KDTree):
+        return kdTree.findNearestList(vectors)
+
+    result = SearchResultLists(len(vectors))
+    for vector in vectors:
+        location, index, distance = kdTree.find(vector)
+        if location is None:
+            result.append(Vector((0, 0, 0)), 0, -1)
+        else:
+            result.append(location, index, distance)
+    return result.asTuple()
+
+def findNearestNList(kdTree, vectors, amount):
+    if isinstance(kdTree, KDTree):
+        vectors, indices, distances, offsets = kdTree.findNearestNList(vectors, amount)
+        return vectors, indices, distances, getAmountsFromOffsets(offsets)
+    return searchEveryVector(vectors, lambda vector: kdTree.find_n(vector, max(amount, 0)))
+
+def findInRadiusList(kdTree, vectors, radius):
+    if isinstance(kdTree, KDTree):
+        vectors, indices, distances, offsets = kdTree.findInRadiusList(vectors, radius)
+        return vectors, indices, distances, getAmountsFromOffsets(offsets)
+    return searchEveryVector(vectors, lambda vector: kdTree.find_range(vector, max(radius, 0)))
+
+def getAmountsFromOffsets(offsets):
+    return LongList.fromNumpyArray(numpy.diff(offsets.asNumpyArray()))
+
+def searchEveryVector(vectors, search):
+    result = SearchResultLists(len(vectors))
+    amounts = LongList(capacity = len(vectors))
+    for vector in vectors:
+        foundPoints = search(vector)
+        for location, index, distance in foundPoints:
+            result.append(location, index, distance)
+        amounts.append(len(foundPoints))
+    return result.asTuple() + (amounts, )
+
+def unpackSearchResult(foundPoints):
+    result = SearchResultLists(len(foundPoints))
+    for location, index, distance in foundPoints:
+        result.append(location, index, distance)
+    return result.asTuple()
+
+class SearchResultLists:
+    def __init__(self, capacity):
+        self.vectors = Vector3DList(capacity = capacity)
+        self.indices = LongList(capacity = capacity)
+        self.distances = DoubleList(capacity = capacity)
+
+    def append(self, vector, index, distance):
+        self.vectors.append(vector)
+        self.indices.append(index)
+        self.distances.append(distance)
+
+    def asTuple(self):
+        return self.vectors, self.indices, self.distances
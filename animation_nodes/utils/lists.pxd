@@ -1,2 +1,2 @@
 cpdef findListSegment(long amount, bint cyclic, float parameter)
-cdef void findListSegment_LowLevel(long amount, bint cyclic, float parameter, long* index, float* factor)
+cdef void findListSegment_LowLevel(long amount, bint cyclic, float parameter, long* index, float* factor) nogil
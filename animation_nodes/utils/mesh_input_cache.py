@@ -0,0 +1,222 @@
+import bpy
+import numpy
+from .. import events
+from . handlers import eventHandler
+
+# Imported mesh data by (object pointer, use modifiers).
+#
+# Entries are removed when the depsgraph reports a geometry update of the
+# object or its mesh. Meshes with modifiers can also change when the frame
+# changes. Their positions are loaded again in a new frame, but the topology
+# lists are kept when the edges and polygons are still the same. To check this,
+# the vertex indices of the edges and loops and the loop starts are stored
+# when topology data is cached for the first time.
+#
+# This is not zero-copy: nodes can modify their inputs in place, so the
+# node gets a copy of every cached list. Only lists that are converted to
+# another type anyway are passed on without a copy. Copying is still much
+# cheaper than reading the data from Blender again.
+#
+# Every node that reads a mesh is the owner of one entry. An entry is removed
+# when no node reads it anymore, because the nodes have been removed or
+# read another object.
+
+cachedMeshInputs = {}
+cacheKeyByOwner = {}
+
+topologyDataNames = {"getEdgeIndices", "getPolygonIndices", "getLoopEdges"}
+
+class MeshInputCacheEntry:
+    def __init__(self, meshPointer, amounts, frame):
+        self.meshPointer = meshPointer
+        self.amounts = amounts
+        self.frame = frame
+        self.topology = {}
+        self.topologyArrays = None
+        self.data = {}
+        self.worldData = {}
+        self.worldMatrix = None
+
+    def reset(self, amounts, frame, getTopologyArrays):
+        if amounts != self.amounts or not self.hasSameTopology(getTopologyArrays):
+            self.topology.clear()
+            self.topologyArrays = None
+        self.amounts = amounts
+        self.frame = frame
+        self.data.clear()
+        self.worldData.clear()
+
+    def hasSameTopology(self, getTopologyArrays):
+        if self.topologyArrays is None: return True
+        return all(numpy.array_equal(a, b) for a, b in zip(self.topologyArrays, getTopologyArrays()))
+
+def getMeshInput(object, useModifiers, owner):
+    '''
+    Returns None when the object has no mesh data.
+    owner is the identifier of the node that reads the data.
+    '''
+    if object is None:
+        removeOwner(owner)
+        return None
+
+    # edit mode and render data are not tracked by the depsgraph updates below
+    if object.mode == "EDIT" or events.isRendering():
+        return MeshInput.fromObject(object, useModifiers, None)
+
+    key = (object.as_pointer(), useModifiers)
+    setOwnerKey(owner, key)
+    entry = cachedMeshInputs.get(key)
+    usesEvaluatedMesh = useModifiers or object.type != "MESH"
+    frame = getCurrentFrame() if usesEvaluatedMesh else None
+
+    if entry is not None:
+        if entry.meshPointer != getMeshPointer(object):
+            del cachedMeshInputs[key]
+        elif entry.frame == frame:
+            return MeshInput(object, useModifiers, entry)
+
+    meshInput = MeshInput.fromObject(object, useModifiers, entry)
+    if meshInput is None:
+        removeOwner(owner)
+        cachedMeshInputs.pop(key, None)
+        return None
+
+    amounts = meshInput.getAmounts()
+    if key in cachedMeshInputs:
+        entry.reset(amounts, frame, meshInput.getTopologyArrays)
+    else:
+        meshInput.entry = MeshInputCacheEntry(getMeshPointer(object), amounts, frame)
+        cachedMeshInputs[key] = meshInput.entry
+    return meshInput
+
+class MeshInput:
+    '''
+    Gives access to the data of an object mesh. The source mesh is only
+    created when some data is not in the cache yet. release() has to be
+    called when the data is not needed anymore.
+    '''
+    def __init__(self, object, useModifiers, entry, sourceMesh = None):
+        self.object = object
+        self.useModifiers = useModifiers
+        self.entry = entry
+        self._sourceMesh = sourceMesh
+
+    @classmethod
+    def fromObject(cls, object, useModifiers, entry):
+        sourceMesh = object.an.getMesh(useModifiers)
+        if sourceMesh is None: return None
+        return cls(object, useModifiers, entry, sourceMesh)
+
+    @property
+    def sourceMesh(self):
+        if self._sourceMesh is None:
+            self._sourceMesh = self.object.an.getMesh(self.useModifiers)
+        return self._sourceMesh
+
+    def release(self):
+        if self._sourceMesh is not None:
+            if self._sourceMesh.users == 0:
+                self.object.to_mesh_clear()
+            self._sourceMesh = None
+
+    def getAmounts(self):
+        mesh = self.sourceMesh
+        return (len(mesh.vertices), len(mesh.edges), len(mesh.loops), len(mesh.polygons))
+
+    def getTopologyArrays(self):
+        mesh = self.sourceMesh
+        edges = numpy.empty(len(mesh.edges) * 2, dtype = numpy.int32)
+        vertexIndices = numpy.empty(len(mesh.loops), dtype = numpy.int32)
+        loopStarts = numpy.empty(len(mesh.polygons), dtype = numpy.int32)
+        mesh.edges.foreach_get("vertices", edges)
+        mesh.loops.foreach_get("vertex_index", vertexIndices)
+        mesh.polygons.foreach_get("loop_start", loopStarts)
+        return edges, vertexIndices, loopStarts
+
+    def get(self, name, copy = True):
+        '''
+        name is the name of a method of MeshProperties in extend_bpy_types.
+        Without a copy, the returned list must not be changed or stored.
+        '''
+        if self.entry is None:
+            return getattr(self.sourceMesh.an, name)()
+
+        isTopology = name in topologyDataNames
+        storage = self.entry.topology if isTopology else self.entry.data
+        if name not in storage:
+            if isTopology and self.entry.topologyArrays is None:
+                self.entry.topologyArrays = self.getTopologyArrays()
+            storage[name] = getattr(self.sourceMesh.an, name)()
+        return storage[name].copy() if copy else storage[name]
+
+    def getTransformed(self, name, matrix, ignoreTranslation = False):
+        if self.entry is None:
+            data = self.get(name)
+            data.transform(matrix, ignoreTranslation = ignoreTranslation)
+            return data
+
+        if self.entry.worldMatrix != matrix:
+            self.entry.worldMatrix = matrix.copy()
+            self.entry.worldData.clear()
+
+        worldData = self.entry.worldData
+        if name not in worldData:
+            data = self.get(name)
+            data.transform(matrix, ignoreTranslation = ignoreTranslation)
+            worldData[name] = data
+        return worldData[name].copy()
+
+    @property
+    def meshName(self):
+        return self.sourceMesh.name
+
+def setOwnerKey(owner, key):
+    oldKey = cacheKeyByOwner.get(owner)
+    cacheKeyByOwner[owner] = key
+    if oldKey is not None and oldKey != key:
+        removeUnusedEntry(oldKey)
+
+def removeOwner(owner):
+    '''Has to be called when a node that reads meshes is removed.'''
+    key = cacheKeyByOwner.pop(owner, None)
+    if key is not None:
+        removeUnusedEntry(key)
+
+def removeUnusedEntry(key):
+    if key not in cacheKeyByOwner.values():
+        cachedMeshInputs.pop(key, None)
+
+def getMeshPointer(object):
+    return object.data.as_pointer() if object.data is not None else 0
+
+def getCurrentFrame():
+    # imported here because the depsgraph utils depend on the events module
+    from . depsgraph import getActiveDepsgraph
+    return getActiveDepsgraph().scene.frame_current_final
+
+def invalidateObject(object):
+    pointer = object.as_pointer()
+    for key in [key for key in cachedMeshInputs if key[0] == pointer]:
+        del cachedMeshInputs[key]
+
+def invalidateMesh(mesh):
+    pointer = mesh.as_pointer()
+    for key in [key for key, entry in cachedMeshInputs.items() if entry.meshPointer == pointer]:
+        del cachedMeshInputs[key]
+
+def removeChangedMeshInputs(depsgraph):
+    '''Has to be called before the node trees are executed after a depsgraph update.'''
+    if len(cachedMeshInputs) == 0: return
+    for update in depsgraph.updates:
+        if not update.is_updated_geometry: continue
+        idBlock = update.id.original
+        if isinstance(idBlock, bpy.types.Object):
+            invalidateObject(idBlock)
+        elif isinstance(idBlock, bpy.types.Mesh):
+            invalidateMesh(idBlock)
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_REDO_POST")
+def clearMeshInputCache():
+    cachedMeshInputs.clear()
+    cacheKeyByOwner.clear()
@@ -0,0 +1 @@
+cdef int getThreadAmount(Py_ssize_t amount, Py_ssize_t minAmountPerThread) nogil
@@ -0,0 +1,35 @@
+# Loops over large lists are split up between threads with prange.
+# Every such loop should get its amount of threads from getThreadAmount,
+# so that small lists stay in the calling thread:
+#
+#   for i in prange(amount, nogil = True, schedule = "static",
+#                   num_threads = getThreadAmount(amount, 10000)):
+#
+# The result must not depend on the amount of threads. Modules that use
+# prange need the "openmp" setup option, otherwise the loops run serially.
+
+import os
+from . handlers import eventHandler
+from .. preferences import getPerformanceSettings
+
+cdef int maxThreadAmount = 1
+
+def setThreadAmount(int amount):
+    '''0 means that all cores will be used.'''
+    global maxThreadAmount
+    if amount <= 0:
+        amount = os.cpu_count() or 1
+    maxThreadAmount = amount
+
+def getMaxThreadAmount():
+    return maxThreadAmount
+
+cdef int getThreadAmount(Py_ssize_t amount, Py_ssize_t minAmountPerThread) nogil:
+    cdef Py_ssize_t threadAmount = amount // max(minAmountPerThread, 1)
+    if threadAmount <= 1:
+        return 1
+    return <int>min(threadAmount, maxThreadAmount)
+
+@eventHandler("ADDON_LOAD_POST")
+def updateThreadAmount():
+    setThreadAmount(getPerformanceSettings().threadAmount)
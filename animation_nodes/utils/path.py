@@ -10,6 +10,31 @@ def toAbsolutePath(path, start = None, library = None):
     absPath = bpy.path.abspath(path, start, library)
     return os.path.normpath(absPath)
 
+def getPrivateDirectory(*names):
+    '''
+    Folder in the Blender user directory that only the current user can write to.
+    Returns None when it cannot be created or is not private.
+    '''
+    root = bpy.utils.user_resource("DATAFILES", path = "animation_nodes")
+    path = os.path.join(root, *names)
+    try:
+        if ensurePrivateDirectory(path): return path
+    except OSError: pass
+    return None
+
+def ensurePrivateDirectory(path):
+    '''
+    Creates the directory when it does not exist. Returns False when other users
+    could put files into it. Files from such directories must not be loaded.
+    '''
+    os.makedirs(path, mode = 0o700, exist_ok = True)
+    if not hasattr(os, "getuid"):
+        # user directories on Windows are protected by their access control lists
+        return True
+
+    info = os.stat(path)
+    return info.st_uid == os.getuid() and info.st_mode & 0o022 == 0
+
 def toIDPropertyPath(name):
     return '["' + name + '"]'
 
@@ -0,0 +1,46 @@
+from unittest import TestCase
+from . import mesh_input_cache
+from . mesh_input_cache import getMeshInput, removeOwner, clearMeshInputCache
+
+class FakeMesh:
+    def __init__(self):
+        self.vertices = self.edges = self.loops = self.polygons = []
+        self.users = 1
+
+    def as_pointer(self):
+        return id(self)
+
+class FakeObject:
+    def __init__(self, pointer):
+        self.pointer = pointer
+        self.mode = "OBJECT"
+        self.type = "MESH"
+        self.data = FakeMesh()
+        self.an = self
+
+    def as_pointer(self):
+        return self.pointer
+
+    def getMesh(self, useModifiers):
+        return self.data
+
+class TestOwners(TestCase):
+    def tearDown(self):
+        clearMeshInputCache()
+
+    def testEntryIsRemovedWithLastOwner(self):
+        object = FakeObject(1)
+        getMeshInput(object, False, "a")
+        getMeshInput(object, False, "b")
+        removeOwner("a")
+        self.assertIn((1, False), mesh_input_cache.cachedMeshInputs)
+        removeOwner("b")
+        self.assertEqual(len(mesh_input_cache.cachedMeshInputs), 0)
+
+    def testOwnerReadsOtherObject(self):
+        getMeshInput(FakeObject(1), False, "a")
+        getMeshInput(FakeObject(2), False, "a")
+        self.assertEqual(list(mesh_input_cache.cachedMeshInputs), [(2, False)])
+
+        getMeshInput(None, False, "a")
+        self.assertEqual(len(mesh_input_cache.cachedMeshInputs), 0)
@@ -0,0 +1,36 @@
+import numpy
+
+def setVertexGroupWeights(vertexGroup, weights, indices = None):
+    '''
+    Set the weights of many vertices at once. Blender can only assign
+    a single weight per call, so vertices that get the same weight
+    are combined into one call.
+    Without indices, the i-th weight is assigned to the i-th vertex.
+    The weights and indices have to be given as lists from data_structures.
+    '''
+    for weight, vertexIndices in groupVerticesByWeight(weights, indices):
+        vertexGroup.add(vertexIndices, weight, "REPLACE")
+
+def groupVerticesByWeight(weights, indices = None):
+    '''Returns a list of (weight, vertexIndices) tuples.'''
+    # Blender stores weights as 32 bit floats, so values that are only
+    # different in double precision end up in the same group.
+    weights = weights.asNumpyArray().astype(numpy.float32)
+
+    if indices is None:
+        indices = numpy.arange(len(weights))
+    else:
+        # Only the last weight of an index is used when it occurs multiple times.
+        indices, lastPositions = numpy.unique(
+            indices.asNumpyArray().astype(numpy.int64)[::-1], return_index = True)
+        weights = weights[::-1][lastPositions]
+
+    if len(weights) == 0:
+        return []
+
+    uniqueWeights, groupIndices, counts = numpy.unique(weights,
+        return_inverse = True, return_counts = True)
+    sortedIndices = indices[numpy.argsort(groupIndices, kind = "stable")]
+    splitIndices = numpy.split(sortedIndices, numpy.cumsum(counts)[:-1])
+    return [(float(weight), vertexIndices.tolist())
+            for weight, vertexIndices in zip(uniqueWeights, splitIndices)]